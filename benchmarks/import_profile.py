@@ -0,0 +1,92 @@
+"""Measure the import time and peak memory of every `pydantic_extra_types` module.
+
+Each module is imported in a fresh interpreter, with `pydantic` already imported so the numbers
+reflect the cost of the module itself rather than pydantic's own start-up. The result is written
+as JSON so two releases can be compared with any diff tool:
+
+```shell
+python -m benchmarks.import_profile --output import-profile.json
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pkgutil
+import platform
+import subprocess
+import sys
+from typing import Any
+
+import pydantic_extra_types
+
+_PROBE = """
+import json, sys, time, tracemalloc
+import pydantic
+name = sys.argv[1]
+if sys.argv[2] == 'memory':
+    tracemalloc.start()
+    __import__(name)
+    print(json.dumps({'peak_bytes': tracemalloc.get_traced_memory()[1]}))
+else:
+    start = time.perf_counter()
+    __import__(name)
+    print(json.dumps({'seconds': time.perf_counter() - start}))
+"""
+
+
+def _modules() -> list[str]:
+    return sorted(
+        f'pydantic_extra_types.{info.name}'
+        for info in pkgutil.iter_modules(pydantic_extra_types.__path__)
+        if not info.name.startswith('_')
+    )
+
+
+def _probe(module: str, what: str) -> dict[str, Any] | None:
+    result = subprocess.run([sys.executable, '-c', _PROBE, module, what], capture_output=True, text=True)
+    if result.returncode != 0:
+        # most likely a missing optional dependency
+        return None
+    return json.loads(result.stdout)
+
+
+def profile(modules: list[str], repeat: int) -> dict[str, Any]:
+    """Profile `modules`, keeping the fastest of `repeat` imports to reduce noise."""
+    results: dict[str, Any] = {}
+    for module in modules:
+        timings = [_probe(module, 'time') for _ in range(repeat)]
+        memory = _probe(module, 'memory')
+        if memory is None or any(t is None for t in timings):
+            results[module] = {'error': 'import failed'}
+            continue
+        results[module] = {
+            'import_seconds': min(t['seconds'] for t in timings),  # type: ignore[index]
+            'peak_memory_bytes': memory['peak_bytes'],
+        }
+    return {
+        'version': pydantic_extra_types.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'modules': results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('modules', nargs='*', help='modules to profile, defaults to all of them')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timed imports per module')
+    parser.add_argument('--output', help='file to write the JSON report to, defaults to stdout')
+    args = parser.parse_args()
+
+    report = json.dumps(profile(args.modules or _modules(), args.repeat), indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report + '\n')
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+"""Bulk validation paths (`validate_array`, the array types) against validating one value at a time."""
+
+from __future__ import annotations
+
+import math
+import random
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter
+
+from pydantic_extra_types.color import Color, ColorArray
+from pydantic_extra_types.coordinate import Coordinate, CoordinateArray
+from pydantic_extra_types.iban import IBAN, IBAN_COUNTRY_CODE_LENGTH, _validate_iban_check_digits
+from pydantic_extra_types.payment import PaymentCardNumber
+from pydantic_extra_types.phone_numbers import normalize_many
+
+np = pytest.importorskip('numpy')
+
+N_BULK = 100_000
+N_IBANS = 1_000_000
+N_PHONE_NUMBERS = 100_000
+
+
+def _luhn_complete(body: str) -> str:
+    for check_digit in '0123456789':
+        card_number = body + check_digit
+        total = 0
+        for i, c in enumerate(reversed(card_number)):
+            digit = int(c) * (2 if i % 2 else 1)
+            total += digit - 9 if digit > 9 else digit
+        if total % 10 == 0:
+            return card_number
+    raise AssertionError('unreachable')
+
+
+@pytest.fixture(scope='module')
+def card_numbers() -> list[str]:
+    rng = random.Random(0)
+    prefixes = ['4', '51', '2221', '34', '2200', '6011', '506099', '62', '3528', '36', '9792', '1']
+    values = []
+    for i in range(N_BULK):
+        body = rng.choice(prefixes) + ''.join(rng.choices('0123456789', k=15))
+        # roughly 10% fail the Luhn check
+        values.append(_luhn_complete(body[:15]) if i % 10 else body[:16])
+    return values
+
+
+def _validate_each(values: list[str]) -> None:
+    for value in values:
+        try:
+            PaymentCardNumber._validate_str(value)
+        except ValueError:
+            pass
+
+
+def test_payment_card_scalar(benchmark: Any, card_numbers: list[str]) -> None:
+    benchmark.group = 'payment-card-bulk'
+    benchmark(_validate_each, card_numbers)
+
+
+def test_payment_card_validate_array(benchmark: Any, card_numbers: list[str]) -> None:
+    benchmark.group = 'payment-card-bulk'
+    benchmark(PaymentCardNumber.validate_array, np.array(card_numbers))
+
+
+def _legacy_iban_check_digits(iban: str) -> bool:
+    """The MOD-97 check as it was implemented before, building the number by string concatenation."""
+    rearranged = iban[4:] + iban[:4]
+    numeric = ''
+    for char in rearranged:
+        if char.isdigit():
+            numeric += char
+        else:
+            numeric += str(ord(char) - ord('A') + 10)
+    return int(numeric) % 97 == 1
+
+
+@pytest.fixture(scope='module')
+def ibans() -> list[str]:
+    rng = random.Random(0)
+    letter_digits = str.maketrans({chr(ord('A') + i): str(10 + i) for i in range(26)})
+    countries = sorted(IBAN_COUNTRY_CODE_LENGTH)
+    values = []
+    for i in range(N_IBANS):
+        country_code = rng.choice(countries)
+        bban = ''.join(rng.choices('0123456789', k=IBAN_COUNTRY_CODE_LENGTH[country_code] - 4))
+        check = 98 - int(f'{bban}{country_code}00'.translate(letter_digits)) % 97
+        # roughly 10% fail the checksum
+        values.append(f'{country_code}{check if i % 10 else (check + 1) % 100:02d}{bban}')
+    return values
+
+
+def _check_each(check: Any, values: list[str]) -> None:
+    for value in values:
+        check(value)
+
+
+@pytest.mark.parametrize('check', [_legacy_iban_check_digits, _validate_iban_check_digits], ids=['legacy', 'current'])
+def test_iban_checksum(benchmark: Any, ibans: list[str], check: Any) -> None:
+    benchmark.group = 'iban-checksum'
+    benchmark.pedantic(_check_each, (check, ibans), rounds=3)
+
+
+def test_iban_scalar(benchmark: Any, ibans: list[str]) -> None:
+    benchmark.group = 'iban-bulk'
+    benchmark.pedantic(IBAN.validate_many, (ibans,), rounds=3)
+
+
+def test_iban_validate_array(benchmark: Any, ibans: list[str]) -> None:
+    benchmark.group = 'iban-bulk'
+    benchmark.pedantic(IBAN.validate_array, (np.array(ibans),), rounds=3)
+
+
+@pytest.fixture(scope='module')
+def phone_numbers() -> list[str]:
+    rng = random.Random(0)
+    formats = ['+1 650 {}', '+44 20 {}', '+49 30 {}', '650 {}']
+    return [rng.choice(formats).format(rng.randint(2000000, 9999999)) for _ in range(N_PHONE_NUMBERS)]
+
+
+@pytest.mark.parametrize('workers', [1, None], ids=['1-process', 'all-cpus'])
+def test_phone_numbers_normalize_many(benchmark: Any, phone_numbers: list[str], workers: Any) -> None:
+    benchmark.group = 'phone-numbers-bulk'
+    benchmark.pedantic(normalize_many, (phone_numbers,), {'default_region': 'US', 'workers': workers}, rounds=1)
+
+
+@pytest.fixture(scope='module')
+def image() -> Any:
+    """A 1000x1000 RGB image with 5 bits per channel, up to 32768 distinct colors."""
+    rng = np.random.default_rng(0)
+    gradient = np.linspace(0, 255, 1000)
+    pixels = np.stack(np.broadcast_arrays(gradient[:, None], gradient[None, :], 128.0), axis=-1)
+    pixels += rng.normal(0, 24, size=pixels.shape)
+    return (np.clip(pixels, 0, 255).astype(np.uint8) >> 3) << 3
+
+
+@pytest.mark.parametrize('metric', ['rgb', 'lab', 'ciede2000'])
+def test_color_nearest_named_array(benchmark: Any, image: Any, metric: str) -> None:
+    benchmark.group = 'color-nearest-named'
+    benchmark.pedantic(Color.nearest_named_array, (image, metric), rounds=1)
+
+
+def _convert_each(values: list[Any]) -> None:
+    for color in map(Color, values):
+        color.as_hex()
+        color.as_hsl_tuple()
+
+
+def _convert_array(values: Any) -> None:
+    colors = ColorArray(values)
+    colors.as_hex()
+    colors.as_hsl_tuple()
+
+
+@pytest.mark.parametrize('convert', [_convert_each, _convert_array], ids=['color', 'color-array'])
+def test_color_conversion(benchmark: Any, image: Any, convert: Any) -> None:
+    benchmark.group = 'color-conversion'
+    benchmark.pedantic(convert, (image.reshape(-1, 3)[:N_BULK].tolist(),), rounds=3)
+
+
+@pytest.fixture(scope='module')
+def track() -> list[tuple[float, float]]:
+    rng = random.Random(0)
+    return [(rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(N_BULK)]
+
+
+def _measure_each(points: list[tuple[float, float]]) -> None:
+    coordinates = TypeAdapter(list[Coordinate]).validate_python(points)
+    origin = math.radians(coordinates[0].latitude), math.radians(coordinates[0].longitude)
+    for coordinate in coordinates:
+        latitude, longitude = math.radians(coordinate.latitude), math.radians(coordinate.longitude)
+        a = (
+            math.sin((latitude - origin[0]) / 2) ** 2
+            + math.cos(origin[0]) * math.cos(latitude) * math.sin((longitude - origin[1]) / 2) ** 2
+        )
+        2 * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def _measure_array(points: list[tuple[float, float]]) -> None:
+    coordinates = TypeAdapter(CoordinateArray).validate_python(points)
+    coordinates.distance_to(coordinates[0])
+
+
+@pytest.mark.parametrize('measure', [_measure_each, _measure_array], ids=['coordinate', 'coordinate-array'])
+def test_coordinate_distances(benchmark: Any, track: list[tuple[float, float]], measure: Any) -> None:
+    benchmark.group = 'coordinate-distances'
+    benchmark.pedantic(measure, (track,), rounds=3)
@@ -0,0 +1,114 @@
+"""`color.parse_str` against the parser it replaced, which tried each pattern in turn."""
+
+from __future__ import annotations
+
+import random
+import re
+from typing import Any, Callable
+
+import pytest
+
+from pydantic_extra_types.color import (
+    COLORS_BY_NAME,
+    RGBA,
+    Color,
+    disable_parse_cache,
+    enable_parse_cache,
+    ints_to_rgba,
+    parse_hsl,
+    parse_str,
+    r_hex_long,
+    r_hex_short,
+    r_hsl,
+    r_hsl_v4_style,
+    r_rgb,
+    r_rgb_v4_style,
+)
+
+N_COLORS = 10_000
+
+
+def _legacy_parse_str(value: str) -> RGBA:
+    value_lower = value.lower()
+    if value_lower in COLORS_BY_NAME:
+        r, g, b = COLORS_BY_NAME[value_lower]
+        return ints_to_rgba(r, g, b, None)
+
+    m = re.fullmatch(r_hex_short, value_lower)
+    if m:
+        *rgb, a = m.groups()
+        r, g, b = (int(v * 2, 16) for v in rgb)
+        alpha = int(a * 2, 16) / 255 if a else None
+        return ints_to_rgba(r, g, b, alpha)
+
+    m = re.fullmatch(r_hex_long, value_lower)
+    if m:
+        *rgb, a = m.groups()
+        r, g, b = (int(v, 16) for v in rgb)
+        alpha = int(a, 16) / 255 if a else None
+        return ints_to_rgba(r, g, b, alpha)
+
+    m = re.fullmatch(r_rgb, value_lower) or re.fullmatch(r_rgb_v4_style, value_lower)
+    if m:
+        return ints_to_rgba(*m.groups())  # type: ignore
+
+    m = re.fullmatch(r_hsl, value_lower) or re.fullmatch(r_hsl_v4_style, value_lower)
+    if m:
+        return parse_hsl(*m.groups())  # type: ignore
+
+    if value_lower == 'transparent':
+        return RGBA(0, 0, 0, 0)
+    raise ValueError(value)
+
+
+@pytest.fixture(scope='module')
+def css_colors() -> list[str]:
+    """Colors as they show up in stylesheets: mostly hex, then functional notations, then names."""
+    rng = random.Random(0)
+    names = sorted(COLORS_BY_NAME)
+
+    def channel() -> int:
+        return rng.randint(0, 255)
+
+    makers: list[Callable[[], str]] = [
+        lambda: f'#{rng.getrandbits(24):06x}',
+        lambda: f'#{rng.getrandbits(12):03x}',
+        lambda: f'#{rng.getrandbits(32):08X}',
+        lambda: f'rgb({channel()}, {channel()}, {channel()})',
+        lambda: f'rgba({channel()}, {channel()}, {channel()}, {rng.random():.2f})',
+        lambda: f'rgb({channel()} {channel()} {channel()} / {rng.randint(0, 99)}%)',
+        lambda: f'hsl({rng.randint(0, 359)}, {rng.randint(0, 100)}%, {rng.randint(0, 100)}%)',
+        lambda: f'hsl({rng.randint(0, 359)}deg {rng.randint(0, 100)}% {rng.randint(0, 100)}% / 0.5)',
+        lambda: rng.choice(names),
+    ]
+    weights = [30, 10, 5, 15, 10, 5, 10, 5, 10]
+    return [maker() for maker in rng.choices(makers, weights, k=N_COLORS)]
+
+
+def _parse_each(parse: Callable[[str], RGBA], values: list[str]) -> None:
+    for value in values:
+        parse(value)
+
+
+@pytest.mark.parametrize('parse', [_legacy_parse_str, parse_str], ids=['legacy', 'dispatching'])
+def test_parse_str(benchmark: Any, css_colors: list[str], parse: Callable[[str], RGBA]) -> None:
+    benchmark.group = 'color-parse-str'
+    benchmark(_parse_each, parse, css_colors)
+
+
+def _construct_each(values: list[str]) -> None:
+    for value in values:
+        Color(value)
+
+
+@pytest.mark.parametrize('cache', [False, True], ids=['uncached', 'cached'])
+def test_color_repeated_inputs(benchmark: Any, css_colors: list[str], cache: bool) -> None:
+    """A theme's worth of colors, each validated many times over."""
+    benchmark.group = 'color-repeated'
+    values = css_colors[:300] * 100
+    if cache:
+        enable_parse_cache()
+    try:
+        benchmark(_construct_each, values)
+    finally:
+        disable_parse_cache()
@@ -0,0 +1,132 @@
+"""DataFrame column validation and constraints against validating the rows one at a time, passing
+frames between processes as Arrow IPC streams against pickle, and the JSON serialization modes."""
+
+from __future__ import annotations
+
+import pickle
+import random
+from typing import Annotated, Any, Literal
+
+import pytest
+from pydantic import BaseModel, Field, TypeAdapter
+
+from pydantic_extra_types.country import CountryAlpha2
+from pydantic_extra_types.iban import IBAN, IBAN_COUNTRY_CODE_LENGTH
+
+pd = pytest.importorskip('pandas')
+
+from pydantic_extra_types.pandas import PandasDataFrameValidator, validate_columns  # noqa: E402
+
+N_ROWS = 200_000
+COLUMNS = {'country': CountryAlpha2, 'iban': IBAN}
+# countries whose BBANs are all digits, so that random digits make a valid IBAN
+IBAN_COUNTRIES = ('AT', 'BE', 'DE', 'DK', 'ES', 'FI', 'FR', 'NO', 'PL', 'SE')
+
+
+@pytest.fixture(scope='module')
+def payments() -> Any:
+    rng = random.Random(0)
+    letter_digits = str.maketrans({chr(ord('A') + i): str(10 + i) for i in range(26)})
+    ibans = []
+    for i in range(N_ROWS):
+        country_code = rng.choice(IBAN_COUNTRIES)
+        bban = ''.join(rng.choices('0123456789', k=IBAN_COUNTRY_CODE_LENGTH[country_code] - 4))
+        check = 98 - int(f'{bban}{country_code}00'.translate(letter_digits)) % 97
+        # roughly 1% fail the checksum
+        ibans.append(f'{country_code}{check if i % 100 else (check + 1) % 100:02d}{bban}')
+    # roughly 1% of the countries are unknown
+    countries = sorted(IBAN_COUNTRY_CODE_LENGTH)
+    country_codes = [country if rng.random() > 0.01 else 'XX' for country in rng.choices(countries, k=N_ROWS)]
+    return pd.DataFrame({'country': country_codes, 'iban': ibans})
+
+
+def _validate_rows(df: Any) -> None:
+    adapters = {column: TypeAdapter(annotation) for column, annotation in COLUMNS.items()}
+    for column, adapter in adapters.items():
+        for value in df[column]:
+            try:
+                adapter.validate_python(value)
+            except ValueError:
+                pass
+
+
+def _validate_columns(df: Any) -> None:
+    validate_columns(df, COLUMNS)
+
+
+@pytest.mark.parametrize('validate', [_validate_rows, _validate_columns], ids=['rows', 'columns'])
+def test_dataframe_columns(benchmark: Any, payments: Any, validate: Any) -> None:
+    benchmark.group = 'dataframe-columns'
+    benchmark.pedantic(validate, (payments,), rounds=3)
+
+
+class Order(BaseModel):
+    id: int
+    price: float = Field(ge=0)
+    status: Literal['open', 'paid', 'refunded']
+
+
+ORDER_CONSTRAINTS = PandasDataFrameValidator(
+    dtypes={'id': 'int64', 'price': 'float64'},
+    non_null=['id', 'price', 'status'],
+    unique=['id'],
+    min={'price': 0},
+    categories={'status': ['open', 'paid', 'refunded']},
+)
+
+
+@pytest.fixture(scope='module')
+def orders() -> Any:
+    rng = random.Random(0)
+    return pd.DataFrame(
+        {
+            'id': range(N_ROWS),
+            'price': [rng.uniform(0, 100) for _ in range(N_ROWS)],
+            'status': rng.choices(['open', 'paid', 'refunded'], k=N_ROWS),
+        }
+    )
+
+
+def _validate_order_rows(df: Any) -> None:
+    TypeAdapter(list[Order]).validate_python(df.to_dict('records'))
+
+
+def _validate_order_constraints(df: Any) -> None:
+    TypeAdapter(Annotated[pd.DataFrame, ORDER_CONSTRAINTS]).validate_python(df)
+
+
+@pytest.mark.parametrize('validate', [_validate_order_rows, _validate_order_constraints], ids=['rows', 'constraints'])
+def test_dataframe_constraints(benchmark: Any, orders: Any, validate: Any) -> None:
+    benchmark.group = 'dataframe-constraints'
+    benchmark.pedantic(validate, (orders,), rounds=3)
+
+
+def _pickle_round_trip(df: Any) -> None:
+    pickle.loads(pickle.dumps(df))
+
+
+def _arrow_ipc_round_trip(df: Any) -> None:
+    from pydantic_extra_types.arrow import ArrowTable, to_ipc
+
+    adapter = TypeAdapter(ArrowTable)
+    adapter.validate_python(to_ipc(adapter.validate_python(df)))
+
+
+@pytest.mark.parametrize(
+    'round_trip, dtype_backend',
+    [(_pickle_round_trip, 'numpy_nullable'), (_arrow_ipc_round_trip, 'pyarrow')],
+    ids=['pickle', 'arrow-ipc'],
+)
+def test_dataframe_transfer(benchmark: Any, orders: Any, round_trip: Any, dtype_backend: str) -> None:
+    pytest.importorskip('pyarrow')
+    benchmark.group = 'dataframe-transfer'
+    benchmark.pedantic(round_trip, (orders.convert_dtypes(dtype_backend=dtype_backend),), rounds=3)
+
+
+@pytest.mark.parametrize('serialization', ['records', 'split', 'list', 'arrow'])
+def test_dataframe_serialization(benchmark: Any, orders: Any, serialization: str) -> None:
+    if serialization == 'arrow':
+        pytest.importorskip('pyarrow')
+    benchmark.group = 'dataframe-serialization'
+    adapter = TypeAdapter(Annotated[pd.DataFrame, PandasDataFrameValidator(serialization=serialization)])
+    benchmark.pedantic(lambda: adapter.validate_json(adapter.dump_json(orders)), rounds=3)
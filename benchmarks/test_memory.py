@@ -0,0 +1,71 @@
+"""Memory held by validated models, reported in each benchmark's `extra_info`."""
+
+from __future__ import annotations
+
+import gc
+import random
+import tracemalloc
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_extra_types.color import Color
+from pydantic_extra_types.country import CountryAlpha2
+
+N_COLORS = 1_000_000
+N_CODES = 1_000_000
+
+
+class Theme(BaseModel):
+    colors: list[Color]
+
+
+class Shipments(BaseModel):
+    destinations: list[CountryAlpha2]
+
+
+@pytest.fixture(scope='module')
+def hex_colors() -> list[str]:
+    rng = random.Random(0)
+    return [f'#{rng.getrandbits(24):06x}' for _ in range(N_COLORS)]
+
+
+def test_color_model_memory(benchmark: Any, hex_colors: list[str]) -> None:
+    benchmark.group = 'memory'
+    sizes = []
+
+    def validate() -> None:
+        gc.collect()
+        tracemalloc.start()
+        theme = Theme(colors=hex_colors)
+        sizes.append(tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+        del theme
+
+    benchmark.pedantic(validate, rounds=1)
+    bytes_per_color = sizes[0] / N_COLORS
+    benchmark.extra_info['bytes_per_color'] = round(bytes_per_color, 1)
+    # a Color, its RGBA channels and the list slot; the channel floats are shared
+    assert bytes_per_color < 150
+
+
+def test_country_code_model_memory(benchmark: Any) -> None:
+    benchmark.group = 'memory'
+    rng = random.Random(0)
+    codes = [rng.choice(('us', 'de', 'fr', 'jp', 'br', 'in')) for _ in range(N_CODES)]
+    sizes = []
+
+    def validate() -> None:
+        gc.collect()
+        tracemalloc.start()
+        shipments = Shipments(destinations=codes)
+        sizes.append(tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+        del shipments
+
+    benchmark.pedantic(validate, rounds=1)
+    bytes_per_code = sizes[0] / N_CODES
+    benchmark.extra_info['bytes_per_code'] = round(bytes_per_code, 1)
+    # only the list slot, every validated code is the shared instance
+    assert bytes_per_code < 10
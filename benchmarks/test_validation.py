@@ -0,0 +1,79 @@
+"""Validation and serialization throughput for every type listed in `benchmarks.cases`.
+
+Run with `make benchmark`, or compare against a saved run with
+`pytest benchmarks --benchmark-compare`.
+"""
+
+from __future__ import annotations
+
+import json
+import warnings
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from benchmarks.cases import CASES, BenchCase
+
+KINDS = ('valid', 'invalid', 'mixed')
+
+
+def _adapter(case: BenchCase) -> TypeAdapter[list[Any]]:
+    try:
+        annotation = case.load()
+    except (ImportError, RuntimeError) as e:  # missing optional dependency
+        pytest.skip(str(e))
+    with warnings.catch_warnings():
+        # `semver.ManifestVersion` is deprecated but still public
+        warnings.simplefilter('ignore', DeprecationWarning)
+        return TypeAdapter(list[annotation])  # type: ignore[valid-type]
+
+
+def _validate_python(adapter: TypeAdapter[list[Any]], values: list[Any]) -> None:
+    try:
+        adapter.validate_python(values)
+    except ValidationError:
+        pass
+
+
+def _validate_json(adapter: TypeAdapter[list[Any]], data: str) -> None:
+    try:
+        adapter.validate_json(data)
+    except ValidationError:
+        pass
+
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('case', CASES, ids=[case.name for case in CASES])
+def test_validate_python(benchmark: Any, case: BenchCase, kind: str) -> None:
+    adapter = _adapter(case)
+    values = case.inputs(kind)
+    benchmark.group = f'validate_python-{kind}'
+    benchmark.extra_info['items'] = len(values)
+    benchmark(_validate_python, adapter, values)
+
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('case', CASES, ids=[case.name for case in CASES])
+def test_validate_json(benchmark: Any, case: BenchCase, kind: str) -> None:
+    adapter = _adapter(case)
+    values = case.inputs(kind)
+    benchmark.group = f'validate_json-{kind}'
+    benchmark.extra_info['items'] = len(values)
+    benchmark(_validate_json, adapter, json.dumps(values))
+
+
+@pytest.mark.parametrize('mode', ['python', 'jsonable', 'json'])
+@pytest.mark.parametrize('case', CASES, ids=[case.name for case in CASES])
+def test_serialize(benchmark: Any, case: BenchCase, mode: str) -> None:
+    # `python` dumps Python objects, `jsonable` JSON-compatible Python objects and `json` a JSON string
+    adapter = _adapter(case)
+    validated = adapter.validate_python(case.inputs('valid'))
+    benchmark.group = f'serialize-{mode}'
+    benchmark.extra_info['items'] = len(validated)
+    if mode == 'json':
+        benchmark(adapter.dump_json, validated)
+    elif mode == 'jsonable':
+        benchmark(adapter.dump_python, validated, mode='json')
+    else:
+        benchmark(adapter.dump_python, validated)
@@ -1,7 +1,210 @@
 __version__ = '2.11.2'
 
-from pydantic_extra_types.color import Color
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = [
+if TYPE_CHECKING:
+    from pydantic_extra_types.arrow import ArrowArray, ArrowTable, ArrowTableValidator
+    from pydantic_extra_types.color import Color, ColorArray
+    from pydantic_extra_types.coordinate import Coordinate, CoordinateArray, Latitude, Longitude
+    from pydantic_extra_types.country import (
+        CountryAlpha2,
+        CountryAlpha3,
+        CountryName,
+        CountryNumericCode,
+        CountryShortName,
+    )
+    from pydantic_extra_types.cron import CronStr
+    from pydantic_extra_types.currency_code import ISO4217, Currency
+    from pydantic_extra_types.domain import DomainStr
+    from pydantic_extra_types.dsn import (
+        AmqpDsn,
+        ClickHouseDsn,
+        CockroachDsn,
+        KafkaDsn,
+        MariaDBDsn,
+        MongoDsn,
+        MySQLDsn,
+        NatsDsn,
+        PostgresDsn,
+        RedisDsn,
+        SnowflakeDsn,
+    )
+    from pydantic_extra_types.iban import IBAN
+    from pydantic_extra_types.isbn import ISBN
+    from pydantic_extra_types.isin import ISIN
+    from pydantic_extra_types.json_schema import JsonSchema
+    from pydantic_extra_types.language_code import ISO639_3, ISO639_5, LanguageAlpha2, LanguageName
+    from pydantic_extra_types.mac_address import MacAddress
+    from pydantic_extra_types.mime_types import MimeType
+    from pydantic_extra_types.mongo_object_id import MongoObjectId
+    from pydantic_extra_types.pandas import (
+        PandasDataFrame,
+        PandasDataFrameStream,
+        PandasDataFrameValidator,
+        PandasSeries,
+    )
+    from pydantic_extra_types.path import (
+        ResolvedDirectoryPath,
+        ResolvedExistingPath,
+        ResolvedFilePath,
+        ResolvedNewPath,
+    )
+    from pydantic_extra_types.payment import PaymentCardBrand, PaymentCardNumber
+    from pydantic_extra_types.phone_numbers import PhoneNumber, PhoneNumberValidator
+    from pydantic_extra_types.routing_number import ABARoutingNumber
+    from pydantic_extra_types.s3 import S3Path
+    from pydantic_extra_types.script_code import ISO_15924
+    from pydantic_extra_types.semantic_version import SemanticVersion
+    from pydantic_extra_types.timezone_name import TimeZoneName
+    from pydantic_extra_types.ulid import ULID
+    from pydantic_extra_types.uuid_types import UUID6, UUID7, UUID8
+
+# Types are imported on first access (PEP 562) so that importing the package only pays for the
+# modules that are actually used; several of them build large lookup tables or need optional extras.
+# `epoch` and `pendulum_dt` are not re-exported because their generic names (`Number`, `DateTime`, ...)
+# only make sense qualified by their module.
+_dynamic_imports: dict[str, str] = {
+    'ArrowArray': 'arrow',
+    'ArrowTable': 'arrow',
+    'ArrowTableValidator': 'arrow',
+    'Color': 'color',
+    'ColorArray': 'color',
+    'Coordinate': 'coordinate',
+    'CoordinateArray': 'coordinate',
+    'Latitude': 'coordinate',
+    'Longitude': 'coordinate',
+    'CountryAlpha2': 'country',
+    'CountryAlpha3': 'country',
+    'CountryName': 'country',
+    'CountryNumericCode': 'country',
+    'CountryShortName': 'country',
+    'CronStr': 'cron',
+    'Currency': 'currency_code',
+    'ISO4217': 'currency_code',
+    'DomainStr': 'domain',
+    'AmqpDsn': 'dsn',
+    'ClickHouseDsn': 'dsn',
+    'CockroachDsn': 'dsn',
+    'KafkaDsn': 'dsn',
+    'MariaDBDsn': 'dsn',
+    'MongoDsn': 'dsn',
+    'MySQLDsn': 'dsn',
+    'NatsDsn': 'dsn',
+    'PostgresDsn': 'dsn',
+    'RedisDsn': 'dsn',
+    'SnowflakeDsn': 'dsn',
+    'IBAN': 'iban',
+    'ISBN': 'isbn',
+    'ISIN': 'isin',
+    'JsonSchema': 'json_schema',
+    'ISO639_3': 'language_code',
+    'ISO639_5': 'language_code',
+    'LanguageAlpha2': 'language_code',
+    'LanguageName': 'language_code',
+    'MacAddress': 'mac_address',
+    'MimeType': 'mime_types',
+    'MongoObjectId': 'mongo_object_id',
+    'PandasDataFrame': 'pandas',
+    'PandasDataFrameStream': 'pandas',
+    'PandasDataFrameValidator': 'pandas',
+    'PandasSeries': 'pandas',
+    'ResolvedDirectoryPath': 'path',
+    'ResolvedExistingPath': 'path',
+    'ResolvedFilePath': 'path',
+    'ResolvedNewPath': 'path',
+    'PaymentCardBrand': 'payment',
+    'PaymentCardNumber': 'payment',
+    'PhoneNumber': 'phone_numbers',
+    'PhoneNumberValidator': 'phone_numbers',
+    'ABARoutingNumber': 'routing_number',
+    'S3Path': 's3',
+    'ISO_15924': 'script_code',
+    'SemanticVersion': 'semantic_version',
+    'TimeZoneName': 'timezone_name',
+    'ULID': 'ulid',
+    'UUID6': 'uuid_types',
+    'UUID7': 'uuid_types',
+    'UUID8': 'uuid_types',
+}
+
+__all__ = (
+    '__version__',
+    'ArrowArray',
+    'ArrowTable',
+    'ArrowTableValidator',
     'Color',
-]
+    'ColorArray',
+    'Coordinate',
+    'CoordinateArray',
+    'Latitude',
+    'Longitude',
+    'CountryAlpha2',
+    'CountryAlpha3',
+    'CountryName',
+    'CountryNumericCode',
+    'CountryShortName',
+    'CronStr',
+    'Currency',
+    'ISO4217',
+    'DomainStr',
+    'AmqpDsn',
+    'ClickHouseDsn',
+    'CockroachDsn',
+    'KafkaDsn',
+    'MariaDBDsn',
+    'MongoDsn',
+    'MySQLDsn',
+    'NatsDsn',
+    'PostgresDsn',
+    'RedisDsn',
+    'SnowflakeDsn',
+    'IBAN',
+    'ISBN',
+    'ISIN',
+    'JsonSchema',
+    'ISO639_3',
+    'ISO639_5',
+    'LanguageAlpha2',
+    'LanguageName',
+    'MacAddress',
+    'MimeType',
+    'MongoObjectId',
+    'PandasDataFrame',
+    'PandasDataFrameStream',
+    'PandasDataFrameValidator',
+    'PandasSeries',
+    'ResolvedDirectoryPath',
+    'ResolvedExistingPath',
+    'ResolvedFilePath',
+    'ResolvedNewPath',
+    'PaymentCardBrand',
+    'PaymentCardNumber',
+    'PhoneNumber',
+    'PhoneNumberValidator',
+    'ABARoutingNumber',
+    'S3Path',
+    'ISO_15924',
+    'SemanticVersion',
+    'TimeZoneName',
+    'ULID',
+    'UUID6',
+    'UUID7',
+    'UUID8',
+)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _dynamic_imports.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    module = import_module(f'.{module_name}', __name__)
+    result = getattr(module, name)
+    # cache the attribute so `__getattr__` is only hit once per name
+    globals()[name] = result
+    return result
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
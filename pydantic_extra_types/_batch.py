@@ -0,0 +1,110 @@
+"""Helpers behind the `validate_many` classmethods of the string types.
+
+Validating through a pydantic schema costs a `ValidationInfo` and a Python callback per value,
+and raises on the first bad one. These helpers validate a whole column in one loop instead and
+collect failures as `(index, error_type)` pairs, where `error_type` is the same error type the
+schema would report.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Container, Iterable
+from typing import Any, Callable, Optional, TypeVar
+
+from pydantic_core import PydanticCustomError
+
+T = TypeVar('T')
+
+BatchErrors = list[tuple[int, str]]
+"""`(index, error_type)` for every value that failed validation, in input order."""
+BatchResult = tuple[list[T], BatchErrors]
+"""The values that passed validation, in input order, and the errors for those that did not."""
+
+
+def as_iterable(values: Iterable[Any]) -> Iterable[Any]:
+    """Convert Arrow and NumPy/pandas arrays to Python lists in one go rather than one scalar at a time."""
+    to_pylist = getattr(values, 'to_pylist', None)
+    if to_pylist is not None:
+        return to_pylist()  # type: ignore[no-any-return]
+    tolist = getattr(values, 'tolist', None)
+    if tolist is not None:
+        return tolist()  # type: ignore[no-any-return]
+    return values
+
+
+def _decode(value: Any) -> tuple[str, Optional[str]]:
+    """Decode a non-`str` value the way pydantic's lax string schema does, returning it and the error type if any."""
+    if isinstance(value, (bytes, bytearray)):
+        try:
+            return value.decode(), None
+        except UnicodeDecodeError:
+            return '', 'string_unicode'
+    return '', 'string_type'
+
+
+def validate_codes(
+    values: Iterable[Any],
+    allowed: Container[str],
+    factory: Callable[[str], T],
+    error_type: str,
+    *,
+    normalize: Optional[Callable[[str], str]] = None,
+    length: Optional[int] = None,
+) -> BatchResult[T]:
+    """Validate values against a fixed set of codes.
+
+    Args:
+        values: The values to validate.
+        allowed: The valid codes, after normalization.
+        factory: Builds the validated value from a normalized code.
+        error_type: The error type reported for values not in `allowed`.
+        normalize: Applied to each string before the lookup, e.g. `str.upper`.
+        length: The exact length codes must have, checked before the lookup like the schema does.
+    """
+    valid: list[T] = []
+    errors: BatchErrors = []
+    for index, value in enumerate(as_iterable(values)):
+        if not isinstance(value, str):
+            value, error = _decode(value)
+            if error is not None:
+                errors.append((index, error))
+                continue
+        if length is not None and len(value) != length:
+            errors.append((index, 'string_too_short' if len(value) < length else 'string_too_long'))
+            continue
+        if normalize is not None:
+            value = normalize(value)
+        if value in allowed:
+            valid.append(factory(value))
+        else:
+            errors.append((index, error_type))
+    return valid, errors
+
+
+def validate_each(
+    values: Iterable[Any], validate: Callable[[str], T], *, type_error: Optional[str] = None
+) -> BatchResult[T]:
+    """Validate strings with a function that raises `PydanticCustomError`, for types with more than a lookup.
+
+    Args:
+        values: The values to validate.
+        validate: Validates a single string.
+        type_error: The error type reported for every value that is not a `str`, for types that check the input
+            themselves before the string schema. By default bytes are decoded like the string schema does.
+    """
+    valid: list[T] = []
+    errors: BatchErrors = []
+    for index, value in enumerate(as_iterable(values)):
+        if not isinstance(value, str):
+            if type_error is not None:
+                errors.append((index, type_error))
+                continue
+            value, error = _decode(value)
+            if error is not None:
+                errors.append((index, error))
+                continue
+        try:
+            valid.append(validate(value))
+        except PydanticCustomError as e:
+            errors.append((index, e.type))
+    return valid, errors
@@ -0,0 +1,90 @@
+"""The bounded LRU cache behind the opt-in parse caches of `phone_numbers` and `color`.
+
+Unlike `functools.lru_cache` it can be resized and switched off at runtime, and it caches
+validation errors as well as results, so that repeated bad input is rejected as cheaply as
+repeated good input is accepted.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Callable, Generic, TypeVar, Union
+
+from pydantic_core import PydanticCustomError
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+@dataclass(frozen=True)
+class ParseCacheInfo:
+    """Statistics of a parse cache, like `functools.lru_cache`'s `cache_info()`."""
+
+    hits: int
+    """Lookups answered from the cache."""
+    misses: int
+    """Lookups that had to parse the input."""
+    maxsize: int
+    """The maximum number of entries, 0 while the cache is disabled."""
+    currsize: int
+    """The current number of entries."""
+
+
+class ParseCache(Generic[K, V]):
+    """A bounded LRU cache of parse results, safe to share between threads without relying on the GIL.
+
+    It starts disabled, with a `maxsize` of 0.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # the parsed value, or the error the input failed with
+        self._entries: OrderedDict[K, Union[V, PydanticCustomError]] = OrderedDict()
+        self.maxsize = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K, parse: Callable[[], V]) -> V:
+        """Look `key` up, calling `parse` to compute and store its value on a miss.
+
+        Raises:
+            PydanticCustomError: The error `parse` raised for this key, now or on an earlier miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is None:
+            try:
+                entry = parse()
+            except PydanticCustomError as exc:
+                entry = exc
+            with self._lock:
+                self._entries[key] = entry
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        if isinstance(entry, PydanticCustomError):
+            # a new error each time, a shared one would accumulate tracebacks
+            raise PydanticCustomError(entry.type, entry.message_template, entry.context)
+        return entry
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> ParseCacheInfo:
+        with self._lock:
+            return ParseCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
@@ -0,0 +1,51 @@
+"""The core schema shared by the types whose values come from a fixed set of codes.
+
+Country, language, currency and script codes used to be checked by a Python validator: a function
+call, a lookup of the lazily built index, and a dict lookup per value. Here the set of codes becomes
+a `literal` schema instead, which pydantic-core checks against its own hash table without calling
+into Python. The literal's values are the one canonical instance of each code, and pydantic-core
+returns the matching one as it is, so validation allocates nothing and every model holding a code
+shares the same object.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Optional
+
+from pydantic_core import core_schema
+
+
+def code_schema(
+    str_schema: core_schema.StringSchema,
+    codes: Iterable[str],
+    error_type: str,
+    error_message: str,
+    *,
+    serialization: Optional[core_schema.SerSchema] = None,
+) -> core_schema.CoreSchema:
+    """Validate a string with `str_schema`, then check it is one of `codes`.
+
+    Args:
+        str_schema: Normalizes the input, e.g. upper-casing it, and checks its length.
+        codes: The canonical instances of the valid values, after normalization. Validation returns these.
+        error_type: The error type raised for values that are not in `codes`.
+        error_message: The message of that error.
+        serialization: A custom serialization schema.
+
+    Returns:
+        The core schema.
+    """
+    membership = core_schema.custom_error_schema(
+        core_schema.literal_schema(list(codes)),
+        custom_error_type=error_type,
+        custom_error_message=error_message,
+    )
+    # describe the values by `str_schema` alone, the literal would list every code in the JSON schema
+    schema = core_schema.chain_schema(
+        [str_schema, membership],
+        metadata={'pydantic_js_functions': [lambda _, handler: handler(str_schema)]},
+    )
+    if serialization is not None:
+        schema['serialization'] = serialization
+    return schema
@@ -0,0 +1,105 @@
+"""The errors shared by the DataFrame and Arrow table types.
+
+Both report every failing column of a frame in one `PydanticCustomError`: the message counts the
+failing rows of each column, and its context lists each error with a sample of its rows.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from pydantic_core import PydanticCustomError
+
+SAMPLE_ROWS = 10
+"""The number of failing rows of each error listed in the context of a `PydanticCustomError`."""
+
+
+@dataclass(frozen=True)
+class ColumnError:
+    """The rows of a column whose values failed validation with the same error."""
+
+    column: str
+    """The column name."""
+    type: str
+    """The error type, as reported when validating one of the values against the column's type,
+    or the constraint that failed."""
+    rows: list[Any]
+    """The index labels of the failing rows, or their positions in an Arrow table, in order. Empty for
+    `dtype` errors, which fail the whole column."""
+    ctx: Optional[dict[str, Any]] = None
+    """The values of the failed constraint, e.g. `{'ge': 0}`."""
+
+
+def format_column_errors(errors: list[ColumnError]) -> str:
+    rows: dict[str, int] = {}
+    dtypes: dict[str, str] = {}
+    for error in errors:
+        rows[error.column] = rows.get(error.column, 0) + len(error.rows)
+        if error.type == 'dtype' and error.ctx is not None:
+            expected = error.ctx.get('expected')
+            dtypes[error.column] = f'dtype {error.ctx["actual"]}' + (f', expected {expected}' if expected else '')
+
+    def describe(column: str) -> str:
+        count = rows[column]
+        if column in dtypes:
+            return dtypes[column] + (f'; {count} row{"" if count == 1 else "s"}' if count else '')
+        return f'{count} row{"" if count == 1 else "s"}'
+
+    return ', '.join(f'{column!r} ({describe(column)})' for column in rows)
+
+
+def check_required_columns(
+    kind: str, required_columns: Optional[list[str]], columns: Iterable[str], present: Collection[str]
+) -> None:
+    """Raise unless the *present* columns of a *kind*, e.g. `'DataFrame'`, include the required ones once each.
+
+    A label that appears more than once selects several columns, which cannot be checked as one.
+
+    Args:
+        kind: The name of the frame type in the error message.
+        required_columns: The columns that must be present.
+        columns: More columns that must be present, those with a type or a constraint.
+        present: The columns of the frame.
+    """
+    required = list(required_columns or ())
+    required += [col for col in dict.fromkeys(columns) if col not in required]
+    counts = Counter(present)
+    missing = [col for col in required if not counts[col]]
+    if missing:
+        raise PydanticCustomError(
+            'value_error',
+            '{} is missing required columns: {}'.format(kind, ', '.join(missing)),
+        )
+    duplicated = [col for col in required if counts[col] > 1]
+    if duplicated:
+        raise PydanticCustomError(
+            'value_error',
+            '{} has duplicate columns: {}'.format(kind, ', '.join(duplicated)),
+        )
+
+
+def _error_context(error: ColumnError) -> dict[str, Any]:
+    context = {
+        'column': error.column,
+        'type': error.type,
+        'count': len(error.rows),
+        'rows': error.rows[:SAMPLE_ROWS],
+    }
+    if error.ctx is not None:
+        context['ctx'] = error.ctx
+    return context
+
+
+def column_values_error(kind: str, errors: list[ColumnError]) -> PydanticCustomError:
+    """The error listing the failing rows of every column of a *kind*, e.g. `'DataFrame'`."""
+    return PydanticCustomError(
+        'value_error',
+        f'{kind} has invalid values in {{columns}}',
+        {
+            'columns': format_column_errors(errors),
+            'errors': [_error_context(error) for error in errors],
+        },
+    )
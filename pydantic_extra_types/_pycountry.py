@@ -0,0 +1,117 @@
+"""Reference data for the `pycountry`-backed types.
+
+Walking pycountry's JSON databases takes a noticeable share of the cold start of short-lived
+processes, so by default the data is loaded from `_pycountry_snapshot`, a module of plain tuples
+generated from pycountry at build time. Set the `PYDANTIC_EXTRA_TYPES_PYCOUNTRY_LIVE` environment
+variable to `1` before importing the types to read the installed pycountry instead.
+
+The snapshot is regenerated with `make pycountry-snapshot`, which runs this module as a script.
+"""
+
+from __future__ import annotations
+
+import os
+import pprint
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from types import ModuleType
+from typing import Optional
+
+LIVE_DATA_ENV = 'PYDANTIC_EXTRA_TYPES_PYCOUNTRY_LIVE'
+"""Environment variable that switches the reference data from the bundled snapshot to the installed pycountry."""
+
+CountryRecord = tuple[str, str, str, str]
+"""`(alpha2, alpha3, numeric_code, short_name)`"""
+CountryAliasRecord = tuple[str, str]
+"""`(name, alpha2)`"""
+LanguageRecord = tuple[Optional[str], str, str]
+"""`(alpha2, alpha3, name)`"""
+
+
+def use_live_data() -> bool:
+    """Whether the reference data should be read from the installed pycountry rather than the snapshot."""
+    return os.environ.get(LIVE_DATA_ENV, '').lower() in {'1', 'true', 'yes'}
+
+
+def _import_pycountry() -> ModuleType:
+    try:
+        import pycountry
+    except ModuleNotFoundError as e:  # pragma: no cover
+        raise RuntimeError(
+            f'Live reference data (`{LIVE_DATA_ENV}`) requires "pycountry" to be installed.'
+            ' You can install it with "pip install pycountry".'
+        ) from e
+    return pycountry
+
+
+@dataclass(frozen=True)
+class ReferenceData:
+    """The subset of pycountry the types need, as plain tuples."""
+
+    pycountry_version: str
+    countries: tuple[CountryRecord, ...]
+    """ISO 3166-1 countries."""
+    country_aliases: tuple[CountryAliasRecord, ...]
+    """The official and common names of countries, where they differ from the short name."""
+    languages: tuple[LanguageRecord, ...]
+    """ISO 639-3 languages."""
+    language_families: tuple[str, ...]
+    """ISO 639-5 language family codes."""
+    currencies: tuple[str, ...]
+    """ISO 4217 currency codes."""
+    scripts: tuple[str, ...]
+    """ISO 15924 script codes."""
+
+
+def _live_data() -> ReferenceData:
+    from importlib.metadata import version
+
+    pycountry = _import_pycountry()
+    return ReferenceData(
+        pycountry_version=version('pycountry'),
+        countries=tuple((c.alpha_2, c.alpha_3, c.numeric, c.name) for c in pycountry.countries),
+        country_aliases=tuple(
+            (name, c.alpha_2)
+            for c in pycountry.countries
+            for name in dict.fromkeys((getattr(c, 'official_name', c.name), getattr(c, 'common_name', c.name)))
+            if name != c.name
+        ),
+        languages=tuple((getattr(lang, 'alpha_2', None), lang.alpha_3, lang.name) for lang in pycountry.languages),
+        language_families=tuple(family.alpha_3 for family in pycountry.language_families),
+        currencies=tuple(currency.alpha_3 for currency in pycountry.currencies),
+        scripts=tuple(script.alpha_4 for script in pycountry.scripts),
+    )
+
+
+def _snapshot_data() -> ReferenceData:
+    from pydantic_extra_types import _pycountry_snapshot
+
+    return ReferenceData(
+        **{field.name: getattr(_pycountry_snapshot, field.name.upper()) for field in fields(ReferenceData)}
+    )
+
+
+@lru_cache
+def reference_data() -> ReferenceData:
+    """The reference data, from the snapshot unless live data was requested via `PYDANTIC_EXTRA_TYPES_PYCOUNTRY_LIVE`."""
+    return _live_data() if use_live_data() else _snapshot_data()
+
+
+def generate_snapshot() -> str:
+    """Render the source of the `_pycountry_snapshot` module from the installed pycountry."""
+    lines = [
+        '# This file is generated by `make pycountry-snapshot` from the installed pycountry, do not edit it by hand.',
+        '# fmt: off',
+    ]
+    data = _live_data()
+    for field in fields(ReferenceData):
+        value = pprint.pformat(getattr(data, field.name), width=120, compact=True)
+        lines.append(f'{field.name.upper()} = {value}')
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':  # pragma: no cover
+    snapshot_path = os.path.join(os.path.dirname(__file__), '_pycountry_snapshot.py')
+    with open(snapshot_path, 'w', encoding='utf-8') as f:
+        f.write(generate_snapshot())
+    print(f'wrote {snapshot_path}')
@@ -0,0 +1,2292 @@
+# This file is generated by `make pycountry-snapshot` from the installed pycountry, do not edit it by hand.
+# fmt: off
+PYCOUNTRY_VERSION = '24.6.1'
+COUNTRIES = (('AW', 'ABW', '533', 'Aruba'), ('AF', 'AFG', '004', 'Afghanistan'), ('AO', 'AGO', '024', 'Angola'),
+ ('AI', 'AIA', '660', 'Anguilla'), ('AX', 'ALA', '248', 'Åland Islands'), ('AL', 'ALB', '008', 'Albania'),
+ ('AD', 'AND', '020', 'Andorra'), ('AE', 'ARE', '784', 'United Arab Emirates'), ('AR', 'ARG', '032', 'Argentina'),
+ ('AM', 'ARM', '051', 'Armenia'), ('AS', 'ASM', '016', 'American Samoa'), ('AQ', 'ATA', '010', 'Antarctica'),
+ ('TF', 'ATF', '260', 'French Southern Territories'), ('AG', 'ATG', '028', 'Antigua and Barbuda'),
+ ('AU', 'AUS', '036', 'Australia'), ('AT', 'AUT', '040', 'Austria'), ('AZ', 'AZE', '031', 'Azerbaijan'),
+ ('BI', 'BDI', '108', 'Burundi'), ('BE', 'BEL', '056', 'Belgium'), ('BJ', 'BEN', '204', 'Benin'),
+ ('BQ', 'BES', '535', 'Bonaire, Sint Eustatius and Saba'), ('BF', 'BFA', '854', 'Burkina Faso'),
+ ('BD', 'BGD', '050', 'Bangladesh'), ('BG', 'BGR', '100', 'Bulgaria'), ('BH', 'BHR', '048', 'Bahrain'),
+ ('BS', 'BHS', '044', 'Bahamas'), ('BA', 'BIH', '070', 'Bosnia and Herzegovina'),
+ ('BL', 'BLM', '652', 'Saint Barthélemy'), ('BY', 'BLR', '112', 'Belarus'), ('BZ', 'BLZ', '084', 'Belize'),
+ ('BM', 'BMU', '060', 'Bermuda'), ('BO', 'BOL', '068', 'Bolivia, Plurinational State of'),
+ ('BR', 'BRA', '076', 'Brazil'), ('BB', 'BRB', '052', 'Barbados'), ('BN', 'BRN', '096', 'Brunei Darussalam'),
+ ('BT', 'BTN', '064', 'Bhutan'), ('BV', 'BVT', '074', 'Bouvet Island'), ('BW', 'BWA', '072', 'Botswana'),
+ ('CF', 'CAF', '140', 'Central African Republic'), ('CA', 'CAN', '124', 'Canada'),
+ ('CC', 'CCK', '166', 'Cocos (Keeling) Islands'), ('CH', 'CHE', '756', 'Switzerland'), ('CL', 'CHL', '152', 'Chile'),
+ ('CN', 'CHN', '156', 'China'), ('CI', 'CIV', '384', "Côte d'Ivoire"), ('CM', 'CMR', '120', 'Cameroon'),
+ ('CD', 'COD', '180', 'Congo, The Democratic Republic of the'), ('CG', 'COG', '178', 'Congo'),
+ ('CK', 'COK', '184', 'Cook Islands'), ('CO', 'COL', '170', 'Colombia'), ('KM', 'COM', '174', 'Comoros'),
+ ('CV', 'CPV', '132', 'Cabo Verde'), ('CR', 'CRI', '188', 'Costa Rica'), ('CU', 'CUB', '192', 'Cuba'),
+ ('CW', 'CUW', '531', 'Curaçao'), ('CX', 'CXR', '162', 'Christmas Island'), ('KY', 'CYM', '136', 'Cayman Islands'),
+ ('CY', 'CYP', '196', 'Cyprus'), ('CZ', 'CZE', '203', 'Czechia'), ('DE', 'DEU', '276', 'Germany'),
+ ('DJ', 'DJI', '262', 'Djibouti'), ('DM', 'DMA', '212', 'Dominica'), ('DK', 'DNK', '208', 'Denmark'),
+ ('DO', 'DOM', '214', 'Dominican Republic'), ('DZ', 'DZA', '012', 'Algeria'), ('EC', 'ECU', '218', 'Ecuador'),
+ ('EG', 'EGY', '818', 'Egypt'), ('ER', 'ERI', '232', 'Eritrea'), ('EH', 'ESH', '732', 'Western Sahara'),
+ ('ES', 'ESP', '724', 'Spain'), ('EE', 'EST', '233', 'Estonia'), ('ET', 'ETH', '231', 'Ethiopia'),
+ ('FI', 'FIN', '246', 'Finland'), ('FJ', 'FJI', '242', 'Fiji'), ('FK', 'FLK', '238', 'Falkland Islands (Malvinas)'),
+ ('FR', 'FRA', '250', 'France'), ('FO', 'FRO', '234', 'Faroe Islands'),
+ ('FM', 'FSM', '583', 'Micronesia, Federated States of'), ('GA', 'GAB', '266', 'Gabon'),
+ ('GB', 'GBR', '826', 'United Kingdom'), ('GE', 'GEO', '268', 'Georgia'), ('GG', 'GGY', '831', 'Guernsey'),
+ ('GH', 'GHA', '288', 'Ghana'), ('GI', 'GIB', '292', 'Gibraltar'), ('GN', 'GIN', '324', 'Guinea'),
+ ('GP', 'GLP', '312', 'Guadeloupe'), ('GM', 'GMB', '270', 'Gambia'), ('GW', 'GNB', '624', 'Guinea-Bissau'),
+ ('GQ', 'GNQ', '226', 'Equatorial Guinea'), ('GR', 'GRC', '300', 'Greece'), ('GD', 'GRD', '308', 'Grenada'),
+ ('GL', 'GRL', '304', 'Greenland'), ('GT', 'GTM', '320', 'Guatemala'), ('GF', 'GUF', '254', 'French Guiana'),
+ ('GU', 'GUM', '316', 'Guam'), ('GY', 'GUY', '328', 'Guyana'), ('HK', 'HKG', '344', 'Hong Kong'),
+ ('HM', 'HMD', '334', 'Heard Island and McDonald Islands'), ('HN', 'HND', '340', 'Honduras'),
+ ('HR', 'HRV', '191', 'Croatia'), ('HT', 'HTI', '332', 'Haiti'), ('HU', 'HUN', '348', 'Hungary'),
+ ('ID', 'IDN', '360', 'Indonesia'), ('IM', 'IMN', '833', 'Isle of Man'), ('IN', 'IND', '356', 'India'),
+ ('IO', 'IOT', '086', 'British Indian Ocean Territory'), ('IE', 'IRL', '372', 'Ireland'),
+ ('IR', 'IRN', '364', 'Iran, Islamic Republic of'), ('IQ', 'IRQ', '368', 'Iraq'), ('IS', 'ISL', '352', 'Iceland'),
+ ('IL', 'ISR', '376', 'Israel'), ('IT', 'ITA', '380', 'Italy'), ('JM', 'JAM', '388', 'Jamaica'),
+ ('JE', 'JEY', '832', 'Jersey'), ('JO', 'JOR', '400', 'Jordan'), ('JP', 'JPN', '392', 'Japan'),
+ ('KZ', 'KAZ', '398', 'Kazakhstan'), ('KE', 'KEN', '404', 'Kenya'), ('KG', 'KGZ', '417', 'Kyrgyzstan'),
+ ('KH', 'KHM', '116', 'Cambodia'), ('KI', 'KIR', '296', 'Kiribati'), ('KN', 'KNA', '659', 'Saint Kitts and Nevis'),
+ ('KR', 'KOR', '410', 'Korea, Republic of'), ('KW', 'KWT', '414', 'Kuwait'),
+ ('LA', 'LAO', '418', "Lao People's Democratic Republic"), ('LB', 'LBN', '422', 'Lebanon'),
+ ('LR', 'LBR', '430', 'Liberia'), ('LY', 'LBY', '434', 'Libya'), ('LC', 'LCA', '662', 'Saint Lucia'),
+ ('LI', 'LIE', '438', 'Liechtenstein'), ('LK', 'LKA', '144', 'Sri Lanka'), ('LS', 'LSO', '426', 'Lesotho'),
+ ('LT', 'LTU', '440', 'Lithuania'), ('LU', 'LUX', '442', 'Luxembourg'), ('LV', 'LVA', '428', 'Latvia'),
+ ('MO', 'MAC', '446', 'Macao'), ('MF', 'MAF', '663', 'Saint Martin (French part)'), ('MA', 'MAR', '504', 'Morocco'),
+ ('MC', 'MCO', '492', 'Monaco'), ('MD', 'MDA', '498', 'Moldova, Republic of'), ('MG', 'MDG', '450', 'Madagascar'),
+ ('MV', 'MDV', '462', 'Maldives'), ('MX', 'MEX', '484', 'Mexico'), ('MH', 'MHL', '584', 'Marshall Islands'),
+ ('MK', 'MKD', '807', 'North Macedonia'), ('ML', 'MLI', '466', 'Mali'), ('MT', 'MLT', '470', 'Malta'),
+ ('MM', 'MMR', '104', 'Myanmar'), ('ME', 'MNE', '499', 'Montenegro'), ('MN', 'MNG', '496', 'Mongolia'),
+ ('MP', 'MNP', '580', 'Northern Mariana Islands'), ('MZ', 'MOZ', '508', 'Mozambique'),
+ ('MR', 'MRT', '478', 'Mauritania'), ('MS', 'MSR', '500', 'Montserrat'), ('MQ', 'MTQ', '474', 'Martinique'),
+ ('MU', 'MUS', '480', 'Mauritius'), ('MW', 'MWI', '454', 'Malawi'), ('MY', 'MYS', '458', 'Malaysia'),
+ ('YT', 'MYT', '175', 'Mayotte'), ('NA', 'NAM', '516', 'Namibia'), ('NC', 'NCL', '540', 'New Caledonia'),
+ ('NE', 'NER', '562', 'Niger'), ('NF', 'NFK', '574', 'Norfolk Island'), ('NG', 'NGA', '566', 'Nigeria'),
+ ('NI', 'NIC', '558', 'Nicaragua'), ('NU', 'NIU', '570', 'Niue'), ('NL', 'NLD', '528', 'Netherlands'),
+ ('NO', 'NOR', '578', 'Norway'), ('NP', 'NPL', '524', 'Nepal'), ('NR', 'NRU', '520', 'Nauru'),
+ ('NZ', 'NZL', '554', 'New Zealand'), ('OM', 'OMN', '512', 'Oman'), ('PK', 'PAK', '586', 'Pakistan'),
+ ('PA', 'PAN', '591', 'Panama'), ('PN', 'PCN', '612', 'Pitcairn'), ('PE', 'PER', '604', 'Peru'),
+ ('PH', 'PHL', '608', 'Philippines'), ('PW', 'PLW', '585', 'Palau'), ('PG', 'PNG', '598', 'Papua New Guinea'),
+ ('PL', 'POL', '616', 'Poland'), ('PR', 'PRI', '630', 'Puerto Rico'),
+ ('KP', 'PRK', '408', "Korea, Democratic People's Republic of"), ('PT', 'PRT', '620', 'Portugal'),
+ ('PY', 'PRY', '600', 'Paraguay'), ('PS', 'PSE', '275', 'Palestine, State of'),
+ ('PF', 'PYF', '258', 'French Polynesia'), ('QA', 'QAT', '634', 'Qatar'), ('RE', 'REU', '638', 'Réunion'),
+ ('RO', 'ROU', '642', 'Romania'), ('RU', 'RUS', '643', 'Russian Federation'), ('RW', 'RWA', '646', 'Rwanda'),
+ ('SA', 'SAU', '682', 'Saudi Arabia'), ('SD', 'SDN', '729', 'Sudan'), ('SN', 'SEN', '686', 'Senegal'),
+ ('SG', 'SGP', '702', 'Singapore'), ('GS', 'SGS', '239', 'South Georgia and the South Sandwich Islands'),
+ ('SH', 'SHN', '654', 'Saint Helena, Ascension and Tristan da Cunha'), ('SJ', 'SJM', '744', 'Svalbard and Jan Mayen'),
+ ('SB', 'SLB', '090', 'Solomon Islands'), ('SL', 'SLE', '694', 'Sierra Leone'), ('SV', 'SLV', '222', 'El Salvador'),
+ ('SM', 'SMR', '674', 'San Marino'), ('SO', 'SOM', '706', 'Somalia'), ('PM', 'SPM', '666', 'Saint Pierre and Miquelon'),
+ ('RS', 'SRB', '688', 'Serbia'), ('SS', 'SSD', '728', 'South Sudan'), ('ST', 'STP', '678', 'Sao Tome and Principe'),
+ ('SR', 'SUR', '740', 'Suriname'), ('SK', 'SVK', '703', 'Slovakia'), ('SI', 'SVN', '705', 'Slovenia'),
+ ('SE', 'SWE', '752', 'Sweden'), ('SZ', 'SWZ', '748', 'Eswatini'), ('SX', 'SXM', '534', 'Sint Maarten (Dutch part)'),
+ ('SC', 'SYC', '690', 'Seychelles'), ('SY', 'SYR', '760', 'Syrian Arab Republic'),
+ ('TC', 'TCA', '796', 'Turks and Caicos Islands'), ('TD', 'TCD', '148', 'Chad'), ('TG', 'TGO', '768', 'Togo'),
+ ('TH', 'THA', '764', 'Thailand'), ('TJ', 'TJK', '762', 'Tajikistan'), ('TK', 'TKL', '772', 'Tokelau'),
+ ('TM', 'TKM', '795', 'Turkmenistan'), ('TL', 'TLS', '626', 'Timor-Leste'), ('TO', 'TON', '776', 'Tonga'),
+ ('TT', 'TTO', '780', 'Trinidad and Tobago'), ('TN', 'TUN', '788', 'Tunisia'), ('TR', 'TUR', '792', 'Türkiye'),
+ ('TV', 'TUV', '798', 'Tuvalu'), ('TW', 'TWN', '158', 'Taiwan, Province of China'),
+ ('TZ', 'TZA', '834', 'Tanzania, United Republic of'), ('UG', 'UGA', '800', 'Uganda'), ('UA', 'UKR', '804', 'Ukraine'),
+ ('UM', 'UMI', '581', 'United States Minor Outlying Islands'), ('UY', 'URY', '858', 'Uruguay'),
+ ('US', 'USA', '840', 'United States'), ('UZ', 'UZB', '860', 'Uzbekistan'),
+ ('VA', 'VAT', '336', 'Holy See (Vatican City State)'), ('VC', 'VCT', '670', 'Saint Vincent and the Grenadines'),
+ ('VE', 'VEN', '862', 'Venezuela, Bolivarian Republic of'), ('VG', 'VGB', '092', 'Virgin Islands, British'),
+ ('VI', 'VIR', '850', 'Virgin Islands, U.S.'), ('VN', 'VNM', '704', 'Viet Nam'), ('VU', 'VUT', '548', 'Vanuatu'),
+ ('WF', 'WLF', '876', 'Wallis and Futuna'), ('WS', 'WSM', '882', 'Samoa'), ('YE', 'YEM', '887', 'Yemen'),
+ ('ZA', 'ZAF', '710', 'South Africa'), ('ZM', 'ZMB', '894', 'Zambia'), ('ZW', 'ZWE', '716', 'Zimbabwe'))
+COUNTRY_ALIASES = (('Islamic Republic of Afghanistan', 'AF'), ('Republic of Angola', 'AO'), ('Republic of Albania', 'AL'),
+ ('Principality of Andorra', 'AD'), ('Argentine Republic', 'AR'), ('Republic of Armenia', 'AM'),
+ ('Republic of Austria', 'AT'), ('Republic of Azerbaijan', 'AZ'), ('Republic of Burundi', 'BI'),
+ ('Kingdom of Belgium', 'BE'), ('Republic of Benin', 'BJ'), ("People's Republic of Bangladesh", 'BD'),
+ ('Republic of Bulgaria', 'BG'), ('Kingdom of Bahrain', 'BH'), ('Commonwealth of the Bahamas', 'BS'),
+ ('Republic of Bosnia and Herzegovina', 'BA'), ('Republic of Belarus', 'BY'), ('Plurinational State of Bolivia', 'BO'),
+ ('Bolivia', 'BO'), ('Federative Republic of Brazil', 'BR'), ('Kingdom of Bhutan', 'BT'),
+ ('Republic of Botswana', 'BW'), ('Swiss Confederation', 'CH'), ('Republic of Chile', 'CL'),
+ ("People's Republic of China", 'CN'), ("Republic of Côte d'Ivoire", 'CI'), ('Republic of Cameroon', 'CM'),
+ ('Republic of the Congo', 'CG'), ('Republic of Colombia', 'CO'), ('Union of the Comoros', 'KM'),
+ ('Republic of Cabo Verde', 'CV'), ('Republic of Costa Rica', 'CR'), ('Republic of Cuba', 'CU'),
+ ('Republic of Cyprus', 'CY'), ('Czech Republic', 'CZ'), ('Federal Republic of Germany', 'DE'),
+ ('Republic of Djibouti', 'DJ'), ('Commonwealth of Dominica', 'DM'), ('Kingdom of Denmark', 'DK'),
+ ("People's Democratic Republic of Algeria", 'DZ'), ('Republic of Ecuador', 'EC'), ('Arab Republic of Egypt', 'EG'),
+ ('the State of Eritrea', 'ER'), ('Kingdom of Spain', 'ES'), ('Republic of Estonia', 'EE'),
+ ('Federal Democratic Republic of Ethiopia', 'ET'), ('Republic of Finland', 'FI'), ('Republic of Fiji', 'FJ'),
+ ('French Republic', 'FR'), ('Federated States of Micronesia', 'FM'), ('Gabonese Republic', 'GA'),
+ ('United Kingdom of Great Britain and Northern Ireland', 'GB'), ('Republic of Ghana', 'GH'),
+ ('Republic of Guinea', 'GN'), ('Republic of the Gambia', 'GM'), ('Republic of Guinea-Bissau', 'GW'),
+ ('Republic of Equatorial Guinea', 'GQ'), ('Hellenic Republic', 'GR'), ('Republic of Guatemala', 'GT'),
+ ('Republic of Guyana', 'GY'), ('Hong Kong Special Administrative Region of China', 'HK'),
+ ('Republic of Honduras', 'HN'), ('Republic of Croatia', 'HR'), ('Republic of Haiti', 'HT'),
+ ('Republic of Indonesia', 'ID'), ('Republic of India', 'IN'), ('Islamic Republic of Iran', 'IR'), ('Iran', 'IR'),
+ ('Republic of Iraq', 'IQ'), ('Republic of Iceland', 'IS'), ('State of Israel', 'IL'), ('Italian Republic', 'IT'),
+ ('Hashemite Kingdom of Jordan', 'JO'), ('Republic of Kazakhstan', 'KZ'), ('Republic of Kenya', 'KE'),
+ ('Kyrgyz Republic', 'KG'), ('Kingdom of Cambodia', 'KH'), ('Republic of Kiribati', 'KI'), ('South Korea', 'KR'),
+ ('State of Kuwait', 'KW'), ('Laos', 'LA'), ('Lebanese Republic', 'LB'), ('Republic of Liberia', 'LR'),
+ ('Principality of Liechtenstein', 'LI'), ('Democratic Socialist Republic of Sri Lanka', 'LK'),
+ ('Kingdom of Lesotho', 'LS'), ('Republic of Lithuania', 'LT'), ('Grand Duchy of Luxembourg', 'LU'),
+ ('Republic of Latvia', 'LV'), ('Macao Special Administrative Region of China', 'MO'), ('Kingdom of Morocco', 'MA'),
+ ('Principality of Monaco', 'MC'), ('Republic of Moldova', 'MD'), ('Moldova', 'MD'), ('Republic of Madagascar', 'MG'),
+ ('Republic of Maldives', 'MV'), ('United Mexican States', 'MX'), ('Republic of the Marshall Islands', 'MH'),
+ ('Republic of North Macedonia', 'MK'), ('Republic of Mali', 'ML'), ('Republic of Malta', 'MT'),
+ ('Republic of Myanmar', 'MM'), ('Commonwealth of the Northern Mariana Islands', 'MP'),
+ ('Republic of Mozambique', 'MZ'), ('Islamic Republic of Mauritania', 'MR'), ('Republic of Mauritius', 'MU'),
+ ('Republic of Malawi', 'MW'), ('Republic of Namibia', 'NA'), ('Republic of the Niger', 'NE'),
+ ('Federal Republic of Nigeria', 'NG'), ('Republic of Nicaragua', 'NI'), ('Kingdom of the Netherlands', 'NL'),
+ ('Kingdom of Norway', 'NO'), ('Federal Democratic Republic of Nepal', 'NP'), ('Republic of Nauru', 'NR'),
+ ('Sultanate of Oman', 'OM'), ('Islamic Republic of Pakistan', 'PK'), ('Republic of Panama', 'PA'),
+ ('Republic of Peru', 'PE'), ('Republic of the Philippines', 'PH'), ('Republic of Palau', 'PW'),
+ ('Independent State of Papua New Guinea', 'PG'), ('Republic of Poland', 'PL'),
+ ("Democratic People's Republic of Korea", 'KP'), ('North Korea', 'KP'), ('Portuguese Republic', 'PT'),
+ ('Republic of Paraguay', 'PY'), ('the State of Palestine', 'PS'), ('State of Qatar', 'QA'),
+ ('Rwandese Republic', 'RW'), ('Kingdom of Saudi Arabia', 'SA'), ('Republic of the Sudan', 'SD'),
+ ('Republic of Senegal', 'SN'), ('Republic of Singapore', 'SG'), ('Republic of Sierra Leone', 'SL'),
+ ('Republic of El Salvador', 'SV'), ('Republic of San Marino', 'SM'), ('Federal Republic of Somalia', 'SO'),
+ ('Republic of Serbia', 'RS'), ('Republic of South Sudan', 'SS'),
+ ('Democratic Republic of Sao Tome and Principe', 'ST'), ('Republic of Suriname', 'SR'), ('Slovak Republic', 'SK'),
+ ('Republic of Slovenia', 'SI'), ('Kingdom of Sweden', 'SE'), ('Kingdom of Eswatini', 'SZ'),
+ ('Republic of Seychelles', 'SC'), ('Syria', 'SY'), ('Republic of Chad', 'TD'), ('Togolese Republic', 'TG'),
+ ('Kingdom of Thailand', 'TH'), ('Republic of Tajikistan', 'TJ'), ('Democratic Republic of Timor-Leste', 'TL'),
+ ('Kingdom of Tonga', 'TO'), ('Republic of Trinidad and Tobago', 'TT'), ('Republic of Tunisia', 'TN'),
+ ('Republic of Türkiye', 'TR'), ('Taiwan', 'TW'), ('United Republic of Tanzania', 'TZ'), ('Tanzania', 'TZ'),
+ ('Republic of Uganda', 'UG'), ('Eastern Republic of Uruguay', 'UY'), ('United States of America', 'US'),
+ ('Republic of Uzbekistan', 'UZ'), ('Bolivarian Republic of Venezuela', 'VE'), ('Venezuela', 'VE'),
+ ('British Virgin Islands', 'VG'), ('Virgin Islands of the United States', 'VI'),
+ ('Socialist Republic of Viet Nam', 'VN'), ('Vietnam', 'VN'), ('Republic of Vanuatu', 'VU'),
+ ('Independent State of Samoa', 'WS'), ('Republic of Yemen', 'YE'), ('Republic of South Africa', 'ZA'),
+ ('Republic of Zambia', 'ZM'), ('Republic of Zimbabwe', 'ZW'))
+LANGUAGES = ((None, 'aaa', 'Ghotuo'), (None, 'aab', 'Alumu-Tesu'), (None, 'aac', 'Ari'), (None, 'aad', 'Amal'),
+ (None, 'aae', 'Arbëreshë Albanian'), (None, 'aaf', 'Aranadan'), (None, 'aag', 'Ambrak'), (None, 'aah', "Abu' Arapesh"),
+ (None, 'aai', 'Arifama-Miniafia'), (None, 'aak', 'Ankave'), (None, 'aal', 'Afade'), (None, 'aan', 'Anambé'),
+ (None, 'aao', 'Algerian Saharan Arabic'), (None, 'aap', 'Pará Arára'), (None, 'aaq', 'Eastern Abnaki'),
+ ('aa', 'aar', 'Afar'), (None, 'aas', 'Aasáx'), (None, 'aat', 'Arvanitika Albanian'), (None, 'aau', 'Abau'),
+ (None, 'aaw', 'Solong'), (None, 'aax', 'Mandobo Atas'), (None, 'aaz', 'Amarasi'), (None, 'aba', 'Abé'),
+ (None, 'abb', 'Bankon'), (None, 'abc', 'Ambala Ayta'), (None, 'abd', 'Manide'), (None, 'abe', 'Western Abnaki'),
+ (None, 'abf', 'Abai Sungai'), (None, 'abg', 'Abaga'), (None, 'abh', 'Tajiki Arabic'), (None, 'abi', 'Abidji'),
+ (None, 'abj', 'Aka-Bea'), ('ab', 'abk', 'Abkhazian'), (None, 'abl', 'Lampung Nyo'), (None, 'abm', 'Abanyom'),
+ (None, 'abn', 'Abua'), (None, 'abo', 'Abon'), (None, 'abp', 'Abellen Ayta'), (None, 'abq', 'Abaza'),
+ (None, 'abr', 'Abron'), (None, 'abs', 'Ambonese Malay'), (None, 'abt', 'Ambulas'), (None, 'abu', 'Abure'),
+ (None, 'abv', 'Baharna Arabic'), (None, 'abw', 'Pal'), (None, 'abx', 'Inabaknon'), (None, 'aby', 'Aneme Wake'),
+ (None, 'abz', 'Abui'), (None, 'aca', 'Achagua'), (None, 'acb', 'Áncá'), (None, 'acd', 'Gikyode'),
+ (None, 'ace', 'Achinese'), (None, 'acf', 'Saint Lucian Creole French'), (None, 'ach', 'Acoli'),
+ (None, 'aci', 'Aka-Cari'), (None, 'ack', 'Aka-Kora'), (None, 'acl', 'Akar-Bale'), (None, 'acm', 'Mesopotamian Arabic'),
+ (None, 'acn', 'Achang'), (None, 'acp', 'Eastern Acipa'), (None, 'acq', "Ta'izzi-Adeni Arabic"), (None, 'acr', 'Achi'),
+ (None, 'acs', 'Acroá'), (None, 'act', 'Achterhoeks'), (None, 'acu', 'Achuar-Shiwiar'), (None, 'acv', 'Achumawi'),
+ (None, 'acw', 'Hijazi Arabic'), (None, 'acx', 'Omani Arabic'), (None, 'acy', 'Cypriot Arabic'),
+ (None, 'acz', 'Acheron'), (None, 'ada', 'Adangme'), (None, 'adb', 'Atauran'), (None, 'add', 'Lidzonka'),
+ (None, 'ade', 'Adele'), (None, 'adf', 'Dhofari Arabic'), (None, 'adg', 'Andegerebinha'), (None, 'adh', 'Adhola'),
+ (None, 'adi', 'Adi'), (None, 'adj', 'Adioukrou'), (None, 'adl', 'Galo'), (None, 'adn', 'Adang'), (None, 'ado', 'Abu'),
+ (None, 'adq', 'Adangbe'), (None, 'adr', 'Adonara'), (None, 'ads', 'Adamorobe Sign Language'),
+ (None, 'adt', 'Adnyamathanha'), (None, 'adu', 'Aduge'), (None, 'adw', 'Amundava'), (None, 'adx', 'Amdo Tibetan'),
+ (None, 'ady', 'Adyghe'), (None, 'adz', 'Adzera'), (None, 'aea', 'Areba'), (None, 'aeb', 'Tunisian Arabic'),
+ (None, 'aec', 'Saidi Arabic'), (None, 'aed', 'Argentine Sign Language'), (None, 'aee', 'Northeast Pashai'),
+ (None, 'aek', 'Haeke'), (None, 'ael', 'Ambele'), (None, 'aem', 'Arem'), (None, 'aen', 'Armenian Sign Language'),
+ (None, 'aeq', 'Aer'), (None, 'aer', 'Eastern Arrernte'), (None, 'aes', 'Alsea'), (None, 'aeu', 'Akeu'),
+ (None, 'aew', 'Ambakich'), (None, 'aey', 'Amele'), (None, 'aez', 'Aeka'), (None, 'afb', 'Gulf Arabic'),
+ (None, 'afd', 'Andai'), (None, 'afe', 'Putukwam'), (None, 'afg', 'Afghan Sign Language'), (None, 'afh', 'Afrihili'),
+ (None, 'afi', 'Akrukay'), (None, 'afk', 'Nanubae'), (None, 'afn', 'Defaka'), (None, 'afo', 'Eloyi'),
+ (None, 'afp', 'Tapei'), ('af', 'afr', 'Afrikaans'), (None, 'afs', 'Afro-Seminole Creole'), (None, 'aft', 'Afitti'),
+ (None, 'afu', 'Awutu'), (None, 'afz', 'Obokuitai'), (None, 'aga', 'Aguano'), (None, 'agb', 'Legbo'),
+ (None, 'agc', 'Agatu'), (None, 'agd', 'Agarabi'), (None, 'age', 'Angal'), (None, 'agf', 'Arguni'),
+ (None, 'agg', 'Angor'), (None, 'agh', 'Ngelima'), (None, 'agi', 'Agariya'), (None, 'agj', 'Argobba'),
+ (None, 'agk', 'Isarog Agta'), (None, 'agl', 'Fembe'), (None, 'agm', 'Angaataha'), (None, 'agn', 'Agutaynen'),
+ (None, 'ago', 'Tainae'), (None, 'agq', 'Aghem'), (None, 'agr', 'Aguaruna'), (None, 'ags', 'Esimbi'),
+ (None, 'agt', 'Central Cagayan Agta'), (None, 'agu', 'Aguacateco'), (None, 'agv', 'Remontado Dumagat'),
+ (None, 'agw', 'Kahua'), (None, 'agx', 'Aghul'), (None, 'agy', 'Southern Alta'), (None, 'agz', 'Mt. Iriga Agta'),
+ (None, 'aha', 'Ahanta'), (None, 'ahb', 'Axamb'), (None, 'ahg', 'Qimant'), (None, 'ahh', 'Aghu'),
+ (None, 'ahi', 'Tiagbamrin Aizi'), (None, 'ahk', 'Akha'), (None, 'ahl', 'Igo'), (None, 'ahm', 'Mobumrin Aizi'),
+ (None, 'ahn', 'Àhàn'), (None, 'aho', 'Ahom'), (None, 'ahp', 'Aproumu Aizi'), (None, 'ahr', 'Ahirani'),
+ (None, 'ahs', 'Ashe'), (None, 'aht', 'Ahtena'), (None, 'aia', 'Arosi'), (None, 'aib', 'Ainu (China)'),
+ (None, 'aic', 'Ainbai'), (None, 'aid', 'Alngith'), (None, 'aie', 'Amara'), (None, 'aif', 'Agi'),
+ (None, 'aig', 'Antigua and Barbuda Creole English'), (None, 'aih', 'Ai-Cham'), (None, 'aii', 'Assyrian Neo-Aramaic'),
+ (None, 'aij', 'Lishanid Noshan'), (None, 'aik', 'Ake'), (None, 'ail', 'Aimele'), (None, 'aim', 'Aimol'),
+ (None, 'ain', 'Ainu (Japan)'), (None, 'aio', 'Aiton'), (None, 'aip', 'Burumakok'), (None, 'aiq', 'Aimaq'),
+ (None, 'air', 'Airoran'), (None, 'ait', 'Arikem'), (None, 'aiw', 'Aari'), (None, 'aix', 'Aighon'),
+ (None, 'aiy', 'Ali'), (None, 'aja', 'Aja (South Sudan)'), (None, 'ajg', 'Aja (Benin)'), (None, 'aji', 'Ajië'),
+ (None, 'ajn', 'Andajin'), (None, 'ajp', 'South Levantine Arabic'), (None, 'ajs', 'Algerian Jewish Sign Language'),
+ (None, 'aju', 'Judeo-Moroccan Arabic'), (None, 'ajw', 'Ajawa'), (None, 'ajz', 'Amri Karbi'), ('ak', 'aka', 'Akan'),
+ (None, 'akb', 'Batak Angkola'), (None, 'akc', 'Mpur'), (None, 'akd', 'Ukpet-Ehom'), (None, 'ake', 'Akawaio'),
+ (None, 'akf', 'Akpa'), (None, 'akg', 'Anakalangu'), (None, 'akh', 'Angal Heneng'), (None, 'aki', 'Aiome'),
+ (None, 'akj', 'Aka-Jeru'), (None, 'akk', 'Akkadian'), (None, 'akl', 'Aklanon'), (None, 'akm', 'Aka-Bo'),
+ (None, 'ako', 'Akurio'), (None, 'akp', 'Siwu'), (None, 'akq', 'Ak'), (None, 'akr', 'Araki'), (None, 'aks', 'Akaselem'),
+ (None, 'akt', 'Akolet'), (None, 'aku', 'Akum'), (None, 'akv', 'Akhvakh'), (None, 'akw', 'Akwa'),
+ (None, 'akx', 'Aka-Kede'), (None, 'aky', 'Aka-Kol'), (None, 'akz', 'Alabama'), (None, 'ala', 'Alago'),
+ (None, 'alc', 'Qawasqar'), (None, 'ald', 'Alladian'), (None, 'ale', 'Aleut'), (None, 'alf', 'Alege'),
+ (None, 'alh', 'Alawa'), (None, 'ali', 'Amaimon'), (None, 'alj', 'Alangan'), (None, 'alk', 'Alak'),
+ (None, 'all', 'Allar'), (None, 'alm', 'Amblong'), (None, 'aln', 'Gheg Albanian'), (None, 'alo', 'Larike-Wakasihu'),
+ (None, 'alp', 'Alune'), (None, 'alq', 'Algonquin'), (None, 'alr', 'Alutor'), (None, 'als', 'Tosk Albanian'),
+ (None, 'alt', 'Southern Altai'), (None, 'alu', "'Are'are"), (None, 'alw', 'Alaba-K’abeena'), (None, 'alx', 'Amol'),
+ (None, 'aly', 'Alyawarr'), (None, 'alz', 'Alur'), (None, 'ama', 'Amanayé'), (None, 'amb', 'Ambo'),
+ (None, 'amc', 'Amahuaca'), (None, 'ame', "Yanesha'"), (None, 'amf', 'Hamer-Banna'), (None, 'amg', 'Amurdak'),
+ ('am', 'amh', 'Amharic'), (None, 'ami', 'Amis'), (None, 'amj', 'Amdang'), (None, 'amk', 'Ambai'),
+ (None, 'aml', 'War-Jaintia'), (None, 'amm', 'Ama (Papua New Guinea)'), (None, 'amn', 'Amanab'), (None, 'amo', 'Amo'),
+ (None, 'amp', 'Alamblak'), (None, 'amq', 'Amahai'), (None, 'amr', 'Amarakaeri'),
+ (None, 'ams', 'Southern Amami-Oshima'), (None, 'amt', 'Amto'), (None, 'amu', 'Guerrero Amuzgo'),
+ (None, 'amv', 'Ambelau'), (None, 'amw', 'Western Neo-Aramaic'), (None, 'amx', 'Anmatyerre'), (None, 'amy', 'Ami'),
+ (None, 'amz', 'Atampaya'), (None, 'ana', 'Andaqui'), (None, 'anb', 'Andoa'), (None, 'anc', 'Ngas'),
+ (None, 'and', 'Ansus'), (None, 'ane', 'Xârâcùù'), (None, 'anf', 'Animere'),
+ (None, 'ang', 'Old English (ca. 450-1100)'), (None, 'anh', 'Nend'), (None, 'ani', 'Andi'), (None, 'anj', 'Anor'),
+ (None, 'ank', 'Goemai'), (None, 'anl', 'Anu-Hkongso Chin'), (None, 'anm', 'Anal'), (None, 'ann', 'Obolo'),
+ (None, 'ano', 'Andoque'), (None, 'anp', 'Angika'), (None, 'anq', 'Jarawa (India)'), (None, 'anr', 'Andh'),
+ (None, 'ans', 'Anserma'), (None, 'ant', 'Antakarinya'), (None, 'anu', 'Anuak'), (None, 'anv', 'Denya'),
+ (None, 'anw', 'Anaang'), (None, 'anx', 'Andra-Hus'), (None, 'any', 'Anyin'), (None, 'anz', 'Anem'),
+ (None, 'aoa', 'Angolar'), (None, 'aob', 'Abom'), (None, 'aoc', 'Pemon'), (None, 'aod', 'Andarum'),
+ (None, 'aoe', 'Angal Enen'), (None, 'aof', 'Bragat'), (None, 'aog', 'Angoram'), (None, 'aoi', 'Anindilyakwa'),
+ (None, 'aoj', 'Mufian'), (None, 'aok', 'Arhö'), (None, 'aol', 'Alor'), (None, 'aom', 'Ömie'),
+ (None, 'aon', 'Bumbita Arapesh'), (None, 'aor', 'Aore'), (None, 'aos', 'Taikat'), (None, 'aot', 'Atong (India)'),
+ (None, 'aou', "A'ou"), (None, 'aox', 'Atorada'), (None, 'aoz', 'Uab Meto'), (None, 'apb', "Sa'a"),
+ (None, 'apc', 'North Levantine Arabic'), (None, 'apd', 'Sudanese Arabic'), (None, 'ape', 'Bukiyip'),
+ (None, 'apf', 'Pahanan Agta'), (None, 'apg', 'Ampanang'), (None, 'aph', 'Athpariya'), (None, 'api', 'Apiaká'),
+ (None, 'apj', 'Jicarilla Apache'), (None, 'apk', 'Kiowa Apache'), (None, 'apl', 'Lipan Apache'),
+ (None, 'apm', 'Mescalero-Chiricahua Apache'), (None, 'apn', 'Apinayé'), (None, 'apo', 'Ambul'), (None, 'app', 'Apma'),
+ (None, 'apq', 'A-Pucikwar'), (None, 'apr', 'Arop-Lokep'), (None, 'aps', 'Arop-Sissano'), (None, 'apt', 'Apatani'),
+ (None, 'apu', 'Apurinã'), (None, 'apv', 'Alapmunte'), (None, 'apw', 'Western Apache'), (None, 'apx', 'Aputai'),
+ (None, 'apy', 'Apalaí'), (None, 'apz', 'Safeyoka'), (None, 'aqc', 'Archi'), (None, 'aqd', 'Ampari Dogon'),
+ (None, 'aqg', 'Arigidi'), (None, 'aqk', 'Aninka'), (None, 'aqm', 'Atohwaim'), (None, 'aqn', 'Northern Alta'),
+ (None, 'aqp', 'Atakapa'), (None, 'aqr', 'Arhâ'), (None, 'aqt', 'Angaité'), (None, 'aqz', 'Akuntsu'),
+ ('ar', 'ara', 'Arabic'), (None, 'arb', 'Standard Arabic'), (None, 'arc', 'Official Aramaic (700-300 BCE)'),
+ (None, 'ard', 'Arabana'), (None, 'are', 'Western Arrarnta'), ('an', 'arg', 'Aragonese'), (None, 'arh', 'Arhuaco'),
+ (None, 'ari', 'Arikara'), (None, 'arj', 'Arapaso'), (None, 'ark', 'Arikapú'), (None, 'arl', 'Arabela'),
+ (None, 'arn', 'Mapudungun'), (None, 'aro', 'Araona'), (None, 'arp', 'Arapaho'), (None, 'arq', 'Algerian Arabic'),
+ (None, 'arr', 'Karo (Brazil)'), (None, 'ars', 'Najdi Arabic'), (None, 'aru', 'Aruá (Amazonas State)'),
+ (None, 'arv', 'Arbore'), (None, 'arw', 'Arawak'), (None, 'arx', 'Aruá (Rodonia State)'),
+ (None, 'ary', 'Moroccan Arabic'), (None, 'arz', 'Egyptian Arabic'), (None, 'asa', 'Asu (Tanzania)'),
+ (None, 'asb', 'Assiniboine'), (None, 'asc', 'Casuarina Coast Asmat'), (None, 'ase', 'American Sign Language'),
+ (None, 'asf', 'Auslan'), (None, 'asg', 'Cishingini'), (None, 'ash', 'Abishira'), (None, 'asi', 'Buruwai'),
+ (None, 'asj', 'Sari'), (None, 'ask', 'Ashkun'), (None, 'asl', 'Asilulu'), ('as', 'asm', 'Assamese'),
+ (None, 'asn', 'Xingú Asuriní'), (None, 'aso', 'Dano'), (None, 'asp', 'Algerian Sign Language'),
+ (None, 'asq', 'Austrian Sign Language'), (None, 'asr', 'Asuri'), (None, 'ass', 'Ipulo'), (None, 'ast', 'Asturian'),
+ (None, 'asu', 'Tocantins Asurini'), (None, 'asv', 'Asoa'), (None, 'asw', 'Australian Aborigines Sign Language'),
+ (None, 'asx', 'Muratayak'), (None, 'asy', 'Yaosakor Asmat'), (None, 'asz', 'As'), (None, 'ata', 'Pele-Ata'),
+ (None, 'atb', 'Zaiwa'), (None, 'atc', 'Atsahuaca'), (None, 'atd', 'Ata Manobo'), (None, 'ate', 'Atemble'),
+ (None, 'atg', 'Ivbie North-Okpela-Arhe'), (None, 'ati', 'Attié'), (None, 'atj', 'Atikamekw'), (None, 'atk', 'Ati'),
+ (None, 'atl', 'Mt. Iraya Agta'), (None, 'atm', 'Ata'), (None, 'atn', 'Ashtiani'), (None, 'ato', 'Atong (Cameroon)'),
+ (None, 'atp', 'Pudtol Atta'), (None, 'atq', 'Aralle-Tabulahan'), (None, 'atr', 'Waimiri-Atroari'),
+ (None, 'ats', 'Gros Ventre'), (None, 'att', 'Pamplona Atta'), (None, 'atu', 'Reel'), (None, 'atv', 'Northern Altai'),
+ (None, 'atw', 'Atsugewi'), (None, 'atx', 'Arutani'), (None, 'aty', 'Aneityum'), (None, 'atz', 'Arta'),
+ (None, 'aua', 'Asumboa'), (None, 'aub', 'Alugu'), (None, 'auc', 'Waorani'), (None, 'aud', 'Anuta'),
+ (None, 'aug', 'Aguna'), (None, 'auh', 'Aushi'), (None, 'aui', 'Anuki'), (None, 'auj', 'Awjilah'),
+ (None, 'auk', 'Heyo'), (None, 'aul', 'Aulua'), (None, 'aum', 'Asu (Nigeria)'), (None, 'aun', 'Molmo One'),
+ (None, 'auo', 'Auyokawa'), (None, 'aup', 'Makayam'), (None, 'auq', 'Anus'), (None, 'aur', 'Aruek'),
+ (None, 'aut', 'Austral'), (None, 'auu', 'Auye'), (None, 'auw', 'Awyi'), (None, 'aux', 'Aurá'),
+ (None, 'auy', 'Awiyaana'), (None, 'auz', 'Uzbeki Arabic'), ('av', 'ava', 'Avaric'), (None, 'avb', 'Avau'),
+ (None, 'avd', 'Alviri-Vidari'), ('ae', 'ave', 'Avestan'), (None, 'avi', 'Avikam'), (None, 'avk', 'Kotava'),
+ (None, 'avl', 'Eastern Egyptian Bedawi Arabic'), (None, 'avm', 'Angkamuthi'), (None, 'avn', 'Avatime'),
+ (None, 'avo', 'Agavotaguerra'), (None, 'avs', 'Aushiri'), (None, 'avt', 'Au'), (None, 'avu', 'Avokaya'),
+ (None, 'avv', 'Avá-Canoeiro'), (None, 'awa', 'Awadhi'), (None, 'awb', 'Awa (Papua New Guinea)'),
+ (None, 'awc', 'Cicipu'), (None, 'awe', 'Awetí'), (None, 'awg', 'Anguthimri'), (None, 'awh', 'Awbono'),
+ (None, 'awi', 'Aekyom'), (None, 'awk', 'Awabakal'), (None, 'awm', 'Arawum'), (None, 'awn', 'Awngi'),
+ (None, 'awo', 'Awak'), (None, 'awr', 'Awera'), (None, 'aws', 'South Awyu'), (None, 'awt', 'Araweté'),
+ (None, 'awu', 'Central Awyu'), (None, 'awv', 'Jair Awyu'), (None, 'aww', 'Awun'), (None, 'awx', 'Awara'),
+ (None, 'awy', 'Edera Awyu'), (None, 'axb', 'Abipon'), (None, 'axe', 'Ayerrerenge'), (None, 'axg', 'Mato Grosso Arára'),
+ (None, 'axk', 'Yaka (Central African Republic)'), (None, 'axl', 'Lower Southern Aranda'),
+ (None, 'axm', 'Middle Armenian'), (None, 'axx', 'Xârâgurè'), (None, 'aya', 'Awar'), (None, 'ayb', 'Ayizo Gbe'),
+ (None, 'ayc', 'Southern Aymara'), (None, 'ayd', 'Ayabadhu'), (None, 'aye', 'Ayere'), (None, 'ayg', 'Ginyanga'),
+ (None, 'ayh', 'Hadrami Arabic'), (None, 'ayi', 'Leyigha'), (None, 'ayk', 'Akuku'), (None, 'ayl', 'Libyan Arabic'),
+ ('ay', 'aym', 'Aymara'), (None, 'ayn', 'Sanaani Arabic'), (None, 'ayo', 'Ayoreo'),
+ (None, 'ayp', 'North Mesopotamian Arabic'), (None, 'ayq', 'Ayi (Papua New Guinea)'), (None, 'ayr', 'Central Aymara'),
+ (None, 'ays', 'Sorsogon Ayta'), (None, 'ayt', 'Magbukun Ayta'), (None, 'ayu', 'Ayu'), (None, 'ayz', 'Mai Brat'),
+ (None, 'aza', 'Azha'), (None, 'azb', 'South Azerbaijani'), (None, 'azd', 'Eastern Durango Nahuatl'),
+ ('az', 'aze', 'Azerbaijani'), (None, 'azg', 'San Pedro Amuzgos Amuzgo'), (None, 'azj', 'North Azerbaijani'),
+ (None, 'azm', 'Ipalapa Amuzgo'), (None, 'azn', 'Western Durango Nahuatl'), (None, 'azo', 'Awing'),
+ (None, 'azt', 'Faire Atta'), (None, 'azz', 'Highland Puebla Nahuatl'), (None, 'baa', 'Babatana'),
+ (None, 'bab', 'Bainouk-Gunyuño'), (None, 'bac', 'Badui'), (None, 'bae', 'Baré'), (None, 'baf', 'Nubaca'),
+ (None, 'bag', 'Tuki'), (None, 'bah', 'Bahamas Creole English'), (None, 'baj', 'Barakai'), ('ba', 'bak', 'Bashkir'),
+ (None, 'bal', 'Baluchi'), ('bm', 'bam', 'Bambara'), (None, 'ban', 'Balinese'), (None, 'bao', 'Waimaha'),
+ (None, 'bap', 'Bantawa'), (None, 'bar', 'Bavarian'), (None, 'bas', 'Basa (Cameroon)'), (None, 'bau', 'Bada (Nigeria)'),
+ (None, 'bav', 'Vengo'), (None, 'baw', 'Bambili-Bambui'), (None, 'bax', 'Bamun'), (None, 'bay', 'Batuley'),
+ (None, 'bba', 'Baatonum'), (None, 'bbb', 'Barai'), (None, 'bbc', 'Batak Toba'), (None, 'bbd', 'Bau'),
+ (None, 'bbe', 'Bangba'), (None, 'bbf', 'Baibai'), (None, 'bbg', 'Barama'), (None, 'bbh', 'Bugan'),
+ (None, 'bbi', 'Barombi'), (None, 'bbj', "Ghomálá'"), (None, 'bbk', 'Babanki'), (None, 'bbl', 'Bats'),
+ (None, 'bbm', 'Babango'), (None, 'bbn', 'Uneapa'), (None, 'bbo', 'Northern Bobo Madaré'),
+ (None, 'bbp', 'West Central Banda'), (None, 'bbq', 'Bamali'), (None, 'bbr', 'Girawa'), (None, 'bbs', 'Bakpinka'),
+ (None, 'bbt', 'Mburku'), (None, 'bbu', 'Kulung (Nigeria)'), (None, 'bbv', 'Karnai'), (None, 'bbw', 'Baba'),
+ (None, 'bbx', 'Bubia'), (None, 'bby', 'Befang'), (None, 'bca', 'Central Bai'), (None, 'bcb', 'Bainouk-Samik'),
+ (None, 'bcc', 'Southern Balochi'), (None, 'bcd', 'North Babar'), (None, 'bce', 'Bamenyam'), (None, 'bcf', 'Bamu'),
+ (None, 'bcg', 'Baga Pokur'), (None, 'bch', 'Bariai'), (None, 'bci', 'Baoulé'), (None, 'bcj', 'Bardi'),
+ (None, 'bck', 'Bunuba'), (None, 'bcl', 'Central Bikol'), (None, 'bcm', 'Bannoni'), (None, 'bcn', 'Bali (Nigeria)'),
+ (None, 'bco', 'Kaluli'), (None, 'bcp', 'Bali (Democratic Republic of Congo)'), (None, 'bcq', 'Bench'),
+ (None, 'bcr', 'Babine'), (None, 'bcs', 'Kohumono'), (None, 'bct', 'Bendi'), (None, 'bcu', 'Awad Bing'),
+ (None, 'bcv', 'Shoo-Minda-Nye'), (None, 'bcw', 'Bana'), (None, 'bcy', 'Bacama'), (None, 'bcz', 'Bainouk-Gunyaamolo'),
+ (None, 'bda', 'Bayot'), (None, 'bdb', 'Basap'), (None, 'bdc', 'Emberá-Baudó'), (None, 'bdd', 'Bunama'),
+ (None, 'bde', 'Bade'), (None, 'bdf', 'Biage'), (None, 'bdg', 'Bonggi'), (None, 'bdh', 'Baka (South Sudan)'),
+ (None, 'bdi', 'Burun'), (None, 'bdj', 'Bai (South Sudan)'), (None, 'bdk', 'Budukh'), (None, 'bdl', 'Indonesian Bajau'),
+ (None, 'bdm', 'Buduma'), (None, 'bdn', 'Baldemu'), (None, 'bdo', 'Morom'), (None, 'bdp', 'Bende'),
+ (None, 'bdq', 'Bahnar'), (None, 'bdr', 'West Coast Bajau'), (None, 'bds', 'Burunge'), (None, 'bdt', 'Bokoto'),
+ (None, 'bdu', 'Oroko'), (None, 'bdv', 'Bodo Parja'), (None, 'bdw', 'Baham'), (None, 'bdx', 'Budong-Budong'),
+ (None, 'bdy', 'Bandjalang'), (None, 'bdz', 'Badeshi'), (None, 'bea', 'Beaver'), (None, 'beb', 'Bebele'),
+ (None, 'bec', 'Iceve-Maci'), (None, 'bed', 'Bedoanas'), (None, 'bee', 'Byangsi'), (None, 'bef', 'Benabena'),
+ (None, 'beg', 'Belait'), (None, 'beh', 'Biali'), (None, 'bei', "Bekati'"), (None, 'bej', 'Beja'),
+ (None, 'bek', 'Bebeli'), ('be', 'bel', 'Belarusian'), (None, 'bem', 'Bemba (Zambia)'), ('bn', 'ben', 'Bengali'),
+ (None, 'beo', 'Beami'), (None, 'bep', 'Besoa'), (None, 'beq', 'Beembe'), (None, 'bes', 'Besme'),
+ (None, 'bet', 'Guiberoua Béte'), (None, 'beu', 'Blagar'), (None, 'bev', 'Daloa Bété'), (None, 'bew', 'Betawi'),
+ (None, 'bex', 'Jur Modo'), (None, 'bey', 'Beli (Papua New Guinea)'), (None, 'bez', 'Bena (Tanzania)'),
+ (None, 'bfa', 'Bari'), (None, 'bfb', 'Pauri Bareli'), (None, 'bfc', 'Panyi Bai'), (None, 'bfd', 'Bafut'),
+ (None, 'bfe', 'Betaf'), (None, 'bff', 'Bofi'), (None, 'bfg', 'Busang Kayan'), (None, 'bfh', 'Blafe'),
+ (None, 'bfi', 'British Sign Language'), (None, 'bfj', 'Bafanji'), (None, 'bfk', 'Ban Khor Sign Language'),
+ (None, 'bfl', 'Banda-Ndélé'), (None, 'bfm', 'Mmen'), (None, 'bfn', 'Bunak'), (None, 'bfo', 'Malba Birifor'),
+ (None, 'bfp', 'Beba'), (None, 'bfq', 'Badaga'), (None, 'bfr', 'Bazigar'), (None, 'bfs', 'Southern Bai'),
+ (None, 'bft', 'Balti'), (None, 'bfu', 'Gahri'), (None, 'bfw', 'Bondo'), (None, 'bfx', 'Bantayanon'),
+ (None, 'bfy', 'Bagheli'), (None, 'bfz', 'Mahasu Pahari'), (None, 'bga', 'Gwamhi-Wuri'), (None, 'bgb', 'Bobongko'),
+ (None, 'bgc', 'Haryanvi'), (None, 'bgd', 'Rathwi Bareli'), (None, 'bge', 'Bauria'), (None, 'bgf', 'Bangandu'),
+ (None, 'bgg', 'Bugun'), (None, 'bgi', 'Giangan'), (None, 'bgj', 'Bangolan'), (None, 'bgk', 'Bit'),
+ (None, 'bgl', 'Bo (Laos)'), (None, 'bgn', 'Western Balochi'), (None, 'bgo', 'Baga Koga'),
+ (None, 'bgp', 'Eastern Balochi'), (None, 'bgq', 'Bagri'), (None, 'bgr', 'Bawm Chin'), (None, 'bgs', 'Tagabawa'),
+ (None, 'bgt', 'Bughotu'), (None, 'bgu', 'Mbongno'), (None, 'bgv', 'Warkay-Bipim'), (None, 'bgw', 'Bhatri'),
+ (None, 'bgx', 'Balkan Gagauz Turkish'), (None, 'bgy', 'Benggoi'), (None, 'bgz', 'Banggai'), (None, 'bha', 'Bharia'),
+ (None, 'bhb', 'Bhili'), (None, 'bhc', 'Biga'), (None, 'bhd', 'Bhadrawahi'), (None, 'bhe', 'Bhaya'),
+ (None, 'bhf', 'Odiai'), (None, 'bhg', 'Binandere'), (None, 'bhh', 'Bukharic'), (None, 'bhi', 'Bhilali'),
+ (None, 'bhj', 'Bahing'), (None, 'bhl', 'Bimin'), (None, 'bhm', 'Bathari'), (None, 'bhn', 'Bohtan Neo-Aramaic'),
+ (None, 'bho', 'Bhojpuri'), (None, 'bhp', 'Bima'), (None, 'bhq', 'Tukang Besi South'), (None, 'bhr', 'Bara Malagasy'),
+ (None, 'bhs', 'Buwal'), (None, 'bht', 'Bhattiyali'), (None, 'bhu', 'Bhunjia'), (None, 'bhv', 'Bahau'),
+ (None, 'bhw', 'Biak'), (None, 'bhx', 'Bhalay'), (None, 'bhy', 'Bhele'), (None, 'bhz', 'Bada (Indonesia)'),
+ (None, 'bia', 'Badimaya'), (None, 'bib', 'Bissa'), (None, 'bid', 'Bidiyo'), (None, 'bie', 'Bepour'),
+ (None, 'bif', 'Biafada'), (None, 'big', 'Biangai'), (None, 'bik', 'Bikol'), (None, 'bil', 'Bile'),
+ (None, 'bim', 'Bimoba'), (None, 'bin', 'Bini'), (None, 'bio', 'Nai'), (None, 'bip', 'Bila'), (None, 'biq', 'Bipi'),
+ (None, 'bir', 'Bisorio'), ('bi', 'bis', 'Bislama'), (None, 'bit', 'Berinomo'), (None, 'biu', 'Biete'),
+ (None, 'biv', 'Southern Birifor'), (None, 'biw', 'Kol (Cameroon)'), (None, 'bix', 'Bijori'), (None, 'biy', 'Birhor'),
+ (None, 'biz', 'Baloi'), (None, 'bja', 'Budza'), (None, 'bjb', 'Banggarla'), (None, 'bjc', 'Bariji'),
+ (None, 'bje', 'Biao-Jiao Mien'), (None, 'bjf', 'Barzani Jewish Neo-Aramaic'), (None, 'bjg', 'Bidyogo'),
+ (None, 'bjh', 'Bahinemo'), (None, 'bji', 'Burji'), (None, 'bjj', 'Kanauji'), (None, 'bjk', 'Barok'),
+ (None, 'bjl', 'Bulu (Papua New Guinea)'), (None, 'bjm', 'Bajelani'), (None, 'bjn', 'Banjar'),
+ (None, 'bjo', 'Mid-Southern Banda'), (None, 'bjp', 'Fanamaket'), (None, 'bjr', 'Binumarien'), (None, 'bjs', 'Bajan'),
+ (None, 'bjt', 'Balanta-Ganja'), (None, 'bju', 'Busuu'), (None, 'bjv', 'Bedjond'), (None, 'bjw', 'Bakwé'),
+ (None, 'bjx', 'Banao Itneg'), (None, 'bjy', 'Bayali'), (None, 'bjz', 'Baruga'), (None, 'bka', 'Kyak'),
+ (None, 'bkc', 'Baka (Cameroon)'), (None, 'bkd', 'Binukid'), (None, 'bkf', 'Beeke'), (None, 'bkg', 'Buraka'),
+ (None, 'bkh', 'Bakoko'), (None, 'bki', 'Baki'), (None, 'bkj', 'Pande'), (None, 'bkk', 'Brokskat'),
+ (None, 'bkl', 'Berik'), (None, 'bkm', 'Kom (Cameroon)'), (None, 'bkn', 'Bukitan'), (None, 'bko', "Kwa'"),
+ (None, 'bkp', 'Boko (Democratic Republic of Congo)'), (None, 'bkq', 'Bakairí'), (None, 'bkr', 'Bakumpai'),
+ (None, 'bks', 'Northern Sorsoganon'), (None, 'bkt', 'Boloki'), (None, 'bku', 'Buhid'), (None, 'bkv', 'Bekwarra'),
+ (None, 'bkw', 'Bekwel'), (None, 'bkx', 'Baikeno'), (None, 'bky', 'Bokyi'), (None, 'bkz', 'Bungku'),
+ (None, 'bla', 'Siksika'), (None, 'blb', 'Bilua'), (None, 'blc', 'Bella Coola'), (None, 'bld', 'Bolango'),
+ (None, 'ble', 'Balanta-Kentohe'), (None, 'blf', 'Buol'), (None, 'blh', 'Kuwaa'), (None, 'bli', 'Bolia'),
+ (None, 'blj', 'Bolongan'), (None, 'blk', "Pa'o Karen"), (None, 'bll', 'Biloxi'), (None, 'blm', 'Beli (South Sudan)'),
+ (None, 'bln', 'Southern Catanduanes Bikol'), (None, 'blo', 'Anii'), (None, 'blp', 'Blablanga'),
+ (None, 'blq', 'Baluan-Pam'), (None, 'blr', 'Blang'), (None, 'bls', 'Balaesang'), (None, 'blt', 'Tai Dam'),
+ (None, 'blv', 'Kibala'), (None, 'blw', 'Balangao'), (None, 'blx', 'Mag-Indi Ayta'), (None, 'bly', 'Notre'),
+ (None, 'blz', 'Balantak'), (None, 'bma', 'Lame'), (None, 'bmb', 'Bembe'), (None, 'bmc', 'Biem'),
+ (None, 'bmd', 'Baga Manduri'), (None, 'bme', 'Limassa'), (None, 'bmf', 'Bom-Kim'), (None, 'bmg', 'Bamwe'),
+ (None, 'bmh', 'Kein'), (None, 'bmi', 'Bagirmi'), (None, 'bmj', 'Bote-Majhi'), (None, 'bmk', 'Ghayavi'),
+ (None, 'bml', 'Bomboli'), (None, 'bmm', 'Northern Betsimisaraka Malagasy'), (None, 'bmn', 'Bina (Papua New Guinea)'),
+ (None, 'bmo', 'Bambalang'), (None, 'bmp', 'Bulgebi'), (None, 'bmq', 'Bomu'), (None, 'bmr', 'Muinane'),
+ (None, 'bms', 'Bilma Kanuri'), (None, 'bmt', 'Biao Mon'), (None, 'bmu', 'Somba-Siawari'), (None, 'bmv', 'Bum'),
+ (None, 'bmw', 'Bomwali'), (None, 'bmx', 'Baimak'), (None, 'bmz', 'Baramu'), (None, 'bna', 'Bonerate'),
+ (None, 'bnb', 'Bookan'), (None, 'bnc', 'Bontok'), (None, 'bnd', 'Banda (Indonesia)'), (None, 'bne', 'Bintauna'),
+ (None, 'bnf', 'Masiwang'), (None, 'bng', 'Benga'), (None, 'bni', 'Bangi'), (None, 'bnj', 'Eastern Tawbuid'),
+ (None, 'bnk', 'Bierebo'), (None, 'bnl', 'Boon'), (None, 'bnm', 'Batanga'), (None, 'bnn', 'Bunun'),
+ (None, 'bno', 'Bantoanon'), (None, 'bnp', 'Bola'), (None, 'bnq', 'Bantik'), (None, 'bnr', 'Butmas-Tur'),
+ (None, 'bns', 'Bundeli'), (None, 'bnu', 'Bentong'), (None, 'bnv', 'Bonerif'), (None, 'bnw', 'Bisis'),
+ (None, 'bnx', 'Bangubangu'), (None, 'bny', 'Bintulu'), (None, 'bnz', 'Beezen'), (None, 'boa', 'Bora'),
+ (None, 'bob', 'Aweer'), ('bo', 'bod', 'Tibetan'), (None, 'boe', 'Mundabli'), (None, 'bof', 'Bolon'),
+ (None, 'bog', 'Bamako Sign Language'), (None, 'boh', 'Boma'), (None, 'boi', 'Barbareño'), (None, 'boj', 'Anjam'),
+ (None, 'bok', 'Bonjo'), (None, 'bol', 'Bole'), (None, 'bom', 'Berom'), (None, 'bon', 'Bine'),
+ (None, 'boo', 'Tiemacèwè Bozo'), (None, 'bop', 'Bonkiman'), (None, 'boq', 'Bogaya'), (None, 'bor', 'Borôro'),
+ ('bs', 'bos', 'Bosnian'), (None, 'bot', 'Bongo'), (None, 'bou', 'Bondei'), (None, 'bov', 'Tuwuli'),
+ (None, 'bow', 'Rema'), (None, 'box', 'Buamu'), (None, 'boy', 'Bodo (Central African Republic)'),
+ (None, 'boz', 'Tiéyaxo Bozo'), (None, 'bpa', 'Daakaka'), (None, 'bpc', 'Mbuk'), (None, 'bpd', 'Banda-Banda'),
+ (None, 'bpe', 'Bauni'), (None, 'bpg', 'Bonggo'), (None, 'bph', 'Botlikh'), (None, 'bpi', 'Bagupi'),
+ (None, 'bpj', 'Binji'), (None, 'bpk', 'Orowe'), (None, 'bpl', 'Broome Pearling Lugger Pidgin'), (None, 'bpm', 'Biyom'),
+ (None, 'bpn', 'Dzao Min'), (None, 'bpo', 'Anasi'), (None, 'bpp', 'Kaure'), (None, 'bpq', 'Banda Malay'),
+ (None, 'bpr', 'Koronadal Blaan'), (None, 'bps', 'Sarangani Blaan'), (None, 'bpt', 'Barrow Point'),
+ (None, 'bpu', 'Bongu'), (None, 'bpv', 'Bian Marind'), (None, 'bpw', 'Bo (Papua New Guinea)'),
+ (None, 'bpx', 'Palya Bareli'), (None, 'bpy', 'Bishnupriya'), (None, 'bpz', 'Bilba'), (None, 'bqa', 'Tchumbuli'),
+ (None, 'bqb', 'Bagusa'), (None, 'bqc', 'Boko (Benin)'), (None, 'bqd', 'Bung'), (None, 'bqf', 'Baga Kaloum'),
+ (None, 'bqg', 'Bago-Kusuntu'), (None, 'bqh', 'Baima'), (None, 'bqi', 'Bakhtiari'), (None, 'bqj', 'Bandial'),
+ (None, 'bqk', 'Banda-Mbrès'), (None, 'bql', 'Bilakura'), (None, 'bqm', 'Wumboko'),
+ (None, 'bqn', 'Bulgarian Sign Language'), (None, 'bqo', 'Balo'), (None, 'bqp', 'Busa'), (None, 'bqq', 'Biritai'),
+ (None, 'bqr', 'Burusu'), (None, 'bqs', 'Bosngun'), (None, 'bqt', 'Bamukumbit'), (None, 'bqu', 'Boguru'),
+ (None, 'bqv', 'Koro Wachi'), (None, 'bqw', 'Buru (Nigeria)'), (None, 'bqx', 'Baangi'),
+ (None, 'bqy', 'Bengkala Sign Language'), (None, 'bqz', 'Bakaka'), (None, 'bra', 'Braj'), (None, 'brb', 'Brao'),
+ (None, 'brc', 'Berbice Creole Dutch'), (None, 'brd', 'Baraamu'), ('br', 'bre', 'Breton'), (None, 'brf', 'Bira'),
+ (None, 'brg', 'Baure'), (None, 'brh', 'Brahui'), (None, 'bri', 'Mokpwe'), (None, 'brj', 'Bieria'),
+ (None, 'brk', 'Birked'), (None, 'brl', 'Birwa'), (None, 'brm', 'Barambu'), (None, 'brn', 'Boruca'),
+ (None, 'bro', 'Brokkat'), (None, 'brp', 'Barapasi'), (None, 'brq', 'Breri'), (None, 'brr', 'Birao'),
+ (None, 'brs', 'Baras'), (None, 'brt', 'Bitare'), (None, 'bru', 'Eastern Bru'), (None, 'brv', 'Western Bru'),
+ (None, 'brw', 'Bellari'), (None, 'brx', 'Bodo (India)'), (None, 'bry', 'Burui'), (None, 'brz', 'Bilbil'),
+ (None, 'bsa', 'Abinomn'), (None, 'bsb', 'Brunei Bisaya'), (None, 'bsc', 'Bassari'), (None, 'bse', 'Wushi'),
+ (None, 'bsf', 'Bauchi'), (None, 'bsg', 'Bashkardi'), (None, 'bsh', 'Kati'), (None, 'bsi', 'Bassossi'),
+ (None, 'bsj', 'Bangwinji'), (None, 'bsk', 'Burushaski'), (None, 'bsl', 'Basa-Gumna'), (None, 'bsm', 'Busami'),
+ (None, 'bsn', 'Barasana-Eduria'), (None, 'bso', 'Buso'), (None, 'bsp', 'Baga Sitemu'), (None, 'bsq', 'Bassa'),
+ (None, 'bsr', 'Bassa-Kontagora'), (None, 'bss', 'Akoose'), (None, 'bst', 'Basketo'), (None, 'bsu', 'Bahonsuai'),
+ (None, 'bsv', 'Baga Sobané'), (None, 'bsw', 'Baiso'), (None, 'bsx', 'Yangkam'), (None, 'bsy', 'Sabah Bisaya'),
+ (None, 'bta', 'Bata'), (None, 'btc', 'Bati (Cameroon)'), (None, 'btd', 'Batak Dairi'), (None, 'bte', 'Gamo-Ningi'),
+ (None, 'btf', 'Birgit'), (None, 'btg', 'Gagnoa Bété'), (None, 'bth', 'Biatah Bidayuh'), (None, 'bti', 'Burate'),
+ (None, 'btj', 'Bacanese Malay'), (None, 'btm', 'Batak Mandailing'), (None, 'btn', 'Ratagnon'),
+ (None, 'bto', 'Rinconada Bikol'), (None, 'btp', 'Budibud'), (None, 'btq', 'Batek'), (None, 'btr', 'Baetora'),
+ (None, 'bts', 'Batak Simalungun'), (None, 'btt', 'Bete-Bendi'), (None, 'btu', 'Batu'), (None, 'btv', 'Bateri'),
+ (None, 'btw', 'Butuanon'), (None, 'btx', 'Batak Karo'), (None, 'bty', 'Bobot'), (None, 'btz', 'Batak Alas-Kluet'),
+ (None, 'bua', 'Buriat'), (None, 'bub', 'Bua'), (None, 'buc', 'Bushi'), (None, 'bud', 'Ntcham'),
+ (None, 'bue', 'Beothuk'), (None, 'buf', 'Bushoong'), (None, 'bug', 'Buginese'), (None, 'buh', 'Younuo Bunu'),
+ (None, 'bui', 'Bongili'), (None, 'buj', 'Basa-Gurmana'), (None, 'buk', 'Bugawac'), ('bg', 'bul', 'Bulgarian'),
+ (None, 'bum', 'Bulu (Cameroon)'), (None, 'bun', 'Sherbro'), (None, 'buo', 'Terei'), (None, 'bup', 'Busoa'),
+ (None, 'buq', 'Brem'), (None, 'bus', 'Bokobaru'), (None, 'but', 'Bungain'), (None, 'buu', 'Budu'),
+ (None, 'buv', 'Bun'), (None, 'buw', 'Bubi'), (None, 'bux', 'Boghom'), (None, 'buy', 'Bullom So'),
+ (None, 'buz', 'Bukwen'), (None, 'bva', 'Barein'), (None, 'bvb', 'Bube'), (None, 'bvc', 'Baelelea'),
+ (None, 'bvd', 'Baeggu'), (None, 'bve', 'Berau Malay'), (None, 'bvf', 'Boor'), (None, 'bvg', 'Bonkeng'),
+ (None, 'bvh', 'Bure'), (None, 'bvi', 'Belanda Viri'), (None, 'bvj', 'Baan'), (None, 'bvk', 'Bukat'),
+ (None, 'bvl', 'Bolivian Sign Language'), (None, 'bvm', 'Bamunka'), (None, 'bvn', 'Buna'), (None, 'bvo', 'Bolgo'),
+ (None, 'bvp', 'Bumang'), (None, 'bvq', 'Birri'), (None, 'bvr', 'Burarra'), (None, 'bvt', 'Bati (Indonesia)'),
+ (None, 'bvu', 'Bukit Malay'), (None, 'bvv', 'Baniva'), (None, 'bvw', 'Boga'), (None, 'bvx', 'Dibole'),
+ (None, 'bvy', 'Baybayanon'), (None, 'bvz', 'Bauzi'), (None, 'bwa', 'Bwatoo'), (None, 'bwb', 'Namosi-Naitasiri-Serua'),
+ (None, 'bwc', 'Bwile'), (None, 'bwd', 'Bwaidoka'), (None, 'bwe', 'Bwe Karen'), (None, 'bwf', 'Boselewa'),
+ (None, 'bwg', 'Barwe'), (None, 'bwh', 'Bishuo'), (None, 'bwi', 'Baniwa'), (None, 'bwj', 'Láá Láá Bwamu'),
+ (None, 'bwk', 'Bauwaki'), (None, 'bwl', 'Bwela'), (None, 'bwm', 'Biwat'), (None, 'bwn', 'Wunai Bunu'),
+ (None, 'bwo', 'Boro (Ethiopia)'), (None, 'bwp', 'Mandobo Bawah'), (None, 'bwq', 'Southern Bobo Madaré'),
+ (None, 'bwr', 'Bura-Pabir'), (None, 'bws', 'Bomboma'), (None, 'bwt', 'Bafaw-Balong'), (None, 'bwu', 'Buli (Ghana)'),
+ (None, 'bww', 'Bwa'), (None, 'bwx', 'Bu-Nao Bunu'), (None, 'bwy', 'Cwi Bwamu'), (None, 'bwz', 'Bwisi'),
+ (None, 'bxa', 'Tairaha'), (None, 'bxb', 'Belanda Bor'), (None, 'bxc', 'Molengue'), (None, 'bxd', 'Pela'),
+ (None, 'bxe', 'Birale'), (None, 'bxf', 'Bilur'), (None, 'bxg', 'Bangala'), (None, 'bxh', 'Buhutu'),
+ (None, 'bxi', 'Pirlatapa'), (None, 'bxj', 'Bayungu'), (None, 'bxk', 'Bukusu'), (None, 'bxl', 'Jalkunan'),
+ (None, 'bxm', 'Mongolia Buriat'), (None, 'bxn', 'Burduna'), (None, 'bxo', 'Barikanchi'), (None, 'bxp', 'Bebil'),
+ (None, 'bxq', 'Beele'), (None, 'bxr', 'Russia Buriat'), (None, 'bxs', 'Busam'), (None, 'bxu', 'China Buriat'),
+ (None, 'bxv', 'Berakou'), (None, 'bxw', 'Bankagooma'), (None, 'bxz', 'Binahari'), (None, 'bya', 'Batak'),
+ (None, 'byb', 'Bikya'), (None, 'byc', 'Ubaghara'), (None, 'byd', "Benyadu'"), (None, 'bye', 'Pouye'),
+ (None, 'byf', 'Bete'), (None, 'byg', 'Baygo'), (None, 'byh', 'Bhujel'), (None, 'byi', 'Buyu'),
+ (None, 'byj', 'Bina (Nigeria)'), (None, 'byk', 'Biao'), (None, 'byl', 'Bayono'), (None, 'bym', 'Bidjara'),
+ (None, 'byn', 'Bilin'), (None, 'byo', 'Biyo'), (None, 'byp', 'Bumaji'), (None, 'byq', 'Basay'),
+ (None, 'byr', 'Baruya'), (None, 'bys', 'Burak'), (None, 'byt', 'Berti'), (None, 'byv', 'Medumba'),
+ (None, 'byw', 'Belhariya'), (None, 'byx', 'Qaqet'), (None, 'byz', 'Banaro'), (None, 'bza', 'Bandi'),
+ (None, 'bzb', 'Andio'), (None, 'bzc', 'Southern Betsimisaraka Malagasy'), (None, 'bzd', 'Bribri'),
+ (None, 'bze', 'Jenaama Bozo'), (None, 'bzf', 'Boikin'), (None, 'bzg', 'Babuza'), (None, 'bzh', 'Mapos Buang'),
+ (None, 'bzi', 'Bisu'), (None, 'bzj', 'Belize Kriol English'), (None, 'bzk', 'Nicaragua Creole English'),
+ (None, 'bzl', 'Boano (Sulawesi)'), (None, 'bzm', 'Bolondo'), (None, 'bzn', 'Boano (Maluku)'), (None, 'bzo', 'Bozaba'),
+ (None, 'bzp', 'Kemberano'), (None, 'bzq', 'Buli (Indonesia)'), (None, 'bzr', 'Biri'),
+ (None, 'bzs', 'Brazilian Sign Language'), (None, 'bzt', 'Brithenig'), (None, 'bzu', 'Burmeso'), (None, 'bzv', 'Naami'),
+ (None, 'bzw', 'Basa (Nigeria)'), (None, 'bzx', 'Kɛlɛngaxo Bozo'), (None, 'bzy', 'Obanliku'), (None, 'bzz', 'Evant'),
+ (None, 'caa', 'Chortí'), (None, 'cab', 'Garifuna'), (None, 'cac', 'Chuj'), (None, 'cad', 'Caddo'),
+ (None, 'cae', 'Lehar'), (None, 'caf', 'Southern Carrier'), (None, 'cag', 'Nivaclé'), (None, 'cah', 'Cahuarano'),
+ (None, 'caj', 'Chané'), (None, 'cak', 'Kaqchikel'), (None, 'cal', 'Carolinian'), (None, 'cam', 'Cemuhî'),
+ (None, 'can', 'Chambri'), (None, 'cao', 'Chácobo'), (None, 'cap', 'Chipaya'), (None, 'caq', 'Car Nicobarese'),
+ (None, 'car', 'Galibi Carib'), (None, 'cas', 'Tsimané'), ('ca', 'cat', 'Catalan'), (None, 'cav', 'Cavineña'),
+ (None, 'caw', 'Callawalla'), (None, 'cax', 'Chiquitano'), (None, 'cay', 'Cayuga'), (None, 'caz', 'Canichana'),
+ (None, 'cbb', 'Cabiyarí'), (None, 'cbc', 'Carapana'), (None, 'cbd', 'Carijona'), (None, 'cbg', 'Chimila'),
+ (None, 'cbi', 'Chachi'), (None, 'cbj', 'Ede Cabe'), (None, 'cbk', 'Chavacano'), (None, 'cbl', 'Bualkhaw Chin'),
+ (None, 'cbn', 'Nyahkur'), (None, 'cbo', 'Izora'), (None, 'cbq', 'Tsucuba'), (None, 'cbr', 'Cashibo-Cacataibo'),
+ (None, 'cbs', 'Cashinahua'), (None, 'cbt', 'Chayahuita'), (None, 'cbu', 'Candoshi-Shapra'), (None, 'cbv', 'Cacua'),
+ (None, 'cbw', 'Kinabalian'), (None, 'cby', 'Carabayo'), (None, 'ccc', 'Chamicuro'), (None, 'ccd', 'Cafundo Creole'),
+ (None, 'cce', 'Chopi'), (None, 'ccg', 'Samba Daka'), (None, 'cch', 'Atsam'), (None, 'ccj', 'Kasanga'),
+ (None, 'ccl', 'Cutchi-Swahili'), (None, 'ccm', 'Malaccan Creole Malay'), (None, 'cco', 'Comaltepec Chinantec'),
+ (None, 'ccp', 'Chakma'), (None, 'ccr', 'Cacaopera'), (None, 'cda', 'Choni'), (None, 'cde', 'Chenchu'),
+ (None, 'cdf', 'Chiru'), (None, 'cdh', 'Chambeali'), (None, 'cdi', 'Chodri'), (None, 'cdj', 'Churahi'),
+ (None, 'cdm', 'Chepang'), (None, 'cdn', 'Chaudangsi'), (None, 'cdo', 'Min Dong Chinese'),
+ (None, 'cdr', 'Cinda-Regi-Tiyal'), (None, 'cds', 'Chadian Sign Language'), (None, 'cdy', 'Chadong'),
+ (None, 'cdz', 'Koda'), (None, 'cea', 'Lower Chehalis'), (None, 'ceb', 'Cebuano'), (None, 'ceg', 'Chamacoco'),
+ (None, 'cek', 'Eastern Khumi Chin'), (None, 'cen', 'Cen'), ('cs', 'ces', 'Czech'), (None, 'cet', 'Centúúm'),
+ (None, 'cey', 'Ekai Chin'), (None, 'cfa', 'Dijim-Bwilim'), (None, 'cfd', 'Cara'), (None, 'cfg', 'Como Karim'),
+ (None, 'cfm', 'Falam Chin'), (None, 'cga', 'Changriwa'), (None, 'cgc', 'Kagayanen'), (None, 'cgg', 'Chiga'),
+ (None, 'cgk', 'Chocangacakha'), ('ch', 'cha', 'Chamorro'), (None, 'chb', 'Chibcha'), (None, 'chc', 'Catawba'),
+ (None, 'chd', 'Highland Oaxaca Chontal'), ('ce', 'che', 'Chechen'), (None, 'chf', 'Tabasco Chontal'),
+ (None, 'chg', 'Chagatai'), (None, 'chh', 'Chinook'), (None, 'chj', 'Ojitlán Chinantec'), (None, 'chk', 'Chuukese'),
+ (None, 'chl', 'Cahuilla'), (None, 'chm', 'Mari (Russia)'), (None, 'chn', 'Chinook jargon'), (None, 'cho', 'Choctaw'),
+ (None, 'chp', 'Chipewyan'), (None, 'chq', 'Quiotepec Chinantec'), (None, 'chr', 'Cherokee'), (None, 'cht', 'Cholón'),
+ ('cu', 'chu', 'Church Slavic'), ('cv', 'chv', 'Chuvash'), (None, 'chw', 'Chuwabu'), (None, 'chx', 'Chantyal'),
+ (None, 'chy', 'Cheyenne'), (None, 'chz', 'Ozumacín Chinantec'), (None, 'cia', 'Cia-Cia'), (None, 'cib', 'Ci Gbe'),
+ (None, 'cic', 'Chickasaw'), (None, 'cid', 'Chimariko'), (None, 'cie', 'Cineni'), (None, 'cih', 'Chinali'),
+ (None, 'cik', 'Chitkuli Kinnauri'), (None, 'cim', 'Cimbrian'), (None, 'cin', 'Cinta Larga'),
+ (None, 'cip', 'Chiapanec'), (None, 'cir', 'Tiri'), (None, 'ciw', 'Chippewa'), (None, 'ciy', 'Chaima'),
+ (None, 'cja', 'Western Cham'), (None, 'cje', 'Chru'), (None, 'cjh', 'Upper Chehalis'), (None, 'cji', 'Chamalal'),
+ (None, 'cjk', 'Chokwe'), (None, 'cjm', 'Eastern Cham'), (None, 'cjn', 'Chenapian'), (None, 'cjo', 'Ashéninka Pajonal'),
+ (None, 'cjp', 'Cabécar'), (None, 'cjs', 'Shor'), (None, 'cjv', 'Chuave'), (None, 'cjy', 'Jinyu Chinese'),
+ (None, 'ckb', 'Central Kurdish'), (None, 'ckh', 'Chak'), (None, 'ckl', 'Cibak'), (None, 'ckm', 'Chakavian'),
+ (None, 'ckn', 'Kaang Chin'), (None, 'cko', 'Anufo'), (None, 'ckq', 'Kajakse'), (None, 'ckr', 'Kairak'),
+ (None, 'cks', 'Tayo'), (None, 'ckt', 'Chukot'), (None, 'cku', 'Koasati'), (None, 'ckv', 'Kavalan'),
+ (None, 'ckx', 'Caka'), (None, 'cky', 'Cakfem-Mushere'), (None, 'ckz', 'Cakchiquel-Quiché Mixed Language'),
+ (None, 'cla', 'Ron'), (None, 'clc', 'Chilcotin'), (None, 'cld', 'Chaldean Neo-Aramaic'),
+ (None, 'cle', 'Lealao Chinantec'), (None, 'clh', 'Chilisso'), (None, 'cli', 'Chakali'), (None, 'clj', 'Laitu Chin'),
+ (None, 'clk', 'Idu-Mishmi'), (None, 'cll', 'Chala'), (None, 'clm', 'Clallam'), (None, 'clo', 'Lowland Oaxaca Chontal'),
+ (None, 'clt', 'Lautu Chin'), (None, 'clu', 'Caluyanun'), (None, 'clw', 'Chulym'),
+ (None, 'cly', 'Eastern Highland Chatino'), (None, 'cma', 'Maa'), (None, 'cme', 'Cerma'),
+ (None, 'cmg', 'Classical Mongolian'), (None, 'cmi', 'Emberá-Chamí'), (None, 'cml', 'Campalagian'),
+ (None, 'cmm', 'Michigamea'), (None, 'cmn', 'Mandarin Chinese'), (None, 'cmo', 'Central Mnong'),
+ (None, 'cmr', 'Mro-Khimi Chin'), (None, 'cms', 'Messapic'), (None, 'cmt', 'Camtho'), (None, 'cna', 'Changthang'),
+ (None, 'cnb', 'Chinbon Chin'), (None, 'cnc', 'Côông'), (None, 'cng', 'Northern Qiang'), (None, 'cnh', 'Hakha Chin'),
+ (None, 'cni', 'Asháninka'), (None, 'cnk', 'Khumi Chin'), (None, 'cnl', 'Lalana Chinantec'), (None, 'cno', 'Con'),
+ (None, 'cnp', 'Northern Ping Chinese'), (None, 'cnq', 'Chung'), (None, 'cnr', 'Montenegrin'),
+ (None, 'cns', 'Central Asmat'), (None, 'cnt', 'Tepetotutla Chinantec'), (None, 'cnu', 'Chenoua'),
+ (None, 'cnw', 'Ngawn Chin'), (None, 'cnx', 'Middle Cornish'), (None, 'coa', 'Cocos Islands Malay'),
+ (None, 'cob', 'Chicomuceltec'), (None, 'coc', 'Cocopa'), (None, 'cod', 'Cocama-Cocamilla'), (None, 'coe', 'Koreguaje'),
+ (None, 'cof', 'Colorado'), (None, 'cog', 'Chong'), (None, 'coh', 'Chonyi-Dzihana-Kauma'), (None, 'coj', 'Cochimi'),
+ (None, 'cok', 'Santa Teresa Cora'), (None, 'col', 'Columbia-Wenatchi'), (None, 'com', 'Comanche'),
+ (None, 'con', 'Cofán'), (None, 'coo', 'Comox'), (None, 'cop', 'Coptic'), (None, 'coq', 'Coquille'),
+ ('kw', 'cor', 'Cornish'), ('co', 'cos', 'Corsican'), (None, 'cot', 'Caquinte'), (None, 'cou', 'Wamey'),
+ (None, 'cov', 'Cao Miao'), (None, 'cow', 'Cowlitz'), (None, 'cox', 'Nanti'), (None, 'coz', 'Chochotec'),
+ (None, 'cpa', 'Palantla Chinantec'), (None, 'cpb', 'Ucayali-Yurúa Ashéninka'), (None, 'cpc', 'Ajyíninka Apurucayali'),
+ (None, 'cpg', 'Cappadocian Greek'), (None, 'cpi', 'Chinese Pidgin English'), (None, 'cpn', 'Cherepon'),
+ (None, 'cpo', 'Kpeego'), (None, 'cps', 'Capiznon'), (None, 'cpu', 'Pichis Ashéninka'),
+ (None, 'cpx', 'Pu-Xian Chinese'), (None, 'cpy', 'South Ucayali Ashéninka'),
+ (None, 'cqd', 'Chuanqiandian Cluster Miao'), (None, 'cra', 'Chara'), (None, 'crb', 'Island Carib'),
+ (None, 'crc', 'Lonwolwol'), (None, 'crd', "Coeur d'Alene"), ('cr', 'cre', 'Cree'), (None, 'crf', 'Caramanta'),
+ (None, 'crg', 'Michif'), (None, 'crh', 'Crimean Tatar'), (None, 'cri', 'Sãotomense'),
+ (None, 'crj', 'Southern East Cree'), (None, 'crk', 'Plains Cree'), (None, 'crl', 'Northern East Cree'),
+ (None, 'crm', 'Moose Cree'), (None, 'crn', 'El Nayar Cora'), (None, 'cro', 'Crow'), (None, 'crq', "Iyo'wujwa Chorote"),
+ (None, 'crr', 'Carolina Algonquian'), (None, 'crs', 'Seselwa Creole French'), (None, 'crt', "Iyojwa'ja Chorote"),
+ (None, 'crv', 'Chaura'), (None, 'crw', 'Chrau'), (None, 'crx', 'Carrier'), (None, 'cry', 'Cori'),
+ (None, 'crz', 'Cruzeño'), (None, 'csa', 'Chiltepec Chinantec'), (None, 'csb', 'Kashubian'),
+ (None, 'csc', 'Catalan Sign Language'), (None, 'csd', 'Chiangmai Sign Language'), (None, 'cse', 'Czech Sign Language'),
+ (None, 'csf', 'Cuba Sign Language'), (None, 'csg', 'Chilean Sign Language'), (None, 'csh', 'Asho Chin'),
+ (None, 'csi', 'Coast Miwok'), (None, 'csj', 'Songlai Chin'), (None, 'csk', 'Jola-Kasa'),
+ (None, 'csl', 'Chinese Sign Language'), (None, 'csm', 'Central Sierra Miwok'),
+ (None, 'csn', 'Colombian Sign Language'), (None, 'cso', 'Sochiapam Chinantec'), (None, 'csp', 'Southern Ping Chinese'),
+ (None, 'csq', 'Croatia Sign Language'), (None, 'csr', 'Costa Rican Sign Language'), (None, 'css', 'Southern Ohlone'),
+ (None, 'cst', 'Northern Ohlone'), (None, 'csv', 'Sumtu Chin'), (None, 'csw', 'Swampy Cree'),
+ (None, 'csx', 'Cambodian Sign Language'), (None, 'csy', 'Siyin Chin'), (None, 'csz', 'Coos'),
+ (None, 'cta', 'Tataltepec Chatino'), (None, 'ctc', 'Chetco'), (None, 'ctd', 'Tedim Chin'),
+ (None, 'cte', 'Tepinapa Chinantec'), (None, 'ctg', 'Chittagonian'), (None, 'cth', 'Thaiphum Chin'),
+ (None, 'ctl', 'Tlacoatzintepec Chinantec'), (None, 'ctm', 'Chitimacha'), (None, 'ctn', 'Chhintange'),
+ (None, 'cto', 'Emberá-Catío'), (None, 'ctp', 'Western Highland Chatino'), (None, 'cts', 'Northern Catanduanes Bikol'),
+ (None, 'ctt', 'Wayanad Chetti'), (None, 'ctu', 'Chol'), (None, 'cty', 'Moundadan Chetty'),
+ (None, 'ctz', 'Zacatepec Chatino'), (None, 'cua', 'Cua'), (None, 'cub', 'Cubeo'), (None, 'cuc', 'Usila Chinantec'),
+ (None, 'cuh', 'Chuka'), (None, 'cui', 'Cuiba'), (None, 'cuj', 'Mashco Piro'), (None, 'cuk', 'San Blas Kuna'),
+ (None, 'cul', 'Culina'), (None, 'cuo', 'Cumanagoto'), (None, 'cup', 'Cupeño'), (None, 'cuq', 'Cun'),
+ (None, 'cur', 'Chhulung'), (None, 'cut', 'Teutila Cuicatec'), (None, 'cuu', 'Tai Ya'), (None, 'cuv', 'Cuvok'),
+ (None, 'cuw', 'Chukwa'), (None, 'cux', 'Tepeuxila Cuicatec'), (None, 'cuy', 'Cuitlatec'), (None, 'cvg', 'Chug'),
+ (None, 'cvn', 'Valle Nacional Chinantec'), (None, 'cwa', 'Kabwa'), (None, 'cwb', 'Maindo'),
+ (None, 'cwd', 'Woods Cree'), (None, 'cwe', 'Kwere'), (None, 'cwg', 'Chewong'), (None, 'cwt', 'Kuwaataay'),
+ (None, 'cya', 'Nopala Chatino'), (None, 'cyb', 'Cayubaba'), ('cy', 'cym', 'Welsh'), (None, 'cyo', 'Cuyonon'),
+ (None, 'czh', 'Huizhou Chinese'), (None, 'czk', 'Knaanic'), (None, 'czn', 'Zenzontepec Chatino'),
+ (None, 'czo', 'Min Zhong Chinese'), (None, 'czt', 'Zotung Chin'), (None, 'daa', 'Dangaléat'), (None, 'dac', 'Dambi'),
+ (None, 'dad', 'Marik'), (None, 'dae', 'Duupa'), (None, 'dag', 'Dagbani'), (None, 'dah', 'Gwahatike'),
+ (None, 'dai', 'Day'), (None, 'daj', 'Dar Fur Daju'), (None, 'dak', 'Dakota'), (None, 'dal', 'Dahalo'),
+ (None, 'dam', 'Damakawa'), ('da', 'dan', 'Danish'), (None, 'dao', 'Daai Chin'), (None, 'daq', 'Dandami Maria'),
+ (None, 'dar', 'Dargwa'), (None, 'das', 'Daho-Doo'), (None, 'dau', 'Dar Sila Daju'), (None, 'dav', 'Taita'),
+ (None, 'daw', 'Davawenyo'), (None, 'dax', 'Dayi'), (None, 'daz', 'Dao'), (None, 'dba', 'Bangime'),
+ (None, 'dbb', 'Deno'), (None, 'dbd', 'Dadiya'), (None, 'dbe', 'Dabe'), (None, 'dbf', 'Edopi'),
+ (None, 'dbg', 'Dogul Dom Dogon'), (None, 'dbi', 'Doka'), (None, 'dbj', "Ida'an"), (None, 'dbl', 'Dyirbal'),
+ (None, 'dbm', 'Duguri'), (None, 'dbn', 'Duriankere'), (None, 'dbo', 'Dulbu'), (None, 'dbp', 'Duwai'),
+ (None, 'dbq', 'Daba'), (None, 'dbr', 'Dabarre'), (None, 'dbt', 'Ben Tey Dogon'), (None, 'dbu', 'Bondum Dom Dogon'),
+ (None, 'dbv', 'Dungu'), (None, 'dbw', 'Bankan Tey Dogon'), (None, 'dby', 'Dibiyaso'), (None, 'dcc', 'Deccan'),
+ (None, 'dcr', 'Negerhollands'), (None, 'dda', 'Dadi Dadi'), (None, 'ddd', 'Dongotono'), (None, 'dde', 'Doondo'),
+ (None, 'ddg', 'Fataluku'), (None, 'ddi', 'West Goodenough'), (None, 'ddj', 'Jaru'), (None, 'ddn', 'Dendi (Benin)'),
+ (None, 'ddo', 'Dido'), (None, 'ddr', 'Dhudhuroa'), (None, 'dds', 'Donno So Dogon'), (None, 'ddw', 'Dawera-Daweloor'),
+ (None, 'dec', 'Dagik'), (None, 'ded', 'Dedua'), (None, 'dee', 'Dewoin'), (None, 'def', 'Dezfuli'),
+ (None, 'deg', 'Degema'), (None, 'deh', 'Dehwari'), (None, 'dei', 'Demisa'), (None, 'dek', 'Dek'),
+ (None, 'del', 'Delaware'), (None, 'dem', 'Dem'), (None, 'den', 'Slave (Athapascan)'), (None, 'dep', 'Pidgin Delaware'),
+ (None, 'deq', 'Dendi (Central African Republic)'), (None, 'der', 'Deori'), (None, 'des', 'Desano'),
+ ('de', 'deu', 'German'), (None, 'dev', 'Domung'), (None, 'dez', 'Dengese'), (None, 'dga', 'Southern Dagaare'),
+ (None, 'dgb', 'Bunoge Dogon'), (None, 'dgc', 'Casiguran Dumagat Agta'), (None, 'dgd', 'Dagaari Dioula'),
+ (None, 'dge', 'Degenan'), (None, 'dgg', 'Doga'), (None, 'dgh', 'Dghwede'), (None, 'dgi', 'Northern Dagara'),
+ (None, 'dgk', 'Dagba'), (None, 'dgl', 'Andaandi'), (None, 'dgn', 'Dagoman'),
+ (None, 'dgo', 'Dogri (individual language)'), (None, 'dgr', 'Dogrib'), (None, 'dgs', 'Dogoso'),
+ (None, 'dgt', "Ndra'ngith"), (None, 'dgw', 'Daungwurrung'), (None, 'dgx', 'Doghoro'), (None, 'dgz', 'Daga'),
+ (None, 'dhd', 'Dhundari'), (None, 'dhg', 'Dhangu-Djangu'), (None, 'dhi', 'Dhimal'), (None, 'dhl', 'Dhalandji'),
+ (None, 'dhm', 'Zemba'), (None, 'dhn', 'Dhanki'), (None, 'dho', 'Dhodia'), (None, 'dhr', 'Dhargari'),
+ (None, 'dhs', 'Dhaiso'), (None, 'dhu', 'Dhurga'), (None, 'dhv', 'Dehu'), (None, 'dhw', 'Dhanwar (Nepal)'),
+ (None, 'dhx', 'Dhungaloo'), (None, 'dia', 'Dia'), (None, 'dib', 'South Central Dinka'), (None, 'dic', 'Lakota Dida'),
+ (None, 'did', 'Didinga'), (None, 'dif', 'Dieri'), (None, 'dig', 'Digo'), (None, 'dih', 'Kumiai'),
+ (None, 'dii', 'Dimbong'), (None, 'dij', 'Dai'), (None, 'dik', 'Southwestern Dinka'), (None, 'dil', 'Dilling'),
+ (None, 'dim', 'Dime'), (None, 'din', 'Dinka'), (None, 'dio', 'Dibo'), (None, 'dip', 'Northeastern Dinka'),
+ (None, 'diq', 'Dimli (individual language)'), (None, 'dir', 'Dirim'), (None, 'dis', 'Dimasa'), (None, 'diu', 'Diriku'),
+ ('dv', 'div', 'Dhivehi'), (None, 'diw', 'Northwestern Dinka'), (None, 'dix', 'Dixon Reef'), (None, 'diy', 'Diuwe'),
+ (None, 'diz', 'Ding'), (None, 'dja', 'Djadjawurrung'), (None, 'djb', 'Djinba'), (None, 'djc', 'Dar Daju Daju'),
+ (None, 'djd', 'Djamindjung'), (None, 'dje', 'Zarma'), (None, 'djf', 'Djangun'), (None, 'dji', 'Djinang'),
+ (None, 'djj', 'Djeebbana'), (None, 'djk', 'Eastern Maroon Creole'), (None, 'djm', 'Jamsay Dogon'),
+ (None, 'djn', 'Jawoyn'), (None, 'djo', 'Jangkang'), (None, 'djr', 'Djambarrpuyngu'), (None, 'dju', 'Kapriman'),
+ (None, 'djw', 'Djawi'), (None, 'dka', 'Dakpakha'), (None, 'dkg', 'Kadung'), (None, 'dkk', 'Dakka'),
+ (None, 'dkr', 'Kuijau'), (None, 'dks', 'Southeastern Dinka'), (None, 'dkx', 'Mazagway'), (None, 'dlg', 'Dolgan'),
+ (None, 'dlk', 'Dahalik'), (None, 'dlm', 'Dalmatian'), (None, 'dln', 'Darlong'), (None, 'dma', 'Duma'),
+ (None, 'dmb', 'Mombo Dogon'), (None, 'dmc', 'Gavak'), (None, 'dmd', 'Madhi Madhi'), (None, 'dme', 'Dugwor'),
+ (None, 'dmf', 'Medefaidrin'), (None, 'dmg', 'Upper Kinabatangan'), (None, 'dmk', 'Domaaki'), (None, 'dml', 'Dameli'),
+ (None, 'dmm', 'Dama'), (None, 'dmo', 'Kemedzung'), (None, 'dmr', 'East Damar'), (None, 'dms', 'Dampelas'),
+ (None, 'dmu', 'Dubu'), (None, 'dmv', 'Dumpas'), (None, 'dmw', 'Mudburra'), (None, 'dmx', 'Dema'),
+ (None, 'dmy', 'Demta'), (None, 'dna', 'Upper Grand Valley Dani'), (None, 'dnd', 'Daonda'), (None, 'dne', 'Ndendeule'),
+ (None, 'dng', 'Dungan'), (None, 'dni', 'Lower Grand Valley Dani'), (None, 'dnj', 'Dan'), (None, 'dnk', 'Dengka'),
+ (None, 'dnn', 'Dzùùngoo'), (None, 'dno', 'Ndrulo'), (None, 'dnr', 'Danaru'), (None, 'dnt', 'Mid Grand Valley Dani'),
+ (None, 'dnu', 'Danau'), (None, 'dnv', 'Danu'), (None, 'dnw', 'Western Dani'), (None, 'dny', 'Dení'),
+ (None, 'doa', 'Dom'), (None, 'dob', 'Dobu'), (None, 'doc', 'Northern Dong'), (None, 'doe', 'Doe'),
+ (None, 'dof', 'Domu'), (None, 'doh', 'Dong'), (None, 'doi', 'Dogri (macrolanguage)'), (None, 'dok', 'Dondo'),
+ (None, 'dol', 'Doso'), (None, 'don', 'Toura (Papua New Guinea)'), (None, 'doo', 'Dongo'), (None, 'dop', 'Lukpa'),
+ (None, 'doq', 'Dominican Sign Language'), (None, 'dor', "Dori'o"), (None, 'dos', 'Dogosé'), (None, 'dot', 'Dass'),
+ (None, 'dov', 'Dombe'), (None, 'dow', 'Doyayo'), (None, 'dox', 'Bussa'), (None, 'doy', 'Dompo'),
+ (None, 'doz', 'Dorze'), (None, 'dpp', 'Papar'), (None, 'drb', 'Dair'), (None, 'drc', 'Minderico'),
+ (None, 'drd', 'Darmiya'), (None, 'dre', 'Dolpo'), (None, 'drg', 'Rungus'), (None, 'dri', "C'Lela"),
+ (None, 'drl', 'Paakantyi'), (None, 'drn', 'West Damar'), (None, 'dro', 'Daro-Matu Melanau'), (None, 'drq', 'Dura'),
+ (None, 'drs', 'Gedeo'), (None, 'drt', 'Drents'), (None, 'dru', 'Rukai'), (None, 'dry', 'Darai'),
+ (None, 'dsb', 'Lower Sorbian'), (None, 'dse', 'Dutch Sign Language'), (None, 'dsh', 'Daasanach'),
+ (None, 'dsi', 'Disa'), (None, 'dsl', 'Danish Sign Language'), (None, 'dsn', 'Dusner'), (None, 'dso', 'Desiya'),
+ (None, 'dsq', 'Tadaksahak'), (None, 'dsz', 'Mardin Sign Language'), (None, 'dta', 'Daur'),
+ (None, 'dtb', 'Labuk-Kinabatangan Kadazan'), (None, 'dtd', 'Ditidaht'), (None, 'dth', 'Adithinngithigh'),
+ (None, 'dti', 'Ana Tinga Dogon'), (None, 'dtk', 'Tene Kan Dogon'), (None, 'dtm', 'Tomo Kan Dogon'),
+ (None, 'dtn', 'Daatsʼíin'), (None, 'dto', 'Tommo So Dogon'), (None, 'dtp', 'Kadazan Dusun'), (None, 'dtr', 'Lotud'),
+ (None, 'dts', 'Toro So Dogon'), (None, 'dtt', 'Toro Tegu Dogon'), (None, 'dtu', 'Tebul Ure Dogon'),
+ (None, 'dty', 'Dotyali'), (None, 'dua', 'Duala'), (None, 'dub', 'Dubli'), (None, 'duc', 'Duna'),
+ (None, 'due', 'Umiray Dumaget Agta'), (None, 'duf', 'Dumbea'), (None, 'dug', 'Duruma'), (None, 'duh', 'Dungra Bhil'),
+ (None, 'dui', 'Dumun'), (None, 'duk', 'Uyajitaya'), (None, 'dul', 'Alabat Island Agta'),
+ (None, 'dum', 'Middle Dutch (ca. 1050-1350)'), (None, 'dun', 'Dusun Deyah'), (None, 'duo', 'Dupaninan Agta'),
+ (None, 'dup', 'Duano'), (None, 'duq', 'Dusun Malang'), (None, 'dur', 'Dii'), (None, 'dus', 'Dumi'),
+ (None, 'duu', 'Drung'), (None, 'duv', 'Duvle'), (None, 'duw', 'Dusun Witu'), (None, 'dux', 'Duungooma'),
+ (None, 'duy', 'Dicamay Agta'), (None, 'duz', 'Duli-Gey'), (None, 'dva', 'Duau'), (None, 'dwa', 'Diri'),
+ (None, 'dwk', 'Dawik Kui'), (None, 'dwr', 'Dawro'), (None, 'dws', 'Dutton World Speedwords'), (None, 'dwu', 'Dhuwal'),
+ (None, 'dww', 'Dawawa'), (None, 'dwy', 'Dhuwaya'), (None, 'dwz', 'Dewas Rai'), (None, 'dya', 'Dyan'),
+ (None, 'dyb', 'Dyaberdyaber'), (None, 'dyd', 'Dyugun'), (None, 'dyg', 'Villa Viciosa Agta'),
+ (None, 'dyi', 'Djimini Senoufo'), (None, 'dym', 'Yanda Dom Dogon'), (None, 'dyn', 'Dyangadi'),
+ (None, 'dyo', 'Jola-Fonyi'), (None, 'dyu', 'Dyula'), (None, 'dyy', 'Djabugay'), (None, 'dza', 'Tunzu'),
+ (None, 'dze', 'Djiwarli'), (None, 'dzg', 'Dazaga'), (None, 'dzl', 'Dzalakha'), (None, 'dzn', 'Dzando'),
+ ('dz', 'dzo', 'Dzongkha'), (None, 'eaa', 'Karenggapa'), (None, 'ebc', 'Beginci'), (None, 'ebg', 'Ebughu'),
+ (None, 'ebk', 'Eastern Bontok'), (None, 'ebo', 'Teke-Ebo'), (None, 'ebr', 'Ebrié'), (None, 'ebu', 'Embu'),
+ (None, 'ecr', 'Eteocretan'), (None, 'ecs', 'Ecuadorian Sign Language'), (None, 'ecy', 'Eteocypriot'),
+ (None, 'eee', 'E'), (None, 'efa', 'Efai'), (None, 'efe', 'Efe'), (None, 'efi', 'Efik'), (None, 'ega', 'Ega'),
+ (None, 'egl', 'Emilian'), (None, 'egm', 'Benamanga'), (None, 'ego', 'Eggon'), (None, 'egy', 'Egyptian (Ancient)'),
+ (None, 'ehs', 'Miyakubo Sign Language'), (None, 'ehu', 'Ehueun'), (None, 'eip', 'Eipomek'), (None, 'eit', 'Eitiep'),
+ (None, 'eiv', 'Askopan'), (None, 'eja', 'Ejamat'), (None, 'eka', 'Ekajuk'), (None, 'eke', 'Ekit'),
+ (None, 'ekg', 'Ekari'), (None, 'eki', 'Eki'), (None, 'ekk', 'Standard Estonian'), (None, 'ekl', 'Kol (Bangladesh)'),
+ (None, 'ekm', 'Elip'), (None, 'eko', 'Koti'), (None, 'ekp', 'Ekpeye'), (None, 'ekr', 'Yace'),
+ (None, 'eky', 'Eastern Kayah'), (None, 'ele', 'Elepi'), (None, 'elh', 'El Hugeirat'), (None, 'eli', 'Nding'),
+ (None, 'elk', 'Elkei'), ('el', 'ell', 'Modern Greek (1453-)'), (None, 'elm', 'Eleme'), (None, 'elo', 'El Molo'),
+ (None, 'elu', 'Elu'), (None, 'elx', 'Elamite'), (None, 'ema', 'Emai-Iuleha-Ora'), (None, 'emb', 'Embaloh'),
+ (None, 'eme', 'Emerillon'), (None, 'emg', 'Eastern Meohang'), (None, 'emi', 'Mussau-Emira'),
+ (None, 'emk', 'Eastern Maninkakan'), (None, 'emm', 'Mamulique'), (None, 'emn', 'Eman'),
+ (None, 'emp', 'Northern Emberá'), (None, 'emq', 'Eastern Minyag'), (None, 'ems', 'Pacific Gulf Yupik'),
+ (None, 'emu', 'Eastern Muria'), (None, 'emw', 'Emplawas'), (None, 'emx', 'Erromintxela'),
+ (None, 'emy', 'Epigraphic Mayan'), (None, 'emz', 'Mbessa'), (None, 'ena', 'Apali'), (None, 'enb', 'Markweeta'),
+ (None, 'enc', 'En'), (None, 'end', 'Ende'), (None, 'enf', 'Forest Enets'), ('en', 'eng', 'English'),
+ (None, 'enh', 'Tundra Enets'), (None, 'enl', 'Enlhet'), (None, 'enm', 'Middle English (1100-1500)'),
+ (None, 'enn', 'Engenni'), (None, 'eno', 'Enggano'), (None, 'enq', 'Enga'), (None, 'enr', 'Emumu'),
+ (None, 'enu', 'Enu'), (None, 'env', 'Enwan (Edo State)'), (None, 'enw', 'Enwan (Akwa Ibom State)'),
+ (None, 'enx', 'Enxet'), (None, 'eot', "Beti (Côte d'Ivoire)"), (None, 'epi', 'Epie'), ('eo', 'epo', 'Esperanto'),
+ (None, 'era', 'Eravallan'), (None, 'erg', 'Sie'), (None, 'erh', 'Eruwa'), (None, 'eri', 'Ogea'),
+ (None, 'erk', 'South Efate'), (None, 'ero', 'Horpa'), (None, 'err', 'Erre'), (None, 'ers', 'Ersu'),
+ (None, 'ert', 'Eritai'), (None, 'erw', 'Erokwanas'), (None, 'ese', 'Ese Ejja'), (None, 'esg', 'Aheri Gondi'),
+ (None, 'esh', 'Eshtehardi'), (None, 'esi', 'North Alaskan Inupiatun'), (None, 'esk', 'Northwest Alaska Inupiatun'),
+ (None, 'esl', 'Egypt Sign Language'), (None, 'esm', 'Esuma'), (None, 'esn', 'Salvadoran Sign Language'),
+ (None, 'eso', 'Estonian Sign Language'), (None, 'esq', 'Esselen'), (None, 'ess', 'Central Siberian Yupik'),
+ ('et', 'est', 'Estonian'), (None, 'esu', 'Central Yupik'), (None, 'esy', 'Eskayan'), (None, 'etb', 'Etebi'),
+ (None, 'etc', 'Etchemin'), (None, 'eth', 'Ethiopian Sign Language'), (None, 'etn', 'Eton (Vanuatu)'),
+ (None, 'eto', 'Eton (Cameroon)'), (None, 'etr', 'Edolo'), (None, 'ets', 'Yekhee'), (None, 'ett', 'Etruscan'),
+ (None, 'etu', 'Ejagham'), (None, 'etx', 'Eten'), (None, 'etz', 'Semimi'), ('eu', 'eus', 'Basque'),
+ (None, 'eve', 'Even'), (None, 'evh', 'Uvbie'), (None, 'evn', 'Evenki'), ('ee', 'ewe', 'Ewe'), (None, 'ewo', 'Ewondo'),
+ (None, 'ext', 'Extremaduran'), (None, 'eya', 'Eyak'), (None, 'eyo', 'Keiyo'), (None, 'eza', 'Ezaa'),
+ (None, 'eze', 'Uzekwe'), (None, 'faa', 'Fasu'), (None, 'fab', "Fa d'Ambu"), (None, 'fad', 'Wagi'),
+ (None, 'faf', 'Fagani'), (None, 'fag', 'Finongan'), (None, 'fah', 'Baissa Fali'), (None, 'fai', 'Faiwol'),
+ (None, 'faj', 'Faita'), (None, 'fak', 'Fang (Cameroon)'), (None, 'fal', 'South Fali'), (None, 'fam', 'Fam'),
+ (None, 'fan', 'Fang (Equatorial Guinea)'), ('fo', 'fao', 'Faroese'), (None, 'fap', 'Paloor'),
+ (None, 'far', 'Fataleka'), ('fa', 'fas', 'Persian'), (None, 'fat', 'Fanti'), (None, 'fau', 'Fayu'),
+ (None, 'fax', 'Fala'), (None, 'fay', 'Southwestern Fars'), (None, 'faz', 'Northwestern Fars'),
+ (None, 'fbl', 'West Albay Bikol'), (None, 'fcs', 'Quebec Sign Language'), (None, 'fer', 'Feroge'),
+ (None, 'ffi', 'Foia Foia'), (None, 'ffm', 'Maasina Fulfulde'), (None, 'fgr', 'Fongoro'), (None, 'fia', 'Nobiin'),
+ (None, 'fie', 'Fyer'), (None, 'fif', 'Faifi'), ('fj', 'fij', 'Fijian'), (None, 'fil', 'Filipino'),
+ ('fi', 'fin', 'Finnish'), (None, 'fip', 'Fipa'), (None, 'fir', 'Firan'), (None, 'fit', 'Tornedalen Finnish'),
+ (None, 'fiw', 'Fiwaga'), (None, 'fkk', 'Kirya-Konzəl'), (None, 'fkv', 'Kven Finnish'),
+ (None, 'fla', "Kalispel-Pend d'Oreille"), (None, 'flh', 'Foau'), (None, 'fli', 'Fali'), (None, 'fll', 'North Fali'),
+ (None, 'fln', 'Flinders Island'), (None, 'flr', 'Fuliiru'), (None, 'fly', 'Flaaitaal'), (None, 'fmp', "Fe'fe'"),
+ (None, 'fmu', 'Far Western Muria'), (None, 'fnb', 'Fanbak'), (None, 'fng', 'Fanagalo'), (None, 'fni', 'Fania'),
+ (None, 'fod', 'Foodo'), (None, 'foi', 'Foi'), (None, 'fom', 'Foma'), (None, 'fon', 'Fon'), (None, 'for', 'Fore'),
+ (None, 'fos', 'Siraya'), (None, 'fpe', 'Fernando Po Creole English'), (None, 'fqs', 'Fas'), ('fr', 'fra', 'French'),
+ (None, 'frc', 'Cajun French'), (None, 'frd', 'Fordata'), (None, 'frk', 'Frankish'),
+ (None, 'frm', 'Middle French (ca. 1400-1600)'), (None, 'fro', 'Old French (842-ca. 1400)'), (None, 'frp', 'Arpitan'),
+ (None, 'frq', 'Forak'), (None, 'frr', 'Northern Frisian'), (None, 'frs', 'Eastern Frisian'),
+ (None, 'frt', 'Fortsenal'), ('fy', 'fry', 'Western Frisian'), (None, 'fse', 'Finnish Sign Language'),
+ (None, 'fsl', 'French Sign Language'), (None, 'fss', 'Finland-Swedish Sign Language'),
+ (None, 'fub', 'Adamawa Fulfulde'), (None, 'fuc', 'Pulaar'), (None, 'fud', 'East Futuna'),
+ (None, 'fue', 'Borgu Fulfulde'), (None, 'fuf', 'Pular'), (None, 'fuh', 'Western Niger Fulfulde'),
+ (None, 'fui', 'Bagirmi Fulfulde'), (None, 'fuj', 'Ko'), ('ff', 'ful', 'Fulah'), (None, 'fum', 'Fum'),
+ (None, 'fun', 'Fulniô'), (None, 'fuq', 'Central-Eastern Niger Fulfulde'), (None, 'fur', 'Friulian'),
+ (None, 'fut', 'Futuna-Aniwa'), (None, 'fuu', 'Furu'), (None, 'fuv', 'Nigerian Fulfulde'), (None, 'fuy', 'Fuyug'),
+ (None, 'fvr', 'Fur'), (None, 'fwa', 'Fwâi'), (None, 'fwe', 'Fwe'), (None, 'gaa', 'Ga'), (None, 'gab', 'Gabri'),
+ (None, 'gac', 'Mixed Great Andamanese'), (None, 'gad', 'Gaddang'), (None, 'gae', 'Guarequena'), (None, 'gaf', 'Gende'),
+ (None, 'gag', 'Gagauz'), (None, 'gah', 'Alekano'), (None, 'gai', 'Borei'), (None, 'gaj', 'Gadsup'),
+ (None, 'gak', 'Gamkonora'), (None, 'gal', 'Galolen'), (None, 'gam', 'Kandawo'), (None, 'gan', 'Gan Chinese'),
+ (None, 'gao', 'Gants'), (None, 'gap', 'Gal'), (None, 'gaq', "Gata'"), (None, 'gar', 'Galeya'),
+ (None, 'gas', 'Adiwasi Garasia'), (None, 'gat', 'Kenati'), (None, 'gau', 'Mudhili Gadaba'), (None, 'gaw', 'Nobonob'),
+ (None, 'gax', 'Borana-Arsi-Guji Oromo'), (None, 'gay', 'Gayo'), (None, 'gaz', 'West Central Oromo'),
+ (None, 'gba', 'Gbaya (Central African Republic)'), (None, 'gbb', 'Kaytetye'), (None, 'gbd', 'Karajarri'),
+ (None, 'gbe', 'Niksek'), (None, 'gbf', 'Gaikundi'), (None, 'gbg', 'Gbanziri'), (None, 'gbh', 'Defi Gbe'),
+ (None, 'gbi', 'Galela'), (None, 'gbj', 'Bodo Gadaba'), (None, 'gbk', 'Gaddi'), (None, 'gbl', 'Gamit'),
+ (None, 'gbm', 'Garhwali'), (None, 'gbn', "Mo'da"), (None, 'gbo', 'Northern Grebo'), (None, 'gbp', 'Gbaya-Bossangoa'),
+ (None, 'gbq', 'Gbaya-Bozoum'), (None, 'gbr', 'Gbagyi'), (None, 'gbs', 'Gbesi Gbe'), (None, 'gbu', 'Gagadu'),
+ (None, 'gbv', 'Gbanu'), (None, 'gbw', 'Gabi-Gabi'), (None, 'gbx', 'Eastern Xwla Gbe'), (None, 'gby', 'Gbari'),
+ (None, 'gbz', 'Zoroastrian Dari'), (None, 'gcc', 'Mali'), (None, 'gcd', 'Ganggalida'), (None, 'gce', 'Galice'),
+ (None, 'gcf', 'Guadeloupean Creole French'), (None, 'gcl', 'Grenadian Creole English'), (None, 'gcn', 'Gaina'),
+ (None, 'gcr', 'Guianese Creole French'), (None, 'gct', 'Colonia Tovar German'), (None, 'gda', 'Gade Lohar'),
+ (None, 'gdb', 'Pottangi Ollar Gadaba'), (None, 'gdc', 'Gugu Badhun'), (None, 'gdd', 'Gedaged'), (None, 'gde', 'Gude'),
+ (None, 'gdf', 'Guduf-Gava'), (None, 'gdg', "Ga'dang"), (None, 'gdh', 'Gadjerawang'), (None, 'gdi', 'Gundi'),
+ (None, 'gdj', 'Gurdjar'), (None, 'gdk', 'Gadang'), (None, 'gdl', 'Dirasha'), (None, 'gdm', 'Laal'),
+ (None, 'gdn', 'Umanakaina'), (None, 'gdo', 'Ghodoberi'), (None, 'gdq', 'Mehri'), (None, 'gdr', 'Wipi'),
+ (None, 'gds', 'Ghandruk Sign Language'), (None, 'gdt', 'Kungardutyi'), (None, 'gdu', 'Gudu'), (None, 'gdx', 'Godwari'),
+ (None, 'gea', 'Geruma'), (None, 'geb', 'Kire'), (None, 'gec', 'Gboloo Grebo'), (None, 'ged', 'Gade'),
+ (None, 'gef', 'Gerai'), (None, 'geg', 'Gengle'), (None, 'geh', 'Hutterite German'), (None, 'gei', 'Gebe'),
+ (None, 'gej', 'Gen'), (None, 'gek', 'Ywom'), (None, 'gel', "ut-Ma'in"), (None, 'geq', 'Geme'),
+ (None, 'ges', 'Geser-Gorom'), (None, 'gev', 'Eviya'), (None, 'gew', 'Gera'), (None, 'gex', 'Garre'),
+ (None, 'gey', 'Enya'), (None, 'gez', 'Geez'), (None, 'gfk', 'Patpatar'), (None, 'gft', 'Gafat'), (None, 'gga', 'Gao'),
+ (None, 'ggb', 'Gbii'), (None, 'ggd', 'Gugadj'), (None, 'gge', 'Gurr-goni'), (None, 'ggg', 'Gurgula'),
+ (None, 'ggk', 'Kungarakany'), (None, 'ggl', 'Ganglau'), (None, 'ggt', 'Gitua'), (None, 'ggu', 'Gagu'),
+ (None, 'ggw', 'Gogodala'), (None, 'gha', 'Ghadamès'), (None, 'ghc', 'Hiberno-Scottish Gaelic'),
+ (None, 'ghe', 'Southern Ghale'), (None, 'ghh', 'Northern Ghale'), (None, 'ghk', 'Geko Karen'),
+ (None, 'ghl', 'Ghulfan'), (None, 'ghn', 'Ghanongga'), (None, 'gho', 'Ghomara'), (None, 'ghr', 'Ghera'),
+ (None, 'ghs', 'Guhu-Samane'), (None, 'ght', 'Kuke'), (None, 'gia', 'Kija'), (None, 'gib', 'Gibanawa'),
+ (None, 'gic', 'Gail'), (None, 'gid', 'Gidar'), (None, 'gie', 'Gaɓogbo'), (None, 'gig', 'Goaria'),
+ (None, 'gih', 'Githabul'), (None, 'gii', 'Girirra'), (None, 'gil', 'Gilbertese'),
+ (None, 'gim', 'Gimi (Eastern Highlands)'), (None, 'gin', 'Hinukh'), (None, 'gip', 'Gimi (West New Britain)'),
+ (None, 'giq', 'Green Gelao'), (None, 'gir', 'Red Gelao'), (None, 'gis', 'North Giziga'), (None, 'git', 'Gitxsan'),
+ (None, 'giu', 'Mulao'), (None, 'giw', 'White Gelao'), (None, 'gix', 'Gilima'), (None, 'giy', 'Giyug'),
+ (None, 'giz', 'South Giziga'), (None, 'gjk', 'Kachi Koli'), (None, 'gjm', 'Gunditjmara'), (None, 'gjn', 'Gonja'),
+ (None, 'gjr', 'Gurindji Kriol'), (None, 'gju', 'Gujari'), (None, 'gka', 'Guya'),
+ (None, 'gkd', 'Magɨ (Madang Province)'), (None, 'gke', 'Ndai'), (None, 'gkn', 'Gokana'), (None, 'gko', 'Kok-Nar'),
+ (None, 'gkp', 'Guinea Kpelle'), (None, 'gku', 'ǂUngkue'), ('gd', 'gla', 'Scottish Gaelic'), (None, 'glb', 'Belning'),
+ (None, 'glc', 'Bon Gula'), (None, 'gld', 'Nanai'), ('ga', 'gle', 'Irish'), ('gl', 'glg', 'Galician'),
+ (None, 'glh', 'Northwest Pashai'), (None, 'glj', 'Gula Iro'), (None, 'glk', 'Gilaki'), (None, 'gll', 'Garlali'),
+ (None, 'glo', 'Galambu'), (None, 'glr', 'Glaro-Twabo'), (None, 'glu', 'Gula (Chad)'), ('gv', 'glv', 'Manx'),
+ (None, 'glw', 'Glavda'), (None, 'gly', 'Gule'), (None, 'gma', 'Gambera'), (None, 'gmb', "Gula'alaa"),
+ (None, 'gmd', 'Mághdì'), (None, 'gmg', 'Magɨyi'), (None, 'gmh', 'Middle High German (ca. 1050-1500)'),
+ (None, 'gml', 'Middle Low German'), (None, 'gmm', 'Gbaya-Mbodomo'), (None, 'gmn', 'Gimnime'), (None, 'gmr', 'Mirning'),
+ (None, 'gmu', 'Gumalu'), (None, 'gmv', 'Gamo'), (None, 'gmx', 'Magoma'), (None, 'gmy', 'Mycenaean Greek'),
+ (None, 'gmz', 'Mgbolizhia'), (None, 'gna', 'Kaansa'), (None, 'gnb', 'Gangte'), (None, 'gnc', 'Guanche'),
+ (None, 'gnd', 'Zulgo-Gemzek'), (None, 'gne', 'Ganang'), (None, 'gng', 'Ngangam'), (None, 'gnh', 'Lere'),
+ (None, 'gni', 'Gooniyandi'), (None, 'gnj', 'Ngen'), (None, 'gnk', 'ǁGana'), (None, 'gnl', 'Gangulu'),
+ (None, 'gnm', 'Ginuman'), (None, 'gnn', 'Gumatj'), (None, 'gno', 'Northern Gondi'), (None, 'gnq', 'Gana'),
+ (None, 'gnr', 'Gureng Gureng'), (None, 'gnt', 'Guntai'), (None, 'gnu', 'Gnau'),
+ (None, 'gnw', 'Western Bolivian Guaraní'), (None, 'gnz', 'Ganzi'), (None, 'goa', 'Guro'), (None, 'gob', 'Playero'),
+ (None, 'goc', 'Gorakor'), (None, 'god', 'Godié'), (None, 'goe', 'Gongduk'), (None, 'gof', 'Gofa'),
+ (None, 'gog', 'Gogo'), (None, 'goh', 'Old High German (ca. 750-1050)'), (None, 'goi', 'Gobasi'),
+ (None, 'goj', 'Gowlan'), (None, 'gok', 'Gowli'), (None, 'gol', 'Gola'), (None, 'gom', 'Goan Konkani'),
+ (None, 'gon', 'Gondi'), (None, 'goo', 'Gone Dau'), (None, 'gop', 'Yeretuar'), (None, 'goq', 'Gorap'),
+ (None, 'gor', 'Gorontalo'), (None, 'gos', 'Gronings'), (None, 'got', 'Gothic'), (None, 'gou', 'Gavar'),
+ (None, 'gov', 'Goo'), (None, 'gow', 'Gorowa'), (None, 'gox', 'Gobu'), (None, 'goy', 'Goundo'),
+ (None, 'goz', 'Gozarkhani'), (None, 'gpa', 'Gupa-Abawa'), (None, 'gpe', 'Ghanaian Pidgin English'),
+ (None, 'gpn', 'Taiap'), (None, 'gqa', "Ga'anda"), (None, 'gqi', 'Guiqiong'), (None, 'gqn', 'Guana (Brazil)'),
+ (None, 'gqr', 'Gor'), (None, 'gqu', 'Qau'), (None, 'gra', 'Rajput Garasia'), (None, 'grb', 'Grebo'),
+ (None, 'grc', 'Ancient Greek (to 1453)'), (None, 'grd', 'Guruntum-Mbaaru'), (None, 'grg', 'Madi'),
+ (None, 'grh', 'Gbiri-Niragu'), (None, 'gri', 'Ghari'), (None, 'grj', 'Southern Grebo'),
+ (None, 'grm', 'Kota Marudu Talantang'), ('gn', 'grn', 'Guarani'), (None, 'gro', 'Groma'), (None, 'grq', 'Gorovu'),
+ (None, 'grr', 'Taznatit'), (None, 'grs', 'Gresi'), (None, 'grt', 'Garo'), (None, 'gru', 'Kistane'),
+ (None, 'grv', 'Central Grebo'), (None, 'grw', 'Gweda'), (None, 'grx', 'Guriaso'), (None, 'gry', 'Barclayville Grebo'),
+ (None, 'grz', 'Guramalum'), (None, 'gse', 'Ghanaian Sign Language'), (None, 'gsg', 'German Sign Language'),
+ (None, 'gsl', 'Gusilay'), (None, 'gsm', 'Guatemalan Sign Language'), (None, 'gsn', 'Nema'),
+ (None, 'gso', 'Southwest Gbaya'), (None, 'gsp', 'Wasembo'), (None, 'gss', 'Greek Sign Language'),
+ (None, 'gsw', 'Swiss German'), (None, 'gta', 'Guató'), (None, 'gtu', 'Aghu-Tharnggala'), (None, 'gua', 'Shiki'),
+ (None, 'gub', 'Guajajára'), (None, 'guc', 'Wayuu'), (None, 'gud', 'Yocoboué Dida'), (None, 'gue', 'Gurindji'),
+ (None, 'guf', 'Gupapuyngu'), (None, 'gug', 'Paraguayan Guaraní'), (None, 'guh', 'Guahibo'),
+ (None, 'gui', 'Eastern Bolivian Guaraní'), ('gu', 'guj', 'Gujarati'), (None, 'guk', 'Gumuz'),
+ (None, 'gul', 'Sea Island Creole English'), (None, 'gum', 'Guambiano'), (None, 'gun', 'Mbyá Guaraní'),
+ (None, 'guo', 'Guayabero'), (None, 'gup', 'Gunwinggu'), (None, 'guq', 'Aché'), (None, 'gur', 'Farefare'),
+ (None, 'gus', 'Guinean Sign Language'), (None, 'gut', 'Maléku Jaíka'), (None, 'guu', 'Yanomamö'), (None, 'guw', 'Gun'),
+ (None, 'gux', 'Gourmanchéma'), (None, 'guz', 'Gusii'), (None, 'gva', 'Guana (Paraguay)'), (None, 'gvc', 'Guanano'),
+ (None, 'gve', 'Duwet'), (None, 'gvf', 'Golin'), (None, 'gvj', 'Guajá'), (None, 'gvl', 'Gulay'),
+ (None, 'gvm', 'Gurmana'), (None, 'gvn', 'Kuku-Yalanji'), (None, 'gvo', 'Gavião Do Jiparaná'),
+ (None, 'gvp', 'Pará Gavião'), (None, 'gvr', 'Gurung'), (None, 'gvs', 'Gumawana'), (None, 'gvy', 'Guyani'),
+ (None, 'gwa', 'Mbato'), (None, 'gwb', 'Gwa'), (None, 'gwc', 'Gawri'), (None, 'gwd', 'Gawwada'), (None, 'gwe', 'Gweno'),
+ (None, 'gwf', 'Gowro'), (None, 'gwg', 'Moo'), (None, 'gwi', 'Gwichʼin'), (None, 'gwj', 'ǀGwi'),
+ (None, 'gwm', 'Awngthim'), (None, 'gwn', 'Gwandara'), (None, 'gwr', 'Gwere'), (None, 'gwt', 'Gawar-Bati'),
+ (None, 'gwu', 'Guwamu'), (None, 'gww', 'Kwini'), (None, 'gwx', 'Gua'), (None, 'gxx', 'Wè Southern'),
+ (None, 'gya', 'Northwest Gbaya'), (None, 'gyb', 'Garus'), (None, 'gyd', 'Kayardild'), (None, 'gye', 'Gyem'),
+ (None, 'gyf', 'Gungabula'), (None, 'gyg', 'Gbayi'), (None, 'gyi', 'Gyele'), (None, 'gyl', 'Gayil'),
+ (None, 'gym', 'Ngäbere'), (None, 'gyn', 'Guyanese Creole English'), (None, 'gyo', 'Gyalsumdo'),
+ (None, 'gyr', 'Guarayu'), (None, 'gyy', 'Gunya'), (None, 'gyz', 'Geji'), (None, 'gza', 'Ganza'), (None, 'gzi', 'Gazi'),
+ (None, 'gzn', 'Gane'), (None, 'haa', 'Han'), (None, 'hab', 'Hanoi Sign Language'), (None, 'hac', 'Gurani'),
+ (None, 'had', 'Hatam'), (None, 'hae', 'Eastern Oromo'), (None, 'haf', 'Haiphong Sign Language'),
+ (None, 'hag', 'Hanga'), (None, 'hah', 'Hahon'), (None, 'hai', 'Haida'), (None, 'haj', 'Hajong'),
+ (None, 'hak', 'Hakka Chinese'), (None, 'hal', 'Halang'), (None, 'ham', 'Hewa'), (None, 'han', 'Hangaza'),
+ (None, 'hao', 'Hakö'), (None, 'hap', 'Hupla'), (None, 'haq', 'Ha'), (None, 'har', 'Harari'), (None, 'has', 'Haisla'),
+ ('ht', 'hat', 'Haitian'), ('ha', 'hau', 'Hausa'), (None, 'hav', 'Havu'), (None, 'haw', 'Hawaiian'),
+ (None, 'hax', 'Southern Haida'), (None, 'hay', 'Haya'), (None, 'haz', 'Hazaragi'), (None, 'hba', 'Hamba'),
+ (None, 'hbb', 'Huba'), (None, 'hbn', 'Heiban'), (None, 'hbo', 'Ancient Hebrew'), ('sh', 'hbs', 'Serbo-Croatian'),
+ (None, 'hbu', 'Habu'), (None, 'hca', 'Andaman Creole Hindi'), (None, 'hch', 'Huichol'),
+ (None, 'hdn', 'Northern Haida'), (None, 'hds', 'Honduras Sign Language'), (None, 'hdy', 'Hadiyya'),
+ (None, 'hea', 'Northern Qiandong Miao'), ('he', 'heb', 'Hebrew'), (None, 'hed', 'Herdé'), (None, 'heg', 'Helong'),
+ (None, 'heh', 'Hehe'), (None, 'hei', 'Heiltsuk'), (None, 'hem', 'Hemba'), ('hz', 'her', 'Herero'),
+ (None, 'hgm', 'Haiǁom'), (None, 'hgw', 'Haigwai'), (None, 'hhi', 'Hoia Hoia'), (None, 'hhr', 'Kerak'),
+ (None, 'hhy', 'Hoyahoya'), (None, 'hia', 'Lamang'), (None, 'hib', 'Hibito'), (None, 'hid', 'Hidatsa'),
+ (None, 'hif', 'Fiji Hindi'), (None, 'hig', 'Kamwe'), (None, 'hih', 'Pamosu'), (None, 'hii', 'Hinduri'),
+ (None, 'hij', 'Hijuk'), (None, 'hik', 'Seit-Kaitetu'), (None, 'hil', 'Hiligaynon'), ('hi', 'hin', 'Hindi'),
+ (None, 'hio', 'Tsoa'), (None, 'hir', 'Himarimã'), (None, 'hit', 'Hittite'), (None, 'hiw', 'Hiw'),
+ (None, 'hix', 'Hixkaryána'), (None, 'hji', 'Haji'), (None, 'hka', 'Kahe'), (None, 'hke', 'Hunde'),
+ (None, 'hkh', 'Khah'), (None, 'hkk', 'Hunjara-Kaina Ke'), (None, 'hkn', 'Mel-Khaonh'),
+ (None, 'hks', 'Hong Kong Sign Language'), (None, 'hla', 'Halia'), (None, 'hlb', 'Halbi'), (None, 'hld', 'Halang Doan'),
+ (None, 'hle', 'Hlersu'), (None, 'hlt', 'Matu Chin'), (None, 'hlu', 'Hieroglyphic Luwian'),
+ (None, 'hma', 'Southern Mashan Hmong'), (None, 'hmb', 'Humburi Senni Songhay'), (None, 'hmc', 'Central Huishui Hmong'),
+ (None, 'hmd', 'Large Flowery Miao'), (None, 'hme', 'Eastern Huishui Hmong'), (None, 'hmf', 'Hmong Don'),
+ (None, 'hmg', 'Southwestern Guiyang Hmong'), (None, 'hmh', 'Southwestern Huishui Hmong'),
+ (None, 'hmi', 'Northern Huishui Hmong'), (None, 'hmj', 'Ge'), (None, 'hmk', 'Maek'), (None, 'hml', 'Luopohe Hmong'),
+ (None, 'hmm', 'Central Mashan Hmong'), (None, 'hmn', 'Hmong'), ('ho', 'hmo', 'Hiri Motu'),
+ (None, 'hmp', 'Northern Mashan Hmong'), (None, 'hmq', 'Eastern Qiandong Miao'), (None, 'hmr', 'Hmar'),
+ (None, 'hms', 'Southern Qiandong Miao'), (None, 'hmt', 'Hamtai'), (None, 'hmu', 'Hamap'), (None, 'hmv', 'Hmong Dô'),
+ (None, 'hmw', 'Western Mashan Hmong'), (None, 'hmy', 'Southern Guiyang Hmong'), (None, 'hmz', 'Hmong Shua'),
+ (None, 'hna', 'Mina (Cameroon)'), (None, 'hnd', 'Southern Hindko'), (None, 'hne', 'Chhattisgarhi'),
+ (None, 'hng', 'Hungu'), (None, 'hnh', 'ǁAni'), (None, 'hni', 'Hani'), (None, 'hnj', 'Hmong Njua'),
+ (None, 'hnn', 'Hanunoo'), (None, 'hno', 'Northern Hindko'), (None, 'hns', 'Caribbean Hindustani'),
+ (None, 'hnu', 'Hung'), (None, 'hoa', 'Hoava'), (None, 'hob', 'Mari (Madang Province)'), (None, 'hoc', 'Ho'),
+ (None, 'hod', 'Holma'), (None, 'hoe', 'Horom'), (None, 'hoh', 'Hobyót'), (None, 'hoi', 'Holikachuk'),
+ (None, 'hoj', 'Hadothi'), (None, 'hol', 'Holu'), (None, 'hom', 'Homa'), (None, 'hoo', 'Holoholo'),
+ (None, 'hop', 'Hopi'), (None, 'hor', 'Horo'), (None, 'hos', 'Ho Chi Minh City Sign Language'), (None, 'hot', 'Hote'),
+ (None, 'hov', 'Hovongan'), (None, 'how', 'Honi'), (None, 'hoy', 'Holiya'), (None, 'hoz', 'Hozo'),
+ (None, 'hpo', 'Hpon'), (None, 'hps', "Hawai'i Sign Language (HSL)"), (None, 'hra', 'Hrangkhol'),
+ (None, 'hrc', 'Niwer Mil'), (None, 'hre', 'Hre'), (None, 'hrk', 'Haruku'), (None, 'hrm', 'Horned Miao'),
+ (None, 'hro', 'Haroi'), (None, 'hrp', 'Nhirrpi'), (None, 'hrt', 'Hértevin'), (None, 'hru', 'Hruso'),
+ ('hr', 'hrv', 'Croatian'), (None, 'hrw', 'Warwar Feni'), (None, 'hrx', 'Hunsrik'), (None, 'hrz', 'Harzani'),
+ (None, 'hsb', 'Upper Sorbian'), (None, 'hsh', 'Hungarian Sign Language'), (None, 'hsl', 'Hausa Sign Language'),
+ (None, 'hsn', 'Xiang Chinese'), (None, 'hss', 'Harsusi'), (None, 'hti', 'Hoti'), (None, 'hto', 'Minica Huitoto'),
+ (None, 'hts', 'Hadza'), (None, 'htu', 'Hitu'), (None, 'htx', 'Middle Hittite'), (None, 'hub', 'Huambisa'),
+ (None, 'huc', 'ǂHua'), (None, 'hud', 'Huaulu'), (None, 'hue', 'San Francisco Del Mar Huave'), (None, 'huf', 'Humene'),
+ (None, 'hug', 'Huachipaeri'), (None, 'huh', 'Huilliche'), (None, 'hui', 'Huli'),
+ (None, 'huj', 'Northern Guiyang Hmong'), (None, 'huk', 'Hulung'), (None, 'hul', 'Hula'), (None, 'hum', 'Hungana'),
+ ('hu', 'hun', 'Hungarian'), (None, 'huo', 'Hu'), (None, 'hup', 'Hupa'), (None, 'huq', 'Tsat'),
+ (None, 'hur', 'Halkomelem'), (None, 'hus', 'Huastec'), (None, 'hut', 'Humla'), (None, 'huu', 'Murui Huitoto'),
+ (None, 'huv', 'San Mateo Del Mar Huave'), (None, 'huw', 'Hukumina'), (None, 'hux', 'Nüpode Huitoto'),
+ (None, 'huy', 'Hulaulá'), (None, 'huz', 'Hunzib'), (None, 'hvc', 'Haitian Vodoun Culture Language'),
+ (None, 'hve', 'San Dionisio Del Mar Huave'), (None, 'hvk', 'Haveke'), (None, 'hvn', 'Sabu'),
+ (None, 'hvv', 'Santa María Del Mar Huave'), (None, 'hwa', 'Wané'), (None, 'hwc', "Hawai'i Creole English"),
+ (None, 'hwo', 'Hwana'), (None, 'hya', 'Hya'), ('hy', 'hye', 'Armenian'), (None, 'hyw', 'Western Armenian'),
+ (None, 'iai', 'Iaai'), (None, 'ian', 'Iatmul'), (None, 'iar', 'Purari'), (None, 'iba', 'Iban'),
+ (None, 'ibb', 'Ibibio'), (None, 'ibd', 'Iwaidja'), (None, 'ibe', 'Akpes'), (None, 'ibg', 'Ibanag'),
+ (None, 'ibh', 'Bih'), (None, 'ibl', 'Ibaloi'), (None, 'ibm', 'Agoi'), (None, 'ibn', 'Ibino'), ('ig', 'ibo', 'Igbo'),
+ (None, 'ibr', 'Ibuoro'), (None, 'ibu', 'Ibu'), (None, 'iby', 'Ibani'), (None, 'ica', 'Ede Ica'),
+ (None, 'ich', 'Etkywan'), (None, 'icl', 'Icelandic Sign Language'), (None, 'icr', 'Islander Creole English'),
+ (None, 'ida', 'Idakho-Isukha-Tiriki'), (None, 'idb', 'Indo-Portuguese'), (None, 'idc', 'Idon'),
+ (None, 'idd', 'Ede Idaca'), (None, 'ide', 'Idere'), (None, 'idi', 'Idi'), ('io', 'ido', 'Ido'), (None, 'idr', 'Indri'),
+ (None, 'ids', 'Idesa'), (None, 'idt', 'Idaté'), (None, 'idu', 'Idoma'), (None, 'ifa', 'Amganad Ifugao'),
+ (None, 'ifb', 'Batad Ifugao'), (None, 'ife', 'Ifè'), (None, 'iff', 'Ifo'), (None, 'ifk', 'Tuwali Ifugao'),
+ (None, 'ifm', 'Teke-Fuumu'), (None, 'ifu', 'Mayoyao Ifugao'), (None, 'ify', 'Keley-I Kallahan'),
+ (None, 'igb', 'Ebira'), (None, 'ige', 'Igede'), (None, 'igg', 'Igana'), (None, 'igl', 'Igala'),
+ (None, 'igm', 'Kanggape'), (None, 'ign', 'Ignaciano'), (None, 'igo', 'Isebe'), (None, 'igs', 'Interglossa'),
+ (None, 'igw', 'Igwe'), (None, 'ihb', 'Iha Based Pidgin'), (None, 'ihi', 'Ihievbe'), (None, 'ihp', 'Iha'),
+ (None, 'ihw', 'Bidhawal'), ('ii', 'iii', 'Sichuan Yi'), (None, 'iin', 'Thiin'), (None, 'ijc', 'Izon'),
+ (None, 'ije', 'Biseni'), (None, 'ijj', 'Ede Ije'), (None, 'ijn', 'Kalabari'), (None, 'ijs', 'Southeast Ijo'),
+ (None, 'ike', 'Eastern Canadian Inuktitut'), (None, 'iki', 'Iko'), (None, 'ikk', 'Ika'), (None, 'ikl', 'Ikulu'),
+ (None, 'iko', 'Olulumo-Ikom'), (None, 'ikp', 'Ikpeshi'), (None, 'ikr', 'Ikaranggal'),
+ (None, 'iks', 'Inuit Sign Language'), (None, 'ikt', 'Inuinnaqtun'), ('iu', 'iku', 'Inuktitut'),
+ (None, 'ikv', 'Iku-Gora-Ankwa'), (None, 'ikw', 'Ikwere'), (None, 'ikx', 'Ik'), (None, 'ikz', 'Ikizu'),
+ (None, 'ila', 'Ile Ape'), (None, 'ilb', 'Ila'), ('ie', 'ile', 'Interlingue'), (None, 'ilg', 'Garig-Ilgar'),
+ (None, 'ili', 'Ili Turki'), (None, 'ilk', 'Ilongot'), (None, 'ilm', 'Iranun (Malaysia)'), (None, 'ilo', 'Iloko'),
+ (None, 'ilp', 'Iranun (Philippines)'), (None, 'ils', 'International Sign'), (None, 'ilu', "Ili'uun"),
+ (None, 'ilv', 'Ilue'), (None, 'ima', 'Mala Malasar'), (None, 'imi', 'Anamgura'), (None, 'iml', 'Miluk'),
+ (None, 'imn', 'Imonda'), (None, 'imo', 'Imbongu'), (None, 'imr', 'Imroing'), (None, 'ims', 'Marsian'),
+ (None, 'imt', 'Imotong'), (None, 'imy', 'Milyan'),
+ ('ia', 'ina', 'Interlingua (International Auxiliary Language Association)'), (None, 'inb', 'Inga'),
+ ('id', 'ind', 'Indonesian'), (None, 'ing', "Degexit'an"), (None, 'inh', 'Ingush'), (None, 'inj', 'Jungle Inga'),
+ (None, 'inl', 'Indonesian Sign Language'), (None, 'inm', 'Minaean'), (None, 'inn', 'Isinai'),
+ (None, 'ino', 'Inoke-Yate'), (None, 'inp', 'Iñapari'), (None, 'ins', 'Indian Sign Language'), (None, 'int', 'Intha'),
+ (None, 'inz', 'Ineseño'), (None, 'ior', 'Inor'), (None, 'iou', 'Tuma-Irumu'), (None, 'iow', 'Iowa-Oto'),
+ (None, 'ipi', 'Ipili'), ('ik', 'ipk', 'Inupiaq'), (None, 'ipo', 'Ipiko'), (None, 'iqu', 'Iquito'),
+ (None, 'iqw', 'Ikwo'), (None, 'ire', 'Iresim'), (None, 'irh', 'Irarutu'), (None, 'iri', 'Rigwe'),
+ (None, 'irk', 'Iraqw'), (None, 'irn', 'Irántxe'), (None, 'irr', 'Ir'), (None, 'iru', 'Irula'),
+ (None, 'irx', 'Kamberau'), (None, 'iry', 'Iraya'), (None, 'isa', 'Isabi'), (None, 'isc', 'Isconahua'),
+ (None, 'isd', 'Isnag'), (None, 'ise', 'Italian Sign Language'), (None, 'isg', 'Irish Sign Language'),
+ (None, 'ish', 'Esan'), (None, 'isi', 'Nkem-Nkum'), (None, 'isk', 'Ishkashimi'), ('is', 'isl', 'Icelandic'),
+ (None, 'ism', 'Masimasi'), (None, 'isn', 'Isanzu'), (None, 'iso', 'Isoko'), (None, 'isr', 'Israeli Sign Language'),
+ (None, 'ist', 'Istriot'), (None, 'isu', 'Isu (Menchum Division)'), ('it', 'ita', 'Italian'),
+ (None, 'itb', 'Binongan Itneg'), (None, 'itd', 'Southern Tidung'), (None, 'ite', 'Itene'),
+ (None, 'iti', 'Inlaod Itneg'), (None, 'itk', 'Judeo-Italian'), (None, 'itl', 'Itelmen'), (None, 'itm', 'Itu Mbon Uzo'),
+ (None, 'ito', 'Itonama'), (None, 'itr', 'Iteri'), (None, 'its', 'Isekiri'), (None, 'itt', 'Maeng Itneg'),
+ (None, 'itv', 'Itawit'), (None, 'itw', 'Ito'), (None, 'itx', 'Itik'), (None, 'ity', 'Moyadan Itneg'),
+ (None, 'itz', 'Itzá'), (None, 'ium', 'Iu Mien'), (None, 'ivb', 'Ibatan'), (None, 'ivv', 'Ivatan'),
+ (None, 'iwk', 'I-Wak'), (None, 'iwm', 'Iwam'), (None, 'iwo', 'Iwur'), (None, 'iws', 'Sepik Iwam'),
+ (None, 'ixc', 'Ixcatec'), (None, 'ixl', 'Ixil'), (None, 'iya', 'Iyayu'), (None, 'iyo', 'Mesaka'),
+ (None, 'iyx', 'Yaka (Congo)'), (None, 'izh', 'Ingrian'), (None, 'izr', 'Izere'), (None, 'izz', 'Izii'),
+ (None, 'jaa', 'Jamamadí'), (None, 'jab', 'Hyam'), (None, 'jac', "Popti'"), (None, 'jad', 'Jahanka'),
+ (None, 'jae', 'Yabem'), (None, 'jaf', 'Jara'), (None, 'jah', 'Jah Hut'), (None, 'jaj', 'Zazao'),
+ (None, 'jak', 'Jakun'), (None, 'jal', 'Yalahatan'), (None, 'jam', 'Jamaican Creole English'), (None, 'jan', 'Jandai'),
+ (None, 'jao', 'Yanyuwa'), (None, 'jaq', 'Yaqay'), (None, 'jas', 'New Caledonian Javanese'), (None, 'jat', 'Jakati'),
+ (None, 'jau', 'Yaur'), ('jv', 'jav', 'Javanese'), (None, 'jax', 'Jambi Malay'), (None, 'jay', 'Yan-nhangu'),
+ (None, 'jaz', 'Jawe'), (None, 'jbe', 'Judeo-Berber'), (None, 'jbi', 'Badjiri'), (None, 'jbj', 'Arandai'),
+ (None, 'jbk', 'Barikewa'), (None, 'jbm', 'Bijim'), (None, 'jbn', 'Nafusi'), (None, 'jbo', 'Lojban'),
+ (None, 'jbr', 'Jofotek-Bromnya'), (None, 'jbt', 'Jabutí'), (None, 'jbu', 'Jukun Takum'), (None, 'jbw', 'Yawijibaya'),
+ (None, 'jcs', 'Jamaican Country Sign Language'), (None, 'jct', 'Krymchak'), (None, 'jda', 'Jad'),
+ (None, 'jdg', 'Jadgali'), (None, 'jdt', 'Judeo-Tat'), (None, 'jeb', 'Jebero'), (None, 'jee', 'Jerung'),
+ (None, 'jeh', 'Jeh'), (None, 'jei', 'Yei'), (None, 'jek', 'Jeri Kuo'), (None, 'jel', 'Yelmek'), (None, 'jen', 'Dza'),
+ (None, 'jer', 'Jere'), (None, 'jet', 'Manem'), (None, 'jeu', 'Jonkor Bourmataguil'), (None, 'jgb', 'Ngbee'),
+ (None, 'jge', 'Judeo-Georgian'), (None, 'jgk', 'Gwak'), (None, 'jgo', 'Ngomba'), (None, 'jhi', 'Jehai'),
+ (None, 'jhs', 'Jhankot Sign Language'), (None, 'jia', 'Jina'), (None, 'jib', 'Jibu'), (None, 'jic', 'Tol'),
+ (None, 'jid', 'Bu (Kaduna State)'), (None, 'jie', 'Jilbe'), (None, 'jig', 'Jingulu'), (None, 'jih', 'sTodsde'),
+ (None, 'jii', 'Jiiddu'), (None, 'jil', 'Jilim'), (None, 'jim', 'Jimi (Cameroon)'), (None, 'jio', 'Jiamao'),
+ (None, 'jiq', 'Guanyinqiao'), (None, 'jit', 'Jita'), (None, 'jiu', 'Youle Jinuo'), (None, 'jiv', 'Shuar'),
+ (None, 'jiy', 'Buyuan Jinuo'), (None, 'jje', 'Jejueo'), (None, 'jjr', 'Bankal'), (None, 'jka', 'Kaera'),
+ (None, 'jkm', 'Mobwa Karen'), (None, 'jko', 'Kubo'), (None, 'jkp', 'Paku Karen'), (None, 'jkr', 'Koro (India)'),
+ (None, 'jks', 'Amami Koniya Sign Language'), (None, 'jku', 'Labir'), (None, 'jle', 'Ngile'),
+ (None, 'jls', 'Jamaican Sign Language'), (None, 'jma', 'Dima'), (None, 'jmb', 'Zumbun'), (None, 'jmc', 'Machame'),
+ (None, 'jmd', 'Yamdena'), (None, 'jmi', 'Jimi (Nigeria)'), (None, 'jml', 'Jumli'), (None, 'jmn', 'Makuri Naga'),
+ (None, 'jmr', 'Kamara'), (None, 'jms', 'Mashi (Nigeria)'), (None, 'jmw', 'Mouwase'),
+ (None, 'jmx', 'Western Juxtlahuaca Mixtec'), (None, 'jna', 'Jangshung'), (None, 'jnd', 'Jandavra'),
+ (None, 'jng', 'Yangman'), (None, 'jni', 'Janji'), (None, 'jnj', 'Yemsa'), (None, 'jnl', 'Rawat'),
+ (None, 'jns', 'Jaunsari'), (None, 'job', 'Joba'), (None, 'jod', 'Wojenaka'), (None, 'jog', 'Jogi'),
+ (None, 'jor', 'Jorá'), (None, 'jos', 'Jordanian Sign Language'), (None, 'jow', 'Jowulu'),
+ (None, 'jpa', 'Jewish Palestinian Aramaic'), ('ja', 'jpn', 'Japanese'), (None, 'jpr', 'Judeo-Persian'),
+ (None, 'jqr', 'Jaqaru'), (None, 'jra', 'Jarai'), (None, 'jrb', 'Judeo-Arabic'), (None, 'jrr', 'Jiru'),
+ (None, 'jrt', 'Jakattoe'), (None, 'jru', 'Japrería'), (None, 'jsl', 'Japanese Sign Language'), (None, 'jua', 'Júma'),
+ (None, 'jub', 'Wannu'), (None, 'juc', 'Jurchen'), (None, 'jud', 'Worodougou'), (None, 'juh', 'Hõne'),
+ (None, 'jui', 'Ngadjuri'), (None, 'juk', 'Wapan'), (None, 'jul', 'Jirel'), (None, 'jum', 'Jumjum'),
+ (None, 'jun', 'Juang'), (None, 'juo', 'Jiba'), (None, 'jup', 'Hupdë'), (None, 'jur', 'Jurúna'),
+ (None, 'jus', 'Jumla Sign Language'), (None, 'jut', 'Jutish'), (None, 'juu', 'Ju'), (None, 'juw', 'Wãpha'),
+ (None, 'juy', 'Juray'), (None, 'jvd', 'Javindo'), (None, 'jvn', 'Caribbean Javanese'), (None, 'jwi', 'Jwira-Pepesa'),
+ (None, 'jya', 'Jiarong'), (None, 'jye', 'Judeo-Yemeni Arabic'), (None, 'jyy', 'Jaya'), (None, 'kaa', 'Kara-Kalpak'),
+ (None, 'kab', 'Kabyle'), (None, 'kac', 'Kachin'), (None, 'kad', 'Adara'), (None, 'kae', 'Ketangalan'),
+ (None, 'kaf', 'Katso'), (None, 'kag', 'Kajaman'), (None, 'kah', 'Kara (Central African Republic)'),
+ (None, 'kai', 'Karekare'), (None, 'kaj', 'Jju'), (None, 'kak', 'Kalanguya'), ('kl', 'kal', 'Kalaallisut'),
+ (None, 'kam', 'Kamba (Kenya)'), ('kn', 'kan', 'Kannada'), (None, 'kao', 'Xaasongaxango'), (None, 'kap', 'Bezhta'),
+ (None, 'kaq', 'Capanahua'), ('ks', 'kas', 'Kashmiri'), ('ka', 'kat', 'Georgian'), ('kr', 'kau', 'Kanuri'),
+ (None, 'kav', 'Katukína'), (None, 'kaw', 'Kawi'), (None, 'kax', 'Kao'), (None, 'kay', 'Kamayurá'),
+ ('kk', 'kaz', 'Kazakh'), (None, 'kba', 'Kalarko'), (None, 'kbb', 'Kaxuiâna'), (None, 'kbc', 'Kadiwéu'),
+ (None, 'kbd', 'Kabardian'), (None, 'kbe', 'Kanju'), (None, 'kbg', 'Khamba'), (None, 'kbh', 'Camsá'),
+ (None, 'kbi', 'Kaptiau'), (None, 'kbj', 'Kari'), (None, 'kbk', 'Grass Koiari'), (None, 'kbl', 'Kanembu'),
+ (None, 'kbm', 'Iwal'), (None, 'kbn', 'Kare (Central African Republic)'), (None, 'kbo', 'Keliko'),
+ (None, 'kbp', 'Kabiyè'), (None, 'kbq', 'Kamano'), (None, 'kbr', 'Kafa'), (None, 'kbs', 'Kande'),
+ (None, 'kbt', 'Abadi'), (None, 'kbu', 'Kabutra'), (None, 'kbv', 'Dera (Indonesia)'), (None, 'kbw', 'Kaiep'),
+ (None, 'kbx', 'Ap Ma'), (None, 'kby', 'Manga Kanuri'), (None, 'kbz', 'Duhwa'), (None, 'kca', 'Khanty'),
+ (None, 'kcb', 'Kawacha'), (None, 'kcc', 'Lubila'), (None, 'kcd', 'Ngkâlmpw Kanum'), (None, 'kce', 'Kaivi'),
+ (None, 'kcf', 'Ukaan'), (None, 'kcg', 'Tyap'), (None, 'kch', 'Vono'), (None, 'kci', 'Kamantan'),
+ (None, 'kcj', 'Kobiana'), (None, 'kck', 'Kalanga'), (None, 'kcl', 'Kela (Papua New Guinea)'),
+ (None, 'kcm', 'Gula (Central African Republic)'), (None, 'kcn', 'Nubi'), (None, 'kco', 'Kinalakna'),
+ (None, 'kcp', 'Kanga'), (None, 'kcq', 'Kamo'), (None, 'kcr', 'Katla'), (None, 'kcs', 'Koenoem'),
+ (None, 'kct', 'Kaian'), (None, 'kcu', 'Kami (Tanzania)'), (None, 'kcv', 'Kete'), (None, 'kcw', 'Kabwari'),
+ (None, 'kcx', 'Kachama-Ganjule'), (None, 'kcy', 'Korandje'), (None, 'kcz', 'Konongo'), (None, 'kda', 'Worimi'),
+ (None, 'kdc', 'Kutu'), (None, 'kdd', 'Yankunytjatjara'), (None, 'kde', 'Makonde'), (None, 'kdf', 'Mamusi'),
+ (None, 'kdg', 'Seba'), (None, 'kdh', 'Tem'), (None, 'kdi', 'Kumam'), (None, 'kdj', 'Karamojong'),
+ (None, 'kdk', 'Numèè'), (None, 'kdl', 'Tsikimba'), (None, 'kdm', 'Kagoma'), (None, 'kdn', 'Kunda'),
+ (None, 'kdp', 'Kaningdon-Nindem'), (None, 'kdq', 'Koch'), (None, 'kdr', 'Karaim'), (None, 'kdt', 'Kuy'),
+ (None, 'kdu', 'Kadaru'), (None, 'kdw', 'Koneraw'), (None, 'kdx', 'Kam'), (None, 'kdy', 'Keder'),
+ (None, 'kdz', 'Kwaja'), (None, 'kea', 'Kabuverdianu'), (None, 'keb', 'Kélé'), (None, 'kec', 'Keiga'),
+ (None, 'ked', 'Kerewe'), (None, 'kee', 'Eastern Keres'), (None, 'kef', 'Kpessi'), (None, 'keg', 'Tese'),
+ (None, 'keh', 'Keak'), (None, 'kei', 'Kei'), (None, 'kej', 'Kadar'), (None, 'kek', 'Kekchí'),
+ (None, 'kel', 'Kela (Democratic Republic of Congo)'), (None, 'kem', 'Kemak'), (None, 'ken', 'Kenyang'),
+ (None, 'keo', 'Kakwa'), (None, 'kep', 'Kaikadi'), (None, 'keq', 'Kamar'), (None, 'ker', 'Kera'),
+ (None, 'kes', 'Kugbo'), (None, 'ket', 'Ket'), (None, 'keu', 'Akebu'), (None, 'kev', 'Kanikkaran'),
+ (None, 'kew', 'West Kewa'), (None, 'kex', 'Kukna'), (None, 'key', 'Kupia'), (None, 'kez', 'Kukele'),
+ (None, 'kfa', 'Kodava'), (None, 'kfb', 'Northwestern Kolami'), (None, 'kfc', 'Konda-Dora'),
+ (None, 'kfd', 'Korra Koraga'), (None, 'kfe', 'Kota (India)'), (None, 'kff', 'Koya'), (None, 'kfg', 'Kudiya'),
+ (None, 'kfh', 'Kurichiya'), (None, 'kfi', 'Kannada Kurumba'), (None, 'kfj', 'Kemiehua'), (None, 'kfk', 'Kinnauri'),
+ (None, 'kfl', 'Kung'), (None, 'kfm', 'Khunsari'), (None, 'kfn', 'Kuk'), (None, 'kfo', "Koro (Côte d'Ivoire)"),
+ (None, 'kfp', 'Korwa'), (None, 'kfq', 'Korku'), (None, 'kfr', 'Kachhi'), (None, 'kfs', 'Bilaspuri'),
+ (None, 'kft', 'Kanjari'), (None, 'kfu', 'Katkari'), (None, 'kfv', 'Kurmukar'), (None, 'kfw', 'Kharam Naga'),
+ (None, 'kfx', 'Kullu Pahari'), (None, 'kfy', 'Kumaoni'), (None, 'kfz', 'Koromfé'), (None, 'kga', 'Koyaga'),
+ (None, 'kgb', 'Kawe'), (None, 'kge', 'Komering'), (None, 'kgf', 'Kube'), (None, 'kgg', 'Kusunda'),
+ (None, 'kgi', 'Selangor Sign Language'), (None, 'kgj', 'Gamale Kham'), (None, 'kgk', 'Kaiwá'),
+ (None, 'kgl', 'Kunggari'), (None, 'kgm', 'Karipúna'), (None, 'kgn', 'Karingani'), (None, 'kgo', 'Krongo'),
+ (None, 'kgp', 'Kaingang'), (None, 'kgq', 'Kamoro'), (None, 'kgr', 'Abun'), (None, 'kgs', 'Kumbainggar'),
+ (None, 'kgt', 'Somyev'), (None, 'kgu', 'Kobol'), (None, 'kgv', 'Karas'), (None, 'kgw', 'Karon Dori'),
+ (None, 'kgx', 'Kamaru'), (None, 'kgy', 'Kyerung'), (None, 'kha', 'Khasi'), (None, 'khb', 'Lü'),
+ (None, 'khc', 'Tukang Besi North'), (None, 'khd', 'Bädi Kanum'), (None, 'khe', 'Korowai'), (None, 'khf', 'Khuen'),
+ (None, 'khg', 'Khams Tibetan'), (None, 'khh', 'Kehu'), (None, 'khj', 'Kuturmi'), (None, 'khk', 'Halh Mongolian'),
+ (None, 'khl', 'Lusi'), ('km', 'khm', 'Khmer'), (None, 'khn', 'Khandesi'), (None, 'kho', 'Khotanese'),
+ (None, 'khp', 'Kapori'), (None, 'khq', 'Koyra Chiini Songhay'), (None, 'khr', 'Kharia'), (None, 'khs', 'Kasua'),
+ (None, 'kht', 'Khamti'), (None, 'khu', 'Nkhumbi'), (None, 'khv', 'Khvarshi'), (None, 'khw', 'Khowar'),
+ (None, 'khx', 'Kanu'), (None, 'khy', 'Kele (Democratic Republic of Congo)'), (None, 'khz', 'Keapara'),
+ (None, 'kia', 'Kim'), (None, 'kib', 'Koalib'), (None, 'kic', 'Kickapoo'), (None, 'kid', 'Koshin'),
+ (None, 'kie', 'Kibet'), (None, 'kif', 'Eastern Parbate Kham'), (None, 'kig', 'Kimaama'), (None, 'kih', 'Kilmeri'),
+ (None, 'kii', 'Kitsai'), (None, 'kij', 'Kilivila'), ('ki', 'kik', 'Kikuyu'), (None, 'kil', 'Kariya'),
+ (None, 'kim', 'Karagas'), ('rw', 'kin', 'Kinyarwanda'), (None, 'kio', 'Kiowa'), (None, 'kip', 'Sheshi Kham'),
+ (None, 'kiq', 'Kosadle'), ('ky', 'kir', 'Kirghiz'), (None, 'kis', 'Kis'), (None, 'kit', 'Agob'),
+ (None, 'kiu', 'Kirmanjki (individual language)'), (None, 'kiv', 'Kimbu'), (None, 'kiw', 'Northeast Kiwai'),
+ (None, 'kix', 'Khiamniungan Naga'), (None, 'kiy', 'Kirikiri'), (None, 'kiz', 'Kisi'), (None, 'kja', 'Mlap'),
+ (None, 'kjb', "Q'anjob'al"), (None, 'kjc', 'Coastal Konjo'), (None, 'kjd', 'Southern Kiwai'), (None, 'kje', 'Kisar'),
+ (None, 'kjg', 'Khmu'), (None, 'kjh', 'Khakas'), (None, 'kji', 'Zabana'), (None, 'kjj', 'Khinalugh'),
+ (None, 'kjk', 'Highland Konjo'), (None, 'kjl', 'Western Parbate Kham'), (None, 'kjm', 'Kháng'),
+ (None, 'kjn', 'Kunjen'), (None, 'kjo', 'Harijan Kinnauri'), (None, 'kjp', 'Pwo Eastern Karen'),
+ (None, 'kjq', 'Western Keres'), (None, 'kjr', 'Kurudu'), (None, 'kjs', 'East Kewa'), (None, 'kjt', 'Phrae Pwo Karen'),
+ (None, 'kju', 'Kashaya'), (None, 'kjv', 'Kaikavian Literary Language'), (None, 'kjx', 'Ramopa'),
+ (None, 'kjy', 'Erave'), (None, 'kjz', 'Bumthangkha'), (None, 'kka', 'Kakanda'), (None, 'kkb', 'Kwerisa'),
+ (None, 'kkc', 'Odoodee'), (None, 'kkd', 'Kinuku'), (None, 'kke', 'Kakabe'), (None, 'kkf', 'Kalaktang Monpa'),
+ (None, 'kkg', 'Mabaka Valley Kalinga'), (None, 'kkh', 'Khün'), (None, 'kki', 'Kagulu'), (None, 'kkj', 'Kako'),
+ (None, 'kkk', 'Kokota'), (None, 'kkl', 'Kosarek Yale'), (None, 'kkm', 'Kiong'), (None, 'kkn', 'Kon Keu'),
+ (None, 'kko', 'Karko'), (None, 'kkp', 'Gugubera'), (None, 'kkq', 'Kaeku'), (None, 'kkr', 'Kir-Balar'),
+ (None, 'kks', 'Giiwo'), (None, 'kkt', 'Koi'), (None, 'kku', 'Tumi'), (None, 'kkv', 'Kangean'),
+ (None, 'kkw', 'Teke-Kukuya'), (None, 'kkx', 'Kohin'), (None, 'kky', 'Guugu Yimidhirr'), (None, 'kkz', 'Kaska'),
+ (None, 'kla', 'Klamath-Modoc'), (None, 'klb', 'Kiliwa'), (None, 'klc', 'Kolbila'), (None, 'kld', 'Gamilaraay'),
+ (None, 'kle', 'Kulung (Nepal)'), (None, 'klf', 'Kendeje'), (None, 'klg', 'Tagakaulo'), (None, 'klh', 'Weliki'),
+ (None, 'kli', 'Kalumpang'), (None, 'klj', 'Khalaj'), (None, 'klk', 'Kono (Nigeria)'), (None, 'kll', 'Kagan Kalagan'),
+ (None, 'klm', 'Migum'), (None, 'kln', 'Kalenjin'), (None, 'klo', 'Kapya'), (None, 'klp', 'Kamasa'),
+ (None, 'klq', 'Rumu'), (None, 'klr', 'Khaling'), (None, 'kls', 'Kalasha'), (None, 'klt', 'Nukna'),
+ (None, 'klu', 'Klao'), (None, 'klv', 'Maskelynes'), (None, 'klw', 'Tado'), (None, 'klx', 'Koluwawa'),
+ (None, 'kly', 'Kalao'), (None, 'klz', 'Kabola'), (None, 'kma', 'Konni'), (None, 'kmb', 'Kimbundu'),
+ (None, 'kmc', 'Southern Dong'), (None, 'kmd', 'Majukayang Kalinga'), (None, 'kme', 'Bakole'),
+ (None, 'kmf', 'Kare (Papua New Guinea)'), (None, 'kmg', 'Kâte'), (None, 'kmh', 'Kalam'),
+ (None, 'kmi', 'Kami (Nigeria)'), (None, 'kmj', 'Kumarbhag Paharia'), (None, 'kmk', 'Limos Kalinga'),
+ (None, 'kml', 'Tanudan Kalinga'), (None, 'kmm', 'Kom (India)'), (None, 'kmn', 'Awtuw'), (None, 'kmo', 'Kwoma'),
+ (None, 'kmp', 'Gimme'), (None, 'kmq', 'Kwama'), (None, 'kmr', 'Northern Kurdish'), (None, 'kms', 'Kamasau'),
+ (None, 'kmt', 'Kemtuik'), (None, 'kmu', 'Kanite'), (None, 'kmv', 'Karipúna Creole French'),
+ (None, 'kmw', 'Komo (Democratic Republic of Congo)'), (None, 'kmx', 'Waboda'), (None, 'kmy', 'Koma'),
+ (None, 'kmz', 'Khorasani Turkish'), (None, 'kna', 'Dera (Nigeria)'), (None, 'knb', 'Lubuagan Kalinga'),
+ (None, 'knc', 'Central Kanuri'), (None, 'knd', 'Konda'), (None, 'kne', 'Kankanaey'), (None, 'knf', 'Mankanya'),
+ (None, 'kng', 'Koongo'), (None, 'kni', 'Kanufi'), (None, 'knj', 'Western Kanjobal'), (None, 'knk', 'Kuranko'),
+ (None, 'knl', 'Keninjal'), (None, 'knm', 'Kanamarí'), (None, 'knn', 'Konkani (individual language)'),
+ (None, 'kno', 'Kono (Sierra Leone)'), (None, 'knp', 'Kwanja'), (None, 'knq', 'Kintaq'), (None, 'knr', 'Kaningra'),
+ (None, 'kns', 'Kensiu'), (None, 'knt', 'Panoan Katukína'), (None, 'knu', 'Kono (Guinea)'), (None, 'knv', 'Tabo'),
+ (None, 'knw', 'Kung-Ekoka'), (None, 'knx', 'Kendayan'), (None, 'kny', 'Kanyok'), (None, 'knz', 'Kalamsé'),
+ (None, 'koa', 'Konomala'), (None, 'koc', 'Kpati'), (None, 'kod', 'Kodi'), (None, 'koe', 'Kacipo-Bale Suri'),
+ (None, 'kof', 'Kubi'), (None, 'kog', 'Cogui'), (None, 'koh', 'Koyo'), (None, 'koi', 'Komi-Permyak'),
+ (None, 'kok', 'Konkani (macrolanguage)'), (None, 'kol', 'Kol (Papua New Guinea)'), ('kv', 'kom', 'Komi'),
+ ('kg', 'kon', 'Kongo'), (None, 'koo', 'Konzo'), (None, 'kop', 'Waube'), (None, 'koq', 'Kota (Gabon)'),
+ ('ko', 'kor', 'Korean'), (None, 'kos', 'Kosraean'), (None, 'kot', 'Lagwan'), (None, 'kou', 'Koke'),
+ (None, 'kov', 'Kudu-Camo'), (None, 'kow', 'Kugama'), (None, 'koy', 'Koyukon'), (None, 'koz', 'Korak'),
+ (None, 'kpa', 'Kutto'), (None, 'kpb', 'Mullu Kurumba'), (None, 'kpc', 'Curripaco'), (None, 'kpd', 'Koba'),
+ (None, 'kpe', 'Kpelle'), (None, 'kpf', 'Komba'), (None, 'kpg', 'Kapingamarangi'), (None, 'kph', 'Kplang'),
+ (None, 'kpi', 'Kofei'), (None, 'kpj', 'Karajá'), (None, 'kpk', 'Kpan'), (None, 'kpl', 'Kpala'), (None, 'kpm', 'Koho'),
+ (None, 'kpn', 'Kepkiriwát'), (None, 'kpo', 'Ikposo'), (None, 'kpq', 'Korupun-Sela'), (None, 'kpr', 'Korafe-Yegha'),
+ (None, 'kps', 'Tehit'), (None, 'kpt', 'Karata'), (None, 'kpu', 'Kafoa'), (None, 'kpv', 'Komi-Zyrian'),
+ (None, 'kpw', 'Kobon'), (None, 'kpx', 'Mountain Koiali'), (None, 'kpy', 'Koryak'), (None, 'kpz', 'Kupsabiny'),
+ (None, 'kqa', 'Mum'), (None, 'kqb', 'Kovai'), (None, 'kqc', 'Doromu-Koki'), (None, 'kqd', 'Koy Sanjaq Surat'),
+ (None, 'kqe', 'Kalagan'), (None, 'kqf', 'Kakabai'), (None, 'kqg', 'Khe'), (None, 'kqh', 'Kisankasa'),
+ (None, 'kqi', 'Koitabu'), (None, 'kqj', 'Koromira'), (None, 'kqk', 'Kotafon Gbe'), (None, 'kql', 'Kyenele'),
+ (None, 'kqm', 'Khisa'), (None, 'kqn', 'Kaonde'), (None, 'kqo', 'Eastern Krahn'), (None, 'kqp', 'Kimré'),
+ (None, 'kqq', 'Krenak'), (None, 'kqr', 'Kimaragang'), (None, 'kqs', 'Northern Kissi'),
+ (None, 'kqt', 'Klias River Kadazan'), (None, 'kqu', 'Seroa'), (None, 'kqv', 'Okolod'), (None, 'kqw', 'Kandas'),
+ (None, 'kqx', 'Mser'), (None, 'kqy', 'Koorete'), (None, 'kqz', 'Korana'), (None, 'kra', 'Kumhali'),
+ (None, 'krb', 'Karkin'), (None, 'krc', 'Karachay-Balkar'), (None, 'krd', 'Kairui-Midiki'), (None, 'kre', 'Panará'),
+ (None, 'krf', 'Koro (Vanuatu)'), (None, 'krh', 'Kurama'), (None, 'kri', 'Krio'), (None, 'krj', 'Kinaray-A'),
+ (None, 'krk', 'Kerek'), (None, 'krl', 'Karelian'), (None, 'krn', 'Sapo'), (None, 'krp', 'Korop'),
+ (None, 'krr', 'Krung'), (None, 'krs', 'Gbaya (Sudan)'), (None, 'krt', 'Tumari Kanuri'), (None, 'kru', 'Kurukh'),
+ (None, 'krv', 'Kavet'), (None, 'krw', 'Western Krahn'), (None, 'krx', 'Karon'), (None, 'kry', 'Kryts'),
+ (None, 'krz', 'Sota Kanum'), (None, 'ksa', 'Shuwa-Zamani'), (None, 'ksb', 'Shambala'),
+ (None, 'ksc', 'Southern Kalinga'), (None, 'ksd', 'Kuanua'), (None, 'kse', 'Kuni'), (None, 'ksf', 'Bafia'),
+ (None, 'ksg', 'Kusaghe'), (None, 'ksh', 'Kölsch'), (None, 'ksi', 'Krisa'), (None, 'ksj', 'Uare'),
+ (None, 'ksk', 'Kansa'), (None, 'ksl', 'Kumalu'), (None, 'ksm', 'Kumba'), (None, 'ksn', 'Kasiguranin'),
+ (None, 'kso', 'Kofa'), (None, 'ksp', 'Kaba'), (None, 'ksq', 'Kwaami'), (None, 'ksr', 'Borong'),
+ (None, 'kss', 'Southern Kisi'), (None, 'kst', 'Winyé'), (None, 'ksu', 'Khamyang'), (None, 'ksv', 'Kusu'),
+ (None, 'ksw', "S'gaw Karen"), (None, 'ksx', 'Kedang'), (None, 'ksy', 'Kharia Thar'), (None, 'ksz', 'Kodaku'),
+ (None, 'kta', 'Katua'), (None, 'ktb', 'Kambaata'), (None, 'ktc', 'Kholok'), (None, 'ktd', 'Kokata'),
+ (None, 'kte', 'Nubri'), (None, 'ktf', 'Kwami'), (None, 'ktg', 'Kalkutung'), (None, 'kth', 'Karanga'),
+ (None, 'kti', 'North Muyu'), (None, 'ktj', 'Plapo Krumen'), (None, 'ktk', 'Kaniet'), (None, 'ktl', 'Koroshi'),
+ (None, 'ktm', 'Kurti'), (None, 'ktn', 'Karitiâna'), (None, 'kto', 'Kuot'), (None, 'ktp', 'Kaduo'),
+ (None, 'ktq', 'Katabaga'), (None, 'kts', 'South Muyu'), (None, 'ktt', 'Ketum'),
+ (None, 'ktu', 'Kituba (Democratic Republic of Congo)'), (None, 'ktv', 'Eastern Katu'), (None, 'ktw', 'Kato'),
+ (None, 'ktx', 'Kaxararí'), (None, 'kty', 'Kango (Bas-Uélé District)'), (None, 'ktz', 'Juǀʼhoan'),
+ ('kj', 'kua', 'Kuanyama'), (None, 'kub', 'Kutep'), (None, 'kuc', 'Kwinsu'), (None, 'kud', "'Auhelawa"),
+ (None, 'kue', 'Kuman (Papua New Guinea)'), (None, 'kuf', 'Western Katu'), (None, 'kug', 'Kupa'),
+ (None, 'kuh', 'Kushi'), (None, 'kui', 'Kuikúro-Kalapálo'), (None, 'kuj', 'Kuria'), (None, 'kuk', "Kepo'"),
+ (None, 'kul', 'Kulere'), (None, 'kum', 'Kumyk'), (None, 'kun', 'Kunama'), (None, 'kuo', 'Kumukio'),
+ (None, 'kup', 'Kunimaipa'), (None, 'kuq', 'Karipuna'), ('ku', 'kur', 'Kurdish'), (None, 'kus', 'Kusaal'),
+ (None, 'kut', 'Kutenai'), (None, 'kuu', 'Upper Kuskokwim'), (None, 'kuv', 'Kur'), (None, 'kuw', 'Kpagua'),
+ (None, 'kux', 'Kukatja'), (None, 'kuy', "Kuuku-Ya'u"), (None, 'kuz', 'Kunza'), (None, 'kva', 'Bagvalal'),
+ (None, 'kvb', 'Kubu'), (None, 'kvc', 'Kove'), (None, 'kvd', 'Kui (Indonesia)'), (None, 'kve', 'Kalabakan'),
+ (None, 'kvf', 'Kabalai'), (None, 'kvg', 'Kuni-Boazi'), (None, 'kvh', 'Komodo'), (None, 'kvi', 'Kwang'),
+ (None, 'kvj', 'Psikye'), (None, 'kvk', 'Korean Sign Language'), (None, 'kvl', 'Kayaw'), (None, 'kvm', 'Kendem'),
+ (None, 'kvn', 'Border Kuna'), (None, 'kvo', 'Dobel'), (None, 'kvp', 'Kompane'), (None, 'kvq', 'Geba Karen'),
+ (None, 'kvr', 'Kerinci'), (None, 'kvt', 'Lahta Karen'), (None, 'kvu', 'Yinbaw Karen'), (None, 'kvv', 'Kola'),
+ (None, 'kvw', 'Wersing'), (None, 'kvx', 'Parkari Koli'), (None, 'kvy', 'Yintale Karen'), (None, 'kvz', 'Tsakwambo'),
+ (None, 'kwa', 'Dâw'), (None, 'kwb', 'Kwa'), (None, 'kwc', 'Likwala'), (None, 'kwd', 'Kwaio'), (None, 'kwe', 'Kwerba'),
+ (None, 'kwf', "Kwara'ae"), (None, 'kwg', 'Sara Kaba Deme'), (None, 'kwh', 'Kowiai'), (None, 'kwi', 'Awa-Cuaiquer'),
+ (None, 'kwj', 'Kwanga'), (None, 'kwk', 'Kwakiutl'), (None, 'kwl', 'Kofyar'), (None, 'kwm', 'Kwambi'),
+ (None, 'kwn', 'Kwangali'), (None, 'kwo', 'Kwomtari'), (None, 'kwp', 'Kodia'), (None, 'kwr', 'Kwer'),
+ (None, 'kws', 'Kwese'), (None, 'kwt', 'Kwesten'), (None, 'kwu', 'Kwakum'), (None, 'kwv', 'Sara Kaba Náà'),
+ (None, 'kww', 'Kwinti'), (None, 'kwx', 'Khirwar'), (None, 'kwy', 'San Salvador Kongo'), (None, 'kwz', 'Kwadi'),
+ (None, 'kxa', 'Kairiru'), (None, 'kxb', 'Krobu'), (None, 'kxc', 'Konso'), (None, 'kxd', 'Brunei'),
+ (None, 'kxf', 'Manumanaw Karen'), (None, 'kxh', 'Karo (Ethiopia)'), (None, 'kxi', 'Keningau Murut'),
+ (None, 'kxj', 'Kulfa'), (None, 'kxk', 'Zayein Karen'), (None, 'kxm', 'Northern Khmer'),
+ (None, 'kxn', 'Kanowit-Tanjong Melanau'), (None, 'kxo', 'Kanoé'), (None, 'kxp', 'Wadiyara Koli'),
+ (None, 'kxq', 'Smärky Kanum'), (None, 'kxr', 'Koro (Papua New Guinea)'), (None, 'kxs', 'Kangjia'),
+ (None, 'kxt', 'Koiwat'), (None, 'kxv', 'Kuvi'), (None, 'kxw', 'Konai'), (None, 'kxx', 'Likuba'),
+ (None, 'kxy', 'Kayong'), (None, 'kxz', 'Kerewo'), (None, 'kya', 'Kwaya'), (None, 'kyb', 'Butbut Kalinga'),
+ (None, 'kyc', 'Kyaka'), (None, 'kyd', 'Karey'), (None, 'kye', 'Krache'), (None, 'kyf', 'Kouya'),
+ (None, 'kyg', 'Keyagana'), (None, 'kyh', 'Karok'), (None, 'kyi', 'Kiput'), (None, 'kyj', 'Karao'),
+ (None, 'kyk', 'Kamayo'), (None, 'kyl', 'Kalapuya'), (None, 'kym', 'Kpatili'), (None, 'kyn', 'Northern Binukidnon'),
+ (None, 'kyo', 'Kelon'), (None, 'kyp', 'Kang'), (None, 'kyq', 'Kenga'), (None, 'kyr', 'Kuruáya'),
+ (None, 'kys', 'Baram Kayan'), (None, 'kyt', 'Kayagar'), (None, 'kyu', 'Western Kayah'), (None, 'kyv', 'Kayort'),
+ (None, 'kyw', 'Kudmali'), (None, 'kyx', 'Rapoisi'), (None, 'kyy', 'Kambaira'), (None, 'kyz', 'Kayabí'),
+ (None, 'kza', 'Western Karaboro'), (None, 'kzb', 'Kaibobo'), (None, 'kzc', 'Bondoukou Kulango'),
+ (None, 'kzd', 'Kadai'), (None, 'kze', 'Kosena'), (None, 'kzf', "Da'a Kaili"), (None, 'kzg', 'Kikai'),
+ (None, 'kzi', 'Kelabit'), (None, 'kzk', 'Kazukuru'), (None, 'kzl', 'Kayeli'), (None, 'kzm', 'Kais'),
+ (None, 'kzn', 'Kokola'), (None, 'kzo', 'Kaningi'), (None, 'kzp', 'Kaidipang'), (None, 'kzq', 'Kaike'),
+ (None, 'kzr', 'Karang'), (None, 'kzs', 'Sugut Dusun'), (None, 'kzu', 'Kayupulau'), (None, 'kzv', 'Komyandaret'),
+ (None, 'kzw', 'Karirí-Xocó'), (None, 'kzx', 'Kamarian'), (None, 'kzy', 'Kango (Tshopo District)'),
+ (None, 'kzz', 'Kalabra'), (None, 'laa', 'Southern Subanen'), (None, 'lab', 'Linear A'), (None, 'lac', 'Lacandon'),
+ (None, 'lad', 'Ladino'), (None, 'lae', 'Pattani'), (None, 'laf', 'Lafofa'), (None, 'lag', 'Langi'),
+ (None, 'lah', 'Lahnda'), (None, 'lai', 'Lambya'), (None, 'laj', 'Lango (Uganda)'), (None, 'lal', 'Lalia'),
+ (None, 'lam', 'Lamba'), (None, 'lan', 'Laru'), ('lo', 'lao', 'Lao'), (None, 'lap', 'Laka (Chad)'),
+ (None, 'laq', 'Qabiao'), (None, 'lar', 'Larteh'), (None, 'las', 'Lama (Togo)'), ('la', 'lat', 'Latin'),
+ (None, 'lau', 'Laba'), ('lv', 'lav', 'Latvian'), (None, 'law', 'Lauje'), (None, 'lax', 'Tiwa'),
+ (None, 'lay', 'Lama Bai'), (None, 'laz', 'Aribwatsa'), (None, 'lbb', 'Label'), (None, 'lbc', 'Lakkia'),
+ (None, 'lbe', 'Lak'), (None, 'lbf', 'Tinani'), (None, 'lbg', 'Laopang'), (None, 'lbi', "La'bi"),
+ (None, 'lbj', 'Ladakhi'), (None, 'lbk', 'Central Bontok'), (None, 'lbl', 'Libon Bikol'), (None, 'lbm', 'Lodhi'),
+ (None, 'lbn', 'Rmeet'), (None, 'lbo', 'Laven'), (None, 'lbq', 'Wampar'), (None, 'lbr', 'Lohorung'),
+ (None, 'lbs', 'Libyan Sign Language'), (None, 'lbt', 'Lachi'), (None, 'lbu', 'Labu'),
+ (None, 'lbv', 'Lavatbura-Lamusong'), (None, 'lbw', 'Tolaki'), (None, 'lbx', 'Lawangan'), (None, 'lby', 'Lamalama'),
+ (None, 'lbz', 'Lardil'), (None, 'lcc', 'Legenyem'), (None, 'lcd', 'Lola'), (None, 'lce', 'Loncong'),
+ (None, 'lcf', 'Lubu'), (None, 'lch', 'Luchazi'), (None, 'lcl', 'Lisela'), (None, 'lcm', 'Tungag'),
+ (None, 'lcp', 'Western Lawa'), (None, 'lcq', 'Luhu'), (None, 'lcs', 'Lisabata-Nuniali'), (None, 'lda', 'Kla-Dan'),
+ (None, 'ldb', 'Dũya'), (None, 'ldd', 'Luri'), (None, 'ldg', 'Lenyima'), (None, 'ldh', 'Lamja-Dengsa-Tola'),
+ (None, 'ldi', 'Laari'), (None, 'ldj', 'Lemoro'), (None, 'ldk', 'Leelau'), (None, 'ldl', 'Kaan'),
+ (None, 'ldm', 'Landoma'), (None, 'ldn', 'Láadan'), (None, 'ldo', 'Loo'), (None, 'ldp', 'Tso'), (None, 'ldq', 'Lufu'),
+ (None, 'lea', 'Lega-Shabunda'), (None, 'leb', 'Lala-Bisa'), (None, 'lec', 'Leco'), (None, 'led', 'Lendu'),
+ (None, 'lee', 'Lyélé'), (None, 'lef', 'Lelemi'), (None, 'leh', 'Lenje'), (None, 'lei', 'Lemio'),
+ (None, 'lej', 'Lengola'), (None, 'lek', 'Leipon'), (None, 'lel', 'Lele (Democratic Republic of Congo)'),
+ (None, 'lem', 'Nomaande'), (None, 'len', 'Lenca'), (None, 'leo', 'Leti (Cameroon)'), (None, 'lep', 'Lepcha'),
+ (None, 'leq', 'Lembena'), (None, 'ler', 'Lenkau'), (None, 'les', 'Lese'), (None, 'let', 'Lesing-Gelimi'),
+ (None, 'leu', 'Kara (Papua New Guinea)'), (None, 'lev', 'Lamma'), (None, 'lew', 'Ledo Kaili'), (None, 'lex', 'Luang'),
+ (None, 'ley', 'Lemolang'), (None, 'lez', 'Lezghian'), (None, 'lfa', 'Lefa'), (None, 'lfn', 'Lingua Franca Nova'),
+ (None, 'lga', 'Lungga'), (None, 'lgb', 'Laghu'), (None, 'lgg', 'Lugbara'), (None, 'lgh', 'Laghuu'),
+ (None, 'lgi', 'Lengilu'), (None, 'lgk', 'Lingarak'), (None, 'lgl', 'Wala'), (None, 'lgm', 'Lega-Mwenga'),
+ (None, 'lgn', "T'apo"), (None, 'lgo', 'Lango (South Sudan)'), (None, 'lgq', 'Logba'), (None, 'lgr', 'Lengo'),
+ (None, 'lgt', 'Pahi'), (None, 'lgu', 'Longgu'), (None, 'lgz', 'Ligenza'), (None, 'lha', 'Laha (Viet Nam)'),
+ (None, 'lhh', 'Laha (Indonesia)'), (None, 'lhi', 'Lahu Shi'), (None, 'lhl', 'Lahul Lohar'), (None, 'lhm', 'Lhomi'),
+ (None, 'lhn', 'Lahanan'), (None, 'lhp', 'Lhokpu'), (None, 'lhs', 'Mlahsö'), (None, 'lht', 'Lo-Toga'),
+ (None, 'lhu', 'Lahu'), (None, 'lia', 'West-Central Limba'), (None, 'lib', 'Likum'), (None, 'lic', 'Hlai'),
+ (None, 'lid', 'Nyindrou'), (None, 'lie', 'Likila'), (None, 'lif', 'Limbu'), (None, 'lig', 'Ligbi'),
+ (None, 'lih', 'Lihir'), (None, 'lij', 'Ligurian'), (None, 'lik', 'Lika'), (None, 'lil', 'Lillooet'),
+ ('li', 'lim', 'Limburgan'), ('ln', 'lin', 'Lingala'), (None, 'lio', 'Liki'), (None, 'lip', 'Sekpele'),
+ (None, 'liq', 'Libido'), (None, 'lir', 'Liberian English'), (None, 'lis', 'Lisu'), ('lt', 'lit', 'Lithuanian'),
+ (None, 'liu', 'Logorik'), (None, 'liv', 'Liv'), (None, 'liw', 'Col'), (None, 'lix', 'Liabuku'),
+ (None, 'liy', 'Banda-Bambari'), (None, 'liz', 'Libinza'), (None, 'lja', 'Golpa'), (None, 'lje', 'Rampi'),
+ (None, 'lji', 'Laiyolo'), (None, 'ljl', "Li'o"), (None, 'ljp', 'Lampung Api'), (None, 'ljw', 'Yirandali'),
+ (None, 'ljx', 'Yuru'), (None, 'lka', 'Lakalei'), (None, 'lkb', 'Kabras'), (None, 'lkc', 'Kucong'),
+ (None, 'lkd', 'Lakondê'), (None, 'lke', 'Kenyi'), (None, 'lkh', 'Lakha'), (None, 'lki', 'Laki'),
+ (None, 'lkj', 'Remun'), (None, 'lkl', 'Laeko-Libuat'), (None, 'lkm', 'Kalaamaya'), (None, 'lkn', 'Lakon'),
+ (None, 'lko', 'Khayo'), (None, 'lkr', 'Päri'), (None, 'lks', 'Kisa'), (None, 'lkt', 'Lakota'),
+ (None, 'lku', 'Kungkari'), (None, 'lky', 'Lokoya'), (None, 'lla', 'Lala-Roba'), (None, 'llb', 'Lolo'),
+ (None, 'llc', 'Lele (Guinea)'), (None, 'lld', 'Ladin'), (None, 'lle', 'Lele (Papua New Guinea)'),
+ (None, 'llf', 'Hermit'), (None, 'llg', 'Lole'), (None, 'llh', 'Lamu'), (None, 'lli', 'Teke-Laali'),
+ (None, 'llj', 'Ladji Ladji'), (None, 'llk', 'Lelak'), (None, 'lll', 'Lilau'), (None, 'llm', 'Lasalimu'),
+ (None, 'lln', 'Lele (Chad)'), (None, 'llp', 'North Efate'), (None, 'llq', 'Lolak'),
+ (None, 'lls', 'Lithuanian Sign Language'), (None, 'llu', 'Lau'), (None, 'llx', 'Lauan'), (None, 'lma', 'East Limba'),
+ (None, 'lmb', 'Merei'), (None, 'lmc', 'Limilngan'), (None, 'lmd', 'Lumun'), (None, 'lme', 'Pévé'),
+ (None, 'lmf', 'South Lembata'), (None, 'lmg', 'Lamogai'), (None, 'lmh', 'Lambichhong'), (None, 'lmi', 'Lombi'),
+ (None, 'lmj', 'West Lembata'), (None, 'lmk', 'Lamkang'), (None, 'lml', 'Hano'), (None, 'lmn', 'Lambadi'),
+ (None, 'lmo', 'Lombard'), (None, 'lmp', 'Limbum'), (None, 'lmq', 'Lamatuka'), (None, 'lmr', 'Lamalera'),
+ (None, 'lmu', 'Lamenu'), (None, 'lmv', 'Lomaiviti'), (None, 'lmw', 'Lake Miwok'), (None, 'lmx', 'Laimbue'),
+ (None, 'lmy', 'Lamboya'), (None, 'lna', 'Langbashe'), (None, 'lnb', 'Mbalanhu'), (None, 'lnd', 'Lundayeh'),
+ (None, 'lng', 'Langobardic'), (None, 'lnh', 'Lanoh'), (None, 'lni', "Daantanai'"), (None, 'lnj', 'Leningitij'),
+ (None, 'lnl', 'South Central Banda'), (None, 'lnm', 'Langam'), (None, 'lnn', 'Lorediakarkar'),
+ (None, 'lns', "Lamnso'"), (None, 'lnu', 'Longuda'), (None, 'lnw', 'Lanima'), (None, 'lnz', 'Lonzo'),
+ (None, 'loa', 'Loloda'), (None, 'lob', 'Lobi'), (None, 'loc', 'Inonhan'), (None, 'loe', 'Saluan'),
+ (None, 'lof', 'Logol'), (None, 'log', 'Logo'), (None, 'loh', 'Narim'), (None, 'loi', "Loma (Côte d'Ivoire)"),
+ (None, 'loj', 'Lou'), (None, 'lok', 'Loko'), (None, 'lol', 'Mongo'), (None, 'lom', 'Loma (Liberia)'),
+ (None, 'lon', 'Malawi Lomwe'), (None, 'loo', 'Lombo'), (None, 'lop', 'Lopa'), (None, 'loq', 'Lobala'),
+ (None, 'lor', 'Téén'), (None, 'los', 'Loniu'), (None, 'lot', 'Otuho'), (None, 'lou', 'Louisiana Creole'),
+ (None, 'lov', 'Lopi'), (None, 'low', 'Tampias Lobu'), (None, 'lox', 'Loun'), (None, 'loy', 'Loke'),
+ (None, 'loz', 'Lozi'), (None, 'lpa', 'Lelepa'), (None, 'lpe', 'Lepki'), (None, 'lpn', 'Long Phuri Naga'),
+ (None, 'lpo', 'Lipo'), (None, 'lpx', 'Lopit'), (None, 'lqr', 'Logir'), (None, 'lra', "Rara Bakati'"),
+ (None, 'lrc', 'Northern Luri'), (None, 'lre', 'Laurentian'), (None, 'lrg', 'Laragia'), (None, 'lri', 'Marachi'),
+ (None, 'lrk', 'Loarki'), (None, 'lrl', 'Lari'), (None, 'lrm', 'Marama'), (None, 'lrn', 'Lorang'),
+ (None, 'lro', 'Laro'), (None, 'lrr', 'Southern Yamphu'), (None, 'lrt', 'Larantuka Malay'), (None, 'lrv', 'Larevat'),
+ (None, 'lrz', 'Lemerig'), (None, 'lsa', 'Lasgerdi'), (None, 'lsb', 'Burundian Sign Language'),
+ (None, 'lsc', 'Albarradas Sign Language'), (None, 'lsd', 'Lishana Deni'), (None, 'lse', 'Lusengo'),
+ (None, 'lsh', 'Lish'), (None, 'lsi', 'Lashi'), (None, 'lsl', 'Latvian Sign Language'), (None, 'lsm', 'Saamia'),
+ (None, 'lsn', 'Tibetan Sign Language'), (None, 'lso', 'Laos Sign Language'), (None, 'lsp', 'Panamanian Sign Language'),
+ (None, 'lsr', 'Aruop'), (None, 'lss', 'Lasi'), (None, 'lst', 'Trinidad and Tobago Sign Language'),
+ (None, 'lsv', 'Sivia Sign Language'), (None, 'lsw', 'Seychelles Sign Language'),
+ (None, 'lsy', 'Mauritian Sign Language'), (None, 'ltc', 'Late Middle Chinese'), (None, 'ltg', 'Latgalian'),
+ (None, 'lth', 'Thur'), (None, 'lti', 'Leti (Indonesia)'), (None, 'ltn', 'Latundê'), (None, 'lto', 'Tsotso'),
+ (None, 'lts', 'Tachoni'), (None, 'ltu', 'Latu'), ('lb', 'ltz', 'Luxembourgish'), (None, 'lua', 'Luba-Lulua'),
+ ('lu', 'lub', 'Luba-Katanga'), (None, 'luc', 'Aringa'), (None, 'lud', 'Ludian'), (None, 'lue', 'Luvale'),
+ (None, 'luf', 'Laua'), ('lg', 'lug', 'Ganda'), (None, 'lui', 'Luiseno'), (None, 'luj', 'Luna'),
+ (None, 'luk', 'Lunanakha'), (None, 'lul', "Olu'bo"), (None, 'lum', 'Luimbi'), (None, 'lun', 'Lunda'),
+ (None, 'luo', 'Luo (Kenya and Tanzania)'), (None, 'lup', 'Lumbu'), (None, 'luq', 'Lucumi'), (None, 'lur', 'Laura'),
+ (None, 'lus', 'Lushai'), (None, 'lut', 'Lushootseed'), (None, 'luu', 'Lumba-Yakkha'), (None, 'luv', 'Luwati'),
+ (None, 'luw', 'Luo (Cameroon)'), (None, 'luy', 'Luyia'), (None, 'luz', 'Southern Luri'), (None, 'lva', "Maku'a"),
+ (None, 'lvi', 'Lavi'), (None, 'lvk', 'Lavukaleve'), (None, 'lvs', 'Standard Latvian'), (None, 'lvu', 'Levuka'),
+ (None, 'lwa', 'Lwalu'), (None, 'lwe', 'Lewo Eleng'), (None, 'lwg', 'Wanga'), (None, 'lwh', 'White Lachi'),
+ (None, 'lwl', 'Eastern Lawa'), (None, 'lwm', 'Laomian'), (None, 'lwo', 'Luwo'),
+ (None, 'lws', 'Malawian Sign Language'), (None, 'lwt', 'Lewotobi'), (None, 'lwu', 'Lawu'), (None, 'lww', 'Lewo'),
+ (None, 'lxm', 'Lakurumau'), (None, 'lya', 'Layakha'), (None, 'lyg', 'Lyngngam'), (None, 'lyn', 'Luyana'),
+ (None, 'lzh', 'Literary Chinese'), (None, 'lzl', 'Litzlitz'), (None, 'lzn', 'Leinong Naga'), (None, 'lzz', 'Laz'),
+ (None, 'maa', 'San Jerónimo Tecóatl Mazatec'), (None, 'mab', 'Yutanduchi Mixtec'), (None, 'mad', 'Madurese'),
+ (None, 'mae', 'Bo-Rukul'), (None, 'maf', 'Mafa'), (None, 'mag', 'Magahi'), ('mh', 'mah', 'Marshallese'),
+ (None, 'mai', 'Maithili'), (None, 'maj', 'Jalapa De Díaz Mazatec'), (None, 'mak', 'Makasar'),
+ ('ml', 'mal', 'Malayalam'), (None, 'mam', 'Mam'), (None, 'man', 'Mandingo'), (None, 'maq', 'Chiquihuitlán Mazatec'),
+ ('mr', 'mar', 'Marathi'), (None, 'mas', 'Masai'), (None, 'mat', 'San Francisco Matlatzinca'),
+ (None, 'mau', 'Huautla Mazatec'), (None, 'mav', 'Sateré-Mawé'), (None, 'maw', 'Mampruli'),
+ (None, 'max', 'North Moluccan Malay'), (None, 'maz', 'Central Mazahua'), (None, 'mba', 'Higaonon'),
+ (None, 'mbb', 'Western Bukidnon Manobo'), (None, 'mbc', 'Macushi'), (None, 'mbd', 'Dibabawon Manobo'),
+ (None, 'mbe', 'Molale'), (None, 'mbf', 'Baba Malay'), (None, 'mbh', 'Mangseng'), (None, 'mbi', 'Ilianen Manobo'),
+ (None, 'mbj', 'Nadëb'), (None, 'mbk', 'Malol'), (None, 'mbl', 'Maxakalí'), (None, 'mbm', 'Ombamba'),
+ (None, 'mbn', 'Macaguán'), (None, 'mbo', 'Mbo (Cameroon)'), (None, 'mbp', 'Malayo'), (None, 'mbq', 'Maisin'),
+ (None, 'mbr', 'Nukak Makú'), (None, 'mbs', 'Sarangani Manobo'), (None, 'mbt', 'Matigsalug Manobo'),
+ (None, 'mbu', 'Mbula-Bwazza'), (None, 'mbv', 'Mbulungish'), (None, 'mbw', 'Maring'),
+ (None, 'mbx', 'Mari (East Sepik Province)'), (None, 'mby', 'Memoni'), (None, 'mbz', 'Amoltepec Mixtec'),
+ (None, 'mca', 'Maca'), (None, 'mcb', 'Machiguenga'), (None, 'mcc', 'Bitur'), (None, 'mcd', 'Sharanahua'),
+ (None, 'mce', 'Itundujia Mixtec'), (None, 'mcf', 'Matsés'), (None, 'mcg', 'Mapoyo'), (None, 'mch', 'Maquiritari'),
+ (None, 'mci', 'Mese'), (None, 'mcj', 'Mvanip'), (None, 'mck', 'Mbunda'), (None, 'mcl', 'Macaguaje'),
+ (None, 'mcm', 'Malaccan Creole Portuguese'), (None, 'mcn', 'Masana'), (None, 'mco', 'Coatlán Mixe'),
+ (None, 'mcp', 'Makaa'), (None, 'mcq', 'Ese'), (None, 'mcr', 'Menya'), (None, 'mcs', 'Mambai'),
+ (None, 'mct', 'Mengisa'), (None, 'mcu', 'Cameroon Mambila'), (None, 'mcv', 'Minanibai'), (None, 'mcw', 'Mawa (Chad)'),
+ (None, 'mcx', 'Mpiemo'), (None, 'mcy', 'South Watut'), (None, 'mcz', 'Mawan'), (None, 'mda', 'Mada (Nigeria)'),
+ (None, 'mdb', 'Morigi'), (None, 'mdc', 'Male (Papua New Guinea)'), (None, 'mdd', 'Mbum'), (None, 'mde', 'Maba (Chad)'),
+ (None, 'mdf', 'Moksha'), (None, 'mdg', 'Massalat'), (None, 'mdh', 'Maguindanaon'), (None, 'mdi', 'Mamvu'),
+ (None, 'mdj', 'Mangbetu'), (None, 'mdk', 'Mangbutu'), (None, 'mdl', 'Maltese Sign Language'), (None, 'mdm', 'Mayogo'),
+ (None, 'mdn', 'Mbati'), (None, 'mdp', 'Mbala'), (None, 'mdq', 'Mbole'), (None, 'mdr', 'Mandar'),
+ (None, 'mds', 'Maria (Papua New Guinea)'), (None, 'mdt', 'Mbere'), (None, 'mdu', 'Mboko'),
+ (None, 'mdv', 'Santa Lucía Monteverde Mixtec'), (None, 'mdw', 'Mbosi'), (None, 'mdx', 'Dizin'),
+ (None, 'mdy', 'Male (Ethiopia)'), (None, 'mdz', 'Suruí Do Pará'), (None, 'mea', 'Menka'), (None, 'meb', 'Ikobi'),
+ (None, 'mec', 'Marra'), (None, 'med', 'Melpa'), (None, 'mee', 'Mengen'), (None, 'mef', 'Megam'),
+ (None, 'meh', 'Southwestern Tlaxiaco Mixtec'), (None, 'mei', 'Midob'), (None, 'mej', 'Meyah'), (None, 'mek', 'Mekeo'),
+ (None, 'mel', 'Central Melanau'), (None, 'mem', 'Mangala'), (None, 'men', 'Mende (Sierra Leone)'),
+ (None, 'meo', 'Kedah Malay'), (None, 'mep', 'Miriwoong'), (None, 'meq', 'Merey'), (None, 'mer', 'Meru'),
+ (None, 'mes', 'Masmaje'), (None, 'met', 'Mato'), (None, 'meu', 'Motu'), (None, 'mev', 'Mano'), (None, 'mew', 'Maaka'),
+ (None, 'mey', 'Hassaniyya'), (None, 'mez', 'Menominee'), (None, 'mfa', 'Pattani Malay'), (None, 'mfb', 'Bangka'),
+ (None, 'mfc', 'Mba'), (None, 'mfd', 'Mendankwe-Nkwen'), (None, 'mfe', 'Morisyen'), (None, 'mff', 'Naki'),
+ (None, 'mfg', 'Mogofin'), (None, 'mfh', 'Matal'), (None, 'mfi', 'Wandala'), (None, 'mfj', 'Mefele'),
+ (None, 'mfk', 'North Mofu'), (None, 'mfl', 'Putai'), (None, 'mfm', 'Marghi South'),
+ (None, 'mfn', 'Cross River Mbembe'), (None, 'mfo', 'Mbe'), (None, 'mfp', 'Makassar Malay'), (None, 'mfq', 'Moba'),
+ (None, 'mfr', 'Marrithiyel'), (None, 'mfs', 'Mexican Sign Language'), (None, 'mft', 'Mokerang'),
+ (None, 'mfu', 'Mbwela'), (None, 'mfv', 'Mandjak'), (None, 'mfw', 'Mulaha'), (None, 'mfx', 'Melo'),
+ (None, 'mfy', 'Mayo'), (None, 'mfz', 'Mabaan'), (None, 'mga', 'Middle Irish (900-1200)'), (None, 'mgb', 'Mararit'),
+ (None, 'mgc', 'Morokodo'), (None, 'mgd', 'Moru'), (None, 'mge', 'Mango'), (None, 'mgf', 'Maklew'),
+ (None, 'mgg', 'Mpumpong'), (None, 'mgh', 'Makhuwa-Meetto'), (None, 'mgi', 'Lijili'), (None, 'mgj', 'Abureni'),
+ (None, 'mgk', 'Mawes'), (None, 'mgl', 'Maleu-Kilenge'), (None, 'mgm', 'Mambae'), (None, 'mgn', 'Mbangi'),
+ (None, 'mgo', "Meta'"), (None, 'mgp', 'Eastern Magar'), (None, 'mgq', 'Malila'), (None, 'mgr', 'Mambwe-Lungu'),
+ (None, 'mgs', 'Manda (Tanzania)'), (None, 'mgt', 'Mongol'), (None, 'mgu', 'Mailu'), (None, 'mgv', 'Matengo'),
+ (None, 'mgw', 'Matumbi'), (None, 'mgy', 'Mbunga'), (None, 'mgz', 'Mbugwe'), (None, 'mha', 'Manda (India)'),
+ (None, 'mhb', 'Mahongwe'), (None, 'mhc', 'Mocho'), (None, 'mhd', 'Mbugu'), (None, 'mhe', 'Besisi'),
+ (None, 'mhf', 'Mamaa'), (None, 'mhg', 'Margu'), (None, 'mhi', "Ma'di"), (None, 'mhj', 'Mogholi'),
+ (None, 'mhk', 'Mungaka'), (None, 'mhl', 'Mauwake'), (None, 'mhm', 'Makhuwa-Moniga'), (None, 'mhn', 'Mócheno'),
+ (None, 'mho', 'Mashi (Zambia)'), (None, 'mhp', 'Balinese Malay'), (None, 'mhq', 'Mandan'),
+ (None, 'mhr', 'Eastern Mari'), (None, 'mhs', 'Buru (Indonesia)'), (None, 'mht', 'Mandahuaca'),
+ (None, 'mhu', 'Digaro-Mishmi'), (None, 'mhw', 'Mbukushu'), (None, 'mhx', 'Maru'), (None, 'mhy', "Ma'anyan"),
+ (None, 'mhz', 'Mor (Mor Islands)'), (None, 'mia', 'Miami'), (None, 'mib', 'Atatláhuca Mixtec'),
+ (None, 'mic', "Mi'kmaq"), (None, 'mid', 'Mandaic'), (None, 'mie', 'Ocotepec Mixtec'), (None, 'mif', 'Mofu-Gudur'),
+ (None, 'mig', 'San Miguel El Grande Mixtec'), (None, 'mih', 'Chayuco Mixtec'), (None, 'mii', 'Chigmecatitlán Mixtec'),
+ (None, 'mij', 'Abar'), (None, 'mik', 'Mikasuki'), (None, 'mil', 'Peñoles Mixtec'),
+ (None, 'mim', 'Alacatlatzala Mixtec'), (None, 'min', 'Minangkabau'), (None, 'mio', 'Pinotepa Nacional Mixtec'),
+ (None, 'mip', 'Apasco-Apoala Mixtec'), (None, 'miq', 'Mískito'), (None, 'mir', 'Isthmus Mixe'),
+ (None, 'mis', 'Uncoded languages'), (None, 'mit', 'Southern Puebla Mixtec'), (None, 'miu', 'Cacaloxtepec Mixtec'),
+ (None, 'miw', 'Akoye'), (None, 'mix', 'Mixtepec Mixtec'), (None, 'miy', 'Ayutla Mixtec'),
+ (None, 'miz', 'Coatzospan Mixtec'), (None, 'mjb', 'Makalero'), (None, 'mjc', 'San Juan Colorado Mixtec'),
+ (None, 'mjd', 'Northwest Maidu'), (None, 'mje', 'Muskum'), (None, 'mjg', 'Tu'), (None, 'mjh', 'Mwera (Nyasa)'),
+ (None, 'mji', 'Kim Mun'), (None, 'mjj', 'Mawak'), (None, 'mjk', 'Matukar'), (None, 'mjl', 'Mandeali'),
+ (None, 'mjm', 'Medebur'), (None, 'mjn', 'Ma (Papua New Guinea)'), (None, 'mjo', 'Malankuravan'),
+ (None, 'mjp', 'Malapandaram'), (None, 'mjq', 'Malaryan'), (None, 'mjr', 'Malavedan'), (None, 'mjs', 'Miship'),
+ (None, 'mjt', 'Sauria Paharia'), (None, 'mju', 'Manna-Dora'), (None, 'mjv', 'Mannan'), (None, 'mjw', 'Karbi'),
+ (None, 'mjx', 'Mahali'), (None, 'mjy', 'Mahican'), (None, 'mjz', 'Majhi'), (None, 'mka', 'Mbre'),
+ (None, 'mkb', 'Mal Paharia'), (None, 'mkc', 'Siliput'), ('mk', 'mkd', 'Macedonian'), (None, 'mke', 'Mawchi'),
+ (None, 'mkf', 'Miya'), (None, 'mkg', 'Mak (China)'), (None, 'mki', 'Dhatki'), (None, 'mkj', 'Mokilese'),
+ (None, 'mkk', 'Byep'), (None, 'mkl', 'Mokole'), (None, 'mkm', 'Moklen'), (None, 'mkn', 'Kupang Malay'),
+ (None, 'mko', 'Mingang Doso'), (None, 'mkp', 'Moikodi'), (None, 'mkq', 'Bay Miwok'), (None, 'mkr', 'Malas'),
+ (None, 'mks', 'Silacayoapan Mixtec'), (None, 'mkt', 'Vamale'), (None, 'mku', 'Konyanka Maninka'),
+ (None, 'mkv', 'Mafea'), (None, 'mkw', 'Kituba (Congo)'), (None, 'mkx', 'Kinamiging Manobo'),
+ (None, 'mky', 'East Makian'), (None, 'mkz', 'Makasae'), (None, 'mla', 'Malo'), (None, 'mlb', 'Mbule'),
+ (None, 'mlc', 'Cao Lan'), (None, 'mle', 'Manambu'), (None, 'mlf', 'Mal'), ('mg', 'mlg', 'Malagasy'),
+ (None, 'mlh', 'Mape'), (None, 'mli', 'Malimpung'), (None, 'mlj', 'Miltu'), (None, 'mlk', 'Ilwana'),
+ (None, 'mll', 'Malua Bay'), (None, 'mlm', 'Mulam'), (None, 'mln', 'Malango'), (None, 'mlo', 'Mlomp'),
+ (None, 'mlp', 'Bargam'), (None, 'mlq', 'Western Maninkakan'), (None, 'mlr', 'Vame'), (None, 'mls', 'Masalit'),
+ ('mt', 'mlt', 'Maltese'), (None, 'mlu', "To'abaita"), (None, 'mlv', 'Motlav'), (None, 'mlw', 'Moloko'),
+ (None, 'mlx', 'Malfaxal'), (None, 'mlz', 'Malaynon'), (None, 'mma', 'Mama'), (None, 'mmb', 'Momina'),
+ (None, 'mmc', 'Michoacán Mazahua'), (None, 'mmd', 'Maonan'), (None, 'mme', 'Mae'), (None, 'mmf', 'Mundat'),
+ (None, 'mmg', 'North Ambrym'), (None, 'mmh', 'Mehináku'), (None, 'mmi', 'Musar'), (None, 'mmj', 'Majhwar'),
+ (None, 'mmk', 'Mukha-Dora'), (None, 'mml', 'Man Met'), (None, 'mmm', 'Maii'), (None, 'mmn', 'Mamanwa'),
+ (None, 'mmo', 'Mangga Buang'), (None, 'mmp', 'Siawi'), (None, 'mmq', 'Musak'), (None, 'mmr', 'Western Xiangxi Miao'),
+ (None, 'mmt', 'Malalamai'), (None, 'mmu', 'Mmaala'), (None, 'mmv', 'Miriti'), (None, 'mmw', 'Emae'),
+ (None, 'mmx', 'Madak'), (None, 'mmy', 'Migaama'), (None, 'mmz', 'Mabaale'), (None, 'mna', 'Mbula'),
+ (None, 'mnb', 'Muna'), (None, 'mnc', 'Manchu'), (None, 'mnd', 'Mondé'), (None, 'mne', 'Naba'),
+ (None, 'mnf', 'Mundani'), (None, 'mng', 'Eastern Mnong'), (None, 'mnh', 'Mono (Democratic Republic of Congo)'),
+ (None, 'mni', 'Manipuri'), (None, 'mnj', 'Munji'), (None, 'mnk', 'Mandinka'), (None, 'mnl', 'Tiale'),
+ (None, 'mnm', 'Mapena'), (None, 'mnn', 'Southern Mnong'), (None, 'mnp', 'Min Bei Chinese'), (None, 'mnq', 'Minriq'),
+ (None, 'mnr', 'Mono (USA)'), (None, 'mns', 'Mansi'), (None, 'mnu', 'Mer'), (None, 'mnv', 'Rennell-Bellona'),
+ (None, 'mnw', 'Mon'), (None, 'mnx', 'Manikion'), (None, 'mny', 'Manyawa'), (None, 'mnz', 'Moni'),
+ (None, 'moa', 'Mwan'), (None, 'moc', 'Mocoví'), (None, 'mod', 'Mobilian'), (None, 'moe', 'Innu'),
+ (None, 'mog', 'Mongondow'), (None, 'moh', 'Mohawk'), (None, 'moi', 'Mboi'), (None, 'moj', 'Monzombo'),
+ (None, 'mok', 'Morori'), (None, 'mom', 'Mangue'), ('mn', 'mon', 'Mongolian'), (None, 'moo', 'Monom'),
+ (None, 'mop', 'Mopán Maya'), (None, 'moq', 'Mor (Bomberai Peninsula)'), (None, 'mor', 'Moro'), (None, 'mos', 'Mossi'),
+ (None, 'mot', 'Barí'), (None, 'mou', 'Mogum'), (None, 'mov', 'Mohave'), (None, 'mow', 'Moi (Congo)'),
+ (None, 'mox', 'Molima'), (None, 'moy', 'Shekkacho'), (None, 'moz', 'Mukulu'), (None, 'mpa', 'Mpoto'),
+ (None, 'mpb', 'Malak Malak'), (None, 'mpc', 'Mangarrayi'), (None, 'mpd', 'Machinere'), (None, 'mpe', 'Majang'),
+ (None, 'mpg', 'Marba'), (None, 'mph', 'Maung'), (None, 'mpi', 'Mpade'), (None, 'mpj', 'Martu Wangka'),
+ (None, 'mpk', 'Mbara (Chad)'), (None, 'mpl', 'Middle Watut'), (None, 'mpm', 'Yosondúa Mixtec'),
+ (None, 'mpn', 'Mindiri'), (None, 'mpo', 'Miu'), (None, 'mpp', 'Migabac'), (None, 'mpq', 'Matís'),
+ (None, 'mpr', 'Vangunu'), (None, 'mps', 'Dadibi'), (None, 'mpt', 'Mian'), (None, 'mpu', 'Makuráp'),
+ (None, 'mpv', 'Mungkip'), (None, 'mpw', 'Mapidian'), (None, 'mpx', 'Misima-Panaeati'), (None, 'mpy', 'Mapia'),
+ (None, 'mpz', 'Mpi'), (None, 'mqa', 'Maba (Indonesia)'), (None, 'mqb', 'Mbuko'), (None, 'mqc', 'Mangole'),
+ (None, 'mqe', 'Matepi'), (None, 'mqf', 'Momuna'), (None, 'mqg', 'Kota Bangun Kutai Malay'),
+ (None, 'mqh', 'Tlazoyaltepec Mixtec'), (None, 'mqi', 'Mariri'), (None, 'mqj', 'Mamasa'),
+ (None, 'mqk', 'Rajah Kabunsuwan Manobo'), (None, 'mql', 'Mbelime'), (None, 'mqm', 'South Marquesan'),
+ (None, 'mqn', 'Moronene'), (None, 'mqo', 'Modole'), (None, 'mqp', 'Manipa'), (None, 'mqq', 'Minokok'),
+ (None, 'mqr', 'Mander'), (None, 'mqs', 'West Makian'), (None, 'mqt', 'Mok'), (None, 'mqu', 'Mandari'),
+ (None, 'mqv', 'Mosimo'), (None, 'mqw', 'Murupi'), (None, 'mqx', 'Mamuju'), (None, 'mqy', 'Manggarai'),
+ (None, 'mqz', 'Pano'), (None, 'mra', 'Mlabri'), (None, 'mrb', 'Marino'), (None, 'mrc', 'Maricopa'),
+ (None, 'mrd', 'Western Magar'), (None, 'mre', "Martha's Vineyard Sign Language"), (None, 'mrf', 'Elseng'),
+ (None, 'mrg', 'Mising'), (None, 'mrh', 'Mara Chin'), ('mi', 'mri', 'Maori'), (None, 'mrj', 'Western Mari'),
+ (None, 'mrk', 'Hmwaveke'), (None, 'mrl', 'Mortlockese'), (None, 'mrm', 'Merlav'), (None, 'mrn', 'Cheke Holo'),
+ (None, 'mro', 'Mru'), (None, 'mrp', 'Morouas'), (None, 'mrq', 'North Marquesan'), (None, 'mrr', 'Maria (India)'),
+ (None, 'mrs', 'Maragus'), (None, 'mrt', 'Marghi Central'), (None, 'mru', 'Mono (Cameroon)'),
+ (None, 'mrv', 'Mangareva'), (None, 'mrw', 'Maranao'), (None, 'mrx', 'Maremgi'), (None, 'mry', 'Mandaya'),
+ (None, 'mrz', 'Marind'), ('ms', 'msa', 'Malay (macrolanguage)'), (None, 'msb', 'Masbatenyo'),
+ (None, 'msc', 'Sankaran Maninka'), (None, 'msd', 'Yucatec Maya Sign Language'), (None, 'mse', 'Musey'),
+ (None, 'msf', 'Mekwei'), (None, 'msg', 'Moraid'), (None, 'msh', 'Masikoro Malagasy'), (None, 'msi', 'Sabah Malay'),
+ (None, 'msj', 'Ma (Democratic Republic of Congo)'), (None, 'msk', 'Mansaka'), (None, 'msl', 'Molof'),
+ (None, 'msm', 'Agusan Manobo'), (None, 'msn', 'Vurës'), (None, 'mso', 'Mombum'), (None, 'msp', 'Maritsauá'),
+ (None, 'msq', 'Caac'), (None, 'msr', 'Mongolian Sign Language'), (None, 'mss', 'West Masela'), (None, 'msu', 'Musom'),
+ (None, 'msv', 'Maslam'), (None, 'msw', 'Mansoanka'), (None, 'msx', 'Moresada'), (None, 'msy', 'Aruamu'),
+ (None, 'msz', 'Momare'), (None, 'mta', 'Cotabato Manobo'), (None, 'mtb', 'Anyin Morofo'), (None, 'mtc', 'Munit'),
+ (None, 'mtd', 'Mualang'), (None, 'mte', 'Mono (Solomon Islands)'), (None, 'mtf', 'Murik (Papua New Guinea)'),
+ (None, 'mtg', 'Una'), (None, 'mth', 'Munggui'), (None, 'mti', 'Maiwa (Papua New Guinea)'), (None, 'mtj', 'Moskona'),
+ (None, 'mtk', "Mbe'"), (None, 'mtl', 'Montol'), (None, 'mtm', 'Mator'), (None, 'mtn', 'Matagalpa'),
+ (None, 'mto', 'Totontepec Mixe'), (None, 'mtp', 'Wichí Lhamtés Nocten'), (None, 'mtq', 'Muong'),
+ (None, 'mtr', 'Mewari'), (None, 'mts', 'Yora'), (None, 'mtt', 'Mota'), (None, 'mtu', 'Tututepec Mixtec'),
+ (None, 'mtv', "Asaro'o"), (None, 'mtw', 'Southern Binukidnon'), (None, 'mtx', 'Tidaá Mixtec'), (None, 'mty', 'Nabi'),
+ (None, 'mua', 'Mundang'), (None, 'mub', 'Mubi'), (None, 'muc', 'Ajumbu'), (None, 'mud', 'Mednyj Aleut'),
+ (None, 'mue', 'Media Lengua'), (None, 'mug', 'Musgu'), (None, 'muh', 'Mündü'), (None, 'mui', 'Musi'),
+ (None, 'muj', 'Mabire'), (None, 'muk', 'Mugom'), (None, 'mul', 'Multiple languages'), (None, 'mum', 'Maiwala'),
+ (None, 'muo', 'Nyong'), (None, 'mup', 'Malvi'), (None, 'muq', 'Eastern Xiangxi Miao'), (None, 'mur', 'Murle'),
+ (None, 'mus', 'Creek'), (None, 'mut', 'Western Muria'), (None, 'muu', 'Yaaku'), (None, 'muv', 'Muthuvan'),
+ (None, 'mux', 'Bo-Ung'), (None, 'muy', 'Muyang'), (None, 'muz', 'Mursi'), (None, 'mva', 'Manam'),
+ (None, 'mvb', 'Mattole'), (None, 'mvd', 'Mamboru'), (None, 'mve', 'Marwari (Pakistan)'),
+ (None, 'mvf', 'Peripheral Mongolian'), (None, 'mvg', 'Yucuañe Mixtec'), (None, 'mvh', 'Mulgi'),
+ (None, 'mvi', 'Miyako'), (None, 'mvk', 'Mekmek'), (None, 'mvl', 'Mbara (Australia)'), (None, 'mvn', 'Minaveha'),
+ (None, 'mvo', 'Marovo'), (None, 'mvp', 'Duri'), (None, 'mvq', 'Moere'), (None, 'mvr', 'Marau'),
+ (None, 'mvs', 'Massep'), (None, 'mvt', 'Mpotovoro'), (None, 'mvu', 'Marfa'), (None, 'mvv', 'Tagal Murut'),
+ (None, 'mvw', 'Machinga'), (None, 'mvx', 'Meoswar'), (None, 'mvy', 'Indus Kohistani'), (None, 'mvz', 'Mesqan'),
+ (None, 'mwa', 'Mwatebu'), (None, 'mwb', 'Juwal'), (None, 'mwc', 'Are'), (None, 'mwe', 'Mwera (Chimwera)'),
+ (None, 'mwf', 'Murrinh-Patha'), (None, 'mwg', 'Aiklep'), (None, 'mwh', 'Mouk-Aria'), (None, 'mwi', 'Labo'),
+ (None, 'mwk', 'Kita Maninkakan'), (None, 'mwl', 'Mirandese'), (None, 'mwm', 'Sar'), (None, 'mwn', 'Nyamwanga'),
+ (None, 'mwo', 'Central Maewo'), (None, 'mwp', 'Kala Lagaw Ya'), (None, 'mwq', 'Mün Chin'), (None, 'mwr', 'Marwari'),
+ (None, 'mws', 'Mwimbi-Muthambi'), (None, 'mwt', 'Moken'), (None, 'mwu', 'Mittu'), (None, 'mwv', 'Mentawai'),
+ (None, 'mww', 'Hmong Daw'), (None, 'mwz', 'Moingi'), (None, 'mxa', 'Northwest Oaxaca Mixtec'),
+ (None, 'mxb', 'Tezoatlán Mixtec'), (None, 'mxc', 'Manyika'), (None, 'mxd', 'Modang'), (None, 'mxe', 'Mele-Fila'),
+ (None, 'mxf', 'Malgbe'), (None, 'mxg', 'Mbangala'), (None, 'mxh', 'Mvuba'), (None, 'mxi', 'Mozarabic'),
+ (None, 'mxj', 'Miju-Mishmi'), (None, 'mxk', 'Monumbo'), (None, 'mxl', 'Maxi Gbe'), (None, 'mxm', 'Meramera'),
+ (None, 'mxn', 'Moi (Indonesia)'), (None, 'mxo', 'Mbowe'), (None, 'mxp', 'Tlahuitoltepec Mixe'),
+ (None, 'mxq', 'Juquila Mixe'), (None, 'mxr', 'Murik (Malaysia)'), (None, 'mxs', 'Huitepec Mixtec'),
+ (None, 'mxt', 'Jamiltepec Mixtec'), (None, 'mxu', 'Mada (Cameroon)'), (None, 'mxv', 'Metlatónoc Mixtec'),
+ (None, 'mxw', 'Namo'), (None, 'mxx', 'Mahou'), (None, 'mxy', 'Southeastern Nochixtlán Mixtec'),
+ (None, 'mxz', 'Central Masela'), ('my', 'mya', 'Burmese'), (None, 'myb', 'Mbay'), (None, 'myc', 'Mayeka'),
+ (None, 'mye', 'Myene'), (None, 'myf', 'Bambassi'), (None, 'myg', 'Manta'), (None, 'myh', 'Makah'),
+ (None, 'myj', 'Mangayat'), (None, 'myk', 'Mamara Senoufo'), (None, 'myl', 'Moma'), (None, 'mym', "Me'en"),
+ (None, 'myo', 'Anfillo'), (None, 'myp', 'Pirahã'), (None, 'myr', 'Muniche'), (None, 'mys', 'Mesmes'),
+ (None, 'myu', 'Mundurukú'), (None, 'myv', 'Erzya'), (None, 'myw', 'Muyuw'), (None, 'myx', 'Masaaba'),
+ (None, 'myy', 'Macuna'), (None, 'myz', 'Classical Mandaic'), (None, 'mza', 'Santa María Zacatepec Mixtec'),
+ (None, 'mzb', 'Tumzabt'), (None, 'mzc', 'Madagascar Sign Language'), (None, 'mzd', 'Malimba'), (None, 'mze', 'Morawa'),
+ (None, 'mzg', 'Monastic Sign Language'), (None, 'mzh', 'Wichí Lhamtés Güisnay'), (None, 'mzi', 'Ixcatlán Mazatec'),
+ (None, 'mzj', 'Manya'), (None, 'mzk', 'Nigeria Mambila'), (None, 'mzl', 'Mazatlán Mixe'), (None, 'mzm', 'Mumuye'),
+ (None, 'mzn', 'Mazanderani'), (None, 'mzo', 'Matipuhy'), (None, 'mzp', 'Movima'), (None, 'mzq', 'Mori Atas'),
+ (None, 'mzr', 'Marúbo'), (None, 'mzs', 'Macanese'), (None, 'mzt', 'Mintil'), (None, 'mzu', 'Inapang'),
+ (None, 'mzv', 'Manza'), (None, 'mzw', 'Deg'), (None, 'mzx', 'Mawayana'), (None, 'mzy', 'Mozambican Sign Language'),
+ (None, 'mzz', 'Maiadomu'), (None, 'naa', 'Namla'), (None, 'nab', 'Southern Nambikuára'), (None, 'nac', 'Narak'),
+ (None, 'nae', "Naka'ela"), (None, 'naf', 'Nabak'), (None, 'nag', 'Naga Pidgin'), (None, 'naj', 'Nalu'),
+ (None, 'nak', 'Nakanai'), (None, 'nal', 'Nalik'), (None, 'nam', "Ngan'gityemerri"), (None, 'nan', 'Min Nan Chinese'),
+ (None, 'nao', 'Naaba'), (None, 'nap', 'Neapolitan'), (None, 'naq', 'Khoekhoe'), (None, 'nar', 'Iguta'),
+ (None, 'nas', 'Naasioi'), (None, 'nat', 'Ca̱hungwa̱rya̱'), ('na', 'nau', 'Nauru'), ('nv', 'nav', 'Navajo'),
+ (None, 'naw', 'Nawuri'), (None, 'nax', 'Nakwi'), (None, 'nay', 'Ngarrindjeri'), (None, 'naz', 'Coatepec Nahuatl'),
+ (None, 'nba', 'Nyemba'), (None, 'nbb', 'Ndoe'), (None, 'nbc', 'Chang Naga'), (None, 'nbd', 'Ngbinda'),
+ (None, 'nbe', 'Konyak Naga'), (None, 'nbg', 'Nagarchal'), (None, 'nbh', 'Ngamo'), (None, 'nbi', 'Mao Naga'),
+ (None, 'nbj', 'Ngarinyman'), (None, 'nbk', 'Nake'), ('nr', 'nbl', 'South Ndebele'), (None, 'nbm', "Ngbaka Ma'bo"),
+ (None, 'nbn', 'Kuri'), (None, 'nbo', 'Nkukoli'), (None, 'nbp', 'Nnam'), (None, 'nbq', 'Nggem'),
+ (None, 'nbr', 'Numana'), (None, 'nbs', 'Namibian Sign Language'), (None, 'nbt', 'Na'), (None, 'nbu', 'Rongmei Naga'),
+ (None, 'nbv', 'Ngamambo'), (None, 'nbw', 'Southern Ngbandi'), (None, 'nby', 'Ningera'), (None, 'nca', 'Iyo'),
+ (None, 'ncb', 'Central Nicobarese'), (None, 'ncc', 'Ponam'), (None, 'ncd', 'Nachering'), (None, 'nce', 'Yale'),
+ (None, 'ncf', 'Notsi'), (None, 'ncg', "Nisga'a"), (None, 'nch', 'Central Huasteca Nahuatl'),
+ (None, 'nci', 'Classical Nahuatl'), (None, 'ncj', 'Northern Puebla Nahuatl'), (None, 'nck', 'Na-kara'),
+ (None, 'ncl', 'Michoacán Nahuatl'), (None, 'ncm', 'Nambo'), (None, 'ncn', 'Nauna'), (None, 'nco', 'Sibe'),
+ (None, 'ncq', 'Northern Katang'), (None, 'ncr', 'Ncane'), (None, 'ncs', 'Nicaraguan Sign Language'),
+ (None, 'nct', 'Chothe Naga'), (None, 'ncu', 'Chumburung'), (None, 'ncx', 'Central Puebla Nahuatl'),
+ (None, 'ncz', 'Natchez'), (None, 'nda', 'Ndasa'), (None, 'ndb', 'Kenswei Nsei'), (None, 'ndc', 'Ndau'),
+ (None, 'ndd', 'Nde-Nsele-Nta'), ('nd', 'nde', 'North Ndebele'), (None, 'ndf', 'Nadruvian'),
+ (None, 'ndg', 'Ndengereko'), (None, 'ndh', 'Ndali'), (None, 'ndi', 'Samba Leko'), (None, 'ndj', 'Ndamba'),
+ (None, 'ndk', 'Ndaka'), (None, 'ndl', 'Ndolo'), (None, 'ndm', 'Ndam'), (None, 'ndn', 'Ngundi'),
+ ('ng', 'ndo', 'Ndonga'), (None, 'ndp', 'Ndo'), (None, 'ndq', 'Ndombe'), (None, 'ndr', 'Ndoola'),
+ (None, 'nds', 'Low German'), (None, 'ndt', 'Ndunga'), (None, 'ndu', 'Dugun'), (None, 'ndv', 'Ndut'),
+ (None, 'ndw', 'Ndobo'), (None, 'ndx', 'Nduga'), (None, 'ndy', 'Lutos'), (None, 'ndz', 'Ndogo'),
+ (None, 'nea', "Eastern Ngad'a"), (None, 'neb', "Toura (Côte d'Ivoire)"), (None, 'nec', 'Nedebang'),
+ (None, 'ned', 'Nde-Gbite'), (None, 'nee', 'Nêlêmwa-Nixumwak'), (None, 'nef', 'Nefamese'), (None, 'neg', 'Negidal'),
+ (None, 'neh', 'Nyenkha'), (None, 'nei', 'Neo-Hittite'), (None, 'nej', 'Neko'), (None, 'nek', 'Neku'),
+ (None, 'nem', 'Nemi'), (None, 'nen', 'Nengone'), (None, 'neo', 'Ná-Meo'), ('ne', 'nep', 'Nepali (macrolanguage)'),
+ (None, 'neq', 'North Central Mixe'), (None, 'ner', 'Yahadian'), (None, 'nes', 'Bhoti Kinnauri'), (None, 'net', 'Nete'),
+ (None, 'neu', 'Neo'), (None, 'nev', 'Nyaheun'), (None, 'new', 'Newari'), (None, 'nex', 'Neme'), (None, 'ney', 'Neyo'),
+ (None, 'nez', 'Nez Perce'), (None, 'nfa', 'Dhao'), (None, 'nfd', 'Ahwai'), (None, 'nfl', 'Ayiwo'),
+ (None, 'nfr', 'Nafaanra'), (None, 'nfu', 'Mfumte'), (None, 'nga', 'Ngbaka'), (None, 'ngb', 'Northern Ngbandi'),
+ (None, 'ngc', 'Ngombe (Democratic Republic of Congo)'), (None, 'ngd', 'Ngando (Central African Republic)'),
+ (None, 'nge', 'Ngemba'), (None, 'ngg', 'Ngbaka Manza'), (None, 'ngh', 'Nǁng'), (None, 'ngi', 'Ngizim'),
+ (None, 'ngj', 'Ngie'), (None, 'ngk', 'Dalabon'), (None, 'ngl', 'Lomwe'), (None, 'ngm', "Ngatik Men's Creole"),
+ (None, 'ngn', 'Ngwo'), (None, 'ngp', 'Ngulu'), (None, 'ngq', 'Ngurimi'), (None, 'ngr', 'Engdewu'),
+ (None, 'ngs', 'Gvoko'), (None, 'ngt', 'Kriang'), (None, 'ngu', 'Guerrero Nahuatl'), (None, 'ngv', 'Nagumi'),
+ (None, 'ngw', 'Ngwaba'), (None, 'ngx', 'Nggwahyi'), (None, 'ngy', 'Tibea'), (None, 'ngz', 'Ngungwel'),
+ (None, 'nha', 'Nhanda'), (None, 'nhb', 'Beng'), (None, 'nhc', 'Tabasco Nahuatl'), (None, 'nhd', 'Chiripá'),
+ (None, 'nhe', 'Eastern Huasteca Nahuatl'), (None, 'nhf', 'Nhuwala'), (None, 'nhg', 'Tetelcingo Nahuatl'),
+ (None, 'nhh', 'Nahari'), (None, 'nhi', 'Zacatlán-Ahuacatlán-Tepetzintla Nahuatl'),
+ (None, 'nhk', 'Isthmus-Cosoleacaque Nahuatl'), (None, 'nhm', 'Morelos Nahuatl'), (None, 'nhn', 'Central Nahuatl'),
+ (None, 'nho', 'Takuu'), (None, 'nhp', 'Isthmus-Pajapan Nahuatl'), (None, 'nhq', 'Huaxcaleca Nahuatl'),
+ (None, 'nhr', 'Naro'), (None, 'nht', 'Ometepec Nahuatl'), (None, 'nhu', 'Noone'),
+ (None, 'nhv', 'Temascaltepec Nahuatl'), (None, 'nhw', 'Western Huasteca Nahuatl'),
+ (None, 'nhx', 'Isthmus-Mecayapan Nahuatl'), (None, 'nhy', 'Northern Oaxaca Nahuatl'),
+ (None, 'nhz', 'Santa María La Alta Nahuatl'), (None, 'nia', 'Nias'), (None, 'nib', 'Nakame'), (None, 'nid', 'Ngandi'),
+ (None, 'nie', 'Niellim'), (None, 'nif', 'Nek'), (None, 'nig', 'Ngalakgan'), (None, 'nih', 'Nyiha (Tanzania)'),
+ (None, 'nii', 'Nii'), (None, 'nij', 'Ngaju'), (None, 'nik', 'Southern Nicobarese'), (None, 'nil', 'Nila'),
+ (None, 'nim', 'Nilamba'), (None, 'nin', 'Ninzo'), (None, 'nio', 'Nganasan'), (None, 'niq', 'Nandi'),
+ (None, 'nir', 'Nimboran'), (None, 'nis', 'Nimi'), (None, 'nit', 'Southeastern Kolami'), (None, 'niu', 'Niuean'),
+ (None, 'niv', 'Gilyak'), (None, 'niw', 'Nimo'), (None, 'nix', 'Hema'), (None, 'niy', 'Ngiti'), (None, 'niz', 'Ningil'),
+ (None, 'nja', 'Nzanyi'), (None, 'njb', 'Nocte Naga'), (None, 'njd', 'Ndonde Hamba'), (None, 'njh', 'Lotha Naga'),
+ (None, 'nji', 'Gudanji'), (None, 'njj', 'Njen'), (None, 'njl', 'Njalgulgule'), (None, 'njm', 'Angami Naga'),
+ (None, 'njn', 'Liangmai Naga'), (None, 'njo', 'Ao Naga'), (None, 'njr', 'Njerep'), (None, 'njs', 'Nisa'),
+ (None, 'njt', 'Ndyuka-Trio Pidgin'), (None, 'nju', 'Ngadjunmaya'), (None, 'njx', 'Kunyi'), (None, 'njy', 'Njyem'),
+ (None, 'njz', 'Nyishi'), (None, 'nka', 'Nkoya'), (None, 'nkb', 'Khoibu Naga'), (None, 'nkc', 'Nkongho'),
+ (None, 'nkd', 'Koireng'), (None, 'nke', 'Duke'), (None, 'nkf', 'Inpui Naga'), (None, 'nkg', 'Nekgini'),
+ (None, 'nkh', 'Khezha Naga'), (None, 'nki', 'Thangal Naga'), (None, 'nkj', 'Nakai'), (None, 'nkk', 'Nokuku'),
+ (None, 'nkm', 'Namat'), (None, 'nkn', 'Nkangala'), (None, 'nko', 'Nkonya'), (None, 'nkp', 'Niuatoputapu'),
+ (None, 'nkq', 'Nkami'), (None, 'nkr', 'Nukuoro'), (None, 'nks', 'North Asmat'), (None, 'nkt', 'Nyika (Tanzania)'),
+ (None, 'nku', 'Bouna Kulango'), (None, 'nkv', 'Nyika (Malawi and Zambia)'), (None, 'nkw', 'Nkutu'),
+ (None, 'nkx', 'Nkoroo'), (None, 'nkz', 'Nkari'), (None, 'nla', 'Ngombale'), (None, 'nlc', 'Nalca'),
+ ('nl', 'nld', 'Dutch'), (None, 'nle', 'East Nyala'), (None, 'nlg', 'Gela'), (None, 'nli', 'Grangali'),
+ (None, 'nlj', 'Nyali'), (None, 'nlk', 'Ninia Yali'), (None, 'nll', 'Nihali'), (None, 'nlm', 'Mankiyali'),
+ (None, 'nlo', 'Ngul'), (None, 'nlq', 'Lao Naga'), (None, 'nlu', 'Nchumbulu'), (None, 'nlv', 'Orizaba Nahuatl'),
+ (None, 'nlw', 'Walangama'), (None, 'nlx', 'Nahali'), (None, 'nly', 'Nyamal'), (None, 'nlz', 'Nalögo'),
+ (None, 'nma', 'Maram Naga'), (None, 'nmb', 'Big Nambas'), (None, 'nmc', 'Ngam'), (None, 'nmd', 'Ndumu'),
+ (None, 'nme', 'Mzieme Naga'), (None, 'nmf', 'Tangkhul Naga (India)'), (None, 'nmg', 'Kwasio'),
+ (None, 'nmh', 'Monsang Naga'), (None, 'nmi', 'Nyam'), (None, 'nmj', 'Ngombe (Central African Republic)'),
+ (None, 'nmk', 'Namakura'), (None, 'nml', 'Ndemli'), (None, 'nmm', 'Manangba'), (None, 'nmn', 'ǃXóõ'),
+ (None, 'nmo', 'Moyon Naga'), (None, 'nmp', 'Nimanbur'), (None, 'nmq', 'Nambya'), (None, 'nmr', 'Nimbari'),
+ (None, 'nms', 'Letemboi'), (None, 'nmt', 'Namonuito'), (None, 'nmu', 'Northeast Maidu'), (None, 'nmv', 'Ngamini'),
+ (None, 'nmw', 'Nimoa'), (None, 'nmx', 'Nama (Papua New Guinea)'), (None, 'nmy', 'Namuyi'), (None, 'nmz', 'Nawdm'),
+ (None, 'nna', 'Nyangumarta'), (None, 'nnb', 'Nande'), (None, 'nnc', 'Nancere'), (None, 'nnd', 'West Ambae'),
+ (None, 'nne', 'Ngandyera'), (None, 'nnf', 'Ngaing'), (None, 'nng', 'Maring Naga'), (None, 'nnh', 'Ngiemboon'),
+ (None, 'nni', 'North Nuaulu'), (None, 'nnj', 'Nyangatom'), (None, 'nnk', 'Nankina'),
+ (None, 'nnl', 'Northern Rengma Naga'), (None, 'nnm', 'Namia'), (None, 'nnn', 'Ngete'),
+ ('nn', 'nno', 'Norwegian Nynorsk'), (None, 'nnp', 'Wancho Naga'), (None, 'nnq', 'Ngindo'), (None, 'nnr', 'Narungga'),
+ (None, 'nnt', 'Nanticoke'), (None, 'nnu', 'Dwang'), (None, 'nnv', 'Nugunu (Australia)'),
+ (None, 'nnw', 'Southern Nuni'), (None, 'nny', 'Nyangga'), (None, 'nnz', "Nda'nda'"), (None, 'noa', 'Woun Meu'),
+ ('nb', 'nob', 'Norwegian Bokmål'), (None, 'noc', 'Nuk'), (None, 'nod', 'Northern Thai'), (None, 'noe', 'Nimadi'),
+ (None, 'nof', 'Nomane'), (None, 'nog', 'Nogai'), (None, 'noh', 'Nomu'), (None, 'noi', 'Noiri'),
+ (None, 'noj', 'Nonuya'), (None, 'nok', 'Nooksack'), (None, 'nol', 'Nomlaki'), (None, 'nom', 'Nocamán'),
+ (None, 'non', 'Old Norse'), (None, 'nop', 'Numanggang'), (None, 'noq', 'Ngongo'), ('no', 'nor', 'Norwegian'),
+ (None, 'nos', 'Eastern Nisu'), (None, 'not', 'Nomatsiguenga'), (None, 'nou', 'Ewage-Notu'), (None, 'nov', 'Novial'),
+ (None, 'now', 'Nyambo'), (None, 'noy', 'Noy'), (None, 'noz', 'Nayi'), (None, 'npa', 'Nar Phu'),
+ (None, 'npb', 'Nupbikha'), (None, 'npg', 'Ponyo-Gongwang Naga'), (None, 'nph', 'Phom Naga'),
+ (None, 'npi', 'Nepali (individual language)'), (None, 'npl', 'Southeastern Puebla Nahuatl'),
+ (None, 'npn', 'Mondropolon'), (None, 'npo', 'Pochuri Naga'), (None, 'nps', 'Nipsan'), (None, 'npu', 'Puimei Naga'),
+ (None, 'npx', 'Noipx'), (None, 'npy', 'Napu'), (None, 'nqg', 'Southern Nago'), (None, 'nqk', 'Kura Ede Nago'),
+ (None, 'nql', 'Ngendelengo'), (None, 'nqm', 'Ndom'), (None, 'nqn', 'Nen'), (None, 'nqo', "N'Ko"),
+ (None, 'nqq', 'Kyan-Karyaw Naga'), (None, 'nqt', 'Nteng'), (None, 'nqy', 'Akyaung Ari Naga'), (None, 'nra', 'Ngom'),
+ (None, 'nrb', 'Nara'), (None, 'nrc', 'Noric'), (None, 'nre', 'Southern Rengma Naga'), (None, 'nrf', 'Jèrriais'),
+ (None, 'nrg', 'Narango'), (None, 'nri', 'Chokri Naga'), (None, 'nrk', 'Ngarla'), (None, 'nrl', 'Ngarluma'),
+ (None, 'nrm', 'Narom'), (None, 'nrn', 'Norn'), (None, 'nrp', 'North Picene'), (None, 'nrr', 'Norra'),
+ (None, 'nrt', 'Northern Kalapuya'), (None, 'nru', 'Narua'), (None, 'nrx', 'Ngurmbur'), (None, 'nrz', 'Lala'),
+ (None, 'nsa', 'Sangtam Naga'), (None, 'nsb', 'Lower Nossob'), (None, 'nsc', 'Nshi'), (None, 'nsd', 'Southern Nisu'),
+ (None, 'nse', 'Nsenga'), (None, 'nsf', 'Northwestern Nisu'), (None, 'nsg', 'Ngasa'), (None, 'nsh', 'Ngoshie'),
+ (None, 'nsi', 'Nigerian Sign Language'), (None, 'nsk', 'Naskapi'), (None, 'nsl', 'Norwegian Sign Language'),
+ (None, 'nsm', 'Sumi Naga'), (None, 'nsn', 'Nehan'), (None, 'nso', 'Pedi'), (None, 'nsp', 'Nepalese Sign Language'),
+ (None, 'nsq', 'Northern Sierra Miwok'), (None, 'nsr', 'Maritime Sign Language'), (None, 'nss', 'Nali'),
+ (None, 'nst', 'Tase Naga'), (None, 'nsu', 'Sierra Negra Nahuatl'), (None, 'nsv', 'Southwestern Nisu'),
+ (None, 'nsw', 'Navut'), (None, 'nsx', 'Nsongo'), (None, 'nsy', 'Nasal'), (None, 'nsz', 'Nisenan'),
+ (None, 'ntd', 'Northern Tidung'), (None, 'nte', 'Nathembo'), (None, 'ntg', 'Ngantangarra'), (None, 'nti', 'Natioro'),
+ (None, 'ntj', 'Ngaanyatjarra'), (None, 'ntk', 'Ikoma-Nata-Isenye'), (None, 'ntm', 'Nateni'), (None, 'nto', 'Ntomba'),
+ (None, 'ntp', 'Northern Tepehuan'), (None, 'ntr', 'Delo'), (None, 'ntu', 'Natügu'), (None, 'ntw', 'Nottoway'),
+ (None, 'ntx', 'Tangkhul Naga (Myanmar)'), (None, 'nty', 'Mantsi'), (None, 'ntz', 'Natanzi'), (None, 'nua', 'Yuanga'),
+ (None, 'nuc', 'Nukuini'), (None, 'nud', 'Ngala'), (None, 'nue', 'Ngundu'), (None, 'nuf', 'Nusu'),
+ (None, 'nug', 'Nungali'), (None, 'nuh', 'Ndunda'), (None, 'nui', 'Ngumbi'), (None, 'nuj', 'Nyole'),
+ (None, 'nuk', 'Nuu-chah-nulth'), (None, 'nul', 'Nusa Laut'), (None, 'num', "Niuafo'ou"), (None, 'nun', 'Anong'),
+ (None, 'nuo', 'Nguôn'), (None, 'nup', 'Nupe-Nupe-Tako'), (None, 'nuq', 'Nukumanu'), (None, 'nur', 'Nukuria'),
+ (None, 'nus', 'Nuer'), (None, 'nut', 'Nung (Viet Nam)'), (None, 'nuu', 'Ngbundu'), (None, 'nuv', 'Northern Nuni'),
+ (None, 'nuw', 'Nguluwan'), (None, 'nux', 'Mehek'), (None, 'nuy', 'Nunggubuyu'), (None, 'nuz', 'Tlamacazapa Nahuatl'),
+ (None, 'nvh', 'Nasarian'), (None, 'nvm', 'Namiae'), (None, 'nvo', 'Nyokon'), (None, 'nwa', 'Nawathinehena'),
+ (None, 'nwb', 'Nyabwa'), (None, 'nwc', 'Classical Newari'), (None, 'nwe', 'Ngwe'), (None, 'nwg', 'Ngayawung'),
+ (None, 'nwi', 'Southwest Tanna'), (None, 'nwm', 'Nyamusa-Molo'), (None, 'nwo', 'Nauo'), (None, 'nwr', 'Nawaru'),
+ (None, 'nww', 'Ndwewe'), (None, 'nwx', 'Middle Newar'), (None, 'nwy', 'Nottoway-Meherrin'), (None, 'nxa', 'Nauete'),
+ (None, 'nxd', 'Ngando (Democratic Republic of Congo)'), (None, 'nxe', 'Nage'), (None, 'nxg', "Ngad'a"),
+ (None, 'nxi', 'Nindi'), (None, 'nxk', 'Koki Naga'), (None, 'nxl', 'South Nuaulu'), (None, 'nxm', 'Numidian'),
+ (None, 'nxn', 'Ngawun'), (None, 'nxo', 'Ndambomo'), (None, 'nxq', 'Naxi'), (None, 'nxr', 'Ninggerum'),
+ (None, 'nxx', 'Nafri'), ('ny', 'nya', 'Nyanja'), (None, 'nyb', 'Nyangbo'), (None, 'nyc', 'Nyanga-li'),
+ (None, 'nyd', 'Nyore'), (None, 'nye', 'Nyengo'), (None, 'nyf', 'Giryama'), (None, 'nyg', 'Nyindu'),
+ (None, 'nyh', 'Nyikina'), (None, 'nyi', 'Ama (Sudan)'), (None, 'nyj', 'Nyanga'), (None, 'nyk', 'Nyaneka'),
+ (None, 'nyl', 'Nyeu'), (None, 'nym', 'Nyamwezi'), (None, 'nyn', 'Nyankole'), (None, 'nyo', 'Nyoro'),
+ (None, 'nyp', "Nyang'i"), (None, 'nyq', 'Nayini'), (None, 'nyr', 'Nyiha (Malawi)'), (None, 'nys', 'Nyungar'),
+ (None, 'nyt', 'Nyawaygi'), (None, 'nyu', 'Nyungwe'), (None, 'nyv', 'Nyulnyul'), (None, 'nyw', 'Nyaw'),
+ (None, 'nyx', 'Nganyaywana'), (None, 'nyy', 'Nyakyusa-Ngonde'), (None, 'nza', 'Tigon Mbembe'), (None, 'nzb', 'Njebi'),
+ (None, 'nzd', 'Nzadi'), (None, 'nzi', 'Nzima'), (None, 'nzk', 'Nzakara'), (None, 'nzm', 'Zeme Naga'),
+ (None, 'nzs', 'New Zealand Sign Language'), (None, 'nzu', 'Teke-Nzikou'), (None, 'nzy', 'Nzakambay'),
+ (None, 'nzz', 'Nanga Dama Dogon'), (None, 'oaa', 'Orok'), (None, 'oac', 'Oroch'),
+ (None, 'oar', 'Old Aramaic (up to 700 BCE)'), (None, 'oav', 'Old Avar'), (None, 'obi', 'Obispeño'),
+ (None, 'obk', 'Southern Bontok'), (None, 'obl', 'Oblo'), (None, 'obm', 'Moabite'), (None, 'obo', 'Obo Manobo'),
+ (None, 'obr', 'Old Burmese'), (None, 'obt', 'Old Breton'), (None, 'obu', 'Obulom'), (None, 'oca', 'Ocaina'),
+ (None, 'och', 'Old Chinese'), ('oc', 'oci', 'Occitan (post 1500)'), (None, 'ocm', 'Old Cham'),
+ (None, 'oco', 'Old Cornish'), (None, 'ocu', 'Atzingo Matlatzinca'), (None, 'oda', 'Odut'), (None, 'odk', 'Od'),
+ (None, 'odt', 'Old Dutch'), (None, 'odu', 'Odual'), (None, 'ofo', 'Ofo'), (None, 'ofs', 'Old Frisian'),
+ (None, 'ofu', 'Efutop'), (None, 'ogb', 'Ogbia'), (None, 'ogc', 'Ogbah'), (None, 'oge', 'Old Georgian'),
+ (None, 'ogg', 'Ogbogolo'), (None, 'ogo', 'Khana'), (None, 'ogu', 'Ogbronuagum'), (None, 'oht', 'Old Hittite'),
+ (None, 'ohu', 'Old Hungarian'), (None, 'oia', 'Oirata'), (None, 'oie', 'Okolie'), (None, 'oin', 'Inebu One'),
+ (None, 'ojb', 'Northwestern Ojibwa'), (None, 'ojc', 'Central Ojibwa'), (None, 'ojg', 'Eastern Ojibwa'),
+ ('oj', 'oji', 'Ojibwa'), (None, 'ojp', 'Old Japanese'), (None, 'ojs', 'Severn Ojibwa'), (None, 'ojv', 'Ontong Java'),
+ (None, 'ojw', 'Western Ojibwa'), (None, 'oka', 'Okanagan'), (None, 'okb', 'Okobo'), (None, 'okc', 'Kobo'),
+ (None, 'okd', 'Okodia'), (None, 'oke', 'Okpe (Southwestern Edo)'), (None, 'okg', 'Koko Babangk'),
+ (None, 'okh', 'Koresh-e Rostam'), (None, 'oki', 'Okiek'), (None, 'okj', 'Oko-Juwoi'), (None, 'okk', 'Kwamtim One'),
+ (None, 'okl', 'Old Kentish Sign Language'), (None, 'okm', 'Middle Korean (10th-16th cent.)'),
+ (None, 'okn', 'Oki-No-Erabu'), (None, 'oko', 'Old Korean (3rd-9th cent.)'), (None, 'okr', 'Kirike'),
+ (None, 'oks', 'Oko-Eni-Osayen'), (None, 'oku', 'Oku'), (None, 'okv', 'Orokaiva'),
+ (None, 'okx', 'Okpe (Northwestern Edo)'), (None, 'okz', 'Old Khmer'), (None, 'ola', 'Walungge'),
+ (None, 'old', 'Mochi'), (None, 'ole', 'Olekha'), (None, 'olk', 'Olkol'), (None, 'olm', 'Oloma'),
+ (None, 'olo', 'Livvi'), (None, 'olr', 'Olrat'), (None, 'olt', 'Old Lithuanian'), (None, 'olu', 'Kuvale'),
+ (None, 'oma', 'Omaha-Ponca'), (None, 'omb', 'East Ambae'), (None, 'omc', 'Mochica'), (None, 'omg', 'Omagua'),
+ (None, 'omi', 'Omi'), (None, 'omk', 'Omok'), (None, 'oml', 'Ombo'), (None, 'omn', 'Minoan'),
+ (None, 'omo', 'Utarmbung'), (None, 'omp', 'Old Manipuri'), (None, 'omr', 'Old Marathi'), (None, 'omt', 'Omotik'),
+ (None, 'omu', 'Omurano'), (None, 'omw', 'South Tairora'), (None, 'omx', 'Old Mon'), (None, 'omy', 'Old Malay'),
+ (None, 'ona', 'Ona'), (None, 'onb', 'Lingao'), (None, 'one', 'Oneida'), (None, 'ong', 'Olo'), (None, 'oni', 'Onin'),
+ (None, 'onj', 'Onjob'), (None, 'onk', 'Kabore One'), (None, 'onn', 'Onobasulu'), (None, 'ono', 'Onondaga'),
+ (None, 'onp', 'Sartang'), (None, 'onr', 'Northern One'), (None, 'ons', 'Ono'), (None, 'ont', 'Ontenu'),
+ (None, 'onu', 'Unua'), (None, 'onw', 'Old Nubian'), (None, 'onx', 'Onin Based Pidgin'),
+ (None, 'ood', "Tohono O'odham"), (None, 'oog', 'Ong'), (None, 'oon', 'Önge'), (None, 'oor', 'Oorlams'),
+ (None, 'oos', 'Old Ossetic'), (None, 'opa', 'Okpamheri'), (None, 'opk', 'Kopkaka'), (None, 'opm', 'Oksapmin'),
+ (None, 'opo', 'Opao'), (None, 'opt', 'Opata'), (None, 'opy', 'Ofayé'), (None, 'ora', 'Oroha'), (None, 'orc', 'Orma'),
+ (None, 'ore', 'Orejón'), (None, 'org', 'Oring'), (None, 'orh', 'Oroqen'), ('or', 'ori', 'Oriya (macrolanguage)'),
+ ('om', 'orm', 'Oromo'), (None, 'orn', 'Orang Kanaq'), (None, 'oro', 'Orokolo'), (None, 'orr', 'Oruma'),
+ (None, 'ors', 'Orang Seletar'), (None, 'ort', 'Adivasi Oriya'), (None, 'oru', 'Ormuri'), (None, 'orv', 'Old Russian'),
+ (None, 'orw', 'Oro Win'), (None, 'orx', 'Oro'), (None, 'ory', 'Odia'), (None, 'orz', 'Ormu'), (None, 'osa', 'Osage'),
+ (None, 'osc', 'Oscan'), (None, 'osi', 'Osing'), (None, 'osn', 'Old Sundanese'), (None, 'oso', 'Ososo'),
+ (None, 'osp', 'Old Spanish'), ('os', 'oss', 'Ossetian'), (None, 'ost', 'Osatu'), (None, 'osu', 'Southern One'),
+ (None, 'osx', 'Old Saxon'), (None, 'ota', 'Ottoman Turkish (1500-1928)'), (None, 'otb', 'Old Tibetan'),
+ (None, 'otd', 'Ot Danum'), (None, 'ote', 'Mezquital Otomi'), (None, 'oti', 'Oti'), (None, 'otk', 'Old Turkish'),
+ (None, 'otl', 'Tilapa Otomi'), (None, 'otm', 'Eastern Highland Otomi'), (None, 'otn', 'Tenango Otomi'),
+ (None, 'otq', 'Querétaro Otomi'), (None, 'otr', 'Otoro'), (None, 'ots', 'Estado de México Otomi'),
+ (None, 'ott', 'Temoaya Otomi'), (None, 'otu', 'Otuke'), (None, 'otw', 'Ottawa'), (None, 'otx', 'Texcatepec Otomi'),
+ (None, 'oty', 'Old Tamil'), (None, 'otz', 'Ixtenco Otomi'), (None, 'oua', 'Tagargrent'), (None, 'oub', 'Glio-Oubi'),
+ (None, 'oue', 'Oune'), (None, 'oui', 'Old Uighur'), (None, 'oum', 'Ouma'), (None, 'ovd', 'Elfdalian'),
+ (None, 'owi', 'Owiniga'), (None, 'owl', 'Old Welsh'), (None, 'oyb', 'Oy'), (None, 'oyd', 'Oyda'),
+ (None, 'oym', 'Wayampi'), (None, 'oyy', "Oya'oya"), (None, 'ozm', 'Koonzime'), (None, 'pab', 'Parecís'),
+ (None, 'pac', 'Pacoh'), (None, 'pad', 'Paumarí'), (None, 'pae', 'Pagibete'), (None, 'paf', 'Paranawát'),
+ (None, 'pag', 'Pangasinan'), (None, 'pah', 'Tenharim'), (None, 'pai', 'Pe'), (None, 'pak', 'Parakanã'),
+ (None, 'pal', 'Pahlavi'), (None, 'pam', 'Pampanga'), ('pa', 'pan', 'Panjabi'), (None, 'pao', 'Northern Paiute'),
+ (None, 'pap', 'Papiamento'), (None, 'paq', 'Parya'), (None, 'par', 'Panamint'), (None, 'pas', 'Papasena'),
+ (None, 'pau', 'Palauan'), (None, 'pav', 'Pakaásnovos'), (None, 'paw', 'Pawnee'), (None, 'pax', 'Pankararé'),
+ (None, 'pay', 'Pech'), (None, 'paz', 'Pankararú'), (None, 'pbb', 'Páez'), (None, 'pbc', 'Patamona'),
+ (None, 'pbe', 'Mezontla Popoloca'), (None, 'pbf', 'Coyotepec Popoloca'), (None, 'pbg', 'Paraujano'),
+ (None, 'pbh', "E'ñapa Woromaipu"), (None, 'pbi', 'Parkwa'), (None, 'pbl', 'Mak (Nigeria)'),
+ (None, 'pbm', 'Puebla Mazatec'), (None, 'pbn', 'Kpasam'), (None, 'pbo', 'Papel'), (None, 'pbp', 'Badyara'),
+ (None, 'pbr', 'Pangwa'), (None, 'pbs', 'Central Pame'), (None, 'pbt', 'Southern Pashto'),
+ (None, 'pbu', 'Northern Pashto'), (None, 'pbv', 'Pnar'), (None, 'pby', 'Pyu (Papua New Guinea)'),
+ (None, 'pca', 'Santa Inés Ahuatempan Popoloca'), (None, 'pcb', 'Pear'), (None, 'pcc', 'Bouyei'),
+ (None, 'pcd', 'Picard'), (None, 'pce', 'Ruching Palaung'), (None, 'pcf', 'Paliyan'), (None, 'pcg', 'Paniya'),
+ (None, 'pch', 'Pardhan'), (None, 'pci', 'Duruwa'), (None, 'pcj', 'Parenga'), (None, 'pck', 'Paite Chin'),
+ (None, 'pcl', 'Pardhi'), (None, 'pcm', 'Nigerian Pidgin'), (None, 'pcn', 'Piti'), (None, 'pcp', 'Pacahuara'),
+ (None, 'pcw', 'Pyapun'), (None, 'pda', 'Anam'), (None, 'pdc', 'Pennsylvania German'), (None, 'pdi', 'Pa Di'),
+ (None, 'pdn', 'Podena'), (None, 'pdo', 'Padoe'), (None, 'pdt', 'Plautdietsch'), (None, 'pdu', 'Kayan'),
+ (None, 'pea', 'Peranakan Indonesian'), (None, 'peb', 'Eastern Pomo'), (None, 'ped', 'Mala (Papua New Guinea)'),
+ (None, 'pee', 'Taje'), (None, 'pef', 'Northeastern Pomo'), (None, 'peg', 'Pengo'), (None, 'peh', 'Bonan'),
+ (None, 'pei', 'Chichimeca-Jonaz'), (None, 'pej', 'Northern Pomo'), (None, 'pek', 'Penchal'), (None, 'pel', 'Pekal'),
+ (None, 'pem', 'Phende'), (None, 'peo', 'Old Persian (ca. 600-400 B.C.)'), (None, 'pep', 'Kunja'),
+ (None, 'peq', 'Southern Pomo'), (None, 'pes', 'Iranian Persian'), (None, 'pev', 'Pémono'), (None, 'pex', 'Petats'),
+ (None, 'pey', 'Petjo'), (None, 'pez', 'Eastern Penan'), (None, 'pfa', 'Pááfang'), (None, 'pfe', 'Pere'),
+ (None, 'pfl', 'Pfaelzisch'), (None, 'pga', 'Sudanese Creole Arabic'), (None, 'pgd', 'Gāndhārī'),
+ (None, 'pgg', 'Pangwali'), (None, 'pgi', 'Pagi'), (None, 'pgk', 'Rerep'), (None, 'pgl', 'Primitive Irish'),
+ (None, 'pgn', 'Paelignian'), (None, 'pgs', 'Pangseng'), (None, 'pgu', 'Pagu'),
+ (None, 'pgz', 'Papua New Guinean Sign Language'), (None, 'pha', 'Pa-Hng'), (None, 'phd', 'Phudagi'),
+ (None, 'phg', 'Phuong'), (None, 'phh', 'Phukha'), (None, 'phj', 'Pahari'), (None, 'phk', 'Phake'),
+ (None, 'phl', 'Phalura'), (None, 'phm', 'Phimbi'), (None, 'phn', 'Phoenician'), (None, 'pho', 'Phunoi'),
+ (None, 'phq', "Phana'"), (None, 'phr', 'Pahari-Potwari'), (None, 'pht', 'Phu Thai'), (None, 'phu', 'Phuan'),
+ (None, 'phv', 'Pahlavani'), (None, 'phw', 'Phangduwali'), (None, 'pia', 'Pima Bajo'), (None, 'pib', 'Yine'),
+ (None, 'pic', 'Pinji'), (None, 'pid', 'Piaroa'), (None, 'pie', 'Piro'), (None, 'pif', 'Pingelapese'),
+ (None, 'pig', 'Pisabo'), (None, 'pih', 'Pitcairn-Norfolk'), (None, 'pij', 'Pijao'), (None, 'pil', 'Yom'),
+ (None, 'pim', 'Powhatan'), (None, 'pin', 'Piame'), (None, 'pio', 'Piapoco'), (None, 'pip', 'Pero'),
+ (None, 'pir', 'Piratapuyo'), (None, 'pis', 'Pijin'), (None, 'pit', 'Pitta Pitta'), (None, 'piu', 'Pintupi-Luritja'),
+ (None, 'piv', 'Pileni'), (None, 'piw', 'Pimbwe'), (None, 'pix', 'Piu'), (None, 'piy', 'Piya-Kwonci'),
+ (None, 'piz', 'Pije'), (None, 'pjt', 'Pitjantjatjara'), (None, 'pka', 'Ardhamāgadhī Prākrit'), (None, 'pkb', 'Pokomo'),
+ (None, 'pkc', 'Paekche'), (None, 'pkg', 'Pak-Tong'), (None, 'pkh', 'Pankhu'), (None, 'pkn', 'Pakanha'),
+ (None, 'pko', 'Pökoot'), (None, 'pkp', 'Pukapuka'), (None, 'pkr', 'Attapady Kurumba'),
+ (None, 'pks', 'Pakistan Sign Language'), (None, 'pkt', 'Maleng'), (None, 'pku', 'Paku'), (None, 'pla', 'Miani'),
+ (None, 'plb', 'Polonombauk'), (None, 'plc', 'Central Palawano'), (None, 'pld', 'Polari'), (None, 'ple', "Palu'e"),
+ (None, 'plg', 'Pilagá'), (None, 'plh', 'Paulohi'), ('pi', 'pli', 'Pali'), (None, 'plj', 'Polci'),
+ (None, 'plk', 'Kohistani Shina'), (None, 'pll', 'Shwe Palaung'), (None, 'pln', 'Palenquero'),
+ (None, 'plo', 'Oluta Popoluca'), (None, 'plq', 'Palaic'), (None, 'plr', 'Palaka Senoufo'),
+ (None, 'pls', 'San Marcos Tlacoyalco Popoloca'), (None, 'plt', 'Plateau Malagasy'), (None, 'plu', 'Palikúr'),
+ (None, 'plv', 'Southwest Palawano'), (None, 'plw', "Brooke's Point Palawano"), (None, 'ply', 'Bolyu'),
+ (None, 'plz', 'Paluan'), (None, 'pma', 'Paama'), (None, 'pmb', 'Pambia'), (None, 'pmd', 'Pallanganmiddang'),
+ (None, 'pme', 'Pwaamei'), (None, 'pmf', 'Pamona'), (None, 'pmh', 'Māhārāṣṭri Prākrit'), (None, 'pmi', 'Northern Pumi'),
+ (None, 'pmj', 'Southern Pumi'), (None, 'pmk', 'Pamlico'), (None, 'pml', 'Lingua Franca'), (None, 'pmm', 'Pomo'),
+ (None, 'pmn', 'Pam'), (None, 'pmo', 'Pom'), (None, 'pmq', 'Northern Pame'), (None, 'pmr', 'Paynamar'),
+ (None, 'pms', 'Piemontese'), (None, 'pmt', 'Tuamotuan'), (None, 'pmw', 'Plains Miwok'), (None, 'pmx', 'Poumei Naga'),
+ (None, 'pmy', 'Papuan Malay'), (None, 'pmz', 'Southern Pame'), (None, 'pna', 'Punan Bah-Biau'),
+ (None, 'pnb', 'Western Panjabi'), (None, 'pnc', 'Pannei'), (None, 'pnd', 'Mpinda'), (None, 'pne', 'Western Penan'),
+ (None, 'png', 'Pangu'), (None, 'pnh', 'Penrhyn'), (None, 'pni', 'Aoheng'), (None, 'pnj', 'Pinjarup'),
+ (None, 'pnk', 'Paunaka'), (None, 'pnl', 'Paleni'), (None, 'pnm', 'Punan Batu 1'), (None, 'pnn', 'Pinai-Hagahai'),
+ (None, 'pno', 'Panobo'), (None, 'pnp', 'Pancana'), (None, 'pnq', 'Pana (Burkina Faso)'), (None, 'pnr', 'Panim'),
+ (None, 'pns', 'Ponosakan'), (None, 'pnt', 'Pontic'), (None, 'pnu', 'Jiongnai Bunu'), (None, 'pnv', 'Pinigura'),
+ (None, 'pnw', 'Banyjima'), (None, 'pnx', 'Phong-Kniang'), (None, 'pny', 'Pinyin'),
+ (None, 'pnz', 'Pana (Central African Republic)'), (None, 'poc', 'Poqomam'), (None, 'poe', 'San Juan Atzingo Popoloca'),
+ (None, 'pof', 'Poke'), (None, 'pog', 'Potiguára'), (None, 'poh', "Poqomchi'"), (None, 'poi', 'Highland Popoluca'),
+ (None, 'pok', 'Pokangá'), ('pl', 'pol', 'Polish'), (None, 'pom', 'Southeastern Pomo'), (None, 'pon', 'Pohnpeian'),
+ (None, 'poo', 'Central Pomo'), (None, 'pop', 'Pwapwâ'), (None, 'poq', 'Texistepec Popoluca'),
+ ('pt', 'por', 'Portuguese'), (None, 'pos', 'Sayula Popoluca'), (None, 'pot', 'Potawatomi'),
+ (None, 'pov', 'Upper Guinea Crioulo'), (None, 'pow', 'San Felipe Otlaltepec Popoloca'), (None, 'pox', 'Polabian'),
+ (None, 'poy', 'Pogolo'), (None, 'ppe', 'Papi'), (None, 'ppi', 'Paipai'), (None, 'ppk', 'Uma'), (None, 'ppl', 'Pipil'),
+ (None, 'ppm', 'Papuma'), (None, 'ppn', 'Papapana'), (None, 'ppo', 'Folopa'), (None, 'ppp', 'Pelende'),
+ (None, 'ppq', 'Pei'), (None, 'pps', 'San Luís Temalacayuca Popoloca'), (None, 'ppt', 'Pare'), (None, 'ppu', 'Papora'),
+ (None, 'pqa', "Pa'a"), (None, 'pqm', 'Malecite-Passamaquoddy'), (None, 'prc', 'Parachi'), (None, 'prd', 'Parsi-Dari'),
+ (None, 'pre', 'Principense'), (None, 'prf', 'Paranan'), (None, 'prg', 'Prussian'), (None, 'prh', 'Porohanon'),
+ (None, 'pri', 'Paicî'), (None, 'prk', 'Parauk'), (None, 'prl', 'Peruvian Sign Language'), (None, 'prm', 'Kibiri'),
+ (None, 'prn', 'Prasuni'), (None, 'pro', 'Old Provençal (to 1500)'), (None, 'prp', 'Parsi'),
+ (None, 'prq', 'Ashéninka Perené'), (None, 'prr', 'Puri'), (None, 'prs', 'Dari'), (None, 'prt', 'Phai'),
+ (None, 'pru', 'Puragi'), (None, 'prw', 'Parawen'), (None, 'prx', 'Purik'), (None, 'prz', 'Providencia Sign Language'),
+ (None, 'psa', 'Asue Awyu'), (None, 'psc', 'Iranian Sign Language'), (None, 'psd', 'Plains Indian Sign Language'),
+ (None, 'pse', 'Central Malay'), (None, 'psg', 'Penang Sign Language'), (None, 'psh', 'Southwest Pashai'),
+ (None, 'psi', 'Southeast Pashai'), (None, 'psl', 'Puerto Rican Sign Language'), (None, 'psm', 'Pauserna'),
+ (None, 'psn', 'Panasuan'), (None, 'pso', 'Polish Sign Language'), (None, 'psp', 'Philippine Sign Language'),
+ (None, 'psq', 'Pasi'), (None, 'psr', 'Portuguese Sign Language'), (None, 'pss', 'Kaulong'),
+ (None, 'pst', 'Central Pashto'), (None, 'psu', 'Sauraseni Prākrit'), (None, 'psw', 'Port Sandwich'),
+ (None, 'psy', 'Piscataway'), (None, 'pta', 'Pai Tavytera'), (None, 'pth', 'Pataxó Hã-Ha-Hãe'),
+ (None, 'pti', 'Pindiini'), (None, 'ptn', 'Patani'), (None, 'pto', "Zo'é"), (None, 'ptp', 'Patep'),
+ (None, 'ptq', 'Pattapu'), (None, 'ptr', 'Piamatsina'), (None, 'ptt', 'Enrekang'), (None, 'ptu', 'Bambam'),
+ (None, 'ptv', 'Port Vato'), (None, 'ptw', 'Pentlatch'), (None, 'pty', 'Pathiya'),
+ (None, 'pua', 'Western Highland Purepecha'), (None, 'pub', 'Purum'), (None, 'puc', 'Punan Merap'),
+ (None, 'pud', 'Punan Aput'), (None, 'pue', 'Puelche'), (None, 'puf', 'Punan Merah'), (None, 'pug', 'Phuie'),
+ (None, 'pui', 'Puinave'), (None, 'puj', 'Punan Tubu'), (None, 'pum', 'Puma'), (None, 'puo', 'Puoc'),
+ (None, 'pup', 'Pulabu'), (None, 'puq', 'Puquina'), (None, 'pur', 'Puruborá'), ('ps', 'pus', 'Pushto'),
+ (None, 'put', 'Putoh'), (None, 'puu', 'Punu'), (None, 'puw', 'Puluwatese'), (None, 'pux', 'Puare'),
+ (None, 'puy', 'Purisimeño'), (None, 'pwa', 'Pawaia'), (None, 'pwb', 'Panawa'), (None, 'pwg', 'Gapapaiwa'),
+ (None, 'pwi', 'Patwin'), (None, 'pwm', 'Molbog'), (None, 'pwn', 'Paiwan'), (None, 'pwo', 'Pwo Western Karen'),
+ (None, 'pwr', 'Powari'), (None, 'pww', 'Pwo Northern Karen'), (None, 'pxm', 'Quetzaltepec Mixe'),
+ (None, 'pye', 'Pye Krumen'), (None, 'pym', 'Fyam'), (None, 'pyn', 'Poyanáwa'),
+ (None, 'pys', 'Paraguayan Sign Language'), (None, 'pyu', 'Puyuma'), (None, 'pyx', 'Pyu (Myanmar)'),
+ (None, 'pyy', 'Pyen'), (None, 'pzh', 'Pazeh'), (None, 'pzn', 'Jejara Naga'), (None, 'qua', 'Quapaw'),
+ (None, 'qub', 'Huallaga Huánuco Quechua'), (None, 'quc', "K'iche'"), (None, 'qud', 'Calderón Highland Quichua'),
+ ('qu', 'que', 'Quechua'), (None, 'quf', 'Lambayeque Quechua'), (None, 'qug', 'Chimborazo Highland Quichua'),
+ (None, 'quh', 'South Bolivian Quechua'), (None, 'qui', 'Quileute'), (None, 'quk', 'Chachapoyas Quechua'),
+ (None, 'qul', 'North Bolivian Quechua'), (None, 'qum', 'Sipacapense'), (None, 'qun', 'Quinault'),
+ (None, 'qup', 'Southern Pastaza Quechua'), (None, 'quq', 'Quinqui'), (None, 'qur', 'Yanahuanca Pasco Quechua'),
+ (None, 'qus', 'Santiago del Estero Quichua'), (None, 'quv', 'Sacapulteco'), (None, 'quw', 'Tena Lowland Quichua'),
+ (None, 'qux', 'Yauyos Quechua'), (None, 'quy', 'Ayacucho Quechua'), (None, 'quz', 'Cusco Quechua'),
+ (None, 'qva', 'Ambo-Pasco Quechua'), (None, 'qvc', 'Cajamarca Quechua'), (None, 'qve', 'Eastern Apurímac Quechua'),
+ (None, 'qvh', 'Huamalíes-Dos de Mayo Huánuco Quechua'), (None, 'qvi', 'Imbabura Highland Quichua'),
+ (None, 'qvj', 'Loja Highland Quichua'), (None, 'qvl', 'Cajatambo North Lima Quechua'),
+ (None, 'qvm', 'Margos-Yarowilca-Lauricocha Quechua'), (None, 'qvn', 'North Junín Quechua'),
+ (None, 'qvo', 'Napo Lowland Quechua'), (None, 'qvp', 'Pacaraos Quechua'), (None, 'qvs', 'San Martín Quechua'),
+ (None, 'qvw', 'Huaylla Wanca Quechua'), (None, 'qvy', 'Queyu'), (None, 'qvz', 'Northern Pastaza Quichua'),
+ (None, 'qwa', 'Corongo Ancash Quechua'), (None, 'qwc', 'Classical Quechua'), (None, 'qwh', 'Huaylas Ancash Quechua'),
+ (None, 'qwm', 'Kuman (Russia)'), (None, 'qws', 'Sihuas Ancash Quechua'), (None, 'qwt', 'Kwalhioqua-Tlatskanai'),
+ (None, 'qxa', 'Chiquián Ancash Quechua'), (None, 'qxc', 'Chincha Quechua'), (None, 'qxh', 'Panao Huánuco Quechua'),
+ (None, 'qxl', 'Salasaca Highland Quichua'), (None, 'qxn', 'Northern Conchucos Ancash Quechua'),
+ (None, 'qxo', 'Southern Conchucos Ancash Quechua'), (None, 'qxp', 'Puno Quechua'), (None, 'qxq', "Qashqa'i"),
+ (None, 'qxr', 'Cañar Highland Quichua'), (None, 'qxs', 'Southern Qiang'),
+ (None, 'qxt', 'Santa Ana de Tusi Pasco Quechua'), (None, 'qxu', 'Arequipa-La Unión Quechua'),
+ (None, 'qxw', 'Jauja Wanca Quechua'), (None, 'qya', 'Quenya'), (None, 'qyp', 'Quiripi'), (None, 'raa', 'Dungmali'),
+ (None, 'rab', 'Camling'), (None, 'rac', 'Rasawa'), (None, 'rad', 'Rade'), (None, 'raf', 'Western Meohang'),
+ (None, 'rag', 'Logooli'), (None, 'rah', 'Rabha'), (None, 'rai', 'Ramoaaina'), (None, 'raj', 'Rajasthani'),
+ (None, 'rak', 'Tulu-Bohuai'), (None, 'ral', 'Ralte'), (None, 'ram', 'Canela'), (None, 'ran', 'Riantana'),
+ (None, 'rao', 'Rao'), (None, 'rap', 'Rapanui'), (None, 'raq', 'Saam'), (None, 'rar', 'Rarotongan'),
+ (None, 'ras', 'Tegali'), (None, 'rat', 'Razajerdi'), (None, 'rau', 'Raute'), (None, 'rav', 'Sampang'),
+ (None, 'raw', 'Rawang'), (None, 'rax', 'Rang'), (None, 'ray', 'Rapa'), (None, 'raz', 'Rahambuu'),
+ (None, 'rbb', 'Rumai Palaung'), (None, 'rbk', 'Northern Bontok'), (None, 'rbl', 'Miraya Bikol'),
+ (None, 'rbp', 'Barababaraba'), (None, 'rcf', 'Réunion Creole French'), (None, 'rdb', 'Rudbari'),
+ (None, 'rea', 'Rerau'), (None, 'reb', 'Rembong'), (None, 'ree', 'Rejang Kayan'), (None, 'reg', 'Kara (Tanzania)'),
+ (None, 'rei', 'Reli'), (None, 'rej', 'Rejang'), (None, 'rel', 'Rendille'), (None, 'rem', 'Remo'),
+ (None, 'ren', 'Rengao'), (None, 'rer', 'Rer Bare'), (None, 'res', 'Reshe'), (None, 'ret', 'Retta'),
+ (None, 'rey', 'Reyesano'), (None, 'rga', 'Roria'), (None, 'rge', 'Romano-Greek'), (None, 'rgk', 'Rangkas'),
+ (None, 'rgn', 'Romagnol'), (None, 'rgr', 'Resígaro'), (None, 'rgs', 'Southern Roglai'), (None, 'rgu', 'Ringgou'),
+ (None, 'rhg', 'Rohingya'), (None, 'rhp', 'Yahang'), (None, 'ria', 'Riang (India)'),
+ (None, 'rib', 'Bribri Sign Language'), (None, 'rif', 'Tarifit'), (None, 'ril', 'Riang Lang'), (None, 'rim', 'Nyaturu'),
+ (None, 'rin', 'Nungu'), (None, 'rir', 'Ribun'), (None, 'rit', 'Ritharrngu'), (None, 'riu', 'Riung'),
+ (None, 'rjg', 'Rajong'), (None, 'rji', 'Raji'), (None, 'rjs', 'Rajbanshi'), (None, 'rka', 'Kraol'),
+ (None, 'rkb', 'Rikbaktsa'), (None, 'rkh', 'Rakahanga-Manihiki'), (None, 'rki', 'Rakhine'), (None, 'rkm', 'Marka'),
+ (None, 'rkt', 'Rangpuri'), (None, 'rkw', 'Arakwal'), (None, 'rma', 'Rama'), (None, 'rmb', 'Rembarrnga'),
+ (None, 'rmc', 'Carpathian Romani'), (None, 'rmd', 'Traveller Danish'), (None, 'rme', 'Angloromani'),
+ (None, 'rmf', 'Kalo Finnish Romani'), (None, 'rmg', 'Traveller Norwegian'), (None, 'rmh', 'Murkim'),
+ (None, 'rmi', 'Lomavren'), (None, 'rmk', 'Romkun'), (None, 'rml', 'Baltic Romani'), (None, 'rmm', 'Roma'),
+ (None, 'rmn', 'Balkan Romani'), (None, 'rmo', 'Sinte Romani'), (None, 'rmp', 'Rempi'), (None, 'rmq', 'Caló'),
+ (None, 'rms', 'Romanian Sign Language'), (None, 'rmt', 'Domari'), (None, 'rmu', 'Tavringer Romani'),
+ (None, 'rmv', 'Romanova'), (None, 'rmw', 'Welsh Romani'), (None, 'rmx', 'Romam'), (None, 'rmy', 'Vlax Romani'),
+ (None, 'rmz', 'Marma'), (None, 'rnb', 'Brunca Sign Language'), (None, 'rnd', 'Ruund'), (None, 'rng', 'Ronga'),
+ (None, 'rnl', 'Ranglong'), (None, 'rnn', 'Roon'), (None, 'rnp', 'Rongpo'), (None, 'rnr', 'Nari Nari'),
+ (None, 'rnw', 'Rungwa'), (None, 'rob', "Tae'"), (None, 'roc', 'Cacgia Roglai'), (None, 'rod', 'Rogo'),
+ (None, 'roe', 'Ronji'), (None, 'rof', 'Rombo'), (None, 'rog', 'Northern Roglai'), ('rm', 'roh', 'Romansh'),
+ (None, 'rol', 'Romblomanon'), (None, 'rom', 'Romany'), ('ro', 'ron', 'Romanian'), (None, 'roo', 'Rotokas'),
+ (None, 'rop', 'Kriol'), (None, 'ror', 'Rongga'), (None, 'rou', 'Runga'), (None, 'row', 'Dela-Oenale'),
+ (None, 'rpn', 'Repanbitip'), (None, 'rpt', 'Rapting'), (None, 'rri', 'Ririo'), (None, 'rro', 'Waima'),
+ (None, 'rrt', 'Arritinngithigh'), (None, 'rsb', 'Romano-Serbian'), (None, 'rsk', 'Ruthenian'),
+ (None, 'rsl', 'Russian Sign Language'), (None, 'rsm', 'Miriwoong Sign Language'),
+ (None, 'rsn', 'Rwandan Sign Language'), (None, 'rtc', 'Rungtu Chin'), (None, 'rth', 'Ratahan'),
+ (None, 'rtm', 'Rotuman'), (None, 'rts', 'Yurats'), (None, 'rtw', 'Rathawi'), (None, 'rub', 'Gungu'),
+ (None, 'ruc', 'Ruuli'), (None, 'rue', 'Rusyn'), (None, 'ruf', 'Luguru'), (None, 'rug', 'Roviana'),
+ (None, 'ruh', 'Ruga'), (None, 'rui', 'Rufiji'), (None, 'ruk', 'Che'), ('rn', 'run', 'Rundi'),
+ (None, 'ruo', 'Istro Romanian'), (None, 'rup', 'Macedo-Romanian'), (None, 'ruq', 'Megleno Romanian'),
+ ('ru', 'rus', 'Russian'), (None, 'rut', 'Rutul'), (None, 'ruu', 'Lanas Lobu'), (None, 'ruy', 'Mala (Nigeria)'),
+ (None, 'ruz', 'Ruma'), (None, 'rwa', 'Rawo'), (None, 'rwk', 'Rwa'), (None, 'rwl', 'Ruwila'),
+ (None, 'rwm', 'Amba (Uganda)'), (None, 'rwo', 'Rawa'), (None, 'rwr', 'Marwari (India)'), (None, 'rxd', 'Ngardi'),
+ (None, 'rxw', 'Karuwali'), (None, 'ryn', 'Northern Amami-Oshima'), (None, 'rys', 'Yaeyama'),
+ (None, 'ryu', 'Central Okinawan'), (None, 'rzh', 'Rāziḥī'), (None, 'saa', 'Saba'), (None, 'sab', 'Buglere'),
+ (None, 'sac', 'Meskwaki'), (None, 'sad', 'Sandawe'), (None, 'sae', 'Sabanê'), (None, 'saf', 'Safaliba'),
+ ('sg', 'sag', 'Sango'), (None, 'sah', 'Yakut'), (None, 'saj', 'Sahu'), (None, 'sak', 'Sake'),
+ (None, 'sam', 'Samaritan Aramaic'), ('sa', 'san', 'Sanskrit'), (None, 'sao', 'Sause'), (None, 'saq', 'Samburu'),
+ (None, 'sar', 'Saraveca'), (None, 'sas', 'Sasak'), (None, 'sat', 'Santali'), (None, 'sau', 'Saleman'),
+ (None, 'sav', 'Saafi-Saafi'), (None, 'saw', 'Sawi'), (None, 'sax', 'Sa'), (None, 'say', 'Saya'),
+ (None, 'saz', 'Saurashtra'), (None, 'sba', 'Ngambay'), (None, 'sbb', 'Simbo'),
+ (None, 'sbc', 'Kele (Papua New Guinea)'), (None, 'sbd', 'Southern Samo'), (None, 'sbe', 'Saliba'),
+ (None, 'sbf', 'Chabu'), (None, 'sbg', 'Seget'), (None, 'sbh', 'Sori-Harengan'), (None, 'sbi', 'Seti'),
+ (None, 'sbj', 'Surbakhal'), (None, 'sbk', 'Safwa'), (None, 'sbl', 'Botolan Sambal'), (None, 'sbm', 'Sagala'),
+ (None, 'sbn', 'Sindhi Bhil'), (None, 'sbo', 'Sabüm'), (None, 'sbp', 'Sangu (Tanzania)'), (None, 'sbq', 'Sileibi'),
+ (None, 'sbr', 'Sembakung Murut'), (None, 'sbs', 'Subiya'), (None, 'sbt', 'Kimki'), (None, 'sbu', 'Stod Bhoti'),
+ (None, 'sbv', 'Sabine'), (None, 'sbw', 'Simba'), (None, 'sbx', 'Seberuang'), (None, 'sby', 'Soli'),
+ (None, 'sbz', 'Sara Kaba'), (None, 'scb', 'Chut'), (None, 'sce', 'Dongxiang'),
+ (None, 'scf', 'San Miguel Creole French'), (None, 'scg', 'Sanggau'), (None, 'sch', 'Sakachep'),
+ (None, 'sci', 'Sri Lankan Creole Malay'), (None, 'sck', 'Sadri'), (None, 'scl', 'Shina'), (None, 'scn', 'Sicilian'),
+ (None, 'sco', 'Scots'), (None, 'scp', 'Hyolmo'), (None, 'scq', "Sa'och"), (None, 'scs', 'North Slavey'),
+ (None, 'sct', 'Southern Katang'), (None, 'scu', 'Shumcho'), (None, 'scv', 'Sheni'), (None, 'scw', 'Sha'),
+ (None, 'scx', 'Sicel'), (None, 'sda', "Toraja-Sa'dan"), (None, 'sdb', 'Shabak'), (None, 'sdc', 'Sassarese Sardinian'),
+ (None, 'sde', 'Surubu'), (None, 'sdf', 'Sarli'), (None, 'sdg', 'Savi'), (None, 'sdh', 'Southern Kurdish'),
+ (None, 'sdj', 'Suundi'), (None, 'sdk', 'Sos Kundi'), (None, 'sdl', 'Saudi Arabian Sign Language'),
+ (None, 'sdn', 'Gallurese Sardinian'), (None, 'sdo', 'Bukar-Sadung Bidayuh'), (None, 'sdp', 'Sherdukpen'),
+ (None, 'sdq', 'Semandang'), (None, 'sdr', 'Oraon Sadri'), (None, 'sds', 'Sened'), (None, 'sdt', 'Shuadit'),
+ (None, 'sdu', 'Sarudu'), (None, 'sdx', 'Sibu Melanau'), (None, 'sdz', 'Sallands'), (None, 'sea', 'Semai'),
+ (None, 'seb', 'Shempire Senoufo'), (None, 'sec', 'Sechelt'), (None, 'sed', 'Sedang'), (None, 'see', 'Seneca'),
+ (None, 'sef', 'Cebaara Senoufo'), (None, 'seg', 'Segeju'), (None, 'seh', 'Sena'), (None, 'sei', 'Seri'),
+ (None, 'sej', 'Sene'), (None, 'sek', 'Sekani'), (None, 'sel', 'Selkup'), (None, 'sen', 'Nanerigé Sénoufo'),
+ (None, 'seo', 'Suarmin'), (None, 'sep', 'Sìcìté Sénoufo'), (None, 'seq', 'Senara Sénoufo'), (None, 'ser', 'Serrano'),
+ (None, 'ses', 'Koyraboro Senni Songhai'), (None, 'set', 'Sentani'), (None, 'seu', 'Serui-Laut'),
+ (None, 'sev', 'Nyarafolo Senoufo'), (None, 'sew', 'Sewa Bay'), (None, 'sey', 'Secoya'), (None, 'sez', 'Senthang Chin'),
+ (None, 'sfb', 'Langue des signes de Belgique Francophone'), (None, 'sfe', 'Eastern Subanen'),
+ (None, 'sfm', 'Small Flowery Miao'), (None, 'sfs', 'South African Sign Language'), (None, 'sfw', 'Sehwi'),
+ (None, 'sga', 'Old Irish (to 900)'), (None, 'sgb', 'Mag-antsi Ayta'), (None, 'sgc', 'Kipsigis'),
+ (None, 'sgd', 'Surigaonon'), (None, 'sge', 'Segai'), (None, 'sgg', 'Swiss-German Sign Language'),
+ (None, 'sgh', 'Shughni'), (None, 'sgi', 'Suga'), (None, 'sgj', 'Surgujia'), (None, 'sgk', 'Sangkong'),
+ (None, 'sgm', 'Singa'), (None, 'sgp', 'Singpho'), (None, 'sgr', 'Sangisari'), (None, 'sgs', 'Samogitian'),
+ (None, 'sgt', 'Brokpake'), (None, 'sgu', 'Salas'), (None, 'sgw', 'Sebat Bet Gurage'),
+ (None, 'sgx', 'Sierra Leone Sign Language'), (None, 'sgy', 'Sanglechi'), (None, 'sgz', 'Sursurunga'),
+ (None, 'sha', 'Shall-Zwall'), (None, 'shb', 'Ninam'), (None, 'shc', 'Sonde'), (None, 'shd', 'Kundal Shahi'),
+ (None, 'she', 'Sheko'), (None, 'shg', 'Shua'), (None, 'shh', 'Shoshoni'), (None, 'shi', 'Tachelhit'),
+ (None, 'shj', 'Shatt'), (None, 'shk', 'Shilluk'), (None, 'shl', 'Shendu'), (None, 'shm', 'Shahrudi'),
+ (None, 'shn', 'Shan'), (None, 'sho', 'Shanga'), (None, 'shp', 'Shipibo-Conibo'), (None, 'shq', 'Sala'),
+ (None, 'shr', 'Shi'), (None, 'shs', 'Shuswap'), (None, 'sht', 'Shasta'), (None, 'shu', 'Chadian Arabic'),
+ (None, 'shv', 'Shehri'), (None, 'shw', 'Shwai'), (None, 'shx', 'She'), (None, 'shy', 'Tachawit'),
+ (None, 'shz', 'Syenara Senoufo'), (None, 'sia', 'Akkala Sami'), (None, 'sib', 'Sebop'), (None, 'sid', 'Sidamo'),
+ (None, 'sie', 'Simaa'), (None, 'sif', 'Siamou'), (None, 'sig', 'Paasaal'), (None, 'sih', 'Zire'),
+ (None, 'sii', 'Shom Peng'), (None, 'sij', 'Numbami'), (None, 'sik', 'Sikiana'), (None, 'sil', 'Tumulung Sisaala'),
+ (None, 'sim', 'Mende (Papua New Guinea)'), ('si', 'sin', 'Sinhala'), (None, 'sip', 'Sikkimese'),
+ (None, 'siq', 'Sonia'), (None, 'sir', 'Siri'), (None, 'sis', 'Siuslaw'), (None, 'siu', 'Sinagen'),
+ (None, 'siv', 'Sumariup'), (None, 'siw', 'Siwai'), (None, 'six', 'Sumau'), (None, 'siy', 'Sivandi'),
+ (None, 'siz', 'Siwi'), (None, 'sja', 'Epena'), (None, 'sjb', 'Sajau Basap'), (None, 'sjd', 'Kildin Sami'),
+ (None, 'sje', 'Pite Sami'), (None, 'sjg', 'Assangori'), (None, 'sjk', 'Kemi Sami'), (None, 'sjl', 'Sajalong'),
+ (None, 'sjm', 'Mapun'), (None, 'sjn', 'Sindarin'), (None, 'sjo', 'Xibe'), (None, 'sjp', 'Surjapuri'),
+ (None, 'sjr', 'Siar-Lak'), (None, 'sjs', 'Senhaja De Srair'), (None, 'sjt', 'Ter Sami'), (None, 'sju', 'Ume Sami'),
+ (None, 'sjw', 'Shawnee'), (None, 'ska', 'Skagit'), (None, 'skb', 'Saek'), (None, 'skc', 'Ma Manda'),
+ (None, 'skd', 'Southern Sierra Miwok'), (None, 'ske', 'Seke (Vanuatu)'), (None, 'skf', 'Sakirabiá'),
+ (None, 'skg', 'Sakalava Malagasy'), (None, 'skh', 'Sikule'), (None, 'ski', 'Sika'), (None, 'skj', 'Seke (Nepal)'),
+ (None, 'skm', 'Kutong'), (None, 'skn', 'Kolibugan Subanon'), (None, 'sko', 'Seko Tengah'), (None, 'skp', 'Sekapan'),
+ (None, 'skq', 'Sininkere'), (None, 'skr', 'Saraiki'), (None, 'sks', 'Maia'), (None, 'skt', 'Sakata'),
+ (None, 'sku', 'Sakao'), (None, 'skv', 'Skou'), (None, 'skw', 'Skepi Creole Dutch'), (None, 'skx', 'Seko Padang'),
+ (None, 'sky', 'Sikaiana'), (None, 'skz', 'Sekar'), (None, 'slc', 'Sáliba'), (None, 'sld', 'Sissala'),
+ (None, 'sle', 'Sholaga'), (None, 'slf', 'Swiss-Italian Sign Language'), (None, 'slg', 'Selungai Murut'),
+ (None, 'slh', 'Southern Puget Sound Salish'), (None, 'sli', 'Lower Silesian'), (None, 'slj', 'Salumá'),
+ ('sk', 'slk', 'Slovak'), (None, 'sll', 'Salt-Yui'), (None, 'slm', 'Pangutaran Sama'), (None, 'sln', 'Salinan'),
+ (None, 'slp', 'Lamaholot'), (None, 'slq', 'Salchuq'), (None, 'slr', 'Salar'), (None, 'sls', 'Singapore Sign Language'),
+ (None, 'slt', 'Sila'), (None, 'slu', 'Selaru'), ('sl', 'slv', 'Slovenian'), (None, 'slw', 'Sialum'),
+ (None, 'slx', 'Salampasu'), (None, 'sly', 'Selayar'), (None, 'slz', "Ma'ya"), (None, 'sma', 'Southern Sami'),
+ (None, 'smb', 'Simbari'), (None, 'smc', 'Som'), ('se', 'sme', 'Northern Sami'), (None, 'smf', 'Auwe'),
+ (None, 'smg', 'Simbali'), (None, 'smh', 'Samei'), (None, 'smj', 'Lule Sami'), (None, 'smk', 'Bolinao'),
+ (None, 'sml', 'Central Sama'), (None, 'smm', 'Musasa'), (None, 'smn', 'Inari Sami'), ('sm', 'smo', 'Samoan'),
+ (None, 'smp', 'Samaritan'), (None, 'smq', 'Samo'), (None, 'smr', 'Simeulue'), (None, 'sms', 'Skolt Sami'),
+ (None, 'smt', 'Simte'), (None, 'smu', 'Somray'), (None, 'smv', 'Samvedi'), (None, 'smw', 'Sumbawa'),
+ (None, 'smx', 'Samba'), (None, 'smy', 'Semnani'), (None, 'smz', 'Simeku'), ('sn', 'sna', 'Shona'),
+ (None, 'snc', 'Sinaugoro'), ('sd', 'snd', 'Sindhi'), (None, 'sne', 'Bau Bidayuh'), (None, 'snf', 'Noon'),
+ (None, 'sng', 'Sanga (Democratic Republic of Congo)'), (None, 'sni', 'Sensi'), (None, 'snj', 'Riverain Sango'),
+ (None, 'snk', 'Soninke'), (None, 'snl', 'Sangil'), (None, 'snm', "Southern Ma'di"), (None, 'snn', 'Siona'),
+ (None, 'sno', 'Snohomish'), (None, 'snp', 'Siane'), (None, 'snq', 'Sangu (Gabon)'), (None, 'snr', 'Sihan'),
+ (None, 'sns', 'South West Bay'), (None, 'snu', 'Senggi'), (None, 'snv', "Sa'ban"), (None, 'snw', 'Selee'),
+ (None, 'snx', 'Sam'), (None, 'sny', 'Saniyo-Hiyewe'), (None, 'snz', 'Kou'), (None, 'soa', 'Thai Song'),
+ (None, 'sob', 'Sobei'), (None, 'soc', 'So (Democratic Republic of Congo)'), (None, 'sod', 'Songoora'),
+ (None, 'soe', 'Songomeno'), (None, 'sog', 'Sogdian'), (None, 'soh', 'Aka'), (None, 'soi', 'Sonha'),
+ (None, 'soj', 'Soi'), (None, 'sok', 'Sokoro'), (None, 'sol', 'Solos'), ('so', 'som', 'Somali'), (None, 'soo', 'Songo'),
+ (None, 'sop', 'Songe'), (None, 'soq', 'Kanasi'), (None, 'sor', 'Somrai'), (None, 'sos', 'Seeku'),
+ ('st', 'sot', 'Southern Sotho'), (None, 'sou', 'Southern Thai'), (None, 'sov', 'Sonsorol'), (None, 'sow', 'Sowanda'),
+ (None, 'sox', 'Swo'), (None, 'soy', 'Miyobe'), (None, 'soz', 'Temi'), ('es', 'spa', 'Spanish'),
+ (None, 'spb', 'Sepa (Indonesia)'), (None, 'spc', 'Sapé'), (None, 'spd', 'Saep'),
+ (None, 'spe', 'Sepa (Papua New Guinea)'), (None, 'spg', 'Sian'), (None, 'spi', 'Saponi'), (None, 'spk', 'Sengo'),
+ (None, 'spl', 'Selepet'), (None, 'spm', 'Akukem'), (None, 'spn', 'Sanapaná'), (None, 'spo', 'Spokane'),
+ (None, 'spp', 'Supyire Senoufo'), (None, 'spq', 'Loreto-Ucayali Spanish'), (None, 'spr', 'Saparua'),
+ (None, 'sps', 'Saposa'), (None, 'spt', 'Spiti Bhoti'), (None, 'spu', 'Sapuan'), (None, 'spv', 'Sambalpuri'),
+ (None, 'spx', 'South Picene'), (None, 'spy', 'Sabaot'), (None, 'sqa', 'Shama-Sambuga'), (None, 'sqh', 'Shau'),
+ ('sq', 'sqi', 'Albanian'), (None, 'sqk', 'Albanian Sign Language'), (None, 'sqm', 'Suma'),
+ (None, 'sqn', 'Susquehannock'), (None, 'sqo', 'Sorkhei'), (None, 'sqq', 'Sou'), (None, 'sqr', 'Siculo Arabic'),
+ (None, 'sqs', 'Sri Lankan Sign Language'), (None, 'sqt', 'Soqotri'), (None, 'squ', 'Squamish'),
+ (None, 'sqx', 'Kufr Qassem Sign Language (KQSL)'), (None, 'sra', 'Saruga'), (None, 'srb', 'Sora'),
+ (None, 'src', 'Logudorese Sardinian'), ('sc', 'srd', 'Sardinian'), (None, 'sre', 'Sara'), (None, 'srf', 'Nafi'),
+ (None, 'srg', 'Sulod'), (None, 'srh', 'Sarikoli'), (None, 'sri', 'Siriano'), (None, 'srk', 'Serudung Murut'),
+ (None, 'srl', 'Isirawa'), (None, 'srm', 'Saramaccan'), (None, 'srn', 'Sranan Tongo'),
+ (None, 'sro', 'Campidanese Sardinian'), ('sr', 'srp', 'Serbian'), (None, 'srq', 'Sirionó'), (None, 'srr', 'Serer'),
+ (None, 'srs', 'Sarsi'), (None, 'srt', 'Sauri'), (None, 'sru', 'Suruí'), (None, 'srv', 'Southern Sorsoganon'),
+ (None, 'srw', 'Serua'), (None, 'srx', 'Sirmauri'), (None, 'sry', 'Sera'), (None, 'srz', 'Shahmirzadi'),
+ (None, 'ssb', 'Southern Sama'), (None, 'ssc', 'Suba-Simbiti'), (None, 'ssd', 'Siroi'), (None, 'sse', 'Balangingi'),
+ (None, 'ssf', 'Thao'), (None, 'ssg', 'Seimat'), (None, 'ssh', 'Shihhi Arabic'), (None, 'ssi', 'Sansi'),
+ (None, 'ssj', 'Sausi'), (None, 'ssk', 'Sunam'), (None, 'ssl', 'Western Sisaala'), (None, 'ssm', 'Semnam'),
+ (None, 'ssn', 'Waata'), (None, 'sso', 'Sissano'), (None, 'ssp', 'Spanish Sign Language'), (None, 'ssq', "So'a"),
+ (None, 'ssr', 'Swiss-French Sign Language'), (None, 'sss', 'Sô'), (None, 'sst', 'Sinasina'), (None, 'ssu', 'Susuami'),
+ (None, 'ssv', 'Shark Bay'), ('ss', 'ssw', 'Swati'), (None, 'ssx', 'Samberigi'), (None, 'ssy', 'Saho'),
+ (None, 'ssz', 'Sengseng'), (None, 'sta', 'Settla'), (None, 'stb', 'Northern Subanen'), (None, 'std', 'Sentinel'),
+ (None, 'ste', 'Liana-Seti'), (None, 'stf', 'Seta'), (None, 'stg', 'Trieng'), (None, 'sth', 'Shelta'),
+ (None, 'sti', 'Bulo Stieng'), (None, 'stj', 'Matya Samo'), (None, 'stk', 'Arammba'), (None, 'stl', 'Stellingwerfs'),
+ (None, 'stm', 'Setaman'), (None, 'stn', 'Owa'), (None, 'sto', 'Stoney'), (None, 'stp', 'Southeastern Tepehuan'),
+ (None, 'stq', 'Saterfriesisch'), (None, 'str', 'Straits Salish'), (None, 'sts', 'Shumashti'),
+ (None, 'stt', 'Budeh Stieng'), (None, 'stu', 'Samtao'), (None, 'stv', "Silt'e"), (None, 'stw', 'Satawalese'),
+ (None, 'sty', 'Siberian Tatar'), (None, 'sua', 'Sulka'), (None, 'sub', 'Suku'), (None, 'suc', 'Western Subanon'),
+ (None, 'sue', 'Suena'), (None, 'sug', 'Suganga'), (None, 'sui', 'Suki'), (None, 'suj', 'Shubi'),
+ (None, 'suk', 'Sukuma'), ('su', 'sun', 'Sundanese'), (None, 'suo', 'Bouni'), (None, 'suq', 'Tirmaga-Chai Suri'),
+ (None, 'sur', 'Mwaghavul'), (None, 'sus', 'Susu'), (None, 'sut', 'Subtiaba'), (None, 'suv', 'Puroik'),
+ (None, 'suw', 'Sumbwa'), (None, 'sux', 'Sumerian'), (None, 'suy', 'Suyá'), (None, 'suz', 'Sunwar'),
+ (None, 'sva', 'Svan'), (None, 'svb', 'Ulau-Suain'), (None, 'svc', 'Vincentian Creole English'),
+ (None, 'sve', 'Serili'), (None, 'svk', 'Slovakian Sign Language'), (None, 'svm', 'Slavomolisano'),
+ (None, 'svs', 'Savosavo'), (None, 'svx', 'Skalvian'), ('sw', 'swa', 'Swahili (macrolanguage)'),
+ (None, 'swb', 'Maore Comorian'), (None, 'swc', 'Congo Swahili'), ('sv', 'swe', 'Swedish'), (None, 'swf', 'Sere'),
+ (None, 'swg', 'Swabian'), (None, 'swh', 'Swahili (individual language)'), (None, 'swi', 'Sui'), (None, 'swj', 'Sira'),
+ (None, 'swk', 'Malawi Sena'), (None, 'swl', 'Swedish Sign Language'), (None, 'swm', 'Samosa'),
+ (None, 'swn', 'Sawknah'), (None, 'swo', 'Shanenawa'), (None, 'swp', 'Suau'), (None, 'swq', 'Sharwa'),
+ (None, 'swr', 'Saweru'), (None, 'sws', 'Seluwasan'), (None, 'swt', 'Sawila'), (None, 'swu', 'Suwawa'),
+ (None, 'swv', 'Shekhawati'), (None, 'sww', 'Sowa'), (None, 'swx', 'Suruahá'), (None, 'swy', 'Sarua'),
+ (None, 'sxb', 'Suba'), (None, 'sxc', 'Sicanian'), (None, 'sxe', 'Sighu'), (None, 'sxg', 'Shuhi'),
+ (None, 'sxk', 'Southern Kalapuya'), (None, 'sxl', 'Selian'), (None, 'sxm', 'Samre'), (None, 'sxn', 'Sangir'),
+ (None, 'sxo', 'Sorothaptic'), (None, 'sxr', 'Saaroa'), (None, 'sxs', 'Sasaru'), (None, 'sxu', 'Upper Saxon'),
+ (None, 'sxw', 'Saxwe Gbe'), (None, 'sya', 'Siang'), (None, 'syb', 'Central Subanen'),
+ (None, 'syc', 'Classical Syriac'), (None, 'syi', 'Seki'), (None, 'syk', 'Sukur'), (None, 'syl', 'Sylheti'),
+ (None, 'sym', 'Maya Samo'), (None, 'syn', 'Senaya'), (None, 'syo', 'Suoy'), (None, 'syr', 'Syriac'),
+ (None, 'sys', 'Sinyar'), (None, 'syw', 'Kagate'), (None, 'syx', 'Samay'),
+ (None, 'syy', 'Al-Sayyid Bedouin Sign Language'), (None, 'sza', 'Semelai'), (None, 'szb', 'Ngalum'),
+ (None, 'szc', 'Semaq Beri'), (None, 'szd', 'Seru'), (None, 'sze', 'Seze'), (None, 'szg', 'Sengele'),
+ (None, 'szl', 'Silesian'), (None, 'szn', 'Sula'), (None, 'szp', 'Suabo'),
+ (None, 'szs', 'Solomon Islands Sign Language'), (None, 'szv', 'Isu (Fako Division)'), (None, 'szw', 'Sawai'),
+ (None, 'szy', 'Sakizaya'), (None, 'taa', 'Lower Tanana'), (None, 'tab', 'Tabassaran'),
+ (None, 'tac', 'Lowland Tarahumara'), (None, 'tad', 'Tause'), (None, 'tae', 'Tariana'), (None, 'taf', 'Tapirapé'),
+ (None, 'tag', 'Tagoi'), ('ty', 'tah', 'Tahitian'), (None, 'taj', 'Eastern Tamang'), (None, 'tak', 'Tala'),
+ (None, 'tal', 'Tal'), ('ta', 'tam', 'Tamil'), (None, 'tan', 'Tangale'), (None, 'tao', 'Yami'), (None, 'tap', 'Taabwa'),
+ (None, 'taq', 'Tamasheq'), (None, 'tar', 'Central Tarahumara'), (None, 'tas', 'Tay Boi'), ('tt', 'tat', 'Tatar'),
+ (None, 'tau', 'Upper Tanana'), (None, 'tav', 'Tatuyo'), (None, 'taw', 'Tai'), (None, 'tax', 'Tamki'),
+ (None, 'tay', 'Atayal'), (None, 'taz', 'Tocho'), (None, 'tba', 'Aikanã'), (None, 'tbc', 'Takia'),
+ (None, 'tbd', 'Kaki Ae'), (None, 'tbe', 'Tanimbili'), (None, 'tbf', 'Mandara'), (None, 'tbg', 'North Tairora'),
+ (None, 'tbh', 'Dharawal'), (None, 'tbi', 'Gaam'), (None, 'tbj', 'Tiang'), (None, 'tbk', 'Calamian Tagbanwa'),
+ (None, 'tbl', 'Tboli'), (None, 'tbm', 'Tagbu'), (None, 'tbn', 'Barro Negro Tunebo'), (None, 'tbo', 'Tawala'),
+ (None, 'tbp', 'Taworta'), (None, 'tbr', 'Tumtum'), (None, 'tbs', 'Tanguat'), (None, 'tbt', 'Tembo (Kitembo)'),
+ (None, 'tbu', 'Tubar'), (None, 'tbv', 'Tobo'), (None, 'tbw', 'Tagbanwa'), (None, 'tbx', 'Kapin'),
+ (None, 'tby', 'Tabaru'), (None, 'tbz', 'Ditammari'), (None, 'tca', 'Ticuna'), (None, 'tcb', 'Tanacross'),
+ (None, 'tcc', 'Datooga'), (None, 'tcd', 'Tafi'), (None, 'tce', 'Southern Tutchone'),
+ (None, 'tcf', "Malinaltepec Me'phaa"), (None, 'tcg', 'Tamagario'), (None, 'tch', 'Turks And Caicos Creole English'),
+ (None, 'tci', 'Wára'), (None, 'tck', 'Tchitchege'), (None, 'tcl', 'Taman (Myanmar)'), (None, 'tcm', 'Tanahmerah'),
+ (None, 'tcn', 'Tichurong'), (None, 'tco', 'Taungyo'), (None, 'tcp', 'Tawr Chin'), (None, 'tcq', 'Kaiy'),
+ (None, 'tcs', 'Torres Strait Creole'), (None, 'tct', "T'en"), (None, 'tcu', 'Southeastern Tarahumara'),
+ (None, 'tcw', 'Tecpatlán Totonac'), (None, 'tcx', 'Toda'), (None, 'tcy', 'Tulu'), (None, 'tcz', 'Thado Chin'),
+ (None, 'tda', 'Tagdal'), (None, 'tdb', 'Panchpargania'), (None, 'tdc', 'Emberá-Tadó'), (None, 'tdd', 'Tai Nüa'),
+ (None, 'tde', 'Tiranige Diga Dogon'), (None, 'tdf', 'Talieng'), (None, 'tdg', 'Western Tamang'),
+ (None, 'tdh', 'Thulung'), (None, 'tdi', 'Tomadino'), (None, 'tdj', 'Tajio'), (None, 'tdk', 'Tambas'),
+ (None, 'tdl', 'Sur'), (None, 'tdm', 'Taruma'), (None, 'tdn', 'Tondano'), (None, 'tdo', 'Teme'), (None, 'tdq', 'Tita'),
+ (None, 'tdr', 'Todrah'), (None, 'tds', 'Doutai'), (None, 'tdt', 'Tetun Dili'), (None, 'tdv', 'Toro'),
+ (None, 'tdx', 'Tandroy-Mahafaly Malagasy'), (None, 'tdy', 'Tadyawan'), (None, 'tea', 'Temiar'),
+ (None, 'teb', 'Tetete'), (None, 'tec', 'Terik'), (None, 'ted', 'Tepo Krumen'), (None, 'tee', 'Huehuetla Tepehua'),
+ (None, 'tef', 'Teressa'), (None, 'teg', 'Teke-Tege'), (None, 'teh', 'Tehuelche'), (None, 'tei', 'Torricelli'),
+ (None, 'tek', 'Ibali Teke'), ('te', 'tel', 'Telugu'), (None, 'tem', 'Timne'), (None, 'ten', 'Tama (Colombia)'),
+ (None, 'teo', 'Teso'), (None, 'tep', 'Tepecano'), (None, 'teq', 'Temein'), (None, 'ter', 'Tereno'),
+ (None, 'tes', 'Tengger'), (None, 'tet', 'Tetum'), (None, 'teu', 'Soo'), (None, 'tev', 'Teor'),
+ (None, 'tew', 'Tewa (USA)'), (None, 'tex', 'Tennet'), (None, 'tey', 'Tulishi'), (None, 'tez', 'Tetserret'),
+ (None, 'tfi', 'Tofin Gbe'), (None, 'tfn', 'Tanaina'), (None, 'tfo', 'Tefaro'), (None, 'tfr', 'Teribe'),
+ (None, 'tft', 'Ternate'), (None, 'tga', 'Sagalla'), (None, 'tgb', 'Tobilung'), (None, 'tgc', 'Tigak'),
+ (None, 'tgd', 'Ciwogai'), (None, 'tge', 'Eastern Gorkha Tamang'), (None, 'tgf', 'Chalikha'),
+ (None, 'tgh', 'Tobagonian Creole English'), (None, 'tgi', 'Lawunuia'), (None, 'tgj', 'Tagin'), ('tg', 'tgk', 'Tajik'),
+ ('tl', 'tgl', 'Tagalog'), (None, 'tgn', 'Tandaganon'), (None, 'tgo', 'Sudest'), (None, 'tgp', 'Tangoa'),
+ (None, 'tgq', 'Tring'), (None, 'tgr', 'Tareng'), (None, 'tgs', 'Nume'), (None, 'tgt', 'Central Tagbanwa'),
+ (None, 'tgu', 'Tanggu'), (None, 'tgv', 'Tingui-Boto'), (None, 'tgw', 'Tagwana Senoufo'), (None, 'tgx', 'Tagish'),
+ (None, 'tgy', 'Togoyo'), (None, 'tgz', 'Tagalaka'), ('th', 'tha', 'Thai'), (None, 'thd', 'Kuuk Thaayorre'),
+ (None, 'the', 'Chitwania Tharu'), (None, 'thf', 'Thangmi'), (None, 'thh', 'Northern Tarahumara'),
+ (None, 'thi', 'Tai Long'), (None, 'thk', 'Tharaka'), (None, 'thl', 'Dangaura Tharu'), (None, 'thm', 'Aheu'),
+ (None, 'thn', 'Thachanadan'), (None, 'thp', 'Thompson'), (None, 'thq', 'Kochila Tharu'), (None, 'thr', 'Rana Tharu'),
+ (None, 'ths', 'Thakali'), (None, 'tht', 'Tahltan'), (None, 'thu', 'Thuri'), (None, 'thv', 'Tahaggart Tamahaq'),
+ (None, 'thy', 'Tha'), (None, 'thz', 'Tayart Tamajeq'), (None, 'tia', 'Tidikelt Tamazight'), (None, 'tic', 'Tira'),
+ (None, 'tif', 'Tifal'), (None, 'tig', 'Tigre'), (None, 'tih', 'Timugon Murut'), (None, 'tii', 'Tiene'),
+ (None, 'tij', 'Tilung'), (None, 'tik', 'Tikar'), (None, 'til', 'Tillamook'), (None, 'tim', 'Timbe'),
+ (None, 'tin', 'Tindi'), (None, 'tio', 'Teop'), (None, 'tip', 'Trimuris'), (None, 'tiq', 'Tiéfo'),
+ ('ti', 'tir', 'Tigrinya'), (None, 'tis', 'Masadiit Itneg'), (None, 'tit', 'Tinigua'), (None, 'tiu', 'Adasen'),
+ (None, 'tiv', 'Tiv'), (None, 'tiw', 'Tiwi'), (None, 'tix', 'Southern Tiwa'), (None, 'tiy', 'Tiruray'),
+ (None, 'tiz', 'Tai Hongjin'), (None, 'tja', 'Tajuasohn'), (None, 'tjg', 'Tunjung'), (None, 'tji', 'Northern Tujia'),
+ (None, 'tjj', 'Tjungundji'), (None, 'tjl', 'Tai Laing'), (None, 'tjm', 'Timucua'), (None, 'tjn', 'Tonjon'),
+ (None, 'tjo', 'Temacine Tamazight'), (None, 'tjp', 'Tjupany'), (None, 'tjs', 'Southern Tujia'),
+ (None, 'tju', 'Tjurruru'), (None, 'tjw', 'Djabwurrung'), (None, 'tka', 'Truká'), (None, 'tkb', 'Buksa'),
+ (None, 'tkd', 'Tukudede'), (None, 'tke', 'Takwane'), (None, 'tkf', 'Tukumanféd'), (None, 'tkg', 'Tesaka Malagasy'),
+ (None, 'tkl', 'Tokelau'), (None, 'tkm', 'Takelma'), (None, 'tkn', 'Toku-No-Shima'), (None, 'tkp', 'Tikopia'),
+ (None, 'tkq', 'Tee'), (None, 'tkr', 'Tsakhur'), (None, 'tks', 'Takestani'), (None, 'tkt', 'Kathoriya Tharu'),
+ (None, 'tku', 'Upper Necaxa Totonac'), (None, 'tkv', 'Mur Pano'), (None, 'tkw', 'Teanu'), (None, 'tkx', 'Tangko'),
+ (None, 'tkz', 'Takua'), (None, 'tla', 'Southwestern Tepehuan'), (None, 'tlb', 'Tobelo'),
+ (None, 'tlc', 'Yecuatla Totonac'), (None, 'tld', 'Talaud'), (None, 'tlf', 'Telefol'), (None, 'tlg', 'Tofanma'),
+ (None, 'tlh', 'Klingon'), (None, 'tli', 'Tlingit'), (None, 'tlj', 'Talinga-Bwisi'), (None, 'tlk', 'Taloki'),
+ (None, 'tll', 'Tetela'), (None, 'tlm', 'Tolomako'), (None, 'tln', "Talondo'"), (None, 'tlo', 'Talodi'),
+ (None, 'tlp', 'Filomena Mata-Coahuitlán Totonac'), (None, 'tlq', 'Tai Loi'), (None, 'tlr', 'Talise'),
+ (None, 'tls', 'Tambotalo'), (None, 'tlt', 'Sou Nama'), (None, 'tlu', 'Tulehu'), (None, 'tlv', 'Taliabu'),
+ (None, 'tlx', 'Khehek'), (None, 'tly', 'Talysh'), (None, 'tma', 'Tama (Chad)'), (None, 'tmb', 'Katbol'),
+ (None, 'tmc', 'Tumak'), (None, 'tmd', 'Haruai'), (None, 'tme', 'Tremembé'), (None, 'tmf', 'Toba-Maskoy'),
+ (None, 'tmg', 'Ternateño'), (None, 'tmh', 'Tamashek'), (None, 'tmi', 'Tutuba'), (None, 'tmj', 'Samarokena'),
+ (None, 'tmk', 'Northwestern Tamang'), (None, 'tml', 'Tamnim Citak'), (None, 'tmm', 'Tai Thanh'),
+ (None, 'tmn', 'Taman (Indonesia)'), (None, 'tmo', 'Temoq'), (None, 'tmq', 'Tumleo'),
+ (None, 'tmr', 'Jewish Babylonian Aramaic (ca. 200-1200 CE)'), (None, 'tms', 'Tima'), (None, 'tmt', 'Tasmate'),
+ (None, 'tmu', 'Iau'), (None, 'tmv', 'Tembo (Motembo)'), (None, 'tmw', 'Temuan'), (None, 'tmy', 'Tami'),
+ (None, 'tmz', 'Tamanaku'), (None, 'tna', 'Tacana'), (None, 'tnb', 'Western Tunebo'), (None, 'tnc', 'Tanimuca-Retuarã'),
+ (None, 'tnd', 'Angosturas Tunebo'), (None, 'tng', 'Tobanga'), (None, 'tnh', 'Maiani'), (None, 'tni', 'Tandia'),
+ (None, 'tnk', 'Kwamera'), (None, 'tnl', 'Lenakel'), (None, 'tnm', 'Tabla'), (None, 'tnn', 'North Tanna'),
+ (None, 'tno', 'Toromono'), (None, 'tnp', 'Whitesands'), (None, 'tnq', 'Taino'), (None, 'tnr', 'Ménik'),
+ (None, 'tns', 'Tenis'), (None, 'tnt', 'Tontemboan'), (None, 'tnu', 'Tay Khang'), (None, 'tnv', 'Tangchangya'),
+ (None, 'tnw', 'Tonsawang'), (None, 'tnx', 'Tanema'), (None, 'tny', 'Tongwe'), (None, 'tnz', "Ten'edn"),
+ (None, 'tob', 'Toba'), (None, 'toc', 'Coyutla Totonac'), (None, 'tod', 'Toma'), (None, 'tof', 'Gizrra'),
+ (None, 'tog', 'Tonga (Nyasa)'), (None, 'toh', 'Gitonga'), (None, 'toi', 'Tonga (Zambia)'), (None, 'toj', 'Tojolabal'),
+ (None, 'tok', 'Toki Pona'), (None, 'tol', 'Tolowa'), (None, 'tom', 'Tombulu'), ('to', 'ton', 'Tonga (Tonga Islands)'),
+ (None, 'too', 'Xicotepec De Juárez Totonac'), (None, 'top', 'Papantla Totonac'), (None, 'toq', 'Toposa'),
+ (None, 'tor', 'Togbo-Vara Banda'), (None, 'tos', 'Highland Totonac'), (None, 'tou', 'Tho'),
+ (None, 'tov', 'Upper Taromi'), (None, 'tow', 'Jemez'), (None, 'tox', 'Tobian'), (None, 'toy', 'Topoiyo'),
+ (None, 'toz', 'To'), (None, 'tpa', 'Taupota'), (None, 'tpc', "Azoyú Me'phaa"), (None, 'tpe', 'Tippera'),
+ (None, 'tpf', 'Tarpia'), (None, 'tpg', 'Kula'), (None, 'tpi', 'Tok Pisin'), (None, 'tpj', 'Tapieté'),
+ (None, 'tpk', 'Tupinikin'), (None, 'tpl', "Tlacoapa Me'phaa"), (None, 'tpm', 'Tampulma'), (None, 'tpn', 'Tupinambá'),
+ (None, 'tpo', 'Tai Pao'), (None, 'tpp', 'Pisaflores Tepehua'), (None, 'tpq', 'Tukpa'), (None, 'tpr', 'Tuparí'),
+ (None, 'tpt', 'Tlachichilco Tepehua'), (None, 'tpu', 'Tampuan'), (None, 'tpv', 'Tanapag'), (None, 'tpw', 'Tupí'),
+ (None, 'tpx', "Acatepec Me'phaa"), (None, 'tpy', 'Trumai'), (None, 'tpz', 'Tinputz'), (None, 'tqb', 'Tembé'),
+ (None, 'tql', 'Lehali'), (None, 'tqm', 'Turumsa'), (None, 'tqn', 'Tenino'), (None, 'tqo', 'Toaripi'),
+ (None, 'tqp', 'Tomoip'), (None, 'tqq', 'Tunni'), (None, 'tqr', 'Torona'), (None, 'tqt', 'Western Totonac'),
+ (None, 'tqu', 'Touo'), (None, 'tqw', 'Tonkawa'), (None, 'tra', 'Tirahi'), (None, 'trb', 'Terebu'),
+ (None, 'trc', 'Copala Triqui'), (None, 'trd', 'Turi'), (None, 'tre', 'East Tarangan'),
+ (None, 'trf', 'Trinidadian Creole English'), (None, 'trg', 'Lishán Didán'), (None, 'trh', 'Turaka'),
+ (None, 'tri', 'Trió'), (None, 'trj', 'Toram'), (None, 'trl', 'Traveller Scottish'), (None, 'trm', 'Tregami'),
+ (None, 'trn', 'Trinitario'), (None, 'tro', 'Tarao Naga'), (None, 'trp', 'Kok Borok'),
+ (None, 'trq', 'San Martín Itunyoso Triqui'), (None, 'trr', 'Taushiro'), (None, 'trs', 'Chicahuaxtla Triqui'),
+ (None, 'trt', 'Tunggare'), (None, 'tru', 'Turoyo'), (None, 'trv', 'Sediq'), (None, 'trw', 'Torwali'),
+ (None, 'trx', 'Tringgus-Sembaan Bidayuh'), (None, 'try', 'Turung'), (None, 'trz', 'Torá'), (None, 'tsa', 'Tsaangi'),
+ (None, 'tsb', 'Tsamai'), (None, 'tsc', 'Tswa'), (None, 'tsd', 'Tsakonian'), (None, 'tse', 'Tunisian Sign Language'),
+ (None, 'tsg', 'Tausug'), (None, 'tsh', 'Tsuvan'), (None, 'tsi', 'Tsimshian'), (None, 'tsj', 'Tshangla'),
+ (None, 'tsk', 'Tseku'), (None, 'tsl', "Ts'ün-Lao"), (None, 'tsm', 'Turkish Sign Language'), ('tn', 'tsn', 'Tswana'),
+ ('ts', 'tso', 'Tsonga'), (None, 'tsp', 'Northern Toussian'), (None, 'tsq', 'Thai Sign Language'),
+ (None, 'tsr', 'Akei'), (None, 'tss', 'Taiwan Sign Language'), (None, 'tst', 'Tondi Songway Kiini'),
+ (None, 'tsu', 'Tsou'), (None, 'tsv', 'Tsogo'), (None, 'tsw', 'Tsishingini'), (None, 'tsx', 'Mubami'),
+ (None, 'tsy', 'Tebul Sign Language'), (None, 'tsz', 'Purepecha'), (None, 'tta', 'Tutelo'), (None, 'ttb', 'Gaa'),
+ (None, 'ttc', 'Tektiteko'), (None, 'ttd', 'Tauade'), (None, 'tte', 'Bwanabwana'), (None, 'ttf', 'Tuotomb'),
+ (None, 'ttg', 'Tutong'), (None, 'tth', "Upper Ta'oih"), (None, 'tti', 'Tobati'), (None, 'ttj', 'Tooro'),
+ (None, 'ttk', 'Totoro'), (None, 'ttl', 'Totela'), (None, 'ttm', 'Northern Tutchone'), (None, 'ttn', 'Towei'),
+ (None, 'tto', "Lower Ta'oih"), (None, 'ttp', 'Tombelala'), (None, 'ttq', 'Tawallammat Tamajaq'), (None, 'ttr', 'Tera'),
+ (None, 'tts', 'Northeastern Thai'), (None, 'ttt', 'Muslim Tat'), (None, 'ttu', 'Torau'), (None, 'ttv', 'Titan'),
+ (None, 'ttw', 'Long Wat'), (None, 'tty', 'Sikaritai'), (None, 'ttz', 'Tsum'), (None, 'tua', 'Wiarumus'),
+ (None, 'tub', 'Tübatulabal'), (None, 'tuc', 'Mutu'), (None, 'tud', 'Tuxá'), (None, 'tue', 'Tuyuca'),
+ (None, 'tuf', 'Central Tunebo'), (None, 'tug', 'Tunia'), (None, 'tuh', 'Taulil'), (None, 'tui', 'Tupuri'),
+ (None, 'tuj', 'Tugutil'), ('tk', 'tuk', 'Turkmen'), (None, 'tul', 'Tula'), (None, 'tum', 'Tumbuka'),
+ (None, 'tun', 'Tunica'), (None, 'tuo', 'Tucano'), (None, 'tuq', 'Tedaga'), ('tr', 'tur', 'Turkish'),
+ (None, 'tus', 'Tuscarora'), (None, 'tuu', 'Tututni'), (None, 'tuv', 'Turkana'), (None, 'tux', 'Tuxináwa'),
+ (None, 'tuy', 'Tugen'), (None, 'tuz', 'Turka'), (None, 'tva', 'Vaghua'), (None, 'tvd', 'Tsuvadi'),
+ (None, 'tve', "Te'un"), (None, 'tvk', 'Southeast Ambrym'), (None, 'tvl', 'Tuvalu'), (None, 'tvm', 'Tela-Masbuar'),
+ (None, 'tvn', 'Tavoyan'), (None, 'tvo', 'Tidore'), (None, 'tvs', 'Taveta'), (None, 'tvt', 'Tutsa Naga'),
+ (None, 'tvu', 'Tunen'), (None, 'tvw', 'Sedoa'), (None, 'tvx', 'Taivoan'), (None, 'tvy', 'Timor Pidgin'),
+ (None, 'twa', 'Twana'), (None, 'twb', 'Western Tawbuid'), (None, 'twc', 'Teshenawa'), (None, 'twd', 'Twents'),
+ (None, 'twe', 'Tewa (Indonesia)'), (None, 'twf', 'Northern Tiwa'), (None, 'twg', 'Tereweng'), (None, 'twh', 'Tai Dón'),
+ ('tw', 'twi', 'Twi'), (None, 'twl', 'Tawara'), (None, 'twm', 'Tawang Monpa'), (None, 'twn', 'Twendi'),
+ (None, 'two', 'Tswapong'), (None, 'twp', 'Ere'), (None, 'twq', 'Tasawaq'), (None, 'twr', 'Southwestern Tarahumara'),
+ (None, 'twt', 'Turiwára'), (None, 'twu', 'Termanu'), (None, 'tww', 'Tuwari'), (None, 'twx', 'Tewe'),
+ (None, 'twy', 'Tawoyan'), (None, 'txa', 'Tombonuo'), (None, 'txb', 'Tokharian B'), (None, 'txc', 'Tsetsaut'),
+ (None, 'txe', 'Totoli'), (None, 'txg', 'Tangut'), (None, 'txh', 'Thracian'), (None, 'txi', 'Ikpeng'),
+ (None, 'txj', 'Tarjumo'), (None, 'txm', 'Tomini'), (None, 'txn', 'West Tarangan'), (None, 'txo', 'Toto'),
+ (None, 'txq', 'Tii'), (None, 'txr', 'Tartessian'), (None, 'txs', 'Tonsea'), (None, 'txt', 'Citak'),
+ (None, 'txu', 'Kayapó'), (None, 'txx', 'Tatana'), (None, 'txy', 'Tanosy Malagasy'), (None, 'tya', 'Tauya'),
+ (None, 'tye', 'Kyanga'), (None, 'tyh', "O'du"), (None, 'tyi', 'Teke-Tsaayi'), (None, 'tyj', 'Tai Do'),
+ (None, 'tyl', 'Thu Lao'), (None, 'tyn', 'Kombai'), (None, 'typ', 'Thaypan'), (None, 'tyr', 'Tai Daeng'),
+ (None, 'tys', 'Tày Sa Pa'), (None, 'tyt', 'Tày Tac'), (None, 'tyu', 'Kua'), (None, 'tyv', 'Tuvinian'),
+ (None, 'tyx', 'Teke-Tyee'), (None, 'tyy', 'Tiyaa'), (None, 'tyz', 'Tày'), (None, 'tza', 'Tanzanian Sign Language'),
+ (None, 'tzh', 'Tzeltal'), (None, 'tzj', "Tz'utujil"), (None, 'tzl', 'Talossan'),
+ (None, 'tzm', 'Central Atlas Tamazight'), (None, 'tzn', 'Tugun'), (None, 'tzo', 'Tzotzil'), (None, 'tzx', 'Tabriak'),
+ (None, 'uam', 'Uamué'), (None, 'uan', 'Kuan'), (None, 'uar', 'Tairuma'), (None, 'uba', 'Ubang'), (None, 'ubi', 'Ubi'),
+ (None, 'ubl', "Buhi'non Bikol"), (None, 'ubr', 'Ubir'), (None, 'ubu', 'Umbu-Ungu'), (None, 'uby', 'Ubykh'),
+ (None, 'uda', 'Uda'), (None, 'ude', 'Udihe'), (None, 'udg', 'Muduga'), (None, 'udi', 'Udi'), (None, 'udj', 'Ujir'),
+ (None, 'udl', 'Wuzlam'), (None, 'udm', 'Udmurt'), (None, 'udu', 'Uduk'), (None, 'ues', 'Kioko'), (None, 'ufi', 'Ufim'),
+ (None, 'uga', 'Ugaritic'), (None, 'ugb', 'Kuku-Ugbanh'), (None, 'uge', 'Ughele'), (None, 'ugh', 'Kubachi'),
+ (None, 'ugn', 'Ugandan Sign Language'), (None, 'ugo', 'Ugong'), (None, 'ugy', 'Uruguayan Sign Language'),
+ (None, 'uha', 'Uhami'), (None, 'uhn', 'Damal'), ('ug', 'uig', 'Uighur'), (None, 'uis', 'Uisai'),
+ (None, 'uiv', 'Iyive'), (None, 'uji', 'Tanjijili'), (None, 'uka', 'Kaburi'), (None, 'ukg', 'Ukuriguma'),
+ (None, 'ukh', 'Ukhwejo'), (None, 'uki', 'Kui (India)'), (None, 'ukk', 'Muak Sa-aak'),
+ (None, 'ukl', 'Ukrainian Sign Language'), (None, 'ukp', 'Ukpe-Bayobiri'), (None, 'ukq', 'Ukwa'),
+ ('uk', 'ukr', 'Ukrainian'), (None, 'uks', 'Urubú-Kaapor Sign Language'), (None, 'uku', 'Ukue'), (None, 'ukv', 'Kuku'),
+ (None, 'ukw', 'Ukwuani-Aboh-Ndoni'), (None, 'uky', 'Kuuk-Yak'), (None, 'ula', 'Fungwa'), (None, 'ulb', 'Ulukwumi'),
+ (None, 'ulc', 'Ulch'), (None, 'ule', 'Lule'), (None, 'ulf', 'Usku'), (None, 'uli', 'Ulithian'),
+ (None, 'ulk', 'Meriam Mir'), (None, 'ull', 'Ullatan'), (None, 'ulm', "Ulumanda'"), (None, 'uln', 'Unserdeutsch'),
+ (None, 'ulu', "Uma' Lung"), (None, 'ulw', 'Ulwa'), (None, 'uma', 'Umatilla'), (None, 'umb', 'Umbundu'),
+ (None, 'umc', 'Marrucinian'), (None, 'umd', 'Umbindhamu'), (None, 'umg', 'Morrobalama'), (None, 'umi', 'Ukit'),
+ (None, 'umm', 'Umon'), (None, 'umn', 'Makyan Naga'), (None, 'umo', 'Umotína'), (None, 'ump', 'Umpila'),
+ (None, 'umr', 'Umbugarla'), (None, 'ums', 'Pendau'), (None, 'umu', 'Munsee'), (None, 'una', 'North Watut'),
+ (None, 'und', 'Undetermined'), (None, 'une', 'Uneme'), (None, 'ung', 'Ngarinyin'), (None, 'uni', 'Uni'),
+ (None, 'unk', 'Enawené-Nawé'), (None, 'unm', 'Unami'), (None, 'unn', 'Kurnai'), (None, 'unr', 'Mundari'),
+ (None, 'unu', 'Unubahe'), (None, 'unx', 'Munda'), (None, 'unz', 'Unde Kaili'), (None, 'uon', 'Kulon'),
+ (None, 'upi', 'Umeda'), (None, 'upv', 'Uripiv-Wala-Rano-Atchin'), (None, 'ura', 'Urarina'),
+ (None, 'urb', 'Urubú-Kaapor'), (None, 'urc', 'Urningangg'), ('ur', 'urd', 'Urdu'), (None, 'ure', 'Uru'),
+ (None, 'urf', 'Uradhi'), (None, 'urg', 'Urigina'), (None, 'urh', 'Urhobo'), (None, 'uri', 'Urim'),
+ (None, 'urk', "Urak Lawoi'"), (None, 'url', 'Urali'), (None, 'urm', 'Urapmin'), (None, 'urn', 'Uruangnirin'),
+ (None, 'uro', 'Ura (Papua New Guinea)'), (None, 'urp', 'Uru-Pa-In'), (None, 'urr', 'Lehalurup'), (None, 'urt', 'Urat'),
+ (None, 'uru', 'Urumi'), (None, 'urv', 'Uruava'), (None, 'urw', 'Sop'), (None, 'urx', 'Urimo'), (None, 'ury', 'Orya'),
+ (None, 'urz', 'Uru-Eu-Wau-Wau'), (None, 'usa', 'Usarufa'), (None, 'ush', 'Ushojo'), (None, 'usi', 'Usui'),
+ (None, 'usk', 'Usaghade'), (None, 'usp', 'Uspanteco'), (None, 'uss', 'us-Saare'), (None, 'usu', 'Uya'),
+ (None, 'uta', 'Otank'), (None, 'ute', 'Ute-Southern Paiute'), (None, 'uth', 'ut-Hun'),
+ (None, 'utp', 'Amba (Solomon Islands)'), (None, 'utr', 'Etulo'), (None, 'utu', 'Utu'), (None, 'uum', 'Urum'),
+ (None, 'uur', 'Ura (Vanuatu)'), (None, 'uuu', 'U'), (None, 'uve', 'West Uvean'), (None, 'uvh', 'Uri'),
+ (None, 'uvl', 'Lote'), (None, 'uwa', 'Kuku-Uwanh'), (None, 'uya', 'Doko-Uyanga'), ('uz', 'uzb', 'Uzbek'),
+ (None, 'uzn', 'Northern Uzbek'), (None, 'uzs', 'Southern Uzbek'), (None, 'vaa', 'Vaagri Booli'), (None, 'vae', 'Vale'),
+ (None, 'vaf', 'Vafsi'), (None, 'vag', 'Vagla'), (None, 'vah', 'Varhadi-Nagpuri'), (None, 'vai', 'Vai'),
+ (None, 'vaj', 'Sekele'), (None, 'val', 'Vehes'), (None, 'vam', 'Vanimo'), (None, 'van', 'Valman'),
+ (None, 'vao', 'Vao'), (None, 'vap', 'Vaiphei'), (None, 'var', 'Huarijio'), (None, 'vas', 'Vasavi'),
+ (None, 'vau', 'Vanuma'), (None, 'vav', 'Varli'), (None, 'vay', 'Wayu'), (None, 'vbb', 'Southeast Babar'),
+ (None, 'vbk', 'Southwestern Bontok'), (None, 'vec', 'Venetian'), (None, 'ved', 'Veddah'), (None, 'vel', 'Veluws'),
+ (None, 'vem', 'Vemgo-Mabas'), ('ve', 'ven', 'Venda'), (None, 'veo', 'Ventureño'), (None, 'vep', 'Veps'),
+ (None, 'ver', 'Mom Jango'), (None, 'vgr', 'Vaghri'), (None, 'vgt', 'Vlaamse Gebarentaal'),
+ (None, 'vic', 'Virgin Islands Creole English'), (None, 'vid', 'Vidunda'), ('vi', 'vie', 'Vietnamese'),
+ (None, 'vif', 'Vili'), (None, 'vig', 'Viemo'), (None, 'vil', 'Vilela'), (None, 'vin', 'Vinza'),
+ (None, 'vis', 'Vishavan'), (None, 'vit', 'Viti'), (None, 'viv', 'Iduna'), (None, 'vka', 'Kariyarra'),
+ (None, 'vkj', 'Kujarge'), (None, 'vkk', 'Kaur'), (None, 'vkl', 'Kulisusu'), (None, 'vkm', 'Kamakan'),
+ (None, 'vkn', 'Koro Nulu'), (None, 'vko', 'Kodeoha'), (None, 'vkp', 'Korlai Creole Portuguese'),
+ (None, 'vkt', 'Tenggarong Kutai Malay'), (None, 'vku', 'Kurrama'), (None, 'vkz', 'Koro Zuba'), (None, 'vlp', 'Valpei'),
+ (None, 'vls', 'Vlaams'), (None, 'vma', 'Martuyhunira'), (None, 'vmb', 'Barbaram'), (None, 'vmc', 'Juxtlahuaca Mixtec'),
+ (None, 'vmd', 'Mudu Koraga'), (None, 'vme', 'East Masela'), (None, 'vmf', 'Mainfränkisch'),
+ (None, 'vmg', 'Lungalunga'), (None, 'vmh', 'Maraghei'), (None, 'vmi', 'Miwa'), (None, 'vmj', 'Ixtayutla Mixtec'),
+ (None, 'vmk', 'Makhuwa-Shirima'), (None, 'vml', 'Malgana'), (None, 'vmm', 'Mitlatongo Mixtec'),
+ (None, 'vmp', 'Soyaltepec Mazatec'), (None, 'vmq', 'Soyaltepec Mixtec'), (None, 'vmr', 'Marenje'),
+ (None, 'vms', 'Moksela'), (None, 'vmu', 'Muluridyi'), (None, 'vmv', 'Valley Maidu'), (None, 'vmw', 'Makhuwa'),
+ (None, 'vmx', 'Tamazola Mixtec'), (None, 'vmy', 'Ayautla Mazatec'), (None, 'vmz', 'Mazatlán Mazatec'),
+ (None, 'vnk', 'Vano'), (None, 'vnm', 'Vinmavis'), (None, 'vnp', 'Vunapu'), ('vo', 'vol', 'Volapük'),
+ (None, 'vor', 'Voro'), (None, 'vot', 'Votic'), (None, 'vra', "Vera'a"), (None, 'vro', 'Võro'), (None, 'vrs', 'Varisi'),
+ (None, 'vrt', 'Burmbar'), (None, 'vsi', 'Moldova Sign Language'), (None, 'vsl', 'Venezuelan Sign Language'),
+ (None, 'vsv', 'Valencian Sign Language'), (None, 'vto', 'Vitou'), (None, 'vum', 'Vumbu'), (None, 'vun', 'Vunjo'),
+ (None, 'vut', 'Vute'), (None, 'vwa', 'Awa (China)'), (None, 'waa', 'Walla Walla'), (None, 'wab', 'Wab'),
+ (None, 'wac', 'Wasco-Wishram'), (None, 'wad', 'Wamesa'), (None, 'wae', 'Walser'), (None, 'waf', 'Wakoná'),
+ (None, 'wag', "Wa'ema"), (None, 'wah', 'Watubela'), (None, 'wai', 'Wares'), (None, 'waj', 'Waffa'),
+ (None, 'wal', 'Wolaytta'), (None, 'wam', 'Wampanoag'), (None, 'wan', 'Wan'), (None, 'wao', 'Wappo'),
+ (None, 'wap', 'Wapishana'), (None, 'waq', 'Wagiman'), (None, 'war', 'Waray (Philippines)'), (None, 'was', 'Washo'),
+ (None, 'wat', 'Kaninuwa'), (None, 'wau', 'Waurá'), (None, 'wav', 'Waka'), (None, 'waw', 'Waiwai'),
+ (None, 'wax', 'Watam'), (None, 'way', 'Wayana'), (None, 'waz', 'Wampur'), (None, 'wba', 'Warao'),
+ (None, 'wbb', 'Wabo'), (None, 'wbe', 'Waritai'), (None, 'wbf', 'Wara'), (None, 'wbh', 'Wanda'),
+ (None, 'wbi', 'Vwanji'), (None, 'wbj', 'Alagwa'), (None, 'wbk', 'Waigali'), (None, 'wbl', 'Wakhi'),
+ (None, 'wbm', 'Wa'), (None, 'wbp', 'Warlpiri'), (None, 'wbq', 'Waddar'), (None, 'wbr', 'Wagdi'),
+ (None, 'wbs', 'West Bengal Sign Language'), (None, 'wbt', 'Warnman'), (None, 'wbv', 'Wajarri'), (None, 'wbw', 'Woi'),
+ (None, 'wca', 'Yanomámi'), (None, 'wci', 'Waci Gbe'), (None, 'wdd', 'Wandji'), (None, 'wdg', 'Wadaginam'),
+ (None, 'wdj', 'Wadjiginy'), (None, 'wdk', 'Wadikali'), (None, 'wdt', 'Wendat'), (None, 'wdu', 'Wadjigu'),
+ (None, 'wdy', 'Wadjabangayi'), (None, 'wea', 'Wewaw'), (None, 'wec', 'Wè Western'), (None, 'wed', 'Wedau'),
+ (None, 'weg', 'Wergaia'), (None, 'weh', 'Weh'), (None, 'wei', 'Kiunum'), (None, 'wem', 'Weme Gbe'),
+ (None, 'weo', 'Wemale'), (None, 'wep', 'Westphalien'), (None, 'wer', 'Weri'), (None, 'wes', 'Cameroon Pidgin'),
+ (None, 'wet', 'Perai'), (None, 'weu', 'Rawngtu Chin'), (None, 'wew', 'Wejewa'), (None, 'wfg', 'Yafi'),
+ (None, 'wga', 'Wagaya'), (None, 'wgb', 'Wagawaga'), (None, 'wgg', 'Wangkangurru'), (None, 'wgi', 'Wahgi'),
+ (None, 'wgo', 'Waigeo'), (None, 'wgu', 'Wirangu'), (None, 'wgy', 'Warrgamay'), (None, 'wha', 'Sou Upaa'),
+ (None, 'whg', 'North Wahgi'), (None, 'whk', 'Wahau Kenyah'), (None, 'whu', 'Wahau Kayan'),
+ (None, 'wib', 'Southern Toussian'), (None, 'wic', 'Wichita'), (None, 'wie', 'Wik-Epa'), (None, 'wif', 'Wik-Keyangan'),
+ (None, 'wig', 'Wik Ngathan'), (None, 'wih', "Wik-Me'anha"), (None, 'wii', 'Minidien'), (None, 'wij', 'Wik-Iiyanh'),
+ (None, 'wik', 'Wikalkan'), (None, 'wil', 'Wilawila'), (None, 'wim', 'Wik-Mungkan'), (None, 'win', 'Ho-Chunk'),
+ (None, 'wir', 'Wiraféd'), (None, 'wiu', 'Wiru'), (None, 'wiv', 'Vitu'), (None, 'wiy', 'Wiyot'), (None, 'wja', 'Waja'),
+ (None, 'wji', 'Warji'), (None, 'wka', "Kw'adza"), (None, 'wkb', 'Kumbaran'), (None, 'wkd', 'Wakde'),
+ (None, 'wkl', 'Kalanadi'), (None, 'wkr', 'Keerray-Woorroong'), (None, 'wku', 'Kunduvadi'), (None, 'wkw', 'Wakawaka'),
+ (None, 'wky', 'Wangkayutyuru'), (None, 'wla', 'Walio'), (None, 'wlc', 'Mwali Comorian'), (None, 'wle', 'Wolane'),
+ (None, 'wlg', 'Kunbarlang'), (None, 'wlh', 'Welaun'), (None, 'wli', 'Waioli'), (None, 'wlk', 'Wailaki'),
+ (None, 'wll', 'Wali (Sudan)'), (None, 'wlm', 'Middle Welsh'), ('wa', 'wln', 'Walloon'), (None, 'wlo', 'Wolio'),
+ (None, 'wlr', 'Wailapa'), (None, 'wls', 'Wallisian'), (None, 'wlu', 'Wuliwuli'), (None, 'wlv', 'Wichí Lhamtés Vejoz'),
+ (None, 'wlw', 'Walak'), (None, 'wlx', 'Wali (Ghana)'), (None, 'wly', 'Waling'), (None, 'wma', 'Mawa (Nigeria)'),
+ (None, 'wmb', 'Wambaya'), (None, 'wmc', 'Wamas'), (None, 'wmd', 'Mamaindé'), (None, 'wme', 'Wambule'),
+ (None, 'wmg', 'Western Minyag'), (None, 'wmh', "Waima'a"), (None, 'wmi', 'Wamin'), (None, 'wmm', 'Maiwa (Indonesia)'),
+ (None, 'wmn', 'Waamwang'), (None, 'wmo', 'Wom (Papua New Guinea)'), (None, 'wms', 'Wambon'),
+ (None, 'wmt', 'Walmajarri'), (None, 'wmw', 'Mwani'), (None, 'wmx', 'Womo'), (None, 'wnb', 'Wanambre'),
+ (None, 'wnc', 'Wantoat'), (None, 'wnd', 'Wandarang'), (None, 'wne', 'Waneci'), (None, 'wng', 'Wanggom'),
+ (None, 'wni', 'Ndzwani Comorian'), (None, 'wnk', 'Wanukaka'), (None, 'wnm', 'Wanggamala'), (None, 'wnn', 'Wunumara'),
+ (None, 'wno', 'Wano'), (None, 'wnp', 'Wanap'), (None, 'wnu', 'Usan'), (None, 'wnw', 'Wintu'), (None, 'wny', 'Wanyi'),
+ (None, 'woa', 'Kuwema'), (None, 'wob', 'Wè Northern'), (None, 'woc', 'Wogeo'), (None, 'wod', 'Wolani'),
+ (None, 'woe', 'Woleaian'), (None, 'wof', 'Gambian Wolof'), (None, 'wog', 'Wogamusin'), (None, 'woi', 'Kamang'),
+ (None, 'wok', 'Longto'), ('wo', 'wol', 'Wolof'), (None, 'wom', 'Wom (Nigeria)'), (None, 'won', 'Wongo'),
+ (None, 'woo', 'Manombai'), (None, 'wor', 'Woria'), (None, 'wos', 'Hanga Hundi'), (None, 'wow', 'Wawonii'),
+ (None, 'woy', 'Weyto'), (None, 'wpc', 'Maco'), (None, 'wrb', 'Waluwarra'), (None, 'wrg', 'Warungu'),
+ (None, 'wrh', 'Wiradjuri'), (None, 'wri', 'Wariyangga'), (None, 'wrk', 'Garrwa'), (None, 'wrl', 'Warlmanpa'),
+ (None, 'wrm', 'Warumungu'), (None, 'wrn', 'Warnang'), (None, 'wro', 'Worrorra'), (None, 'wrp', 'Waropen'),
+ (None, 'wrr', 'Wardaman'), (None, 'wrs', 'Waris'), (None, 'wru', 'Waru'), (None, 'wrv', 'Waruna'),
+ (None, 'wrw', 'Gugu Warra'), (None, 'wrx', 'Wae Rana'), (None, 'wry', 'Merwari'), (None, 'wrz', 'Waray (Australia)'),
+ (None, 'wsa', 'Warembori'), (None, 'wsg', 'Adilabad Gondi'), (None, 'wsi', 'Wusi'), (None, 'wsk', 'Waskia'),
+ (None, 'wsr', 'Owenia'), (None, 'wss', 'Wasa'), (None, 'wsu', 'Wasu'), (None, 'wsv', 'Wotapuri-Katarqalai'),
+ (None, 'wtf', 'Watiwa'), (None, 'wth', 'Wathawurrung'), (None, 'wti', 'Berta'), (None, 'wtk', 'Watakataui'),
+ (None, 'wtm', 'Mewati'), (None, 'wtw', 'Wotu'), (None, 'wua', 'Wikngenchera'), (None, 'wub', 'Wunambal'),
+ (None, 'wud', 'Wudu'), (None, 'wuh', 'Wutunhua'), (None, 'wul', 'Silimo'), (None, 'wum', 'Wumbvu'),
+ (None, 'wun', 'Bungu'), (None, 'wur', 'Wurrugu'), (None, 'wut', 'Wutung'), (None, 'wuu', 'Wu Chinese'),
+ (None, 'wuv', 'Wuvulu-Aua'), (None, 'wux', 'Wulna'), (None, 'wuy', 'Wauyai'), (None, 'wwa', 'Waama'),
+ (None, 'wwb', 'Wakabunga'), (None, 'wwo', 'Wetamut'), (None, 'wwr', 'Warrwa'), (None, 'www', 'Wawa'),
+ (None, 'wxa', 'Waxianghua'), (None, 'wxw', 'Wardandi'), (None, 'wyb', 'Wangaaybuwan-Ngiyambaa'),
+ (None, 'wyi', 'Woiwurrung'), (None, 'wym', 'Wymysorys'), (None, 'wyn', 'Wyandot'), (None, 'wyr', 'Wayoró'),
+ (None, 'wyy', 'Western Fijian'), (None, 'xaa', 'Andalusian Arabic'), (None, 'xab', 'Sambe'), (None, 'xac', 'Kachari'),
+ (None, 'xad', 'Adai'), (None, 'xae', 'Aequian'), (None, 'xag', 'Aghwan'), (None, 'xai', 'Kaimbé'),
+ (None, 'xaj', 'Ararandewára'), (None, 'xak', 'Máku'), (None, 'xal', 'Kalmyk'), (None, 'xam', 'ǀXam'),
+ (None, 'xan', 'Xamtanga'), (None, 'xao', 'Khao'), (None, 'xap', 'Apalachee'), (None, 'xaq', 'Aquitanian'),
+ (None, 'xar', 'Karami'), (None, 'xas', 'Kamas'), (None, 'xat', 'Katawixi'), (None, 'xau', 'Kauwera'),
+ (None, 'xav', 'Xavánte'), (None, 'xaw', 'Kawaiisu'), (None, 'xay', 'Kayan Mahakam'), (None, 'xbb', 'Lower Burdekin'),
+ (None, 'xbc', 'Bactrian'), (None, 'xbd', 'Bindal'), (None, 'xbe', 'Bigambal'), (None, 'xbg', 'Bunganditj'),
+ (None, 'xbi', 'Kombio'), (None, 'xbj', 'Birrpayi'), (None, 'xbm', 'Middle Breton'), (None, 'xbn', 'Kenaboi'),
+ (None, 'xbo', 'Bolgarian'), (None, 'xbp', 'Bibbulman'), (None, 'xbr', 'Kambera'), (None, 'xbw', 'Kambiwá'),
+ (None, 'xby', 'Batjala'), (None, 'xcb', 'Cumbric'), (None, 'xcc', 'Camunic'), (None, 'xce', 'Celtiberian'),
+ (None, 'xcg', 'Cisalpine Gaulish'), (None, 'xch', 'Chemakum'), (None, 'xcl', 'Classical Armenian'),
+ (None, 'xcm', 'Comecrudo'), (None, 'xcn', 'Cotoname'), (None, 'xco', 'Chorasmian'), (None, 'xcr', 'Carian'),
+ (None, 'xct', 'Classical Tibetan'), (None, 'xcu', 'Curonian'), (None, 'xcv', 'Chuvantsy'),
+ (None, 'xcw', 'Coahuilteco'), (None, 'xcy', 'Cayuse'), (None, 'xda', 'Darkinyung'), (None, 'xdc', 'Dacian'),
+ (None, 'xdk', 'Dharuk'), (None, 'xdm', 'Edomite'), (None, 'xdo', 'Kwandu'), (None, 'xdq', 'Kaitag'),
+ (None, 'xdy', 'Malayic Dayak'), (None, 'xeb', 'Eblan'), (None, 'xed', 'Hdi'), (None, 'xeg', 'ǁXegwi'),
+ (None, 'xel', 'Kelo'), (None, 'xem', 'Kembayan'), (None, 'xep', 'Epi-Olmec'), (None, 'xer', 'Xerénte'),
+ (None, 'xes', 'Kesawai'), (None, 'xet', 'Xetá'), (None, 'xeu', 'Keoru-Ahia'), (None, 'xfa', 'Faliscan'),
+ (None, 'xga', 'Galatian'), (None, 'xgb', 'Gbin'), (None, 'xgd', 'Gudang'), (None, 'xgf', 'Gabrielino-Fernandeño'),
+ (None, 'xgg', 'Goreng'), (None, 'xgi', 'Garingbal'), (None, 'xgl', 'Galindan'), (None, 'xgm', 'Dharumbal'),
+ (None, 'xgr', 'Garza'), (None, 'xgu', 'Unggumi'), (None, 'xgw', 'Guwa'), (None, 'xha', 'Harami'),
+ (None, 'xhc', 'Hunnic'), (None, 'xhd', 'Hadrami'), (None, 'xhe', 'Khetrani'),
+ (None, 'xhm', 'Middle Khmer (1400 to 1850 CE)'), ('xh', 'xho', 'Xhosa'), (None, 'xhr', 'Hernican'),
+ (None, 'xht', 'Hattic'), (None, 'xhu', 'Hurrian'), (None, 'xhv', 'Khua'), (None, 'xib', 'Iberian'),
+ (None, 'xii', 'Xiri'), (None, 'xil', 'Illyrian'), (None, 'xin', 'Xinca'), (None, 'xir', 'Xiriâna'),
+ (None, 'xis', 'Kisan'), (None, 'xiv', 'Indus Valley Language'), (None, 'xiy', 'Xipaya'), (None, 'xjb', 'Minjungbal'),
+ (None, 'xjt', 'Jaitmatang'), (None, 'xka', 'Kalkoti'), (None, 'xkb', 'Northern Nago'), (None, 'xkc', "Kho'ini"),
+ (None, 'xkd', 'Mendalam Kayan'), (None, 'xke', 'Kereho'), (None, 'xkf', 'Khengkha'), (None, 'xkg', 'Kagoro'),
+ (None, 'xki', 'Kenyan Sign Language'), (None, 'xkj', 'Kajali'), (None, 'xkk', 'Kachok'),
+ (None, 'xkl', 'Mainstream Kenyah'), (None, 'xkn', 'Kayan River Kayan'), (None, 'xko', 'Kiorr'),
+ (None, 'xkp', 'Kabatei'), (None, 'xkq', 'Koroni'), (None, 'xkr', 'Xakriabá'), (None, 'xks', 'Kumbewaha'),
+ (None, 'xkt', 'Kantosi'), (None, 'xku', 'Kaamba'), (None, 'xkv', 'Kgalagadi'), (None, 'xkw', 'Kembra'),
+ (None, 'xkx', 'Karore'), (None, 'xky', "Uma' Lasan"), (None, 'xkz', 'Kurtokha'), (None, 'xla', 'Kamula'),
+ (None, 'xlb', 'Loup B'), (None, 'xlc', 'Lycian'), (None, 'xld', 'Lydian'), (None, 'xle', 'Lemnian'),
+ (None, 'xlg', 'Ligurian (Ancient)'), (None, 'xli', 'Liburnian'), (None, 'xln', 'Alanic'), (None, 'xlo', 'Loup A'),
+ (None, 'xlp', 'Lepontic'), (None, 'xls', 'Lusitanian'), (None, 'xlu', 'Cuneiform Luwian'), (None, 'xly', 'Elymian'),
+ (None, 'xma', 'Mushungulu'), (None, 'xmb', 'Mbonga'), (None, 'xmc', 'Makhuwa-Marrevone'), (None, 'xmd', 'Mbudum'),
+ (None, 'xme', 'Median'), (None, 'xmf', 'Mingrelian'), (None, 'xmg', 'Mengaka'), (None, 'xmh', 'Kugu-Muminh'),
+ (None, 'xmj', 'Majera'), (None, 'xmk', 'Ancient Macedonian'), (None, 'xml', 'Malaysian Sign Language'),
+ (None, 'xmm', 'Manado Malay'), (None, 'xmn', 'Manichaean Middle Persian'), (None, 'xmo', 'Morerebi'),
+ (None, 'xmp', "Kuku-Mu'inh"), (None, 'xmq', 'Kuku-Mangk'), (None, 'xmr', 'Meroitic'),
+ (None, 'xms', 'Moroccan Sign Language'), (None, 'xmt', 'Matbat'), (None, 'xmu', 'Kamu'),
+ (None, 'xmv', 'Antankarana Malagasy'), (None, 'xmw', 'Tsimihety Malagasy'), (None, 'xmx', 'Salawati'),
+ (None, 'xmy', 'Mayaguduna'), (None, 'xmz', 'Mori Bawah'), (None, 'xna', 'Ancient North Arabian'),
+ (None, 'xnb', 'Kanakanabu'), (None, 'xng', 'Middle Mongolian'), (None, 'xnh', 'Kuanhua'), (None, 'xni', 'Ngarigu'),
+ (None, 'xnj', 'Ngoni (Tanzania)'), (None, 'xnk', 'Nganakarti'), (None, 'xnm', 'Ngumbarl'),
+ (None, 'xnn', 'Northern Kankanay'), (None, 'xno', 'Anglo-Norman'), (None, 'xnq', 'Ngoni (Mozambique)'),
+ (None, 'xnr', 'Kangri'), (None, 'xns', 'Kanashi'), (None, 'xnt', 'Narragansett'), (None, 'xnu', 'Nukunul'),
+ (None, 'xny', 'Nyiyaparli'), (None, 'xnz', 'Kenzi'), (None, 'xoc', "O'chi'chi'"), (None, 'xod', 'Kokoda'),
+ (None, 'xog', 'Soga'), (None, 'xoi', 'Kominimung'), (None, 'xok', 'Xokleng'), (None, 'xom', 'Komo (Sudan)'),
+ (None, 'xon', 'Konkomba'), (None, 'xoo', 'Xukurú'), (None, 'xop', 'Kopar'), (None, 'xor', 'Korubo'),
+ (None, 'xow', 'Kowaki'), (None, 'xpa', 'Pirriya'), (None, 'xpb', 'Northeastern Tasmanian'), (None, 'xpc', 'Pecheneg'),
+ (None, 'xpd', 'Oyster Bay Tasmanian'), (None, 'xpe', 'Liberia Kpelle'), (None, 'xpf', 'Southeast Tasmanian'),
+ (None, 'xpg', 'Phrygian'), (None, 'xph', 'North Midlands Tasmanian'), (None, 'xpi', 'Pictish'),
+ (None, 'xpj', 'Mpalitjanh'), (None, 'xpk', 'Kulina Pano'), (None, 'xpl', 'Port Sorell Tasmanian'),
+ (None, 'xpm', 'Pumpokol'), (None, 'xpn', 'Kapinawá'), (None, 'xpo', 'Pochutec'), (None, 'xpp', 'Puyo-Paekche'),
+ (None, 'xpq', 'Mohegan-Pequot'), (None, 'xpr', 'Parthian'), (None, 'xps', 'Pisidian'), (None, 'xpt', 'Punthamara'),
+ (None, 'xpu', 'Punic'), (None, 'xpv', 'Northern Tasmanian'), (None, 'xpw', 'Northwestern Tasmanian'),
+ (None, 'xpx', 'Southwestern Tasmanian'), (None, 'xpy', 'Puyo'), (None, 'xpz', 'Bruny Island Tasmanian'),
+ (None, 'xqa', 'Karakhanid'), (None, 'xqt', 'Qatabanian'), (None, 'xra', 'Krahô'), (None, 'xrb', 'Eastern Karaboro'),
+ (None, 'xrd', 'Gundungurra'), (None, 'xre', 'Kreye'), (None, 'xrg', 'Minang'), (None, 'xri', 'Krikati-Timbira'),
+ (None, 'xrm', 'Armazic'), (None, 'xrn', 'Arin'), (None, 'xrr', 'Raetic'), (None, 'xrt', 'Aranama-Tamique'),
+ (None, 'xru', 'Marriammu'), (None, 'xrw', 'Karawa'), (None, 'xsa', 'Sabaean'), (None, 'xsb', 'Sambal'),
+ (None, 'xsc', 'Scythian'), (None, 'xsd', 'Sidetic'), (None, 'xse', 'Sempan'), (None, 'xsh', 'Shamang'),
+ (None, 'xsi', 'Sio'), (None, 'xsj', 'Subi'), (None, 'xsl', 'South Slavey'), (None, 'xsm', 'Kasem'),
+ (None, 'xsn', 'Sanga (Nigeria)'), (None, 'xso', 'Solano'), (None, 'xsp', 'Silopi'), (None, 'xsq', 'Makhuwa-Saka'),
+ (None, 'xsr', 'Sherpa'), (None, 'xss', 'Assan'), (None, 'xsu', 'Sanumá'), (None, 'xsv', 'Sudovian'),
+ (None, 'xsy', 'Saisiyat'), (None, 'xta', 'Alcozauca Mixtec'), (None, 'xtb', 'Chazumba Mixtec'),
+ (None, 'xtc', 'Katcha-Kadugli-Miri'), (None, 'xtd', 'Diuxi-Tilantongo Mixtec'), (None, 'xte', 'Ketengban'),
+ (None, 'xtg', 'Transalpine Gaulish'), (None, 'xth', 'Yitha Yitha'), (None, 'xti', 'Sinicahua Mixtec'),
+ (None, 'xtj', 'San Juan Teita Mixtec'), (None, 'xtl', 'Tijaltepec Mixtec'), (None, 'xtm', 'Magdalena Peñasco Mixtec'),
+ (None, 'xtn', 'Northern Tlaxiaco Mixtec'), (None, 'xto', 'Tokharian A'), (None, 'xtp', 'San Miguel Piedras Mixtec'),
+ (None, 'xtq', 'Tumshuqese'), (None, 'xtr', 'Early Tripuri'), (None, 'xts', 'Sindihui Mixtec'),
+ (None, 'xtt', 'Tacahua Mixtec'), (None, 'xtu', 'Cuyamecalco Mixtec'), (None, 'xtv', 'Thawa'), (None, 'xtw', 'Tawandê'),
+ (None, 'xty', 'Yoloxochitl Mixtec'), (None, 'xua', 'Alu Kurumba'), (None, 'xub', 'Betta Kurumba'),
+ (None, 'xud', 'Umiida'), (None, 'xug', 'Kunigami'), (None, 'xuj', 'Jennu Kurumba'), (None, 'xul', 'Ngunawal'),
+ (None, 'xum', 'Umbrian'), (None, 'xun', 'Unggaranggu'), (None, 'xuo', 'Kuo'), (None, 'xup', 'Upper Umpqua'),
+ (None, 'xur', 'Urartian'), (None, 'xut', 'Kuthant'), (None, 'xuu', 'Kxoe'), (None, 'xve', 'Venetic'),
+ (None, 'xvi', 'Kamviri'), (None, 'xvn', 'Vandalic'), (None, 'xvo', 'Volscian'), (None, 'xvs', 'Vestinian'),
+ (None, 'xwa', 'Kwaza'), (None, 'xwc', 'Woccon'), (None, 'xwd', 'Wadi Wadi'), (None, 'xwe', 'Xwela Gbe'),
+ (None, 'xwg', 'Kwegu'), (None, 'xwj', 'Wajuk'), (None, 'xwk', 'Wangkumara'), (None, 'xwl', 'Western Xwla Gbe'),
+ (None, 'xwo', 'Written Oirat'), (None, 'xwr', 'Kwerba Mamberamo'), (None, 'xwt', 'Wotjobaluk'),
+ (None, 'xww', 'Wemba Wemba'), (None, 'xxb', 'Boro (Ghana)'), (None, 'xxk', "Ke'o"), (None, 'xxm', 'Minkin'),
+ (None, 'xxr', 'Koropó'), (None, 'xxt', 'Tambora'), (None, 'xya', 'Yaygir'), (None, 'xyb', 'Yandjibara'),
+ (None, 'xyj', 'Mayi-Yapi'), (None, 'xyk', 'Mayi-Kulan'), (None, 'xyl', 'Yalakalore'), (None, 'xyt', 'Mayi-Thakurti'),
+ (None, 'xyy', 'Yorta Yorta'), (None, 'xzh', 'Zhang-Zhung'), (None, 'xzm', 'Zemgalian'),
+ (None, 'xzp', 'Ancient Zapotec'), (None, 'yaa', 'Yaminahua'), (None, 'yab', 'Yuhup'),
+ (None, 'yac', 'Pass Valley Yali'), (None, 'yad', 'Yagua'), (None, 'yae', 'Pumé'),
+ (None, 'yaf', 'Yaka (Democratic Republic of Congo)'), (None, 'yag', 'Yámana'), (None, 'yah', 'Yazgulyam'),
+ (None, 'yai', 'Yagnobi'), (None, 'yaj', 'Banda-Yangere'), (None, 'yak', 'Yakama'), (None, 'yal', 'Yalunka'),
+ (None, 'yam', 'Yamba'), (None, 'yan', 'Mayangna'), (None, 'yao', 'Yao'), (None, 'yap', 'Yapese'),
+ (None, 'yaq', 'Yaqui'), (None, 'yar', 'Yabarana'), (None, 'yas', 'Nugunu (Cameroon)'), (None, 'yat', 'Yambeta'),
+ (None, 'yau', 'Yuwana'), (None, 'yav', 'Yangben'), (None, 'yaw', 'Yawalapití'), (None, 'yax', 'Yauma'),
+ (None, 'yay', 'Agwagwune'), (None, 'yaz', 'Lokaa'), (None, 'yba', 'Yala'), (None, 'ybb', 'Yemba'),
+ (None, 'ybe', 'West Yugur'), (None, 'ybh', 'Yakha'), (None, 'ybi', 'Yamphu'), (None, 'ybj', 'Hasha'),
+ (None, 'ybk', 'Bokha'), (None, 'ybl', 'Yukuben'), (None, 'ybm', 'Yaben'), (None, 'ybn', 'Yabaâna'),
+ (None, 'ybo', 'Yabong'), (None, 'ybx', 'Yawiyo'), (None, 'yby', 'Yaweyuha'), (None, 'ych', 'Chesu'),
+ (None, 'ycl', 'Lolopo'), (None, 'ycn', 'Yucuna'), (None, 'ycp', 'Chepya'), (None, 'yda', 'Yanda'),
+ (None, 'ydd', 'Eastern Yiddish'), (None, 'yde', 'Yangum Dey'), (None, 'ydg', 'Yidgha'), (None, 'ydk', 'Yoidik'),
+ (None, 'yea', 'Ravula'), (None, 'yec', 'Yeniche'), (None, 'yee', 'Yimas'), (None, 'yei', 'Yeni'),
+ (None, 'yej', 'Yevanic'), (None, 'yel', 'Yela'), (None, 'yer', 'Tarok'), (None, 'yes', 'Nyankpa'),
+ (None, 'yet', 'Yetfa'), (None, 'yeu', 'Yerukula'), (None, 'yev', 'Yapunda'), (None, 'yey', 'Yeyi'),
+ (None, 'yga', 'Malyangapa'), (None, 'ygi', 'Yiningayi'), (None, 'ygl', 'Yangum Gel'), (None, 'ygm', 'Yagomi'),
+ (None, 'ygp', 'Gepo'), (None, 'ygr', 'Yagaria'), (None, 'ygs', 'Yolŋu Sign Language'), (None, 'ygu', 'Yugul'),
+ (None, 'ygw', 'Yagwoia'), (None, 'yha', 'Baha Buyang'), (None, 'yhd', 'Judeo-Iraqi Arabic'),
+ (None, 'yhl', 'Hlepho Phowa'), (None, 'yhs', 'Yan-nhaŋu Sign Language'), (None, 'yia', 'Yinggarda'),
+ ('yi', 'yid', 'Yiddish'), (None, 'yif', 'Ache'), (None, 'yig', 'Wusa Nasu'), (None, 'yih', 'Western Yiddish'),
+ (None, 'yii', 'Yidiny'), (None, 'yij', 'Yindjibarndi'), (None, 'yik', 'Dongshanba Lalo'),
+ (None, 'yil', 'Yindjilandji'), (None, 'yim', 'Yimchungru Naga'), (None, 'yin', 'Riang Lai'), (None, 'yip', 'Pholo'),
+ (None, 'yiq', 'Miqie'), (None, 'yir', 'North Awyu'), (None, 'yis', 'Yis'), (None, 'yit', 'Eastern Lalu'),
+ (None, 'yiu', 'Awu'), (None, 'yiv', 'Northern Nisu'), (None, 'yix', 'Axi Yi'), (None, 'yiz', 'Azhe'),
+ (None, 'yka', 'Yakan'), (None, 'ykg', 'Northern Yukaghir'), (None, 'yki', 'Yoke'), (None, 'ykk', 'Yakaikeke'),
+ (None, 'ykl', 'Khlula'), (None, 'ykm', 'Kap'), (None, 'ykn', 'Kua-nsi'), (None, 'yko', 'Yasa'),
+ (None, 'ykr', 'Yekora'), (None, 'ykt', 'Kathu'), (None, 'yku', 'Kuamasi'), (None, 'yky', 'Yakoma'),
+ (None, 'yla', 'Yaul'), (None, 'ylb', 'Yaleba'), (None, 'yle', 'Yele'), (None, 'ylg', 'Yelogu'),
+ (None, 'yli', 'Angguruk Yali'), (None, 'yll', 'Yil'), (None, 'ylm', 'Limi'), (None, 'yln', 'Langnian Buyang'),
+ (None, 'ylo', 'Naluo Yi'), (None, 'ylr', 'Yalarnnga'), (None, 'ylu', 'Aribwaung'), (None, 'yly', 'Nyâlayu'),
+ (None, 'ymb', 'Yambes'), (None, 'ymc', 'Southern Muji'), (None, 'ymd', 'Muda'), (None, 'yme', 'Yameo'),
+ (None, 'ymg', 'Yamongeri'), (None, 'ymh', 'Mili'), (None, 'ymi', 'Moji'), (None, 'ymk', 'Makwe'),
+ (None, 'yml', 'Iamalele'), (None, 'ymm', 'Maay'), (None, 'ymn', 'Yamna'), (None, 'ymo', 'Yangum Mon'),
+ (None, 'ymp', 'Yamap'), (None, 'ymq', 'Qila Muji'), (None, 'ymr', 'Malasar'), (None, 'yms', 'Mysian'),
+ (None, 'ymx', 'Northern Muji'), (None, 'ymz', 'Muzi'), (None, 'yna', 'Aluo'), (None, 'ynd', 'Yandruwandha'),
+ (None, 'yne', "Lang'e"), (None, 'yng', 'Yango'), (None, 'ynk', 'Naukan Yupik'), (None, 'ynl', 'Yangulam'),
+ (None, 'ynn', 'Yana'), (None, 'yno', 'Yong'), (None, 'ynq', 'Yendang'), (None, 'yns', 'Yansi'),
+ (None, 'ynu', 'Yahuna'), (None, 'yob', 'Yoba'), (None, 'yog', 'Yogad'), (None, 'yoi', 'Yonaguni'),
+ (None, 'yok', 'Yokuts'), (None, 'yol', 'Yola'), (None, 'yom', 'Yombe'), (None, 'yon', 'Yongkom'),
+ ('yo', 'yor', 'Yoruba'), (None, 'yot', 'Yotti'), (None, 'yox', 'Yoron'), (None, 'yoy', 'Yoy'), (None, 'ypa', 'Phala'),
+ (None, 'ypb', 'Labo Phowa'), (None, 'ypg', 'Phola'), (None, 'yph', 'Phupha'), (None, 'ypm', 'Phuma'),
+ (None, 'ypn', 'Ani Phowa'), (None, 'ypo', 'Alo Phola'), (None, 'ypp', 'Phupa'), (None, 'ypz', 'Phuza'),
+ (None, 'yra', 'Yerakai'), (None, 'yrb', 'Yareba'), (None, 'yre', 'Yaouré'), (None, 'yrk', 'Nenets'),
+ (None, 'yrl', 'Nhengatu'), (None, 'yrm', 'Yirrk-Mel'), (None, 'yrn', 'Yerong'), (None, 'yro', 'Yaroamë'),
+ (None, 'yrs', 'Yarsun'), (None, 'yrw', 'Yarawata'), (None, 'yry', 'Yarluyandi'), (None, 'ysc', 'Yassic'),
+ (None, 'ysd', 'Samatao'), (None, 'ysg', 'Sonaga'), (None, 'ysl', 'Yugoslavian Sign Language'),
+ (None, 'ysm', 'Myanmar Sign Language'), (None, 'ysn', 'Sani'), (None, 'yso', 'Nisi (China)'),
+ (None, 'ysp', 'Southern Lolopo'), (None, 'ysr', 'Sirenik Yupik'), (None, 'yss', 'Yessan-Mayo'), (None, 'ysy', 'Sanie'),
+ (None, 'yta', 'Talu'), (None, 'ytl', 'Tanglang'), (None, 'ytp', 'Thopho'), (None, 'ytw', 'Yout Wam'),
+ (None, 'yty', 'Yatay'), (None, 'yua', 'Yucateco'), (None, 'yub', 'Yugambal'), (None, 'yuc', 'Yuchi'),
+ (None, 'yud', 'Judeo-Tripolitanian Arabic'), (None, 'yue', 'Yue Chinese'), (None, 'yuf', 'Havasupai-Walapai-Yavapai'),
+ (None, 'yug', 'Yug'), (None, 'yui', 'Yurutí'), (None, 'yuj', 'Karkar-Yuri'), (None, 'yuk', 'Yuki'),
+ (None, 'yul', 'Yulu'), (None, 'yum', 'Quechan'), (None, 'yun', 'Bena (Nigeria)'), (None, 'yup', 'Yukpa'),
+ (None, 'yuq', 'Yuqui'), (None, 'yur', 'Yurok'), (None, 'yut', 'Yopno'), (None, 'yuw', 'Yau (Morobe Province)'),
+ (None, 'yux', 'Southern Yukaghir'), (None, 'yuy', 'East Yugur'), (None, 'yuz', 'Yuracare'), (None, 'yva', 'Yawa'),
+ (None, 'yvt', 'Yavitero'), (None, 'ywa', 'Kalou'), (None, 'ywg', 'Yinhawangka'), (None, 'ywl', 'Western Lalu'),
+ (None, 'ywn', 'Yawanawa'), (None, 'ywq', 'Wuding-Luquan Yi'), (None, 'ywr', 'Yawuru'), (None, 'ywt', 'Xishanba Lalo'),
+ (None, 'ywu', 'Wumeng Nasu'), (None, 'yww', 'Yawarawarga'), (None, 'yxa', 'Mayawali'), (None, 'yxg', 'Yagara'),
+ (None, 'yxl', 'Yardliyawarra'), (None, 'yxm', 'Yinwum'), (None, 'yxu', 'Yuyu'), (None, 'yxy', 'Yabula Yabula'),
+ (None, 'yyr', 'Yir Yoront'), (None, 'yyu', 'Yau (Sandaun Province)'), (None, 'yyz', 'Ayizi'),
+ (None, 'yzg', "E'ma Buyang"), (None, 'yzk', 'Zokhuo'), (None, 'zaa', 'Sierra de Juárez Zapotec'),
+ (None, 'zab', 'Western Tlacolula Valley Zapotec'), (None, 'zac', 'Ocotlán Zapotec'), (None, 'zad', 'Cajonos Zapotec'),
+ (None, 'zae', 'Yareni Zapotec'), (None, 'zaf', 'Ayoquesco Zapotec'), (None, 'zag', 'Zaghawa'),
+ (None, 'zah', 'Zangwal'), (None, 'zai', 'Isthmus Zapotec'), (None, 'zaj', 'Zaramo'), (None, 'zak', 'Zanaki'),
+ (None, 'zal', 'Zauzou'), (None, 'zam', 'Miahuatlán Zapotec'), (None, 'zao', 'Ozolotepec Zapotec'),
+ (None, 'zap', 'Zapotec'), (None, 'zaq', 'Aloápam Zapotec'), (None, 'zar', 'Rincón Zapotec'),
+ (None, 'zas', 'Santo Domingo Albarradas Zapotec'), (None, 'zat', 'Tabaa Zapotec'), (None, 'zau', 'Zangskari'),
+ (None, 'zav', 'Yatzachi Zapotec'), (None, 'zaw', 'Mitla Zapotec'), (None, 'zax', 'Xadani Zapotec'),
+ (None, 'zay', 'Zayse-Zergulla'), (None, 'zaz', 'Zari'), (None, 'zba', 'Balaibalan'), (None, 'zbc', 'Central Berawan'),
+ (None, 'zbe', 'East Berawan'), (None, 'zbl', 'Blissymbols'), (None, 'zbt', 'Batui'),
+ (None, 'zbu', 'Bu (Bauchi State)'), (None, 'zbw', 'West Berawan'), (None, 'zca', 'Coatecas Altas Zapotec'),
+ (None, 'zcd', 'Las Delicias Zapotec'), (None, 'zch', 'Central Hongshuihe Zhuang'), (None, 'zdj', 'Ngazidja Comorian'),
+ (None, 'zea', 'Zeeuws'), (None, 'zeg', 'Zenag'), (None, 'zeh', 'Eastern Hongshuihe Zhuang'), (None, 'zen', 'Zenaga'),
+ (None, 'zga', 'Kinga'), (None, 'zgb', 'Guibei Zhuang'), (None, 'zgh', 'Standard Moroccan Tamazight'),
+ (None, 'zgm', 'Minz Zhuang'), (None, 'zgn', 'Guibian Zhuang'), (None, 'zgr', 'Magori'), ('za', 'zha', 'Zhuang'),
+ (None, 'zhb', 'Zhaba'), (None, 'zhd', 'Dai Zhuang'), (None, 'zhi', 'Zhire'), (None, 'zhn', 'Nong Zhuang'),
+ ('zh', 'zho', 'Chinese'), (None, 'zhw', 'Zhoa'), (None, 'zia', 'Zia'), (None, 'zib', 'Zimbabwe Sign Language'),
+ (None, 'zik', 'Zimakani'), (None, 'zil', 'Zialo'), (None, 'zim', 'Mesme'), (None, 'zin', 'Zinza'),
+ (None, 'ziw', 'Zigula'), (None, 'ziz', 'Zizilivakan'), (None, 'zka', 'Kaimbulawa'), (None, 'zkb', 'Koibal'),
+ (None, 'zkd', 'Kadu'), (None, 'zkg', 'Koguryo'), (None, 'zkh', 'Khorezmian'), (None, 'zkk', 'Karankawa'),
+ (None, 'zkn', 'Kanan'), (None, 'zko', 'Kott'), (None, 'zkp', 'São Paulo Kaingáng'), (None, 'zkr', 'Zakhring'),
+ (None, 'zkt', 'Kitan'), (None, 'zku', 'Kaurna'), (None, 'zkv', 'Krevinian'), (None, 'zkz', 'Khazar'),
+ (None, 'zla', 'Zula'), (None, 'zlj', 'Liujiang Zhuang'), (None, 'zlm', 'Malay (individual language)'),
+ (None, 'zln', 'Lianshan Zhuang'), (None, 'zlq', 'Liuqian Zhuang'), (None, 'zma', 'Manda (Australia)'),
+ (None, 'zmb', 'Zimba'), (None, 'zmc', 'Margany'), (None, 'zmd', 'Maridan'), (None, 'zme', 'Mangerr'),
+ (None, 'zmf', 'Mfinu'), (None, 'zmg', 'Marti Ke'), (None, 'zmh', 'Makolkol'), (None, 'zmi', 'Negeri Sembilan Malay'),
+ (None, 'zmj', 'Maridjabin'), (None, 'zmk', 'Mandandanyi'), (None, 'zml', 'Matngala'), (None, 'zmm', 'Marimanindji'),
+ (None, 'zmn', 'Mbangwe'), (None, 'zmo', 'Molo'), (None, 'zmp', 'Mpuono'), (None, 'zmq', 'Mituku'),
+ (None, 'zmr', 'Maranunggu'), (None, 'zms', 'Mbesa'), (None, 'zmt', 'Maringarr'), (None, 'zmu', 'Muruwari'),
+ (None, 'zmv', 'Mbariman-Gudhinma'), (None, 'zmw', 'Mbo (Democratic Republic of Congo)'), (None, 'zmx', 'Bomitaba'),
+ (None, 'zmy', 'Mariyedi'), (None, 'zmz', 'Mbandja'), (None, 'zna', 'Zan Gula'),
+ (None, 'zne', 'Zande (individual language)'), (None, 'zng', 'Mang'), (None, 'znk', 'Manangkari'),
+ (None, 'zns', 'Mangas'), (None, 'zoc', 'Copainalá Zoque'), (None, 'zoh', 'Chimalapa Zoque'), (None, 'zom', 'Zou'),
+ (None, 'zoo', 'Asunción Mixtepec Zapotec'), (None, 'zoq', 'Tabasco Zoque'), (None, 'zor', 'Rayón Zoque'),
+ (None, 'zos', 'Francisco León Zoque'), (None, 'zpa', 'Lachiguiri Zapotec'), (None, 'zpb', 'Yautepec Zapotec'),
+ (None, 'zpc', 'Choapan Zapotec'), (None, 'zpd', 'Southeastern Ixtlán Zapotec'), (None, 'zpe', 'Petapa Zapotec'),
+ (None, 'zpf', 'San Pedro Quiatoni Zapotec'), (None, 'zpg', 'Guevea De Humboldt Zapotec'),
+ (None, 'zph', 'Totomachapan Zapotec'), (None, 'zpi', 'Santa María Quiegolani Zapotec'),
+ (None, 'zpj', 'Quiavicuzas Zapotec'), (None, 'zpk', 'Tlacolulita Zapotec'), (None, 'zpl', 'Lachixío Zapotec'),
+ (None, 'zpm', 'Mixtepec Zapotec'), (None, 'zpn', 'Santa Inés Yatzechi Zapotec'), (None, 'zpo', 'Amatlán Zapotec'),
+ (None, 'zpp', 'El Alto Zapotec'), (None, 'zpq', 'Zoogocho Zapotec'), (None, 'zpr', 'Santiago Xanica Zapotec'),
+ (None, 'zps', 'Coatlán Zapotec'), (None, 'zpt', 'San Vicente Coatlán Zapotec'), (None, 'zpu', 'Yalálag Zapotec'),
+ (None, 'zpv', 'Chichicapan Zapotec'), (None, 'zpw', 'Zaniza Zapotec'), (None, 'zpx', 'San Baltazar Loxicha Zapotec'),
+ (None, 'zpy', 'Mazaltepec Zapotec'), (None, 'zpz', 'Texmelucan Zapotec'), (None, 'zqe', 'Qiubei Zhuang'),
+ (None, 'zra', 'Kara (Korea)'), (None, 'zrg', 'Mirgan'), (None, 'zrn', 'Zerenkel'), (None, 'zro', 'Záparo'),
+ (None, 'zrp', 'Zarphatic'), (None, 'zrs', 'Mairasi'), (None, 'zsa', 'Sarasira'), (None, 'zsk', 'Kaskean'),
+ (None, 'zsl', 'Zambian Sign Language'), (None, 'zsm', 'Standard Malay'), (None, 'zsr', 'Southern Rincon Zapotec'),
+ (None, 'zsu', 'Sukurum'), (None, 'zte', 'Elotepec Zapotec'), (None, 'ztg', 'Xanaguía Zapotec'),
+ (None, 'ztl', 'Lapaguía-Guivini Zapotec'), (None, 'ztm', 'San Agustín Mixtepec Zapotec'),
+ (None, 'ztn', 'Santa Catarina Albarradas Zapotec'), (None, 'ztp', 'Loxicha Zapotec'),
+ (None, 'ztq', 'Quioquitani-Quierí Zapotec'), (None, 'zts', 'Tilquiapan Zapotec'), (None, 'ztt', 'Tejalapan Zapotec'),
+ (None, 'ztu', 'Güilá Zapotec'), (None, 'ztx', 'Zaachila Zapotec'), (None, 'zty', 'Yatee Zapotec'),
+ (None, 'zua', 'Zeem'), (None, 'zuh', 'Tokano'), ('zu', 'zul', 'Zulu'), (None, 'zum', 'Kumzari'), (None, 'zun', 'Zuni'),
+ (None, 'zuy', 'Zumaya'), (None, 'zwa', 'Zay'), (None, 'zxx', 'No linguistic content'), (None, 'zyb', 'Yongbei Zhuang'),
+ (None, 'zyg', 'Yang Zhuang'), (None, 'zyj', 'Youjiang Zhuang'), (None, 'zyn', 'Yongnan Zhuang'),
+ (None, 'zyp', 'Zyphe Chin'), (None, 'zza', 'Zaza'), (None, 'zzj', 'Zuojiang Zhuang'))
+LANGUAGE_FAMILIES = ('aav', 'afa', 'alg', 'alv', 'apa', 'aqa', 'aql', 'art', 'ath', 'auf', 'aus', 'awd', 'azc', 'bad', 'bai', 'bat', 'ber',
+ 'bih', 'bnt', 'btk', 'cai', 'cau', 'cba', 'ccn', 'ccs', 'cdc', 'cdd', 'cel', 'cmc', 'cpe', 'cpf', 'cpp', 'crp', 'csu',
+ 'cus', 'day', 'dmn', 'dra', 'egx', 'esx', 'euq', 'fiu', 'fox', 'gem', 'gme', 'gmq', 'gmw', 'grk', 'hmx', 'hok', 'hyx',
+ 'iir', 'ijo', 'inc', 'ine', 'ira', 'iro', 'itc', 'jpx', 'kar', 'kdo', 'khi', 'kro', 'map', 'mkh', 'mno', 'mun', 'myn',
+ 'nah', 'nai', 'ngf', 'nic', 'nub', 'omq', 'omv', 'oto', 'paa', 'phi', 'plf', 'poz', 'pqe', 'pqw', 'pra', 'qwe', 'roa',
+ 'sai', 'sal', 'sdv', 'sem', 'sgn', 'sio', 'sit', 'sla', 'smi', 'son', 'sqj', 'ssa', 'syd', 'tai', 'tbq', 'trk', 'tup',
+ 'tut', 'tuw', 'urj', 'wak', 'wen', 'xgn', 'xnd', 'ypk', 'zhx', 'zle', 'zls', 'zlw', 'znd')
+CURRENCIES = ('AED', 'AFN', 'ALL', 'AMD', 'ANG', 'AOA', 'ARS', 'AUD', 'AWG', 'AZN', 'BAM', 'BBD', 'BDT', 'BGN', 'BHD', 'BIF', 'BMD',
+ 'BND', 'BOB', 'BOV', 'BRL', 'BSD', 'BTN', 'BWP', 'BYN', 'BZD', 'CAD', 'CDF', 'CHE', 'CHF', 'CHW', 'CLF', 'CLP', 'CNY',
+ 'COP', 'COU', 'CRC', 'CUC', 'CUP', 'CVE', 'CZK', 'DJF', 'DKK', 'DOP', 'DZD', 'EGP', 'ERN', 'ETB', 'EUR', 'FJD', 'FKP',
+ 'GBP', 'GEL', 'GHS', 'GIP', 'GMD', 'GNF', 'GTQ', 'GYD', 'HKD', 'HNL', 'HRK', 'HTG', 'HUF', 'IDR', 'ILS', 'INR', 'IQD',
+ 'IRR', 'ISK', 'JMD', 'JOD', 'JPY', 'KES', 'KGS', 'KHR', 'KMF', 'KPW', 'KRW', 'KWD', 'KYD', 'KZT', 'LAK', 'LBP', 'LKR',
+ 'LRD', 'LSL', 'LYD', 'MAD', 'MDL', 'MGA', 'MKD', 'MMK', 'MNT', 'MOP', 'MRU', 'MUR', 'MVR', 'MWK', 'MXN', 'MXV', 'MYR',
+ 'MZN', 'NAD', 'NGN', 'NIO', 'NOK', 'NPR', 'NZD', 'OMR', 'PAB', 'PEN', 'PGK', 'PHP', 'PKR', 'PLN', 'PYG', 'QAR', 'RON',
+ 'RSD', 'RUB', 'RWF', 'SAR', 'SBD', 'SCR', 'SDG', 'SEK', 'SGD', 'SHP', 'SLE', 'SLL', 'SOS', 'SRD', 'SSP', 'STN', 'SVC',
+ 'SYP', 'SZL', 'THB', 'TJS', 'TMT', 'TND', 'TOP', 'TRY', 'TTD', 'TWD', 'TZS', 'UAH', 'UGX', 'USD', 'USN', 'UYI', 'UYU',
+ 'UYW', 'UZS', 'VED', 'VES', 'VND', 'VUV', 'WST', 'XAF', 'XAG', 'XAU', 'XBA', 'XBB', 'XBC', 'XBD', 'XCD', 'XDR', 'XOF',
+ 'XPD', 'XPF', 'XPT', 'XSU', 'XTS', 'XUA', 'XXX', 'YER', 'ZAR', 'ZMW', 'ZWL')
+SCRIPTS = ('Adlm', 'Afak', 'Aghb', 'Ahom', 'Arab', 'Aran', 'Armi', 'Armn', 'Avst', 'Bali', 'Bamu', 'Bass', 'Batk', 'Beng', 'Bhks',
+ 'Blis', 'Bopo', 'Brah', 'Brai', 'Bugi', 'Buhd', 'Cakm', 'Cans', 'Cari', 'Cham', 'Cher', 'Cirt', 'Copt', 'Cprt', 'Cyrl',
+ 'Cyrs', 'Deva', 'Dsrt', 'Dupl', 'Egyd', 'Egyh', 'Egyp', 'Elba', 'Ethi', 'Geok', 'Geor', 'Glag', 'Goth', 'Gran', 'Grek',
+ 'Gujr', 'Guru', 'Hanb', 'Hang', 'Hani', 'Hano', 'Hans', 'Hant', 'Hatr', 'Hebr', 'Hira', 'Hluw', 'Hmng', 'Hrkt', 'Hung',
+ 'Inds', 'Ital', 'Jamo', 'Java', 'Jpan', 'Jurc', 'Kali', 'Kana', 'Khar', 'Khmr', 'Khoj', 'Kitl', 'Kits', 'Knda', 'Kore',
+ 'Kpel', 'Kthi', 'Lana', 'Laoo', 'Latf', 'Latg', 'Latn', 'Leke', 'Lepc', 'Limb', 'Lina', 'Linb', 'Lisu', 'Loma', 'Lyci',
+ 'Lydi', 'Mahj', 'Mand', 'Mani', 'Marc', 'Maya', 'Mend', 'Merc', 'Mero', 'Mlym', 'Modi', 'Mong', 'Moon', 'Mroo', 'Mtei',
+ 'Mult', 'Mymr', 'Narb', 'Nbat', 'Newa', 'Nkgb', 'Nkoo', 'Nshu', 'Ogam', 'Olck', 'Orkh', 'Orya', 'Osge', 'Osma', 'Palm',
+ 'Pauc', 'Perm', 'Phag', 'Phli', 'Phlp', 'Phlv', 'Phnx', 'Piqd', 'Plrd', 'Prti', 'Qaaa', 'Qabx', 'Rjng', 'Roro', 'Runr',
+ 'Samr', 'Sara', 'Sarb', 'Saur', 'Sgnw', 'Shaw', 'Shrd', 'Sidd', 'Sind', 'Sinh', 'Sora', 'Sund', 'Sylo', 'Syrc', 'Syre',
+ 'Syrj', 'Syrn', 'Tagb', 'Takr', 'Tale', 'Talu', 'Taml', 'Tang', 'Tavt', 'Telu', 'Teng', 'Tfng', 'Tglg', 'Thaa', 'Thai',
+ 'Tibt', 'Tirh', 'Ugar', 'Vaii', 'Visp', 'Wara', 'Wole', 'Xpeo', 'Xsux', 'Yiii', 'Zinh', 'Zmth', 'Zsye', 'Zsym', 'Zxxx',
+ 'Zyyy', 'Zzzz')
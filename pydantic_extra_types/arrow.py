@@ -0,0 +1,427 @@
+"""The `pydantic_extra_types.arrow` module provides the [`ArrowTable`][pydantic_extra_types.arrow.ArrowTable]
+and [`ArrowArray`][pydantic_extra_types.arrow.ArrowArray] data types, the Arrow siblings of
+[`PandasDataFrame`][pydantic_extra_types.pandas.PandasDataFrame] and
+[`PandasSeries`][pydantic_extra_types.pandas.PandasSeries].
+
+They hold Arrow data as it is: tables, record batches and arrays are validated on their Arrow buffers
+with `pyarrow.compute`, and pandas objects backed by Arrow dtypes are wrapped without copying their
+values. In JSON mode they serialize to the
+[Arrow IPC stream format](https://arrow.apache.org/docs/format/Columnar.html#ipc-streaming-format),
+so frames can be passed between processes without pickle or NumPy copies.
+
+This module depends on the [pyarrow](https://pypi.org/project/pyarrow/) package.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import sys
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Optional
+
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic_core import PydanticCustomError, core_schema
+
+from pydantic_extra_types._frames import ColumnError, check_required_columns, column_values_error
+
+try:
+    import pyarrow as pa  # type: ignore[import-untyped]
+    import pyarrow.compute as pc  # type: ignore[import-untyped]
+except ModuleNotFoundError as e:
+    raise RuntimeError(
+        '`ArrowTable` requires "pyarrow" to be installed. You can install it with "pip install pyarrow"'
+    ) from e
+
+IPC_MEDIA_TYPE = 'application/vnd.apache.arrow.stream'
+"""The media type of the Arrow IPC stream format, which the types serialize to in JSON mode."""
+
+
+def to_ipc(value: Any) -> bytes:
+    """Serialize an Arrow table, record batch or array to the Arrow IPC stream format.
+
+    Arrays are written as a table with a single `values` column.
+
+    Args:
+        value: A `pyarrow.Table`, `pyarrow.RecordBatch`, `pyarrow.Array` or `pyarrow.ChunkedArray`.
+
+    Returns:
+        The IPC stream.
+    """
+    if isinstance(value, (pa.Array, pa.ChunkedArray)):
+        value = pa.table([value], names=['values'])
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, value.schema) as writer:
+        writer.write(value)
+    return sink.getvalue().to_pybytes()  # type: ignore[no-any-return]
+
+
+def _read_ipc(value: bytes | bytearray | memoryview | str) -> Any:
+    """Read a table from an IPC stream, or from its base64 encoding as found in JSON."""
+    if isinstance(value, str):
+        try:
+            value = base64.b64decode(value, validate=True)
+        except binascii.Error as e:
+            raise PydanticCustomError('value_error', 'value is not valid base64: {error}', {'error': str(e)}) from e
+    try:
+        # the table points into `value`, nothing is copied
+        return pa.ipc.open_stream(pa.py_buffer(value)).read_all()
+    except (pa.ArrowException, OSError) as e:  # malformed messages raise `OSError`
+        raise PydanticCustomError(
+            'value_error', 'value is not a valid Arrow IPC stream: {error}', {'error': str(e)}
+        ) from e
+
+
+def _serialize_ipc(value: Any) -> str:
+    return base64.b64encode(to_ipc(value)).decode()
+
+
+def _is_arrow_backed(dtype: Any, pd: Any) -> bool:
+    return isinstance(dtype, pd.ArrowDtype) or (
+        isinstance(dtype, pd.StringDtype) and dtype.storage in ('pyarrow', 'pyarrow_numpy')
+    )
+
+
+def _check_arrow_backed(columns: list[Any]) -> None:
+    if columns:
+        raise PydanticCustomError(
+            'value_error',
+            'pandas columns are not Arrow-backed: {columns}',
+            {'columns': ', '.join(map(str, columns))},
+        )
+
+
+def _as_table(value: Any) -> Any:
+    if isinstance(value, (pa.Table, pa.RecordBatch)):
+        return value
+    if isinstance(value, (bytes, bytearray, memoryview, str)):
+        return _read_ipc(value)
+
+    # pandas is optional, and `value` can only be a DataFrame if it has been imported
+    pd = sys.modules.get('pandas')
+    if pd is not None and isinstance(value, pd.DataFrame):
+        _check_arrow_backed([column for column, dtype in value.dtypes.items() if not _is_arrow_backed(dtype, pd)])
+        return pa.Table.from_pandas(value, preserve_index=False)
+
+    raise PydanticCustomError(
+        'value_error',
+        'value is not a valid Arrow table',
+    )
+
+
+def _as_array(value: Any) -> Any:
+    if isinstance(value, (pa.Array, pa.ChunkedArray)):
+        return value
+    if isinstance(value, (bytes, bytearray, memoryview, str)):
+        table = _read_ipc(value)
+        # a stream without columns falls through to the error below
+        if table.num_columns:
+            return table.column(0)
+
+    pd = sys.modules.get('pandas')
+    if pd is not None and isinstance(value, pd.Series):
+        _check_arrow_backed([] if _is_arrow_backed(value.dtype, pd) else [value.name])
+        return value.array.__arrow_array__()
+
+    raise PydanticCustomError(
+        'value_error',
+        'value is not a valid Arrow array',
+    )
+
+
+def _arrow_schema(validate: Callable[[Any], Any]) -> core_schema.CoreSchema:
+    return core_schema.no_info_plain_validator_function(
+        validate,
+        serialization=core_schema.plain_serializer_function_ser_schema(_serialize_ipc, when_used='json'),
+    )
+
+
+def _ipc_json_schema(title: str) -> dict[str, Any]:
+    return {'type': 'string', 'contentEncoding': 'base64', 'contentMediaType': IPC_MEDIA_TYPE, 'title': title}
+
+
+def _duplicated(values: Any) -> Any:
+    """Whether each value repeats the value of an earlier row, like `pandas.Series.duplicated`."""
+    rows = pc.subtract(pc.cumulative_sum(pa.repeat(1, len(values))), 1)
+    first_rows = (
+        pa.table({'value': values, 'row': rows}).group_by('value', use_threads=False).aggregate([('row', 'min')])
+    )
+    return pc.invert(pc.is_in(rows, value_set=first_rows['row_min']))
+
+
+def _bound(bound: Any, type_: Any) -> Any:
+    """The scalar to compare the values of a column of *type_* with a `min` or `max` *bound*.
+
+    Bounds that Arrow compares with the values as they are, e.g. `0.5` for an integer column, are kept.
+    Others are cast to the column type, e.g. `'2025-01-01'` for a timestamp column, but never to a
+    string, which would compare numbers as text.
+
+    Raises:
+        pa.ArrowException: If the values cannot be compared with the bound.
+    """
+    if pa.types.is_dictionary(type_):
+        type_ = type_.value_type
+    scalar = bound if isinstance(bound, pa.Scalar) else pa.scalar(bound)
+    # comparing an empty array finds a missing kernel without touching any values
+    empty = pa.array([], type=type_)
+    try:
+        pc.less(empty, scalar)
+    except pa.ArrowNotImplementedError:
+        if pa.types.is_string(type_) or pa.types.is_large_string(type_) or pa.types.is_binary(type_):
+            raise
+        scalar = scalar.cast(type_)
+        pc.less(empty, scalar)
+    return scalar
+
+
+class _Constraints:
+    """Checks the declarative column constraints of an Arrow table with `pyarrow.compute` kernels."""
+
+    def __init__(
+        self,
+        types: Mapping[str, Any] | None = None,
+        non_null: list[str] | None = None,
+        unique: list[str] | None = None,
+        min: Mapping[str, Any] | None = None,
+        max: Mapping[str, Any] | None = None,
+        categories: Mapping[str, Collection[Any]] | None = None,
+    ) -> None:
+        self.types = {
+            column: pa.type_for_alias(type_) if isinstance(type_, str) else type_
+            for column, type_ in (types or {}).items()
+        }
+        self.non_null = frozenset(non_null or ())
+        self.unique = frozenset(unique or ())
+        self.min = dict(min or {})
+        self.max = dict(max or {})
+        self.categories = {column: list(values) for column, values in (categories or {}).items()}
+        self.columns = list(
+            dict.fromkeys([*self.types, *(non_null or ()), *(unique or ()), *self.min, *self.max, *self.categories])
+        )
+        # bounds on columns of a declared type are checked once, rather than failing every table
+        for name, bounds in (('min', self.min), ('max', self.max)):
+            for column, bound in bounds.items():
+                if column in self.types:
+                    try:
+                        _bound(bound, self.types[column])
+                    except pa.ArrowException as e:
+                        raise ValueError(
+                            f'{name} bound {bound!r} of column {column!r} cannot be compared with {self.types[column]}'
+                        ) from e
+
+    def errors(self, table: Any) -> list[ColumnError]:
+        return [error for column in self.columns for error in self._column_errors(column, table.column(column))]
+
+    def _column_errors(self, column: str, values: Any) -> list[ColumnError]:
+        expected = self.types.get(column)
+        if expected is not None and values.type != expected:
+            # the other constraints assume the declared type, so they are not checked
+            return [ColumnError(column, 'dtype', [], {'expected': str(expected), 'actual': str(values.type)})]
+        if pa.types.is_dictionary(values.type):
+            # categorical columns are checked on their values, the kernels do not all take dictionaries
+            values = values.cast(values.type.value_type)
+
+        checks: list[tuple[str, Any, Optional[dict[str, Any]]]] = []
+        if column in self.non_null and values.null_count:
+            checks.append(('missing', pc.is_null(values), None))
+        try:
+            if column in self.unique and pc.count_distinct(values, mode='all').as_py() < len(values):
+                checks.append(('duplicate', _duplicated(values), None))
+            # missing values compare null, they are left to `non_null`
+            if column in self.min:
+                low = _bound(self.min[column], values.type)
+                checks.append(('greater_than_equal', pc.less(values, low), {'ge': self.min[column]}))
+            if column in self.max:
+                high = _bound(self.max[column], values.type)
+                checks.append(('less_than_equal', pc.greater(values, high), {'le': self.max[column]}))
+            if column in self.categories:
+                expected_values = self.categories[column]
+                allowed = pc.is_in(values, value_set=pa.array(expected_values, type=values.type))
+                checks.append(
+                    ('category', pc.and_(pc.invert(allowed), pc.is_valid(values)), {'expected': expected_values})
+                )
+        except pa.ArrowException:  # e.g. strings compared to a number
+            return [ColumnError(column, 'dtype', [], {'actual': str(values.type)})]
+
+        errors = []
+        for error_type, mask, ctx in checks:
+            rows = pc.indices_nonzero(pc.fill_null(mask, False))
+            if len(rows):
+                errors.append(ColumnError(column, error_type, rows.to_pylist(), ctx))
+        return errors
+
+
+def _validate_table(required_columns: list[str] | None, constraints: _Constraints, value: Any) -> Any:
+    """Validate that *value* is, or can be wrapped as, an Arrow table or record batch, that it contains
+    *required_columns* and the constrained columns, and that their values are valid."""
+    table = _as_table(value)
+    check_required_columns('Table', required_columns, constraints.columns, table.schema.names)
+    errors = constraints.errors(table)
+    if errors:
+        raise column_values_error('Table', errors)
+    return table
+
+
+class ArrowTable:
+    """A type that validates an Arrow table, a `pyarrow.Table` or `pyarrow.RecordBatch`.
+
+    Tables and record batches are returned as they are. pandas DataFrames whose columns all have
+    Arrow-backed dtypes, e.g. `int64[pyarrow]` or the pyarrow `str` dtype, are wrapped in a
+    `pyarrow.Table` without copying their values (their index is dropped), and bytes or base64
+    strings are read as an Arrow IPC stream. In JSON mode, the table serializes to the base64 of
+    its IPC stream.
+
+    Like [`PandasDataFrame`][pydantic_extra_types.pandas.PandasDataFrame], subclasses can require
+    columns and constrain them, see
+    [`ArrowTableValidator`][pydantic_extra_types.arrow.ArrowTableValidator].
+
+    ## Examples
+
+    ```python
+    import pyarrow as pa
+    from pydantic import BaseModel
+    from pydantic_extra_types.arrow import ArrowTable
+
+
+    class OrderTable(ArrowTable):
+        types = {'id': 'int64', 'price': 'double'}
+        unique = ['id']
+        min = {'price': 0}
+
+
+    class Model(BaseModel):
+        orders: OrderTable
+
+
+    m = Model(orders=pa.table({'id': [1, 2], 'price': [9.5, 2.0]}))
+    payload = m.model_dump_json()  # the orders as a base64 IPC stream
+    assert Model.model_validate_json(payload).orders.equals(m.orders)
+    ```
+    """
+
+    required_columns: list[str] | None = None
+    """An optional list of column names that the table must contain."""
+    types: Mapping[str, Any] | None = None
+    """An optional mapping of column names to their exact Arrow type, a `pyarrow.DataType` or its alias."""
+    non_null: list[str] | None = None
+    """An optional list of column names that must not contain nulls."""
+    unique: list[str] | None = None
+    """An optional list of column names whose values must not repeat."""
+    min: Mapping[str, Any] | None = None
+    """An optional mapping of column names to the smallest value allowed, inclusive."""
+    max: Mapping[str, Any] | None = None
+    """An optional mapping of column names to the largest value allowed, inclusive."""
+    categories: Mapping[str, Collection[Any]] | None = None
+    """An optional mapping of column names to the values allowed. Nulls are always allowed,
+    see `non_null`. The constrained columns are required too."""
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        constraints = _Constraints(cls.types, cls.non_null, cls.unique, cls.min, cls.max, cls.categories)
+        return _arrow_schema(partial(_validate_table, cls.required_columns, constraints))
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> dict[str, Any]:
+        return _ipc_json_schema('ArrowTable')
+
+
+@dataclass(frozen=True)
+class ArrowTableValidator:
+    """An annotation to validate Arrow tables with column constraints.
+
+    The constraints are checked with `pyarrow.compute` kernels on the Arrow buffers, and every
+    failure is reported in a single error, with the number of failing rows of each column and a
+    sample of their positions.
+
+    Example:
+        ```python
+        from typing import Annotated
+        import pyarrow as pa
+        from pydantic_extra_types.arrow import ArrowTableValidator
+
+        OrderTable = Annotated[
+            pa.Table,
+            ArrowTableValidator(
+                types={'id': pa.int64(), 'price': 'double'},
+                non_null=['id', 'price'],
+                unique=['id'],
+                min={'price': 0},
+                categories={'status': ['open', 'paid', 'refunded']},
+            ),
+        ]
+        ```
+    """
+
+    required_columns: list[str] | None = None
+    """An optional list of column names that the table must contain."""
+    types: Mapping[str, Any] | None = None
+    """An optional mapping of column names to their exact Arrow type, a `pyarrow.DataType` or its alias."""
+    non_null: list[str] | None = None
+    """An optional list of column names that must not contain nulls."""
+    unique: list[str] | None = None
+    """An optional list of column names whose values must not repeat."""
+    min: Mapping[str, Any] | None = None
+    """An optional mapping of column names to the smallest value allowed, inclusive."""
+    max: Mapping[str, Any] | None = None
+    """An optional mapping of column names to the largest value allowed, inclusive."""
+    categories: Mapping[str, Collection[Any]] | None = None
+    """An optional mapping of column names to the values allowed. Nulls are always allowed,
+    see `non_null`. The constrained columns are required too."""
+
+    def __get_pydantic_core_schema__(self, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return _arrow_schema(
+            partial(
+                _validate_table,
+                self.required_columns,
+                _Constraints(self.types, self.non_null, self.unique, self.min, self.max, self.categories),
+            )
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> dict[str, Any]:
+        return _ipc_json_schema('ArrowTable')
+
+    def __hash__(self) -> int:
+        return super().__hash__()
+
+
+class ArrowArray:
+    """A type that validates an Arrow array, a `pyarrow.Array` or `pyarrow.ChunkedArray`.
+
+    Arrays are returned as they are. pandas Series with an Arrow-backed dtype are wrapped in a
+    `pyarrow.ChunkedArray` without copying their values, and bytes or base64 strings are read as
+    an Arrow IPC stream of a single column. In JSON mode, the array serializes to the base64 of the
+    IPC stream of a table with a single `values` column.
+
+    ## Examples
+
+    ```python
+    import pyarrow as pa
+    from pydantic import BaseModel
+    from pydantic_extra_types.arrow import ArrowArray
+
+
+    class Model(BaseModel):
+        prices: ArrowArray
+
+
+    m = Model(prices=pa.array([9.5, 2.0]))
+    print(m.prices)
+    ```
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return _arrow_schema(_as_array)
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> dict[str, Any]:
+        return _ipc_json_schema('ArrowArray')
@@ -11,37 +11,41 @@ from __future__ import annotations
 
 import math
 import re
+from collections.abc import Sequence
 from colorsys import hls_to_rgb, rgb_to_hls
-from typing import Any, Callable, Literal, Union, cast
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable, Literal, NamedTuple, Optional, Union, cast
 
 from pydantic import GetJsonSchemaHandler
 from pydantic._internal import _repr
 from pydantic.json_schema import JsonSchemaValue
 from pydantic_core import CoreSchema, PydanticCustomError, core_schema
 
+from pydantic_extra_types._cache import ParseCache, ParseCacheInfo
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
 ColorTuple = Union[tuple[int, int, int], tuple[int, int, int, float]]
 ColorType = Union[ColorTuple, str, 'Color']
 HslColorTuple = Union[tuple[float, float, float], tuple[float, float, float, float]]
 
 
-class RGBA:
-    """Internal use only as a representation of a color."""
-
-    __slots__ = 'r', 'g', 'b', 'alpha', '_tuple'
-
-    def __init__(self, r: float, g: float, b: float, alpha: float | None):
-        self.r = r
-        self.g = g
-        self.b = b
-        self.alpha = alpha
+class RGBA(NamedTuple):
+    """Internal use only as a representation of a color.
 
-        self._tuple: tuple[float, float, float, float | None] = (r, g, b, alpha)
+    A named tuple holds the channels once, where separate attributes and a tuple for indexing held
+    them twice. Instances are shared between `Color` objects by the parse cache.
+    """
 
-    def __getitem__(self, item: Any) -> Any:
-        return self._tuple[item]
+    r: float
+    g: float
+    b: float
+    alpha: Optional[float]
 
 
-# these are not compiled here to avoid import slowdown, they'll be compiled the first time they're used, then cached
+# these are not compiled here to avoid import slowdown, they're compiled the first time they're used by `parse_str`
 _r_255 = r'(\d{1,3}(?:\.\d+)?)'
 _r_comma = r'\s*,\s*'
 _r_alpha = r'(\d(?:\.\d+)?|\.\d+|\d{1,2}%)'
@@ -72,9 +76,9 @@ class Color(_repr.Representation):
         self._rgba: RGBA
         self._original: ColorType
         if isinstance(value, (tuple, list)):
-            self._rgba = parse_tuple(value)
+            self._rgba = _parse_tuple_cached(value)
         elif isinstance(value, str):
-            self._rgba = parse_str(value)
+            self._rgba = _parse_str_cached(value)
         elif isinstance(value, Color):
             self._rgba = value._rgba
             value = value._original
@@ -125,6 +129,87 @@ class Color(_repr.Representation):
             else:
                 raise ValueError('no named color found, use fallback=True, as_hex() or as_rgb()')
 
+    def as_nearest_named(self, metric: Literal['rgb', 'lab', 'ciede2000'] = 'rgb') -> str:
+        """Returns the name of the named color closest to this color, ignoring the alpha channel.
+
+        Colors found in the `COLORS_BY_VALUE` dictionary get the same name as from `as_named`.
+
+        Args:
+            metric: How to measure the difference between two colors.
+
+                - `'rgb'` (default): The Euclidean distance between RGB values, the fastest.
+                - `'lab'`: The Euclidean distance in CIELAB space (CIE76), closer to perceived differences.
+                - `'ciede2000'`: The CIEDE2000 color difference, the closest to perceived differences
+                    and the slowest.
+
+        Returns:
+            The name of the closest color in `COLORS_BY_VALUE`.
+
+        Raises:
+            ValueError: If `metric` is not one of the above.
+        """
+        names, palette_rgb, palette_lab = _named_palette()
+        rgb = (self._rgba.r * 255, self._rgba.g * 255, self._rgba.b * 255)
+        if metric == 'rgb':
+            distances = [_squared_distance(rgb, other) for other in palette_rgb]
+        elif metric == 'lab':
+            lab = _rgb_to_lab(*rgb)
+            distances = [_squared_distance(lab, other) for other in palette_lab]
+        elif metric == 'ciede2000':
+            lab = _rgb_to_lab(*rgb)
+            distances = [_ciede2000(lab, other) for other in palette_lab]
+        else:
+            raise ValueError(f"metric must be 'rgb', 'lab' or 'ciede2000', got {metric!r}")
+        return names[distances.index(min(distances))]
+
+    @classmethod
+    def nearest_named_array(
+        cls, values: Any, metric: Literal['rgb', 'lab', 'ciede2000'] = 'rgb'
+    ) -> npt.NDArray[np.str_]:
+        """Vectorized `as_nearest_named` over an array of RGB values, such as the pixels of an image.
+
+        Each distinct color is looked up once, so images with large areas of the same color cost
+        little more than their number of distinct colors.
+
+        Args:
+            values: An array of shape `(..., 3)`, or `(..., 4)` with an alpha channel that is ignored,
+                of channel values between 0 and 255, e.g. an `(height, width, 3)` `uint8` image.
+            metric: How to measure the difference between two colors, as for `as_nearest_named`.
+
+        Returns:
+            An array of shape `values.shape[:-1]` with the name of the closest color to each value.
+
+        Raises:
+            ValueError: If `metric` is unknown, or `values` has the wrong shape or values out of range.
+        """
+        try:
+            import numpy as np
+        except ModuleNotFoundError as e:  # pragma: no cover
+            raise RuntimeError(
+                '`Color.nearest_named_array` requires "numpy" to be installed.'
+                ' You can install it with "pip install numpy".'
+            ) from e
+
+        if metric not in {'rgb', 'lab', 'ciede2000'}:
+            raise ValueError(f"metric must be 'rgb', 'lab' or 'ciede2000', got {metric!r}")
+        array = np.asarray(values)
+        if array.ndim == 0 or array.shape[-1] not in {3, 4}:
+            raise ValueError(f'values must have shape (..., 3) or (..., 4), got {array.shape}')
+        rgb = array[..., :3].reshape(-1, 3)
+        if rgb.size and (rgb.min() < 0 or rgb.max() > 255):
+            raise ValueError('values must be between 0 and 255')
+
+        if np.issubdtype(rgb.dtype, np.integer):
+            packed = (rgb[:, 0].astype(np.int32) << 16) | (rgb[:, 1].astype(np.int32) << 8) | rgb[:, 2]
+            packed, inverse = np.unique(packed, return_inverse=True)
+            distinct = np.stack([packed >> 16, (packed >> 8) & 0xFF, packed & 0xFF], axis=1).astype(np.float64)
+        else:
+            distinct, inverse = np.unique(rgb.astype(np.float64), axis=0, return_inverse=True)
+
+        names, palette_rgb, palette_lab = _named_palette_arrays()
+        nearest = _nearest_indices(distinct, metric, palette_rgb, palette_lab)
+        return names[nearest[inverse.reshape(-1)]].reshape(array.shape[:-1])
+
     def as_hex(self, format: Literal['short', 'long'] = 'short') -> str:
         """Returns the hexadecimal representation of the color.
 
@@ -235,6 +320,288 @@ class Color(_repr.Representation):
         return hash(self.as_rgb_tuple())
 
 
+class ColorArray(_repr.Representation):
+    """Represents many colors at once, for converting them in bulk.
+
+    The colors are held in a contiguous `(N, 4)` `float64` NumPy array of red, green, blue and alpha,
+    each between 0 and 1 like the channels of `Color`. The alpha channel is `NaN` for colors without
+    one, where `Color` would have `None`. The conversion methods work on the whole array at once and
+    return NumPy arrays, with the same results as the `Color` methods of the same name.
+
+    `ColorArray` requires NumPy to be installed. In JSON mode it serializes to a list of strings,
+    as each color would on its own.
+
+    ```py
+    from pydantic import BaseModel
+
+    from pydantic_extra_types.color import ColorArray
+
+
+    class Palette(BaseModel):
+        colors: ColorArray
+
+
+    palette = Palette(colors=['red', '#00f8', (0, 128, 0)])
+    print(palette.colors.as_hex())
+    # > ['#f00' '#00f8' '#008000']
+    print(palette.model_dump_json())
+    # > {"colors":["red","#00f8","green"]}
+    ```
+    """
+
+    __slots__ = ('_rgba',)
+
+    def __init__(self, values: ColorArray | Sequence[ColorType] | npt.NDArray[Any]) -> None:
+        """Parse a sequence of colors, or an `(N, 3)` or `(N, 4)` numeric array of channel values.
+
+        Args:
+            values: A `ColorArray`, a sequence of anything `Color` accepts, or a numeric array of red,
+                green and blue values between 0 and 255, optionally followed by alpha between 0 and 1.
+
+        Raises:
+            PydanticCustomError: If `values` or any color in it is invalid.
+        """
+        try:
+            import numpy as np
+        except ModuleNotFoundError as e:  # pragma: no cover
+            raise RuntimeError(
+                '`ColorArray` requires "numpy" to be installed. You can install it with "pip install numpy".'
+            ) from e
+
+        self._rgba: npt.NDArray[np.float64]
+        if isinstance(values, ColorArray):
+            self._rgba = values._rgba
+        elif isinstance(values, np.ndarray) and values.dtype.kind in 'uif':
+            self._rgba = _parse_channel_array(values)
+        elif isinstance(values, (list, tuple, np.ndarray)):
+            self._rgba = np.array([_parse_color_row(value, index) for index, value in enumerate(values)], np.float64)
+            self._rgba = self._rgba.reshape(len(values), 4)
+        else:
+            raise PydanticCustomError(
+                'color_error',
+                'value is not a valid color array: value must be a list, tuple or array of colors',
+            )
+
+    @property
+    def rgba(self) -> npt.NDArray[np.float64]:
+        """The `(N, 4)` array of red, green, blue and alpha between 0 and 1, with `NaN` for no alpha."""
+        return self._rgba
+
+    def as_hex(self, format: Literal['short', 'long'] = 'short') -> npt.NDArray[np.str_]:
+        """Vectorized `Color.as_hex`.
+
+        Returns:
+            The hexadecimal representation of each color.
+        """
+        import numpy as np
+
+        values, has_alpha = self._as_255()
+        high, low = values >> 4, values & 0xF
+        digits = np.frombuffer(_hex_digits.encode(), dtype=np.uint8)
+
+        # ASCII bytes with trailing zeros, which `bytes_` arrays treat as the end of the string
+        long = np.zeros((len(values), 9), dtype=np.uint8)
+        long[:, 0] = ord('#')
+        long[:, 1::2] = digits[high]
+        long[:, 2::2] = digits[low]
+        long[~has_alpha, 7:] = 0
+        if format == 'short':
+            short = np.zeros_like(long)
+            short[:, 0] = ord('#')
+            short[:, 1:5] = digits[high]
+            short[~has_alpha, 4] = 0
+            repeated = high == low
+            repeated[:, 3] |= ~has_alpha
+            is_short = repeated.all(axis=1)
+            long = np.where(is_short[:, None], short, long)
+        return np.ascontiguousarray(long).view('S9').ravel().astype(np.str_)
+
+    def as_rgb_tuple(self, *, alpha: bool | None = None) -> npt.NDArray[Any]:
+        """Vectorized `Color.as_rgb_tuple`.
+
+        Args:
+            alpha: Whether to include the alpha channel.
+
+                - `None` (default): Include the alpha channel only if it's set for any of the colors.
+                - `True`: Always include alpha.
+                - `False`: Always omit alpha.
+
+        Returns:
+            An `(N, 3)` `uint8` array of red, green and blue values between 0 and 255, or with alpha an
+                `(N, 4)` `float64` array that adds alpha values between 0 and 1.
+        """
+        import numpy as np
+
+        values, has_alpha = self._as_255()
+        if alpha is None:
+            alpha = bool(has_alpha.any())
+        if not alpha:
+            return values[:, :3]
+        rgba = values.astype(np.float64)
+        rgba[:, 3] = np.where(has_alpha, self._rgba[:, 3], 1)
+        return rgba
+
+    def as_hsl_tuple(self, *, alpha: bool | None = None) -> npt.NDArray[np.float64]:
+        """Vectorized `Color.as_hsl_tuple`.
+
+        Args:
+            alpha: Whether to include the alpha channel.
+
+                - `None` (default): Include the alpha channel only if it's set for any of the colors.
+                - `True`: Always include alpha.
+                - `False`: Always omit alpha.
+
+        Returns:
+            An `(N, 3)` or, with alpha, `(N, 4)` array of hue, saturation, lightness and alpha, all
+                between 0 and 1.
+        """
+        import numpy as np
+
+        r, g, b, a = self._rgba.T
+        # `colorsys.rgb_to_hls`, one branch at a time
+        max_c = np.maximum(np.maximum(r, g), b)
+        min_c = np.minimum(np.minimum(r, g), b)
+        sum_c = max_c + min_c
+        range_c = max_c - min_c
+        lightness = sum_c / 2
+        grey = range_c == 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            saturation = np.where(lightness <= 0.5, range_c / sum_c, range_c / (2 - sum_c))
+            rc, gc, bc = (max_c - r) / range_c, (max_c - g) / range_c, (max_c - b) / range_c
+        hue = np.where(r == max_c, bc - gc, np.where(g == max_c, 2 + rc - bc, 4 + gc - rc))
+        hue = (hue / 6) % 1
+        columns = [np.where(grey, 0, hue), np.where(grey, 0, saturation), lightness]
+
+        if alpha is None:
+            alpha = bool((~np.isnan(a)).any())
+        if alpha:
+            columns.append(np.where(np.isnan(a), 1, a))
+        return np.stack(columns, axis=1).astype(np.float64)
+
+    def as_named(self, *, fallback: bool = False) -> npt.NDArray[np.str_]:
+        """Vectorized `Color.as_named`.
+
+        Args:
+            fallback: If True, falls back to the hexadecimal representation of the colors that have no
+                name instead of raising a ValueError.
+
+        Returns:
+            The name of each color, or its hexadecimal representation.
+
+        Raises:
+            ValueError: When a color without alpha has no name and fallback is `False`.
+        """
+        import numpy as np
+
+        values, has_alpha = self._as_255()
+        packed = (values[:, 0].astype(np.int32) << 16) | (values[:, 1].astype(np.int32) << 8) | values[:, 2]
+        named_values, names = _named_values_array()
+        positions = np.searchsorted(named_values, packed).clip(max=len(named_values) - 1)
+        found = (named_values[positions] == packed) & ~has_alpha
+        # like `Color.as_named`, colors with alpha are never named but always fall back to hex
+        if not fallback and (~found & ~has_alpha).any():
+            raise ValueError('no named color found, use fallback=True, as_hex() or as_rgb()')
+        return np.where(found, names[positions], self.as_hex())
+
+    def _as_255(self) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.bool_]]:
+        """The channels rounded like `float_to_255`, with alpha 0 where not set, and the mask of set alphas."""
+        import numpy as np
+
+        has_alpha = ~np.isnan(self._rgba[:, 3])
+        values = np.rint(np.nan_to_num(self._rgba, nan=0) * 255).astype(np.uint8)
+        return values, has_alpha
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, core_schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {'type': 'array', 'items': {'type': 'string', 'format': 'color'}}
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: type[Any], handler: Callable[[Any], CoreSchema]
+    ) -> core_schema.CoreSchema:
+        return core_schema.with_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda colors: colors.as_named(fallback=True).tolist(), when_used='json'
+            ),
+        )
+
+    @classmethod
+    def _validate(cls, __input_value: Any, _: Any) -> ColorArray:
+        return cls(__input_value)
+
+    def __len__(self) -> int:
+        return len(self._rgba)
+
+    def __getitem__(self, index: int) -> Color:
+        r, g, b, alpha = (float(c) for c in self._rgba[index])
+        color = Color.__new__(Color)
+        color._rgba = RGBA(r, g, b, None if math.isnan(alpha) else alpha)
+        color._original = color.as_rgb_tuple()
+        return color
+
+    def __repr_args__(self) -> _repr.ReprArgs:
+        return [(None, self.as_named(fallback=True).tolist())]
+
+    def __eq__(self, other: Any) -> bool:
+        import numpy as np
+
+        return isinstance(other, ColorArray) and np.array_equal(self._rgba, other._rgba, equal_nan=True)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _parse_channel_array(values: npt.NDArray[Any]) -> npt.NDArray[np.float64]:
+    """Validate a numeric `(N, 3)` or `(N, 4)` array of channel values, like `parse_tuple` for each row."""
+    import numpy as np
+
+    if values.ndim != 2 or values.shape[1] not in {3, 4}:
+        raise PydanticCustomError(
+            'color_error',
+            'value is not a valid color array: arrays must have shape (N, 3) or (N, 4)',
+        )
+    rgba = np.full((len(values), 4), np.nan, dtype=np.float64)
+    rgb = values[:, :3].astype(np.float64)
+    if not ((rgb >= 0) & (rgb <= 255)).all():
+        raise PydanticCustomError(
+            'color_error',
+            'value is not a valid color: color values must be in the range 0 to {max_val}',
+            {'max_val': 255},
+        )
+    rgba[:, :3] = rgb / 255
+    if values.shape[1] == 4:
+        alpha = values[:, 3].astype(np.float64)
+        if not ((alpha >= 0) & (alpha <= 1)).all():
+            raise PydanticCustomError(
+                'color_error',
+                'value is not a valid color: alpha values must be in the range 0 to 1',
+            )
+        # as in `parse_float_alpha`, an alpha of 1 is no alpha
+        rgba[:, 3] = np.where(np.isclose(alpha, 1, rtol=1e-9, atol=0), np.nan, alpha)
+    return rgba
+
+
+def _parse_color_row(value: Any, index: int) -> tuple[float, float, float, float]:
+    """The channels of one color of a `ColorArray`, with `NaN` for no alpha."""
+    try:
+        if isinstance(value, Color):
+            rgba = value._rgba
+        elif isinstance(value, str):
+            rgba = _parse_str_cached(value)
+        elif isinstance(value, (tuple, list)):
+            rgba = _parse_tuple_cached(value)
+        else:
+            raise PydanticCustomError(
+                'color_error',
+                'value is not a valid color: value must be a tuple, list or string',
+            )
+    except PydanticCustomError as exc:
+        raise PydanticCustomError(exc.type, '{error} at index {index}', {'error': exc.message(), 'index': index})
+    return rgba.r, rgba.g, rgba.b, math.nan if rgba.alpha is None else rgba.alpha
+
+
 def parse_tuple(value: tuple[Any, ...]) -> RGBA:
     """Parse a tuple or list to get RGBA values.
 
@@ -283,30 +650,24 @@ def parse_str(value: str) -> RGBA:
         r, g, b = COLORS_BY_NAME[value_lower]
         return ints_to_rgba(r, g, b, None)
 
-    m = re.fullmatch(r_hex_short, value_lower)
-    if m:
-        *rgb, a = m.groups()
-        r, g, b = (int(v * 2, 16) for v in rgb)
-        alpha = int(a * 2, 16) / 255 if a else None
-        return ints_to_rgba(r, g, b, alpha)
-
-    m = re.fullmatch(r_hex_long, value_lower)
-    if m:
-        *rgb, a = m.groups()
-        r, g, b = (int(v, 16) for v in rgb)
-        alpha = int(a, 16) / 255 if a else None
-        return ints_to_rgba(r, g, b, alpha)
-
-    m = re.fullmatch(r_rgb, value_lower) or re.fullmatch(r_rgb_v4_style, value_lower)
-    if m:
-        return ints_to_rgba(*m.groups())  # type: ignore
-
-    m = re.fullmatch(r_hsl, value_lower) or re.fullmatch(r_hsl_v4_style, value_lower)
-    if m:
-        return parse_hsl(*m.groups())  # type: ignore
-
-    if value_lower == 'transparent':
-        return RGBA(0, 0, 0, 0)
+    # route on the prefix to the one format the string can be in, rather than trying every pattern
+    stripped = value_lower.strip()
+    if stripped.startswith('rgb'):
+        css3, css4 = _compiled_patterns()['rgb']
+        m = css3.fullmatch(value_lower) or css4.fullmatch(value_lower)
+        if m:
+            return ints_to_rgba(*m.groups())  # type: ignore
+    elif stripped.startswith('hsl'):
+        css3, css4 = _compiled_patterns()['hsl']
+        m = css3.fullmatch(value_lower) or css4.fullmatch(value_lower)
+        if m:
+            return parse_hsl(*m.groups())  # type: ignore
+    else:
+        rgba = parse_hex(stripped)
+        if rgba is not None:
+            return rgba
+        if value_lower == 'transparent':
+            return RGBA(0, 0, 0, 0)
 
     raise PydanticCustomError(
         'color_error',
@@ -314,6 +675,101 @@ def parse_str(value: str) -> RGBA:
     )
 
 
+@lru_cache
+def _compiled_patterns() -> dict[str, tuple[re.Pattern[str], re.Pattern[str]]]:
+    """The CSS3 and CSS4 patterns of each functional notation, compiled on first use."""
+    return {
+        'rgb': (re.compile(r_rgb), re.compile(r_rgb_v4_style)),
+        'hsl': (re.compile(r_hsl), re.compile(r_hsl_v4_style)),
+    }
+
+
+_hex_digits = '0123456789abcdef'
+
+_channel_values = [value / 255 for value in range(256)]
+"""The channel value of every integer from 0 to 255, shared by all colors rather than a new float for each."""
+
+
+def parse_hex(value: str) -> RGBA | None:
+    """Decode a lower case hex color, the equivalent of matching `r_hex_short` or `r_hex_long`.
+
+    Args:
+        value: The hex color, with a `#` or `0x` prefix or none, and no surrounding whitespace.
+
+    Returns:
+        An `RGBA` tuple, or `None` if the value is not a hex color.
+    """
+    if value.startswith('#'):
+        digits = value[1:]
+    elif value.startswith('0x'):
+        digits = value[2:]
+    else:
+        digits = value
+    # `int(..., 16)` alone would also accept underscores and signs
+    if len(digits) not in {3, 4, 6, 8} or digits.strip(_hex_digits):
+        return None
+    if len(digits) < 6:
+        digits = ''.join(c * 2 for c in digits)
+    alpha = _channel_values[int(digits[6:], 16)] if len(digits) == 8 else None
+    return ints_to_rgba(int(digits[:2], 16), int(digits[2:4], 16), int(digits[4:6], 16), alpha)
+
+
+# keyed by the lower case string or the tuple, both parse the same regardless of case or sequence type
+_parse_cache: ParseCache[Union[str, tuple[Any, ...]], RGBA] = ParseCache()
+
+
+def _parse_str_cached(value: str) -> RGBA:
+    if not _parse_cache.maxsize:
+        return parse_str(value)
+    return _parse_cache.get(value.lower(), partial(parse_str, value))
+
+
+def _parse_tuple_cached(value: tuple[Any, ...] | list[Any]) -> RGBA:
+    if not _parse_cache.maxsize:
+        return parse_tuple(value)  # type: ignore[arg-type]
+    key = tuple(value)
+    try:
+        hash(key)
+    except TypeError:
+        return parse_tuple(key)
+    return _parse_cache.get(key, partial(parse_tuple, key))
+
+
+def enable_parse_cache(maxsize: int = 10_000) -> None:
+    """Cache the parsed values of color strings and tuples, for inputs that repeat a lot.
+
+    `Color` then looks each string up case-insensitively, and each tuple or list by its items,
+    before parsing it, and colors built from the same input share one parsed value. Invalid
+    inputs are cached too. The least recently used entries are evicted beyond `maxsize`, and
+    calling this again resizes the cache, keeping its entries and statistics.
+
+    Args:
+        maxsize: The maximum number of cached inputs.
+
+    Raises:
+        ValueError: If `maxsize` is not positive.
+    """
+    if maxsize <= 0:
+        raise ValueError(f'maxsize must be positive, got {maxsize}')
+    _parse_cache.resize(maxsize)
+
+
+def disable_parse_cache() -> None:
+    """Stop caching parsed colors, and drop the cached entries and statistics."""
+    _parse_cache.resize(0)
+    _parse_cache.clear()
+
+
+def clear_parse_cache() -> None:
+    """Drop the cached parsed colors and reset the statistics, leaving the cache enabled."""
+    _parse_cache.clear()
+
+
+def parse_cache_info() -> ParseCacheInfo:
+    """The hit and miss statistics and size of the parse cache."""
+    return _parse_cache.info()
+
+
 def ints_to_rgba(
     r: int | str,
     g: int | str,
@@ -360,6 +816,8 @@ def parse_color_value(value: int | str, max_val: int = 255) -> float:
             'value is not a valid color: color values must be a valid number',
         ) from e
     if 0 <= color <= max_val:
+        if max_val == 255 and color.is_integer():
+            return _channel_values[int(color)]
         return color / max_val
     else:
         raise PydanticCustomError(
@@ -445,6 +903,206 @@ def float_to_255(c: float) -> int:
     return round(c * 255)
 
 
+@lru_cache
+def _named_palette() -> tuple[
+    tuple[str, ...], tuple[tuple[int, int, int], ...], tuple[tuple[float, float, float], ...]
+]:
+    """The names in `COLORS_BY_VALUE`, with their RGB and CIELAB values, computed on first use."""
+    return (
+        tuple(COLORS_BY_VALUE.values()),
+        tuple(COLORS_BY_VALUE),
+        tuple(_rgb_to_lab(*rgb) for rgb in COLORS_BY_VALUE),
+    )
+
+
+def _squared_distance(a: tuple[float, float, float], b: tuple[float, float, float]) -> float:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+# the D65 white point of sRGB in CIE XYZ
+_white_x, _white_y, _white_z = 0.95047, 1.0, 1.08883
+_lab_epsilon = (6 / 29) ** 3
+
+
+def _srgb_to_linear(c: float) -> float:
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _lab_f(t: float) -> float:
+    return t ** (1 / 3) if t > _lab_epsilon else t / (3 * (6 / 29) ** 2) + 4 / 29
+
+
+def _rgb_to_lab(r: float, g: float, b: float) -> tuple[float, float, float]:
+    """Convert sRGB channel values between 0 and 255 to CIELAB coordinates, under the D65 illuminant."""
+    r, g, b = _srgb_to_linear(r / 255), _srgb_to_linear(g / 255), _srgb_to_linear(b / 255)
+    fx = _lab_f((0.4124564 * r + 0.3575761 * g + 0.1804375 * b) / _white_x)
+    fy = _lab_f((0.2126729 * r + 0.7151522 * g + 0.0721750 * b) / _white_y)
+    fz = _lab_f((0.0193339 * r + 0.1191920 * g + 0.9503041 * b) / _white_z)
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def _ciede2000(lab1: tuple[float, float, float], lab2: tuple[float, float, float]) -> float:
+    """The CIEDE2000 color difference, as specified by Sharma, Wu and Dalal (2005)."""
+    l1, a1, b1 = lab1
+    l2, a2, b2 = lab2
+    c_mean7 = ((math.hypot(a1, b1) + math.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - math.sqrt(c_mean7 / (c_mean7 + 25**7)))
+    a1, a2 = a1 * (1 + g), a2 * (1 + g)
+    c1, c2 = math.hypot(a1, b1), math.hypot(a2, b2)
+    h1 = math.degrees(math.atan2(b1, a1)) % 360 if c1 else 0.0
+    h2 = math.degrees(math.atan2(b2, a2)) % 360 if c2 else 0.0
+
+    if c1 * c2 == 0:
+        dh = 0.0
+        h_mean = h1 + h2
+    else:
+        dh = h2 - h1
+        if dh > 180:
+            dh -= 360
+        elif dh < -180:
+            dh += 360
+        h_mean = (h1 + h2) / 2
+        if abs(h1 - h2) > 180:
+            h_mean += 180 if h1 + h2 < 360 else -180
+    d_l = l2 - l1
+    d_c = c2 - c1
+    d_h = 2 * math.sqrt(c1 * c2) * math.sin(math.radians(dh / 2))
+
+    l_mean = (l1 + l2) / 2
+    c_mean = (c1 + c2) / 2
+    t = (
+        1
+        - 0.17 * math.cos(math.radians(h_mean - 30))
+        + 0.24 * math.cos(math.radians(2 * h_mean))
+        + 0.32 * math.cos(math.radians(3 * h_mean + 6))
+        - 0.20 * math.cos(math.radians(4 * h_mean - 63))
+    )
+    s_l = 1 + 0.015 * (l_mean - 50) ** 2 / math.sqrt(20 + (l_mean - 50) ** 2)
+    s_c = 1 + 0.045 * c_mean
+    s_h = 1 + 0.015 * c_mean * t
+    c_mean7 = c_mean**7
+    r_t = (
+        -2
+        * math.sqrt(c_mean7 / (c_mean7 + 25**7))
+        * math.sin(math.radians(60 * math.exp(-(((h_mean - 275) / 25) ** 2))))
+    )
+    return math.sqrt((d_l / s_l) ** 2 + (d_c / s_c) ** 2 + (d_h / s_h) ** 2 + r_t * (d_c / s_c) * (d_h / s_h))
+
+
+_NEAREST_CHUNK_SIZE = 1 << 12
+"""Colors compared against the whole palette at once in `_nearest_indices`, to bound memory use."""
+
+
+@lru_cache
+def _named_palette_arrays() -> tuple[npt.NDArray[np.str_], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """`_named_palette` as NumPy arrays."""
+    import numpy as np
+
+    names, rgb, lab = _named_palette()
+    return np.array(names), np.array(rgb, dtype=np.float64), np.array(lab, dtype=np.float64)
+
+
+@lru_cache
+def _named_values_array() -> tuple[npt.NDArray[np.int32], npt.NDArray[np.str_]]:
+    """The colors of `COLORS_BY_VALUE` packed as `0xRRGGBB` and sorted, with their names."""
+    import numpy as np
+
+    packed = np.array([(r << 16) | (g << 8) | b for r, g, b in COLORS_BY_VALUE], dtype=np.int32)
+    order = np.argsort(packed)
+    return packed[order], np.array(list(COLORS_BY_VALUE.values()))[order]
+
+
+def _nearest_indices(
+    rgb: npt.NDArray[np.float64],
+    metric: str,
+    palette_rgb: npt.NDArray[np.float64],
+    palette_lab: npt.NDArray[np.float64],
+) -> npt.NDArray[np.intp]:
+    """The index in the palette of the color closest to each row of `rgb`."""
+    import numpy as np
+
+    if metric == 'rgb':
+        points, palette = rgb, palette_rgb
+    else:
+        points, palette = _rgb_to_lab_array(rgb), palette_lab
+    # |p - q|² is |p|² - 2 p·q + |q|², and |p|² is the same for every palette color q
+    palette_norms = (palette**2).sum(axis=1)
+    palette_products = -2 * palette.T
+    nearest = np.empty(len(points), dtype=np.intp)
+    for start in range(0, len(points), _NEAREST_CHUNK_SIZE):
+        chunk = points[start : start + _NEAREST_CHUNK_SIZE]
+        if metric == 'ciede2000':
+            distances = _ciede2000_array(chunk[:, None, :], palette[None, :, :])
+        else:
+            distances = chunk @ palette_products
+            distances += palette_norms
+        nearest[start : start + len(chunk)] = distances.argmin(axis=1)
+    return nearest
+
+
+def _rgb_to_lab_array(rgb: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Vectorized `_rgb_to_lab` over the rows of an array."""
+    import numpy as np
+
+    c = rgb / 255
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ np.array(
+        [
+            [0.4124564 / _white_x, 0.2126729 / _white_y, 0.0193339 / _white_z],
+            [0.3575761 / _white_x, 0.7151522 / _white_y, 0.1191920 / _white_z],
+            [0.1804375 / _white_x, 0.0721750 / _white_y, 0.9503041 / _white_z],
+        ]
+    )
+    f = np.where(xyz > _lab_epsilon, np.cbrt(xyz), xyz / (3 * (6 / 29) ** 2) + 4 / 29)
+    return np.stack([116 * f[:, 1] - 16, 500 * (f[:, 0] - f[:, 1]), 200 * (f[:, 1] - f[:, 2])], axis=1)
+
+
+def _ciede2000_array(lab1: npt.NDArray[np.float64], lab2: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Vectorized `_ciede2000` between two broadcastable arrays of CIELAB colors in their last axis."""
+    import numpy as np
+
+    l1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    l2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+    c_mean7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - np.sqrt(c_mean7 / (c_mean7 + 25**7)))
+    a1, a2 = a1 * (1 + g), a2 * (1 + g)
+    c1, c2 = np.hypot(a1, b1), np.hypot(a2, b2)
+    h1 = np.where(c1 != 0, np.degrees(np.arctan2(b1, a1)) % 360, 0)
+    h2 = np.where(c2 != 0, np.degrees(np.arctan2(b2, a2)) % 360, 0)
+
+    achromatic = c1 * c2 == 0
+    dh = h2 - h1
+    dh = np.where(dh > 180, dh - 360, np.where(dh < -180, dh + 360, dh))
+    dh = np.where(achromatic, 0, dh)
+    h_sum = h1 + h2
+    h_mean = np.where(
+        achromatic | (np.abs(h1 - h2) <= 180),
+        np.where(achromatic, h_sum, h_sum / 2),
+        np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2),
+    )
+    d_l = l2 - l1
+    d_c = c2 - c1
+    d_h = 2 * np.sqrt(c1 * c2) * np.sin(np.radians(dh / 2))
+
+    l_mean = (l1 + l2) / 2
+    c_mean = (c1 + c2) / 2
+    t = (
+        1
+        - 0.17 * np.cos(np.radians(h_mean - 30))
+        + 0.24 * np.cos(np.radians(2 * h_mean))
+        + 0.32 * np.cos(np.radians(3 * h_mean + 6))
+        - 0.20 * np.cos(np.radians(4 * h_mean - 63))
+    )
+    s_l = 1 + 0.015 * (l_mean - 50) ** 2 / np.sqrt(20 + (l_mean - 50) ** 2)
+    s_c = 1 + 0.045 * c_mean
+    s_h = 1 + 0.015 * c_mean * t
+    c_mean7 = c_mean**7
+    r_t = -2 * np.sqrt(c_mean7 / (c_mean7 + 25**7)) * np.sin(np.radians(60 * np.exp(-(((h_mean - 275) / 25) ** 2))))
+    return np.sqrt(  # type: ignore[no-any-return]
+        (d_l / s_l) ** 2 + (d_c / s_c) ** 2 + (d_h / s_h) ** 2 + r_t * (d_c / s_c) * (d_h / s_h)
+    )
+
+
 COLORS_BY_NAME = {
     'aliceblue': (240, 248, 255),
     'antiquewhite': (250, 235, 215),
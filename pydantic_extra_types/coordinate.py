@@ -1,19 +1,25 @@
 """The `pydantic_extra_types.coordinate` module provides the [`Latitude`][pydantic_extra_types.coordinate.Latitude],
-[`Longitude`][pydantic_extra_types.coordinate.Longitude], and
-[`Coordinate`][pydantic_extra_types.coordinate.Coordinate] data types.
+[`Longitude`][pydantic_extra_types.coordinate.Longitude],
+[`Coordinate`][pydantic_extra_types.coordinate.Coordinate] and
+[`CoordinateArray`][pydantic_extra_types.coordinate.CoordinateArray] data types.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Annotated, Any, ClassVar, Union
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Union, overload
 
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
 from pydantic._internal import _repr
 from pydantic.json_schema import JsonSchemaValue
 from pydantic_core import ArgsKwargs, PydanticCustomError, core_schema
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
 # Pattern used by pydantic for decimal string validation in JSON schema
 _DECIMAL_PATTERN = r'^(?!^[-+.]*$)[+-]?0*\d*\.?\d*$'
 
@@ -49,6 +55,9 @@ LatitudeType = Union[float, Decimal]
 LongitudeType = Union[float, Decimal]
 CoordinateType = tuple[_CoordinateValue, _CoordinateValue]
 
+EARTH_RADIUS = 6_371_008.8
+"""The mean radius of the Earth in meters, the default radius of the distances."""
+
 
 class Latitude(float):
     """Latitude value should be between -90 and 90, inclusive.
@@ -232,3 +241,292 @@ class Coordinate(_repr.Representation):
 
     def __hash__(self) -> int:
         return hash((self.latitude, self.longitude))
+
+
+class CoordinateArray(_repr.Representation):
+    """Represents many coordinates at once, for validating and measuring them in bulk.
+
+    The coordinates are held in a contiguous `(N, 2)` `float64` NumPy array of latitudes and
+    longitudes, which is checked against the ranges of `Latitude` and `Longitude` a whole column at a
+    time. The distance methods work on the whole array at once and return NumPy arrays. Indexing
+    returns a `Coordinate`, slicing a `CoordinateArray`, so that e.g. `track[1:].distance_to(track[:-1])`
+    is the length of each leg of a track.
+
+    `CoordinateArray` requires NumPy to be installed. In JSON mode it serializes to a list of
+    `[latitude, longitude]` pairs.
+
+    ```py
+    from pydantic import BaseModel
+
+    from pydantic_extra_types.coordinate import CoordinateArray
+
+
+    class Route(BaseModel):
+        stops: CoordinateArray
+
+
+    route = Route(stops=[(41.40338, 2.17403), (48.8566, 2.3522), '51.5072,-0.1276'])
+    print(route.stops.distance_to((41.40338, 2.17403)).round())
+    # > [      0.  828879. 1137092.]
+    print(route.model_dump_json())
+    # > {"stops":[[41.40338,2.17403],[48.8566,2.3522],[51.5072,-0.1276]]}
+    ```
+    """
+
+    __slots__ = ('_points',)
+
+    def __init__(self, values: CoordinateArray | Sequence[Any] | npt.NDArray[Any]) -> None:
+        """Parse a sequence of coordinates, or an `(N, 2)` numeric array of latitudes and longitudes.
+
+        Args:
+            values: A `CoordinateArray`, a sequence of anything `Coordinate` accepts as a single value,
+                i.e. `(latitude, longitude)` pairs, `'latitude,longitude'` strings and `Coordinate`
+                instances, or a numeric array.
+
+        Raises:
+            PydanticCustomError: If `values` or any coordinate in it is invalid.
+        """
+        try:
+            import numpy as np
+        except ModuleNotFoundError as e:  # pragma: no cover
+            raise RuntimeError(
+                '`CoordinateArray` requires "numpy" to be installed. You can install it with "pip install numpy".'
+            ) from e
+
+        self._points: npt.NDArray[np.float64]
+        if isinstance(values, CoordinateArray):
+            self._points = values._points
+            return
+        if not isinstance(values, (list, tuple, np.ndarray)):
+            raise PydanticCustomError(
+                'coordinate_error',
+                'value is not a valid coordinate array: value must be a list, tuple or array of coordinates',
+            )
+        try:
+            # pairs of numbers, or an array, convert in one C loop
+            points = np.array(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            points = np.array([_parse_coordinate_row(value, index) for index, value in enumerate(values)])
+        if points.size == 0:
+            points = points.reshape(0, 2)
+        if points.ndim != 2 or points.shape[1] != 2:
+            raise PydanticCustomError(
+                'coordinate_error',
+                'value is not a valid coordinate array: arrays must have shape (N, 2)',
+            )
+        _check_ranges(points)
+        self._points = points
+
+    @property
+    def points(self) -> npt.NDArray[np.float64]:
+        """The `(N, 2)` array of latitudes and longitudes."""
+        return self._points
+
+    @property
+    def latitudes(self) -> npt.NDArray[np.float64]:
+        """The latitudes, a view of the first column of `points`."""
+        return self._points[:, 0]
+
+    @property
+    def longitudes(self) -> npt.NDArray[np.float64]:
+        """The longitudes, a view of the second column of `points`."""
+        return self._points[:, 1]
+
+    def distance_to(
+        self, other: CoordinateArray | Coordinate | tuple[float, float], *, radius: float = EARTH_RADIUS
+    ) -> npt.NDArray[np.float64]:
+        """The great-circle distance from each coordinate to another, with the haversine formula.
+
+        Args:
+            other: A single coordinate to measure every coordinate from, or a `CoordinateArray` of the
+                same length to measure each coordinate from the one at the same index.
+            radius: The radius of the sphere, by default the mean radius of the Earth in meters.
+
+        Returns:
+            The distances, in the unit of `radius`.
+        """
+        latitudes: npt.NDArray[np.float64] | float
+        longitudes: npt.NDArray[np.float64] | float
+        if isinstance(other, CoordinateArray):
+            latitudes, longitudes = other.latitudes, other.longitudes
+        elif isinstance(other, Coordinate):
+            latitudes, longitudes = float(other.latitude), float(other.longitude)
+        else:
+            latitudes, longitudes = float(other[0]), float(other[1])
+        return haversine(self.latitudes, self.longitudes, latitudes, longitudes, radius=radius)
+
+    def bounding_box(self) -> tuple[Coordinate, Coordinate]:
+        """The south-west and north-east corners of the smallest box holding every coordinate.
+
+        The box is bounded by the smallest and largest longitude, it does not wrap around the
+        antimeridian.
+
+        Raises:
+            ValueError: When the array is empty.
+        """
+        if not len(self):
+            raise ValueError('an empty CoordinateArray has no bounding box')
+        (south, west), (north, east) = self._points.min(axis=0), self._points.max(axis=0)
+        return _coordinate(south, west), _coordinate(north, east)
+
+    def centroid(self) -> Coordinate:
+        """The center of the coordinates on the sphere, the mean of their unit vectors projected back to it.
+
+        Unlike the mean of the latitudes and longitudes, it is not thrown off by coordinates on both
+        sides of the antimeridian.
+
+        Raises:
+            ValueError: When the array is empty.
+        """
+        import numpy as np
+
+        if not len(self):
+            raise ValueError('an empty CoordinateArray has no centroid')
+        latitudes, longitudes = np.radians(self.latitudes), np.radians(self.longitudes)
+        x = (np.cos(latitudes) * np.cos(longitudes)).mean()
+        y = (np.cos(latitudes) * np.sin(longitudes)).mean()
+        z = np.sin(latitudes).mean()
+        return _coordinate(np.degrees(np.arctan2(z, np.hypot(x, y))), np.degrees(np.arctan2(y, x)))
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, core_schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {
+            'type': 'array',
+            'items': {
+                'type': 'array',
+                'prefixItems': [
+                    {'type': 'number', 'minimum': Latitude.min, 'maximum': Latitude.max},
+                    {'type': 'number', 'minimum': Longitude.min, 'maximum': Longitude.max},
+                ],
+                'minItems': 2,
+                'maxItems': 2,
+            },
+        }
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.with_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda coordinates: coordinates.points.tolist(), when_used='json'
+            ),
+        )
+
+    @classmethod
+    def _validate(cls, __input_value: Any, _: Any) -> CoordinateArray:
+        return cls(__input_value)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    @overload
+    def __getitem__(self, index: int) -> Coordinate: ...
+
+    @overload
+    def __getitem__(self, index: slice | list[Any] | npt.NDArray[Any]) -> CoordinateArray: ...
+
+    def __getitem__(self, index: int | slice | list[Any] | npt.NDArray[Any]) -> Coordinate | CoordinateArray:
+        """A single `Coordinate` for an integer, or a `CoordinateArray` for a slice, a boolean mask or integer positions."""
+        import numpy as np
+
+        if isinstance(index, (int, np.integer)) and not isinstance(index, bool):
+            latitude, longitude = self._points[index]
+            return _coordinate(latitude, longitude)
+        if isinstance(index, slice):
+            # the points are already validated, and a slice with a step of 1 is a view of them
+            points = self._points[index]
+        else:
+            positions = np.asarray(index) if isinstance(index, (list, np.ndarray)) else None
+            if positions is not None and positions.size == 0:
+                positions = positions.astype(np.intp)
+            if positions is None or positions.ndim != 1 or positions.dtype.kind not in 'biu':
+                raise TypeError(
+                    'CoordinateArray indices must be integers, slices, boolean masks or integer arrays, '
+                    f'not {type(index).__name__}'
+                )
+            points = self._points[positions]
+        coordinates = CoordinateArray.__new__(CoordinateArray)
+        coordinates._points = np.ascontiguousarray(points)
+        return coordinates
+
+    def __repr_args__(self) -> _repr.ReprArgs:
+        return [(None, self._points.tolist())]
+
+    def __eq__(self, other: Any) -> bool:
+        import numpy as np
+
+        if not isinstance(other, CoordinateArray):
+            return NotImplemented
+        return np.array_equal(self._points, other._points)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def haversine(
+    latitudes1: Any, longitudes1: Any, latitudes2: Any, longitudes2: Any, *, radius: float = EARTH_RADIUS
+) -> npt.NDArray[np.float64]:
+    """The great-circle distances between two sets of coordinates, with the haversine formula.
+
+    The arguments are NumPy arrays or anything NumPy broadcasts, e.g. DataFrame columns or a single
+    value, in degrees.
+
+    Args:
+        latitudes1: The latitudes of the first coordinates.
+        longitudes1: The longitudes of the first coordinates.
+        latitudes2: The latitudes of the second coordinates.
+        longitudes2: The longitudes of the second coordinates.
+        radius: The radius of the sphere, by default the mean radius of the Earth in meters.
+
+    Returns:
+        The distances, in the unit of `radius`.
+    """
+    import numpy as np
+
+    phi1, lambda1, phi2, lambda2 = (
+        np.radians(np.asarray(values, dtype=np.float64))
+        for values in (latitudes1, longitudes1, latitudes2, longitudes2)
+    )
+    a = np.sin((phi2 - phi1) / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin((lambda2 - lambda1) / 2) ** 2
+    # rounding can take `a` just past 1 for antipodal points
+    return 2 * radius * np.arcsin(np.sqrt(np.minimum(a, 1.0)))  # type: ignore[no-any-return]
+
+
+def _coordinate(latitude: float, longitude: float) -> Coordinate:
+    return Coordinate(Latitude(latitude), Longitude(longitude))
+
+
+def _parse_coordinate_row(value: Any, index: int) -> tuple[float, float]:
+    """The latitude and longitude of one coordinate of a `CoordinateArray`."""
+    if isinstance(value, Coordinate):
+        return float(value.latitude), float(value.longitude)
+    if isinstance(value, str):
+        value = value.split(',')
+    if isinstance(value, (tuple, list)) and len(value) == 2:
+        try:
+            return float(value[0]), float(value[1])
+        except (TypeError, ValueError):
+            pass
+    raise PydanticCustomError(
+        'coordinate_error',
+        'value is not a valid coordinate at index {index}',
+        {'index': index},
+    )
+
+
+def _check_ranges(points: npt.NDArray[np.float64]) -> None:
+    """Check every latitude and longitude is in range, NaN included, like `Latitude` and `Longitude` do."""
+    import numpy as np
+
+    bounds: list[type[Latitude | Longitude]] = [Latitude, Longitude]
+    for column, (name, type_) in enumerate(zip(('latitude', 'longitude'), bounds)):
+        values = points[:, column]
+        # NaN compares false, so it is out of range
+        invalid = ~((values >= type_.min) & (values <= type_.max))
+        if invalid.any():
+            raise PydanticCustomError(
+                'coordinate_error',
+                'value is not a valid coordinate: {name} must be in the range {min} to {max} at index {index}',
+                {'name': name, 'min': type_.min, 'max': type_.max, 'index': int(np.argmax(invalid))},
+            )
@@ -2,39 +2,50 @@
 
 from __future__ import annotations
 
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Any
 
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
 from pydantic_core import PydanticCustomError, core_schema
 
-try:
-    import pycountry
-except ModuleNotFoundError as e:  # pragma: no cover
-    raise RuntimeError(
-        'The `country` module requires "pycountry" to be installed. You can install it with "pip install pycountry".'
-    ) from e
+from pydantic_extra_types._batch import BatchResult, validate_codes, validate_each
+from pydantic_extra_types._codes import code_schema
+from pydantic_extra_types._pycountry import reference_data
 
 
-@dataclass
+@dataclass(frozen=True)
 class CountryInfo:
+    __slots__ = ('alpha2', 'alpha3', 'numeric_code', 'short_name')
+
     alpha2: str
     alpha3: str
     numeric_code: str
     short_name: str
 
+    # pickle and copy restore slots with `setattr`, which the frozen dataclass forbids
+    def __getstate__(self) -> tuple[str, str, str, str]:
+        return self.alpha2, self.alpha3, self.numeric_code, self.short_name
+
+    def __setstate__(self, state: tuple[str, str, str, str]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 @lru_cache
 def _countries() -> list[CountryInfo]:
     return [
         CountryInfo(
-            alpha2=country.alpha_2,
-            alpha3=country.alpha_3,
-            numeric_code=country.numeric,
-            short_name=country.name,
+            alpha2=alpha2,
+            alpha3=alpha3,
+            numeric_code=numeric_code,
+            short_name=short_name,
         )
-        for country in pycountry.countries
+        for alpha2, alpha3, numeric_code, short_name in reference_data().countries
     ]
 
 
@@ -58,6 +69,80 @@ def _index_by_short_name() -> dict[str, CountryInfo]:
     return {country.short_name: country for country in _countries()}
 
 
+_APOSTROPHES = re.compile(r"['\u2019]")
+_PUNCTUATION = re.compile(r'[^\w\s]')
+
+
+def _normalize_name(name: str) -> str:
+    """Casefold `name` and strip its accents and punctuation, so that `"Cote d’IVOIRE"` matches `"Côte d'Ivoire"`."""
+    name = name.casefold()
+    if name.isascii():
+        name = name.replace("'", '')
+    else:
+        decomposed = unicodedata.normalize('NFKD', name)
+        name = _APOSTROPHES.sub('', ''.join(char for char in decomposed if not unicodedata.combining(char)))
+    return ' '.join(_PUNCTUATION.sub(' ', name).split())
+
+
+@lru_cache
+def _index_by_name() -> dict[str, CountryInfo]:
+    """Every name and code of every country, normalized by `_normalize_name`."""
+    index: dict[str, CountryInfo] = {}
+    by_alpha2 = _index_by_alpha2()
+    for name, alpha2 in reference_data().country_aliases:
+        index[_normalize_name(name)] = by_alpha2[alpha2]
+    for country in _countries():
+        index[_normalize_name(country.alpha2)] = country
+        index[_normalize_name(country.alpha3)] = country
+        index[_normalize_name(country.short_name)] = country
+    return index
+
+
+def _trigrams(name: str) -> set[str]:
+    padded = f'  {name} '
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@lru_cache
+def _index_by_trigram() -> dict[str, list[str]]:
+    """The normalized country names containing each trigram, built on the first failed lookup."""
+    index: defaultdict[str, list[str]] = defaultdict(list)
+    for name, country in _index_by_name().items():
+        if name not in (country.alpha2.lower(), country.alpha3.lower()):
+            for trigram in _trigrams(name):
+                index[trigram].append(name)
+    return dict(index)
+
+
+def suggest_country_names(name: str, limit: int = 3) -> list[str]:
+    """The short names of the countries whose names are most similar to `name`.
+
+    Similarity is the Dice coefficient of the names' trigrams, and names sharing less than a
+    third of their trigrams are not suggested.
+
+    Args:
+        name: The misspelled country name.
+        limit: The maximum number of suggestions.
+
+    Returns:
+        Up to `limit` country short names, the most similar first.
+    """
+    trigrams = _trigrams(_normalize_name(name))
+    shared: Counter[str] = Counter()
+    index = _index_by_trigram()
+    for trigram in trigrams:
+        shared.update(index.get(trigram, ()))
+
+    by_name = _index_by_name()
+    scores: dict[str, float] = {}
+    for candidate, count in shared.items():
+        score = 2 * count / (len(trigrams) + len(candidate) + 1)
+        short_name = by_name[candidate].short_name
+        if score >= 1 / 3 and score > scores.get(short_name, 0):
+            scores[short_name] = score
+    return sorted(scores, key=lambda short_name: (-scores[short_name], short_name))[:limit]
+
+
 class CountryAlpha2(str):
     """CountryAlpha2 parses country codes in the [ISO 3166-1 alpha-2](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2)
     format.
@@ -79,18 +164,25 @@ class CountryAlpha2(str):
     """
 
     @classmethod
-    def _validate(cls, __input_value: str, _: core_schema.ValidationInfo) -> CountryAlpha2:
-        if __input_value not in _index_by_alpha2():
-            raise PydanticCustomError('country_alpha2', 'Invalid country alpha2 code')
-        return cls(__input_value)
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[CountryAlpha2]:
+        """Validate many ISO 3166-1 alpha-2 codes at once, without raising.
+
+        Args:
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
+
+        Returns:
+            The valid codes in input order, and an `(index, error_type)` pair for each invalid value.
+        """
+        instances = _alpha2_instances(cls)
+        return validate_codes(values, instances, instances.__getitem__, 'country_alpha2', normalize=str.upper)
 
     @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source: type[Any], handler: GetCoreSchemaHandler
-    ) -> core_schema.AfterValidatorFunctionSchema:
-        return core_schema.with_info_after_validator_function(
-            cls._validate,
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return code_schema(
             core_schema.str_schema(to_upper=True),
+            _alpha2_instances(cls).values(),
+            'country_alpha2',
+            'Invalid country alpha2 code',
         )
 
     @classmethod
@@ -101,20 +193,35 @@ class CountryAlpha2(str):
         json_schema.update({'pattern': r'^\w{2}$'})
         return json_schema
 
+    @cached_property
+    def _info(self) -> CountryInfo:
+        # validated instances come with their record bound, see `_alpha2_instances`
+        return _index_by_alpha2()[self]
+
     @property
     def alpha3(self) -> str:
         """The country code in the [ISO 3166-1 alpha-3](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-3) format."""
-        return _index_by_alpha2()[self].alpha3
+        return self._info.alpha3
 
     @property
     def numeric_code(self) -> str:
         """The country code in the [ISO 3166-1 numeric](https://en.wikipedia.org/wiki/ISO_3166-1_numeric) format."""
-        return _index_by_alpha2()[self].numeric_code
+        return self._info.numeric_code
 
     @property
     def short_name(self) -> str:
         """The country short name."""
-        return _index_by_alpha2()[self].short_name
+        return self._info.short_name
+
+
+@lru_cache
+def _alpha2_instances(cls: type[CountryAlpha2]) -> dict[str, CountryAlpha2]:
+    """The one `cls` instance of each ISO 3166-1 alpha-2 code, shared by all values validated as `cls`."""
+    instances = {}
+    for code, country in _index_by_alpha2().items():
+        instance = instances[code] = cls(code)
+        instance.__dict__['_info'] = country
+    return instances
 
 
 class CountryAlpha3(str):
@@ -138,18 +245,25 @@ class CountryAlpha3(str):
     """
 
     @classmethod
-    def _validate(cls, __input_value: str, _: core_schema.ValidationInfo) -> CountryAlpha3:
-        if __input_value not in _index_by_alpha3():
-            raise PydanticCustomError('country_alpha3', 'Invalid country alpha3 code')
-        return cls(__input_value)
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[CountryAlpha3]:
+        """Validate many ISO 3166-1 alpha-3 codes at once, without raising.
+
+        Args:
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
+
+        Returns:
+            The valid codes in input order, and an `(index, error_type)` pair for each invalid value.
+        """
+        instances = _alpha3_instances(cls)
+        return validate_codes(values, instances, instances.__getitem__, 'country_alpha3', normalize=str.upper)
 
     @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source: type[Any], handler: GetCoreSchemaHandler
-    ) -> core_schema.AfterValidatorFunctionSchema:
-        return core_schema.with_info_after_validator_function(
-            cls._validate,
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return code_schema(
             core_schema.str_schema(to_upper=True),
+            _alpha3_instances(cls).values(),
+            'country_alpha3',
+            'Invalid country alpha3 code',
             serialization=core_schema.to_string_ser_schema(),
         )
 
@@ -161,20 +275,35 @@ class CountryAlpha3(str):
         json_schema.update({'pattern': r'^\w{3}$'})
         return json_schema
 
+    @cached_property
+    def _info(self) -> CountryInfo:
+        # validated instances come with their record bound, see `_alpha3_instances`
+        return _index_by_alpha3()[self]
+
     @property
     def alpha2(self) -> str:
         """The country code in the [ISO 3166-1 alpha-2](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2) format."""
-        return _index_by_alpha3()[self].alpha2
+        return self._info.alpha2
 
     @property
     def numeric_code(self) -> str:
         """The country code in the [ISO 3166-1 numeric](https://en.wikipedia.org/wiki/ISO_3166-1_numeric) format."""
-        return _index_by_alpha3()[self].numeric_code
+        return self._info.numeric_code
 
     @property
     def short_name(self) -> str:
         """The country short name."""
-        return _index_by_alpha3()[self].short_name
+        return self._info.short_name
+
+
+@lru_cache
+def _alpha3_instances(cls: type[CountryAlpha3]) -> dict[str, CountryAlpha3]:
+    """The one `cls` instance of each ISO 3166-1 alpha-3 code, shared by all values validated as `cls`."""
+    instances = {}
+    for code, country in _index_by_alpha3().items():
+        instance = instances[code] = cls(code)
+        instance.__dict__['_info'] = country
+    return instances
 
 
 class CountryNumericCode(str):
@@ -198,18 +327,25 @@ class CountryNumericCode(str):
     """
 
     @classmethod
-    def _validate(cls, __input_value: str, _: core_schema.ValidationInfo) -> CountryNumericCode:
-        if __input_value not in _index_by_numeric_code():
-            raise PydanticCustomError('country_numeric_code', 'Invalid country numeric code')
-        return cls(__input_value)
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[CountryNumericCode]:
+        """Validate many ISO 3166-1 numeric codes at once, without raising.
+
+        Args:
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
+
+        Returns:
+            The valid codes in input order, and an `(index, error_type)` pair for each invalid value.
+        """
+        instances = _numeric_code_instances(cls)
+        return validate_codes(values, instances, instances.__getitem__, 'country_numeric_code', normalize=str.upper)
 
     @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source: type[Any], handler: GetCoreSchemaHandler
-    ) -> core_schema.AfterValidatorFunctionSchema:
-        return core_schema.with_info_after_validator_function(
-            cls._validate,
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return code_schema(
             core_schema.str_schema(to_upper=True),
+            _numeric_code_instances(cls).values(),
+            'country_numeric_code',
+            'Invalid country numeric code',
             serialization=core_schema.to_string_ser_schema(),
         )
 
@@ -221,20 +357,35 @@ class CountryNumericCode(str):
         json_schema.update({'pattern': r'^[0-9]{3}$'})
         return json_schema
 
+    @cached_property
+    def _info(self) -> CountryInfo:
+        # validated instances come with their record bound, see `_numeric_code_instances`
+        return _index_by_numeric_code()[self]
+
     @property
     def alpha2(self) -> str:
         """The country code in the [ISO 3166-1 alpha-2](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2) format."""
-        return _index_by_numeric_code()[self].alpha2
+        return self._info.alpha2
 
     @property
     def alpha3(self) -> str:
         """The country code in the [ISO 3166-1 alpha-3](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-3) format."""
-        return _index_by_numeric_code()[self].alpha3
+        return self._info.alpha3
 
     @property
     def short_name(self) -> str:
         """The country short name."""
-        return _index_by_numeric_code()[self].short_name
+        return self._info.short_name
+
+
+@lru_cache
+def _numeric_code_instances(cls: type[CountryNumericCode]) -> dict[str, CountryNumericCode]:
+    """The one `cls` instance of each ISO 3166-1 numeric code, shared by all values validated as `cls`."""
+    instances = {}
+    for code, country in _index_by_numeric_code().items():
+        instance = instances[code] = cls(code)
+        instance.__dict__['_info'] = country
+    return instances
 
 
 class CountryShortName(str):
@@ -257,32 +408,143 @@ class CountryShortName(str):
     """
 
     @classmethod
-    def _validate(cls, __input_value: str, _: core_schema.ValidationInfo) -> CountryShortName:
-        if __input_value not in _index_by_short_name():
-            raise PydanticCustomError('country_short_name', 'Invalid country short name')
-        return cls(__input_value)
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[CountryShortName]:
+        """Validate many country short names at once, without raising.
+
+        Args:
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
+
+        Returns:
+            The valid names in input order, and an `(index, error_type)` pair for each invalid value.
+        """
+        instances = _short_name_instances(cls)
+        return validate_codes(values, instances, instances.__getitem__, 'country_short_name')
 
     @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source: type[Any], handler: GetCoreSchemaHandler
-    ) -> core_schema.AfterValidatorFunctionSchema:
-        return core_schema.with_info_after_validator_function(
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return code_schema(
+            core_schema.str_schema(),
+            _short_name_instances(cls).values(),
+            'country_short_name',
+            'Invalid country short name',
+            serialization=core_schema.to_string_ser_schema(),
+        )
+
+    @cached_property
+    def _info(self) -> CountryInfo:
+        # validated instances come with their record bound, see `_short_name_instances`
+        return _index_by_short_name()[self]
+
+    @property
+    def alpha2(self) -> str:
+        """The country code in the [ISO 3166-1 alpha-2](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2) format."""
+        return self._info.alpha2
+
+    @property
+    def alpha3(self) -> str:
+        """The country code in the [ISO 3166-1 alpha-3](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-3) format."""
+        return self._info.alpha3
+
+    @property
+    def numeric_code(self) -> str:
+        """The country code in the [ISO 3166-1 numeric](https://en.wikipedia.org/wiki/ISO_3166-1_numeric) format."""
+        return self._info.numeric_code
+
+
+@lru_cache
+def _short_name_instances(cls: type[CountryShortName]) -> dict[str, CountryShortName]:
+    """The one `cls` instance of each country short name, shared by all values validated as `cls`."""
+    instances = {}
+    for short_name, country in _index_by_short_name().items():
+        instance = instances[short_name] = cls(short_name)
+        instance.__dict__['_info'] = country
+    return instances
+
+
+class CountryName(str):
+    """CountryName parses country names leniently and validates them to the country's short name.
+
+    Besides the short name it accepts the official and common names and the alpha-2 and alpha-3
+    codes, ignoring case, accents, punctuation and extra whitespace. Names that match no country are rejected
+    with up to three suggestions in the error message.
+
+    ```py
+    from pydantic import BaseModel
+
+    from pydantic_extra_types.country import CountryName
+
+
+    class Product(BaseModel):
+        made_in: CountryName
+
+
+    product = Product(made_in='united states of america')
+    print(product)
+    # > made_in='United States'
+    ```
+    """
+
+    @classmethod
+    def _validate(cls, name: str) -> CountryName:
+        country = _index_by_short_name().get(name) or _index_by_name().get(_normalize_name(name))
+        if country is None:
+            suggestions = suggest_country_names(name)
+            if not suggestions:
+                raise PydanticCustomError('country_name', 'Invalid country name')
+            raise PydanticCustomError(
+                'country_name',
+                'Invalid country name, did you mean {suggestions}?',
+                {'suggestions': ', '.join(repr(suggestion) for suggestion in suggestions)},
+            )
+        return _name_instances(cls)[country.short_name]
+
+    @classmethod
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[CountryName]:
+        """Validate many country names at once, without raising.
+
+        Args:
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
+
+        Returns:
+            The short names of the matched countries in input order, and an `(index, error_type)` pair for each
+            invalid value.
+        """
+        return validate_each(values, cls._validate)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_after_validator_function(
             cls._validate,
             core_schema.str_schema(),
             serialization=core_schema.to_string_ser_schema(),
         )
 
+    @cached_property
+    def _info(self) -> CountryInfo:
+        # validated instances come with their record bound, see `_name_instances`
+        return _index_by_short_name()[self]
+
     @property
     def alpha2(self) -> str:
         """The country code in the [ISO 3166-1 alpha-2](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2) format."""
-        return _index_by_short_name()[self].alpha2
+        return self._info.alpha2
 
     @property
     def alpha3(self) -> str:
         """The country code in the [ISO 3166-1 alpha-3](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-3) format."""
-        return _index_by_short_name()[self].alpha3
+        return self._info.alpha3
 
     @property
     def numeric_code(self) -> str:
         """The country code in the [ISO 3166-1 numeric](https://en.wikipedia.org/wiki/ISO_3166-1_numeric) format."""
-        return _index_by_short_name()[self].numeric_code
+        return self._info.numeric_code
+
+
+@lru_cache
+def _name_instances(cls: type[CountryName]) -> dict[str, CountryName]:
+    """The one `cls` instance of each country, by short name, shared by all values validated as `cls`."""
+    instances = {}
+    for short_name, country in _index_by_short_name().items():
+        instance = instances[short_name] = cls(short_name)
+        instance.__dict__['_info'] = country
+    return instances
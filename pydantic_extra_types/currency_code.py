@@ -2,18 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
-from pydantic_core import PydanticCustomError, core_schema
+from pydantic_core import core_schema
 
-try:
-    import pycountry
-except ModuleNotFoundError as e:  # pragma: no cover
-    raise RuntimeError(
-        'The `currency_code` module requires "pycountry" to be installed. You can install it with "pip install '
-        'pycountry".'
-    ) from e
+from pydantic_extra_types._batch import BatchResult, validate_codes
+from pydantic_extra_types._codes import code_schema
+from pydantic_extra_types._pycountry import reference_data
 
 # List of codes that should not be usually used within regular transactions
 _CODES_FOR_BONDS_METAL_TESTING = {
@@ -50,35 +47,28 @@ class ISO4217(str):
     ```
     """
 
-    allowed_countries_list = [country.alpha_3 for country in pycountry.currencies]
+    allowed_countries_list = list(reference_data().currencies)
     allowed_currencies = set(allowed_countries_list)
 
     @classmethod
-    def _validate(cls, currency_code: str, _: core_schema.ValidationInfo) -> str:
-        """Validate a ISO 4217 language code from the provided str value.
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[str]:
+        """Validate many ISO 4217 currency codes at once, without raising.
 
         Args:
-            currency_code: The str value to be validated.
-            _: The Pydantic ValidationInfo.
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
 
         Returns:
-            The validated ISO 4217 currency code.
-
-        Raises:
-            PydanticCustomError: If the ISO 4217 currency code is not valid.
+            The valid codes in input order, and an `(index, error_type)` pair for each invalid value.
         """
-        currency_code = currency_code.upper()
-        if currency_code not in cls.allowed_currencies:
-            raise PydanticCustomError(
-                'ISO4217', 'Invalid ISO 4217 currency code. See https://en.wikipedia.org/wiki/ISO_4217'
-            )
-        return currency_code
+        return validate_codes(values, cls.allowed_currencies, str, 'ISO4217', normalize=str.upper, length=3)
 
     @classmethod
     def __get_pydantic_core_schema__(cls, _: type[Any], __: GetCoreSchemaHandler) -> core_schema.CoreSchema:
-        return core_schema.with_info_after_validator_function(
-            cls._validate,
-            core_schema.str_schema(min_length=3, max_length=3),
+        return code_schema(
+            core_schema.str_schema(min_length=3, max_length=3, to_upper=True),
+            cls.allowed_currencies,
+            'ISO4217',
+            'Invalid ISO 4217 currency code. See https://en.wikipedia.org/wiki/ISO_4217',
         )
 
     @classmethod
@@ -115,29 +105,16 @@ class Currency(str):
     allowed_currencies = set(allowed_countries_list)
 
     @classmethod
-    def _validate(cls, currency_symbol: str, _: core_schema.ValidationInfo) -> str:
-        """Validate a subset of the [ISO4217](https://en.wikipedia.org/wiki/ISO_4217) format.
-        It excludes bonds testing codes and precious metals.
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[str]:
+        """Validate many currency codes at once, without raising.
 
         Args:
-            currency_symbol: The str value to be validated.
-            _: The Pydantic ValidationInfo.
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
 
         Returns:
-            The validated ISO 4217 currency code.
-
-        Raises:
-            PydanticCustomError: If the ISO 4217 currency code is not valid or is bond, precious metal or testing code.
+            The valid codes in input order, and an `(index, error_type)` pair for each invalid value.
         """
-        currency_symbol = currency_symbol.upper()
-        if currency_symbol not in cls.allowed_currencies:
-            raise PydanticCustomError(
-                'InvalidCurrency',
-                'Invalid currency code.'
-                ' See https://en.wikipedia.org/wiki/ISO_4217 . '
-                'Bonds, testing and precious metals codes are not allowed.',
-            )
-        return currency_symbol
+        return validate_codes(values, cls.allowed_currencies, str, 'InvalidCurrency', normalize=str.upper, length=3)
 
     @classmethod
     def __get_pydantic_core_schema__(cls, _: type[Any], __: GetCoreSchemaHandler) -> core_schema.CoreSchema:
@@ -154,9 +131,13 @@ class Currency(str):
             [ISO4217](https://en.wikipedia.org/wiki/ISO_4217) format.
             It excludes bonds testing codes and precious metals.
         """
-        return core_schema.with_info_after_validator_function(
-            cls._validate,
-            core_schema.str_schema(min_length=3, max_length=3),
+        return code_schema(
+            core_schema.str_schema(min_length=3, max_length=3, to_upper=True),
+            cls.allowed_currencies,
+            'InvalidCurrency',
+            'Invalid currency code.'
+            ' See https://en.wikipedia.org/wiki/ISO_4217 . '
+            'Bonds, testing and precious metals codes are not allowed.',
         )
 
     @classmethod
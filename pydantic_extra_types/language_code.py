@@ -2,23 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Any, Union
 
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
-from pydantic_core import PydanticCustomError, core_schema
+from pydantic_core import core_schema
 
-try:
-    import pycountry
-except ModuleNotFoundError as e:  # pragma: no cover
-    raise RuntimeError(
-        'The `language_code` module requires "pycountry" to be installed.'
-        ' You can install it with "pip install pycountry".'
-    ) from e
+from pydantic_extra_types._batch import BatchResult, validate_codes
+from pydantic_extra_types._codes import code_schema
+from pydantic_extra_types._pycountry import reference_data
 
 
-@dataclass
+@dataclass(frozen=True)
 class LanguageInfo:
     """LanguageInfo is a dataclass that contains the language information.
 
@@ -28,10 +25,20 @@ class LanguageInfo:
         name: The language name.
     """
 
+    __slots__ = ('alpha2', 'alpha3', 'name')
+
     alpha2: Union[str, None]
     alpha3: str
     name: str
 
+    # see `CountryInfo.__getstate__`
+    def __getstate__(self) -> tuple[Union[str, None], str, str]:
+        return self.alpha2, self.alpha3, self.name
+
+    def __setstate__(self, state: tuple[Union[str, None], str, str]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 @lru_cache
 def _languages() -> list[LanguageInfo]:
@@ -42,11 +49,11 @@ def _languages() -> list[LanguageInfo]:
     """
     return [
         LanguageInfo(
-            alpha2=getattr(language, 'alpha_2', None),
-            alpha3=language.alpha_3,
-            name=language.name,
+            alpha2=alpha2,
+            alpha3=alpha3,
+            name=name,
         )
-        for language in pycountry.languages
+        for alpha2, alpha3, name in reference_data().languages
     ]
 
 
@@ -90,24 +97,20 @@ class LanguageAlpha2(str):
     """
 
     @classmethod
-    def _validate(cls, __input_value: str, _: core_schema.ValidationInfo) -> LanguageAlpha2:
-        """Validate a language code in the ISO 639-1 alpha-2 format from the provided str value.
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[LanguageAlpha2]:
+        """Validate many ISO 639-1 alpha-2 codes at once, without raising.
 
         Args:
-            __input_value: The str value to be validated.
-            _: The Pydantic ValidationInfo.
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
 
         Returns:
-            The validated language code in the ISO 639-1 alpha-2 format.
+            The valid codes in input order, and an `(index, error_type)` pair for each invalid value.
         """
-        if __input_value not in _index_by_alpha2():
-            raise PydanticCustomError('language_alpha2', 'Invalid language alpha2 code')
-        return cls(__input_value)
+        instances = _alpha2_instances(cls)
+        return validate_codes(values, instances, instances.__getitem__, 'language_alpha2', normalize=str.lower)
 
     @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source: type[Any], handler: GetCoreSchemaHandler
-    ) -> core_schema.AfterValidatorFunctionSchema:
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
         """Return a Pydantic CoreSchema with the language code in the ISO 639-1 alpha-2 format validation.
 
         Args:
@@ -117,9 +120,11 @@ class LanguageAlpha2(str):
         Returns:
             A Pydantic CoreSchema with the language code in the ISO 639-1 alpha-2 format validation.
         """
-        return core_schema.with_info_after_validator_function(
-            cls._validate,
+        return code_schema(
             core_schema.str_schema(to_lower=True),
+            _alpha2_instances(cls).values(),
+            'language_alpha2',
+            'Invalid language alpha2 code',
         )
 
     @classmethod
@@ -139,15 +144,30 @@ class LanguageAlpha2(str):
         json_schema.update({'pattern': r'^\w{2}$'})
         return json_schema
 
+    @cached_property
+    def _info(self) -> LanguageInfo:
+        # validated instances come with their record bound, see `_alpha2_instances`
+        return _index_by_alpha2()[self]
+
     @property
     def alpha3(self) -> str:
         """The language code in the [ISO 639-3 alpha-3](https://en.wikipedia.org/wiki/ISO_639-3) format."""
-        return _index_by_alpha2()[self].alpha3
+        return self._info.alpha3
 
     @property
     def name(self) -> str:
         """The language name."""
-        return _index_by_alpha2()[self].name
+        return self._info.name
+
+
+@lru_cache
+def _alpha2_instances(cls: type[LanguageAlpha2]) -> dict[str, LanguageAlpha2]:
+    """The one `cls` instance of each ISO 639-1 language code, shared by all values validated as `cls`."""
+    instances = {}
+    for code, language in _index_by_alpha2().items():
+        instance = instances[code] = cls(code)
+        instance.__dict__['_info'] = language
+    return instances
 
 
 class LanguageName(str):
@@ -172,24 +192,20 @@ class LanguageName(str):
     """
 
     @classmethod
-    def _validate(cls, __input_value: str, _: core_schema.ValidationInfo) -> LanguageName:
-        """Validate a language name from the provided str value.
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[LanguageName]:
+        """Validate many language names at once, without raising.
 
         Args:
-            __input_value: The str value to be validated.
-            _: The Pydantic ValidationInfo.
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
 
         Returns:
-            The validated language name.
+            The valid names in input order, and an `(index, error_type)` pair for each invalid value.
         """
-        if __input_value not in _index_by_name():
-            raise PydanticCustomError('language_name', 'Invalid language name')
-        return cls(__input_value)
+        instances = _name_instances(cls)
+        return validate_codes(values, instances, instances.__getitem__, 'language_name')
 
     @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source: type[Any], handler: GetCoreSchemaHandler
-    ) -> core_schema.AfterValidatorFunctionSchema:
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
         """Return a Pydantic CoreSchema with the language name validation.
 
         Args:
@@ -199,21 +215,38 @@ class LanguageName(str):
         Returns:
             A Pydantic CoreSchema with the language name validation.
         """
-        return core_schema.with_info_after_validator_function(
-            cls._validate,
+        return code_schema(
             core_schema.str_schema(),
+            _name_instances(cls).values(),
+            'language_name',
+            'Invalid language name',
             serialization=core_schema.to_string_ser_schema(),
         )
 
+    @cached_property
+    def _info(self) -> LanguageInfo:
+        # validated instances come with their record bound, see `_name_instances`
+        return _index_by_name()[self]
+
     @property
     def alpha2(self) -> Union[str, None]:
         """The language code in the [ISO 639-1 alpha-2](https://en.wikipedia.org/wiki/ISO_639-1) format. Does not exist for all languages."""
-        return _index_by_name()[self].alpha2
+        return self._info.alpha2
 
     @property
     def alpha3(self) -> str:
         """The language code in the [ISO 639-3 alpha-3](https://en.wikipedia.org/wiki/ISO_639-3) format."""
-        return _index_by_name()[self].alpha3
+        return self._info.alpha3
+
+
+@lru_cache
+def _name_instances(cls: type[LanguageName]) -> dict[str, LanguageName]:
+    """The one `cls` instance of each language name, shared by all values validated as `cls`."""
+    instances = {}
+    for name, language in _index_by_name().items():
+        instance = instances[name] = cls(name)
+        instance.__dict__['_info'] = language
+    return instances
 
 
 class ISO639_3(str):
@@ -236,33 +269,24 @@ class ISO639_3(str):
     ```
     """
 
-    allowed_values_list = [lang.alpha_3 for lang in pycountry.languages]
+    allowed_values_list = [alpha3 for _, alpha3, _ in reference_data().languages]
     allowed_values = set(allowed_values_list)
 
     @classmethod
-    def _validate(cls, __input_value: str, _: core_schema.ValidationInfo) -> ISO639_3:
-        """Validate a ISO 639-3 language code from the provided str value.
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[ISO639_3]:
+        """Validate many ISO 639-3 codes at once, without raising.
 
         Args:
-            __input_value: The str value to be validated.
-            _: The Pydantic ValidationInfo.
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
 
         Returns:
-            The validated ISO 639-3 language code.
-
-        Raises:
-            PydanticCustomError: If the ISO 639-3 language code is not valid.
+            The valid codes in input order, and an `(index, error_type)` pair for each invalid value.
         """
-        if __input_value not in cls.allowed_values:
-            raise PydanticCustomError(
-                'ISO649_3', 'Invalid ISO 639-3 language code. See https://en.wikipedia.org/wiki/ISO_639-3'
-            )
-        return cls(__input_value)
+        instances = _iso639_3_instances(cls)
+        return validate_codes(values, instances, instances.__getitem__, 'ISO649_3', length=3)
 
     @classmethod
-    def __get_pydantic_core_schema__(
-        cls, _: type[Any], __: GetCoreSchemaHandler
-    ) -> core_schema.AfterValidatorFunctionSchema:
+    def __get_pydantic_core_schema__(cls, _: type[Any], __: GetCoreSchemaHandler) -> core_schema.CoreSchema:
         """Return a Pydantic CoreSchema with the ISO 639-3 language code validation.
 
         Args:
@@ -273,9 +297,11 @@ class ISO639_3(str):
             A Pydantic CoreSchema with the ISO 639-3 language code validation.
 
         """
-        return core_schema.with_info_after_validator_function(
-            cls._validate,
+        return code_schema(
             core_schema.str_schema(min_length=3, max_length=3),
+            _iso639_3_instances(cls).values(),
+            'ISO649_3',
+            'Invalid ISO 639-3 language code. See https://en.wikipedia.org/wiki/ISO_639-3',
         )
 
     @classmethod
@@ -297,6 +323,12 @@ class ISO639_3(str):
         return json_schema
 
 
+@lru_cache
+def _iso639_3_instances(cls: type[ISO639_3]) -> dict[str, ISO639_3]:
+    """The one `cls` instance of each ISO 639-3 language code, shared by all values validated as `cls`."""
+    return {code: cls(code) for code in cls.allowed_values_list}
+
+
 class ISO639_5(str):
     """ISO639_5 parses Language in the [ISO 639-5 alpha-3](https://en.wikipedia.org/wiki/ISO_639-5_alpha-3)
     format.
@@ -317,34 +349,25 @@ class ISO639_5(str):
     ```
     """
 
-    allowed_values_list = [lang.alpha_3 for lang in pycountry.language_families]
+    allowed_values_list = list(reference_data().language_families)
     allowed_values_list.sort()
     allowed_values = set(allowed_values_list)
 
     @classmethod
-    def _validate(cls, __input_value: str, _: core_schema.ValidationInfo) -> ISO639_5:
-        """Validate a ISO 639-5 language code from the provided str value.
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[ISO639_5]:
+        """Validate many ISO 639-5 codes at once, without raising.
 
         Args:
-            __input_value: The str value to be validated.
-            _: The Pydantic ValidationInfo.
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
 
         Returns:
-            The validated ISO 639-3 language code.
-
-        Raises:
-            PydanticCustomError: If the ISO 639-5 language code is not valid.
+            The valid codes in input order, and an `(index, error_type)` pair for each invalid value.
         """
-        if __input_value not in cls.allowed_values:
-            raise PydanticCustomError(
-                'ISO649_5', 'Invalid ISO 639-5 language code. See https://en.wikipedia.org/wiki/ISO_639-5'
-            )
-        return cls(__input_value)
+        instances = _iso639_5_instances(cls)
+        return validate_codes(values, instances, instances.__getitem__, 'ISO649_5', length=3)
 
     @classmethod
-    def __get_pydantic_core_schema__(
-        cls, _: type[Any], __: GetCoreSchemaHandler
-    ) -> core_schema.AfterValidatorFunctionSchema:
+    def __get_pydantic_core_schema__(cls, _: type[Any], __: GetCoreSchemaHandler) -> core_schema.CoreSchema:
         """Return a Pydantic CoreSchema with the ISO 639-5 language code validation.
 
         Args:
@@ -355,9 +378,11 @@ class ISO639_5(str):
             A Pydantic CoreSchema with the ISO 639-5 language code validation.
 
         """
-        return core_schema.with_info_after_validator_function(
-            cls._validate,
+        return code_schema(
             core_schema.str_schema(min_length=3, max_length=3),
+            _iso639_5_instances(cls).values(),
+            'ISO649_5',
+            'Invalid ISO 639-5 language code. See https://en.wikipedia.org/wiki/ISO_639-5',
         )
 
     @classmethod
@@ -377,3 +402,9 @@ class ISO639_5(str):
         json_schema = handler(schema)
         json_schema.update({'enum': cls.allowed_values_list})
         return json_schema
+
+
+@lru_cache
+def _iso639_5_instances(cls: type[ISO639_5]) -> dict[str, ISO639_5]:
+    """The one `cls` instance of each ISO 639-5 language family code, shared by all values validated as `cls`."""
+    return {code: cls(code) for code in cls.allowed_values_list}
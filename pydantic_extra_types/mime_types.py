@@ -17,11 +17,14 @@ else:
         pass
 
 
+from collections.abc import Iterable
 from typing import Any
 
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
 from pydantic_core import PydanticCustomError, core_schema
 
+from pydantic_extra_types._batch import BatchResult, validate_codes
+
 
 @dataclass
 class MimeTypeInfo:
@@ -2515,19 +2518,31 @@ class MimeType(str):
     """
 
     @classmethod
-    def _validate(cls, __input_value: str, _: core_schema.ValidationInfo) -> MimeType:
-        # Store the original mime_type for retrieval
-        mime_info = _index_by_mime_type().get(__input_value.lower())
-        if mime_info is None:
+    def _validate(cls, __input_value: str) -> MimeType:
+        # the shared instance, in the original case from the data
+        mime_type = _instances(cls).get(__input_value.lower())
+        if mime_type is None:
             raise PydanticCustomError('mime_type', 'Invalid MIME type')
-        # Return the original case from the data
-        return cls(mime_info.mime_type)
+        return mime_type
+
+    @classmethod
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[MimeType]:
+        """Validate many MIME types at once, without raising.
+
+        Args:
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
+
+        Returns:
+            The valid MIME types in input order, and an `(index, error_type)` pair for each invalid value.
+        """
+        instances = _instances(cls)
+        return validate_codes(values, instances, instances.__getitem__, 'mime_type', normalize=str.lower)
 
     @classmethod
     def __get_pydantic_core_schema__(
         cls, source: type[Any], handler: GetCoreSchemaHandler
     ) -> core_schema.AfterValidatorFunctionSchema:
-        return core_schema.with_info_after_validator_function(
+        return core_schema.no_info_after_validator_function(
             cls._validate,
             core_schema.str_schema(),
             serialization=core_schema.to_string_ser_schema(),
@@ -2547,6 +2562,12 @@ class MimeType(str):
         return _index_by_mime_type()[self.lower()].category
 
 
+@lru_cache
+def _instances(cls: type[MimeType]) -> dict[str, MimeType]:
+    """The one `cls` instance of each MIME type, by lower-cased type, shared by all values validated as `cls`."""
+    return {key: cls(mime.mime_type) for key, mime in _index_by_mime_type().items()}
+
+
 # Keep old class names for backward compatibility
 Application = _ApplicationEnum
 Audio = _AudioEnum
@@ -6,20 +6,43 @@ This class depends on the [pandas](https://pypi.org/project/pandas/) package.
 
 from __future__ import annotations
 
+import base64
+import binascii
+import io
+from collections import Counter
+from collections.abc import Collection, Iterable, Iterator, Mapping
 from dataclasses import dataclass
-from functools import partial
-from typing import Any
+from functools import lru_cache, partial
+from typing import Any, Callable, Literal, Optional
 
-from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
-from pydantic_core import PydanticCustomError, core_schema
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler, TypeAdapter, ValidationError
+from pydantic_core import PydanticCustomError, PydanticSerializationError, core_schema
+
+from pydantic_extra_types._frames import ColumnError, check_required_columns, column_values_error
 
 try:
+    import numpy as np
+    import numpy.typing as npt
     import pandas as pd  # type: ignore[import-untyped]
 except ModuleNotFoundError as e:
     raise RuntimeError(
         '`PandasDataFrame` requires "pandas" to be installed. You can install it with "pip install pandas"'
     ) from e
 
+DataFrameSerialization = Literal['list', 'records', 'split', 'arrow', 'parquet']
+"""How a DataFrame is serialized in JSON mode:
+
+- `'list'`: a dict of the values of each column, `{column: [value, ...]}`.
+- `'records'`: a list of the rows as dicts, `[{column: value}, ...]`.
+- `'split'`: `{'index': [...], 'columns': [...], 'data': [[value, ...], ...]}`.
+- `'arrow'`: the base64 of an [Arrow IPC stream](https://arrow.apache.org/docs/format/Columnar.html#ipc-streaming-format),
+  which requires `pyarrow`.
+- `'parquet'`: the base64 of a Parquet file, which requires `pyarrow` or `fastparquet`.
+
+The JSON modes lose the dtypes (and, but for `'split'`, the index), the binary modes keep both. In
+every mode, validation turns the serialized form back into a DataFrame.
+"""
+
 
 class PandasDataFrame:
     """A wrapper type that validates an object is a `pandas.DataFrame`.
@@ -27,7 +50,12 @@ class PandasDataFrame:
     You can optionally require a set of columns to be present in the
     DataFrame by setting `required_columns` either via subclassing or
     by using the [`PandasDataFrameValidator`][pydantic_extra_types.pandas.PandasDataFrameValidator]
-    annotation.
+    annotation, declare the type of the values of some columns with `columns`, and constrain
+    columns with `dtypes`, `non_null`, `unique`, `min`, `max` and `categories`. Every failure is
+    reported in a single error, with the number of failing rows of each column and a sample of them.
+
+    In JSON mode, the DataFrame serializes as set by `serialization`, see
+    [`DataFrameSerialization`][pydantic_extra_types.pandas.DataFrameSerialization].
 
     ## Examples
 
@@ -85,68 +113,420 @@ class PandasDataFrame:
     m = Model(df=pd.DataFrame({'name': ['Alice'], 'email': ['alice@example.com']}))
     print(m.df)
     ```
+
+    ### With column types:
+
+    ```python
+    import pandas as pd
+    from pydantic import BaseModel
+    from pydantic_extra_types.country import CountryAlpha2
+    from pydantic_extra_types.pandas import PandasDataFrame
+
+
+    class OrderFrame(PandasDataFrame):
+        columns = {'country': CountryAlpha2, 'quantity': int}
+
+
+    class Model(BaseModel):
+        df: OrderFrame
+
+
+    # This will raise a validation error listing the rows 1 and 2 of the 'country' column
+    m = Model(df=pd.DataFrame({'country': ['ES', 'XX', 'YY'], 'quantity': [1, 2, 3]}))
+    ```
     """
 
     required_columns: list[str] | None = None
     """An optional list of column names that the DataFrame must contain."""
+    columns: Mapping[str, Any] | None = None
+    """An optional mapping of column names to the type of their values, see
+    [`validate_columns`][pydantic_extra_types.pandas.validate_columns]. These columns are required too."""
+    dtypes: Mapping[str, Any] | None = None
+    """An optional mapping of column names to their exact dtype, anything `pandas.api.types.pandas_dtype` accepts."""
+    non_null: list[str] | None = None
+    """An optional list of column names that must not contain missing values."""
+    unique: list[str] | None = None
+    """An optional list of column names whose values must not repeat."""
+    min: Mapping[str, Any] | None = None
+    """An optional mapping of column names to the smallest value allowed, inclusive."""
+    max: Mapping[str, Any] | None = None
+    """An optional mapping of column names to the largest value allowed, inclusive."""
+    categories: Mapping[str, Collection[Any]] | None = None
+    """An optional mapping of column names to the values allowed. Missing values are always allowed,
+    see `non_null`. The constrained columns are required too."""
+    serialization: DataFrameSerialization = 'list'
+    """How the DataFrame is serialized in JSON mode, and which serialized form is validated back into one."""
 
     @classmethod
     def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
-        return core_schema.with_info_after_validator_function(
-            cls._validate,
-            core_schema.any_schema(),
+        return _serialized_schema(
+            cls.serialization,
+            core_schema.with_info_after_validator_function(
+                cls._validate,
+                core_schema.any_schema(),
+            ),
         )
 
     @classmethod
     def __get_pydantic_json_schema__(
         cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
     ) -> dict[str, Any]:
-        json_schema = handler(schema)
-        json_schema.update({'type': 'object', 'title': 'DataFrame'})
-        return json_schema
+        return _dataframe_json_schema(cls.serialization)
 
     @classmethod
     def _validate(cls, value: Any, _: core_schema.ValidationInfo) -> pd.DataFrame:
-        if not isinstance(value, pd.DataFrame):
-            raise PydanticCustomError(
-                'value_error',
-                'value is not a valid pandas DataFrame',
+        constraints = _Constraints(cls.dtypes, cls.non_null, cls.unique, cls.min, cls.max, cls.categories)
+        return _validate_dataframe(cls.required_columns, _column_validators(cls.columns), constraints, value)
+
+
+def _is_missing(value: Any) -> bool:
+    return bool(pd.api.types.is_scalar(value) and pd.isna(value))
+
+
+class _ColumnValidator:
+    """Validates whole columns against a type, validating each distinct value once."""
+
+    def __init__(self, annotation: Any) -> None:
+        self.adapter: TypeAdapter[Any] = TypeAdapter(annotation)
+        # a vectorized kernel such as `IBAN.validate_array`, which finds the invalid rows of
+        # mostly distinct values without a Python call per row
+        self.validate_array = getattr(annotation, 'validate_array', None)
+
+    def error_type(self, value: Any) -> str | None:
+        try:
+            # NaN, NaT and NA are validated as None, so `Optional` types accept missing values
+            self.adapter.validate_python(None if _is_missing(value) else value)
+        except ValidationError as e:
+            return e.errors()[0]['type']
+        return None
+
+    def row_errors(self, series: pd.Series) -> tuple[list[str], npt.NDArray[np.intp]]:
+        """The error types found in `series`, and for each row by position the number of its error type, from 1.
+
+        Valid rows get 0. Rows are numbered by position rather than label, as labels need not be unique.
+        """
+        positions = None
+        candidates = series
+        if self.validate_array is not None:
+            valid, _ = self.validate_array(series)
+            positions = np.flatnonzero(~np.asarray(valid))
+            candidates = series.iloc[positions]
+
+        error_types: dict[str, int] = {}
+        try:
+            # `codes` maps each row to its distinct value, missing values included
+            codes, values = pd.factorize(candidates, use_na_sentinel=False)
+        except TypeError:  # unhashable values, e.g. lists
+            candidate_errors = np.array(
+                [
+                    0 if error_type is None else error_types.setdefault(error_type, len(error_types) + 1)
+                    for error_type in map(self.error_type, candidates)
+                ],
+                dtype=np.intp,
             )
+        else:
+            # number the error types from 1, 0 is valid, then spread the numbers over the rows
+            value_errors = [
+                0 if error_type is None else error_types.setdefault(error_type, len(error_types) + 1)
+                for error_type in map(self.error_type, values)
+            ]
+            candidate_errors = np.asarray(value_errors, dtype=np.intp)[codes]
+        if positions is None:
+            return list(error_types), candidate_errors
+        row_errors = np.zeros(len(series), dtype=np.intp)
+        row_errors[positions] = candidate_errors
+        return list(error_types), row_errors
+
+    def errors(self, column: str, series: pd.Series) -> tuple[list[ColumnError], npt.NDArray[np.bool_]]:
+        """The errors in `series`, and the mask of the rows with any, by position."""
+        error_types, row_errors = self.row_errors(series)
+        errors = [
+            ColumnError(column, error_type, series.index[row_errors == number].tolist())
+            for number, error_type in enumerate(error_types, 1)
+        ]
+        return errors, row_errors > 0
+
+
+@lru_cache
+def _column_validators_for(columns: tuple[tuple[str, Any], ...]) -> dict[str, _ColumnValidator]:
+    return {column: _ColumnValidator(annotation) for column, annotation in columns}
+
+
+def _column_validators(columns: Optional[Mapping[str, Any]]) -> dict[str, _ColumnValidator]:
+    return _column_validators_for(tuple(columns.items())) if columns else {}
+
+
+def _column_errors(validators: Mapping[str, _ColumnValidator], df: pd.DataFrame) -> list[ColumnError]:
+    return _invalid_rows(validators, df)[0]
+
+
+def _invalid_rows(
+    validators: Mapping[str, _ColumnValidator], df: pd.DataFrame
+) -> tuple[list[ColumnError], npt.NDArray[np.bool_]]:
+    """The errors in the columns of `df`, and the mask of the rows with any of them, by position."""
+    errors: list[ColumnError] = []
+    invalid = np.zeros(len(df), dtype=bool)
+    for column, validator in validators.items():
+        column_errors, column_invalid = validator.errors(column, df[column])
+        errors += column_errors
+        invalid |= column_invalid
+    return errors, invalid
+
+
+def validate_columns(df: pd.DataFrame, columns: Mapping[str, Any]) -> list[ColumnError]:
+    """Validate the values of DataFrame columns against pydantic types, without raising.
+
+    Each distinct value of a column is validated once and the failures are mapped back to their
+    rows through `pandas.factorize`, so columns with few distinct values, such as country or
+    currency codes, are validated at the speed of a set membership check. Types with a vectorized
+    `validate_array` classmethod, such as [`IBAN`][pydantic_extra_types.iban.IBAN], run it over the
+    whole column first. Missing values are validated as `None`.
+
+    Args:
+        df: The DataFrame. Every column in `columns` must be present once.
+        columns: The type of the values of each column, anything `pydantic.TypeAdapter` accepts.
+
+    Returns:
+        A `ColumnError` for each column and error type with failing rows, empty if every value is valid.
+
+    Raises:
+        PydanticCustomError: If a column in `columns` is missing, or appears more than once.
+    """
+    check_required_columns('DataFrame', None, columns, df.columns)
+    return _column_errors(_column_validators(columns), df)
+
+
+class _Constraints:
+    """Checks the declarative column constraints of a DataFrame with vectorized pandas operations."""
+
+    def __init__(
+        self,
+        dtypes: Mapping[str, Any] | None = None,
+        non_null: list[str] | None = None,
+        unique: list[str] | None = None,
+        min: Mapping[str, Any] | None = None,
+        max: Mapping[str, Any] | None = None,
+        categories: Mapping[str, Collection[Any]] | None = None,
+    ) -> None:
+        self.dtypes = {column: pd.api.types.pandas_dtype(dtype) for column, dtype in (dtypes or {}).items()}
+        self.non_null = frozenset(non_null or ())
+        self.unique = frozenset(unique or ())
+        self.min = dict(min or {})
+        self.max = dict(max or {})
+        self.categories = {column: list(values) for column, values in (categories or {}).items()}
+        self.columns = list(
+            dict.fromkeys([*self.dtypes, *(non_null or ()), *(unique or ()), *self.min, *self.max, *self.categories])
+        )
 
-        if cls.required_columns:
-            missing = [col for col in cls.required_columns if col not in value.columns]
-            if missing:
-                raise PydanticCustomError(
-                    'value_error',
-                    'DataFrame is missing required columns: {}'.format(', '.join(missing)),
-                )
-
-        return value
+    def errors(self, df: pd.DataFrame) -> list[ColumnError]:
+        return [error for column in self.columns for error in self._column_errors(column, df[column])]
+
+    def _column_errors(self, column: str, series: pd.Series) -> list[ColumnError]:
+        dtype = self.dtypes.get(column)
+        if dtype is not None and series.dtype != dtype:
+            # the other constraints assume the declared dtype, so they are not checked
+            return [ColumnError(column, 'dtype', [], {'expected': str(dtype), 'actual': str(series.dtype)})]
+
+        checks: list[tuple[str, Any, Optional[dict[str, Any]]]] = []
+        if column in self.non_null:
+            checks.append(('missing', series.isna(), None))
+        if column in self.unique:
+            # every repeat of a value after its first row
+            checks.append(('duplicate', series.duplicated(), None))
+        try:
+            # missing values compare false, they are left to `non_null`
+            if column in self.min:
+                checks.append(('greater_than_equal', series < self.min[column], {'ge': self.min[column]}))
+            if column in self.max:
+                checks.append(('less_than_equal', series > self.max[column], {'le': self.max[column]}))
+        except TypeError:  # e.g. strings compared to a number
+            return [ColumnError(column, 'dtype', [], {'actual': str(series.dtype)})]
+        if column in self.categories:
+            expected = self.categories[column]
+            checks.append(('category', ~(series.isin(expected) | series.isna()), {'expected': expected}))
+
+        return [
+            ColumnError(column, error_type, series.index[mask].tolist(), ctx)
+            for error_type, mask, ctx in checks
+            if mask.any()
+        ]
 
 
 def _validate_dataframe(
     required_columns: list[str] | None,
+    columns: Mapping[str, _ColumnValidator],
+    constraints: _Constraints,
     value: Any,
 ) -> pd.DataFrame:
-    """Validate that *value* is a ``pd.DataFrame`` and (optionally) that it
-    contains *required_columns*."""
+    """Validate that *value* is a ``pd.DataFrame``, that it contains *required_columns*, the
+    typed *columns* and the constrained columns, and that their values are valid."""
     if not isinstance(value, pd.DataFrame):
         raise PydanticCustomError(
             'value_error',
             'value is not a valid pandas DataFrame',
         )
 
-    if required_columns:
-        missing = [col for col in required_columns if col not in value.columns]
-        if missing:
-            raise PydanticCustomError(
-                'value_error',
-                'DataFrame is missing required columns: {}'.format(', '.join(missing)),
-            )
+    check_required_columns('DataFrame', required_columns, [*columns, *constraints.columns], value.columns)
+    errors = _column_errors(columns, value) + constraints.errors(value)
+    if errors:
+        raise column_values_error('DataFrame', errors)
 
     return value
 
 
+def _column_values(series: pd.Series) -> list[Any]:
+    """The values of a column as Python objects, with missing values as `None`."""
+    if series.hasnans:
+        # NaN, NaT and NA, which JSON has no literal for
+        return series.astype(object).where(series.notna(), None).tolist()  # type: ignore[no-any-return]
+    return series.tolist()  # type: ignore[no-any-return]
+
+
+def _columns(df: pd.DataFrame) -> list[list[Any]]:
+    return [_column_values(df.iloc[:, position]) for position in range(df.shape[1])]
+
+
+def _dump_list(df: pd.DataFrame) -> dict[Any, list[Any]]:
+    return dict(zip(df.columns, _columns(df)))
+
+
+def _dump_records(df: pd.DataFrame) -> list[dict[Any, Any]]:
+    return [dict(zip(df.columns, row)) for row in zip(*_columns(df))]
+
+
+def _dump_split(df: pd.DataFrame) -> dict[str, list[Any]]:
+    return {
+        'index': _column_values(df.index.to_series()),
+        'columns': df.columns.tolist(),
+        'data': [list(row) for row in zip(*_columns(df))],
+    }
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow as pa  # type: ignore[import-untyped]
+    except ModuleNotFoundError as e:  # pragma: no cover
+        raise RuntimeError(
+            'The "arrow" serialization of `PandasDataFrame` requires "pyarrow" to be installed.'
+            ' You can install it with "pip install pyarrow".'
+        ) from e
+    return pa
+
+
+def _dump_arrow(df: pd.DataFrame) -> str:
+    pa = _import_pyarrow()
+    # the schema metadata records the index and the pandas dtypes, which `to_pandas` restores
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return base64.b64encode(sink.getvalue()).decode()
+
+
+def _dump_parquet(df: pd.DataFrame) -> str:
+    return base64.b64encode(df.to_parquet()).decode()
+
+
+def _decode_base64(value: Any) -> bytes | None:
+    if isinstance(value, str):
+        try:
+            return base64.b64decode(value, validate=True)
+        except binascii.Error:
+            return None
+    return bytes(value) if isinstance(value, (bytes, bytearray, memoryview)) else None
+
+
+def _load_list(value: Any) -> pd.DataFrame | None:
+    return pd.DataFrame(dict(value)) if isinstance(value, Mapping) else None
+
+
+def _load_records(value: Any) -> pd.DataFrame | None:
+    return pd.DataFrame.from_records(value) if isinstance(value, list) else None
+
+
+def _load_split(value: Any) -> pd.DataFrame | None:
+    if not (isinstance(value, Mapping) and {'columns', 'data'} <= value.keys()):
+        return None
+    return pd.DataFrame(value['data'], index=value.get('index'), columns=value['columns'])
+
+
+def _load_arrow(value: Any) -> pd.DataFrame | None:
+    data = _decode_base64(value)
+    if data is None:
+        return None
+    pa = _import_pyarrow()
+    return pa.ipc.open_stream(pa.py_buffer(data)).read_all().to_pandas()
+
+
+def _load_parquet(value: Any) -> pd.DataFrame | None:
+    data = _decode_base64(value)
+    return None if data is None else pd.read_parquet(io.BytesIO(data))
+
+
+_DUMPERS: dict[str, Callable[[pd.DataFrame], Any]] = {
+    'list': _dump_list,
+    'records': _dump_records,
+    'split': _dump_split,
+    'arrow': _dump_arrow,
+    'parquet': _dump_parquet,
+}
+_LOADERS: dict[str, Callable[[Any], Optional[pd.DataFrame]]] = {
+    'list': _load_list,
+    'records': _load_records,
+    'split': _load_split,
+    'arrow': _load_arrow,
+    'parquet': _load_parquet,
+}
+
+
+def _load_dataframe(serialization: DataFrameSerialization, value: Any) -> Any:
+    """Turn the *serialization* of a DataFrame back into one, and leave anything else to the validator."""
+    if isinstance(value, pd.DataFrame):
+        return value
+    try:
+        df = _LOADERS[serialization](value)
+    except (ValueError, TypeError, OSError) as e:  # includes the errors of pyarrow, e.g. `ArrowInvalid`
+        raise PydanticCustomError(
+            'value_error',
+            'value is not a valid pandas DataFrame: {error}',
+            {'error': str(e)},
+        ) from e
+    return value if df is None else df
+
+
+def _serialized_schema(serialization: DataFrameSerialization, schema: core_schema.CoreSchema) -> core_schema.CoreSchema:
+    """Wrap the schema validating a DataFrame to also validate, and serialize to, its *serialization*."""
+    if serialization not in _LOADERS:
+        raise ValueError(f'unknown DataFrame serialization {serialization!r}, expected one of {", ".join(_LOADERS)}')
+    return core_schema.no_info_before_validator_function(
+        partial(_load_dataframe, serialization),
+        schema,
+        serialization=core_schema.plain_serializer_function_ser_schema(_DUMPERS[serialization], when_used='json'),
+    )
+
+
+def _dataframe_json_schema(serialization: DataFrameSerialization) -> dict[str, Any]:
+    if serialization == 'records':
+        return {'type': 'array', 'items': {'type': 'object'}, 'title': 'DataFrame'}
+    if serialization == 'split':
+        return {
+            'type': 'object',
+            'properties': {
+                'index': {'type': 'array'},
+                'columns': {'type': 'array'},
+                'data': {'type': 'array', 'items': {'type': 'array'}},
+            },
+            'required': ['columns', 'data'],
+            'title': 'DataFrame',
+        }
+    if serialization in ('arrow', 'parquet'):
+        media_type = (
+            'application/vnd.apache.arrow.stream' if serialization == 'arrow' else 'application/vnd.apache.parquet'
+        )
+        return {'type': 'string', 'contentEncoding': 'base64', 'contentMediaType': media_type, 'title': 'DataFrame'}
+    return {'type': 'object', 'title': 'DataFrame'}
+
+
 @dataclass(frozen=True)
 class PandasDataFrameValidator:
     """An annotation to validate `pd.DataFrame` objects with column constraints.
@@ -167,27 +547,98 @@ class PandasDataFrameValidator:
 
         m = Model(df=pd.DataFrame({'name': ['Alice'], 'email': ['alice@example.com']}))
         ```
+
+        Column types are validated a whole column at a time, and a failure lists every invalid row:
+
+        ```python
+        from typing import Annotated
+        import pandas as pd
+        from pydantic_extra_types.country import CountryAlpha2
+        from pydantic_extra_types.iban import IBAN
+        from pydantic_extra_types.pandas import PandasDataFrameValidator
+
+        PaymentFrame = Annotated[
+            pd.DataFrame, PandasDataFrameValidator(columns={'country': CountryAlpha2, 'iban': IBAN})
+        ]
+        ```
+
+        Constraints on the dtype, missing values, uniqueness, range and categories of columns are
+        checked with vectorized pandas operations, without validating the values one by one:
+
+        ```python
+        from typing import Annotated
+        import pandas as pd
+        from pydantic_extra_types.pandas import PandasDataFrameValidator
+
+        OrderFrame = Annotated[
+            pd.DataFrame,
+            PandasDataFrameValidator(
+                dtypes={'id': 'int64', 'price': 'float64'},
+                non_null=['id', 'price'],
+                unique=['id'],
+                min={'price': 0},
+                categories={'status': ['open', 'paid', 'refunded']},
+            ),
+        ]
+        ```
+
+        `serialization` sets how the DataFrame is dumped in JSON mode, and validated back from it:
+
+        ```python
+        from typing import Annotated
+        import pandas as pd
+        from pydantic import BaseModel
+        from pydantic_extra_types.pandas import PandasDataFrameValidator
+
+
+        class Model(BaseModel):
+            df: Annotated[pd.DataFrame, PandasDataFrameValidator(serialization='arrow')]
+
+
+        m = Model(df=pd.DataFrame({'a': [1, 2, 3]}))
+        assert Model.model_validate_json(m.model_dump_json()).df.equals(m.df)
+        ```
     """
 
     required_columns: list[str] | None = None
     """An optional list of column names that the DataFrame must contain."""
+    columns: Mapping[str, Any] | None = None
+    """An optional mapping of column names to the type of their values, see
+    [`validate_columns`][pydantic_extra_types.pandas.validate_columns]. These columns are required too."""
+    dtypes: Mapping[str, Any] | None = None
+    """An optional mapping of column names to their exact dtype, anything `pandas.api.types.pandas_dtype` accepts."""
+    non_null: list[str] | None = None
+    """An optional list of column names that must not contain missing values."""
+    unique: list[str] | None = None
+    """An optional list of column names whose values must not repeat."""
+    min: Mapping[str, Any] | None = None
+    """An optional mapping of column names to the smallest value allowed, inclusive."""
+    max: Mapping[str, Any] | None = None
+    """An optional mapping of column names to the largest value allowed, inclusive."""
+    categories: Mapping[str, Collection[Any]] | None = None
+    """An optional mapping of column names to the values allowed. Missing values are always allowed,
+    see `non_null`. The constrained columns are required too."""
+    serialization: DataFrameSerialization = 'list'
+    """How the DataFrame is serialized in JSON mode, and which serialized form is validated back into one."""
 
     def __get_pydantic_core_schema__(self, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
-        return core_schema.no_info_before_validator_function(
-            partial(
-                _validate_dataframe,
-                self.required_columns,
+        return _serialized_schema(
+            self.serialization,
+            core_schema.no_info_before_validator_function(
+                partial(
+                    _validate_dataframe,
+                    self.required_columns,
+                    _column_validators(self.columns),
+                    _Constraints(self.dtypes, self.non_null, self.unique, self.min, self.max, self.categories),
+                ),
+                core_schema.any_schema(),
             ),
-            core_schema.any_schema(),
         )
 
-    @classmethod
     def __get_pydantic_json_schema__(
-        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+        self, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
     ) -> dict[str, Any]:
-        json_schema = handler(schema)
-        json_schema.update({'type': 'object', 'title': 'DataFrame'})
-        return json_schema
+        return _dataframe_json_schema(self.serialization)
 
     def __hash__(self) -> int:
         return super().__hash__()
@@ -237,3 +688,142 @@ class PandasSeries:
             )
 
         return value
+
+
+def _dump_stream(value: PandasDataFrameStream) -> Any:
+    raise PydanticSerializationError('a DataFrame stream cannot be serialized to JSON')
+
+
+class PandasDataFrameStream:
+    """Validates a DataFrame that arrives in chunks, one chunk at a time.
+
+    The chunks can come from `pd.read_csv(..., chunksize=...)`, a `pyarrow.parquet.ParquetFile`
+    (read batch by batch), or any iterable of DataFrames or Arrow tables and record batches. Only
+    the current chunk is held in memory. Each chunk is checked for `required_columns` and its
+    `columns` are validated like [`validate_columns`][pydantic_extra_types.pandas.validate_columns]
+    does, as the stream is iterated.
+
+    Chunks converted from Arrow get a `RangeIndex` that continues from the previous chunk, so that
+    row labels in errors are row numbers in the whole input.
+
+    ## Examples
+
+    ```python
+    import pandas as pd
+    from pydantic_extra_types.country import CountryAlpha2
+    from pydantic_extra_types.pandas import PandasDataFrameStream
+
+    stream = PandasDataFrameStream(
+        pd.read_csv('orders.csv', chunksize=100_000),
+        columns={'country': CountryAlpha2},
+        on_error='drop',
+    )
+    for chunk in stream:
+        ...  # only the rows with a valid country
+    print(stream.rows, stream.invalid_rows, stream.error_counts)
+    ```
+
+    Subclasses can declare `required_columns` and `columns` as class attributes and be used as the
+    type of a model field. The field then accepts any of the chunk sources above, and validates
+    them lazily when the stream is iterated.
+    """
+
+    required_columns: list[str] | None = None
+    """An optional list of column names that every chunk must contain."""
+    columns: Mapping[str, Any] | None = None
+    """An optional mapping of column names to the type of their values. These columns are required too."""
+
+    def __init__(
+        self,
+        chunks: Any,
+        *,
+        required_columns: list[str] | None = None,
+        columns: Mapping[str, Any] | None = None,
+        on_error: Literal['raise', 'drop', 'keep'] = 'raise',
+    ) -> None:
+        """Wrap a source of chunks.
+
+        Args:
+            chunks: A DataFrame, a `pyarrow.parquet.ParquetFile`, or an iterable of DataFrames, Arrow
+                tables or Arrow record batches.
+            required_columns: The column names every chunk must contain, by default the class attribute.
+            columns: The type of the values of each column, by default the class attribute.
+            on_error: What to do with the rows with invalid values: raise a `PydanticCustomError` for the
+                first chunk with any, leave them out of the chunks, or keep them.
+        """
+        self._chunks = chunks
+        self._required_columns = self.required_columns if required_columns is None else required_columns
+        self._columns = _column_validators(self.columns if columns is None else columns)
+        if on_error not in ('raise', 'drop', 'keep'):
+            raise ValueError(f"on_error must be 'raise', 'drop' or 'keep', got {on_error!r}")
+        self.on_error = on_error
+        self.rows = 0
+        """The number of rows read so far."""
+        self.invalid_rows = 0
+        """The number of rows read so far with at least one invalid value."""
+        self.error_counts: Counter[tuple[str, str]] = Counter()
+        """The number of invalid values read so far, by column and error type."""
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for chunk in self._iter_frames():
+            check_required_columns('DataFrame', self._required_columns, self._columns, chunk.columns)
+            errors, invalid = _invalid_rows(self._columns, chunk)
+            self.rows += len(chunk)
+            if not errors:
+                yield chunk
+                continue
+
+            self.invalid_rows += int(invalid.sum())
+            self.error_counts.update({(error.column, error.type): len(error.rows) for error in errors})
+            if self.on_error == 'raise':
+                raise column_values_error('DataFrame', errors)
+            yield chunk[~invalid] if self.on_error == 'drop' else chunk
+
+    def _iter_frames(self) -> Iterator[pd.DataFrame]:
+        chunks: Iterable[Any]
+        if isinstance(self._chunks, pd.DataFrame):
+            chunks = [self._chunks]
+        elif hasattr(self._chunks, 'iter_batches'):  # pyarrow.parquet.ParquetFile
+            chunks = self._chunks.iter_batches()
+        else:
+            chunks = self._chunks
+
+        offset = 0
+        for chunk in chunks:
+            if not isinstance(chunk, pd.DataFrame):
+                if not hasattr(chunk, 'to_pandas'):
+                    raise PydanticCustomError(
+                        'value_error',
+                        'value is not a valid pandas DataFrame',
+                    )
+                chunk = chunk.to_pandas()
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        # a stream can only be read once, so it is dumped as is in Python mode and not at all to JSON
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(_dump_stream, when_used='json'),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> dict[str, Any]:
+        return {'type': 'array', 'items': {'type': 'object', 'title': 'DataFrame'}, 'title': 'DataFrameStream'}
+
+    @classmethod
+    def _validate(cls, value: Any) -> PandasDataFrameStream:
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, (str, bytes, Mapping)) or not (
+            isinstance(value, (pd.DataFrame, Iterable)) or hasattr(value, 'iter_batches')
+        ):
+            raise PydanticCustomError(
+                'value_error',
+                'value is not a valid source of pandas DataFrame chunks',
+            )
+        return cls(value)
@@ -4,12 +4,23 @@
 
 from __future__ import annotations
 
+import csv
+import heapq
+import os
+from bisect import bisect_right
+from collections.abc import Iterable
 from enum import Enum
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Union
 
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import PydanticCustomError, core_schema
 
+from pydantic_extra_types._batch import BatchResult, validate_each
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
 
 class PaymentCardBrand(str, Enum):
     """Payment card brands supported by the [`PaymentCardNumber`][pydantic_extra_types.payment.PaymentCardNumber]."""
@@ -32,6 +43,196 @@ class PaymentCardBrand(str, Enum):
         return self.value
 
 
+BIN_LENGTH = 8
+"""The number of digits BIN prefixes are normalized to in a [`BinTable`][pydantic_extra_types.payment.BinTable]."""
+
+BinEntry = tuple[Union[PaymentCardBrand, str], tuple[int, ...]]
+"""`(brand, valid_lengths)`, where empty `valid_lengths` allow any length."""
+
+
+class BinTable:
+    """Maps [BIN](https://en.wikipedia.org/wiki/Payment_card_number#Issuer_identification_number_(IIN))
+    ranges to card brands.
+
+    Ranges are given as prefixes of up to 8 digits and normalized to 8-digit intervals, so `'4'` covers
+    `40000000` to `49999999` and `'2221'` to `'2720'` covers `22210000` to `27209999`. Where ranges overlap,
+    the one registered last wins, which lets more specific issuer ranges be layered over the built-in ones.
+
+    The ranges are flattened into sorted, non-overlapping intervals when they are registered, so a lookup
+    is a single `bisect` on the 8-digit prefix of the card number.
+
+    ```py
+    from pydantic_extra_types.payment import PaymentCardNumber
+
+    PaymentCardNumber.bin_table.register('Acme Pay', '60480000', '60489999', lengths=[16])
+    PaymentCardNumber.bin_table.load('issuer_bins.csv')
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._ranges: list[tuple[int, int, BinEntry]] = []
+        # flattened intervals, replaced as a whole so lookups never see a partial rebuild
+        self._intervals: tuple[list[int], list[int], list[BinEntry]] = ([], [], [])
+        self._arrays: Any = None
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def register(
+        self, brand: PaymentCardBrand | str, start: str, end: str | None = None, *, lengths: Iterable[int] = ()
+    ) -> None:
+        """Register a BIN range for a brand.
+
+        Args:
+            brand: The brand of the cards in the range. Strings that are a `PaymentCardBrand` value
+                are converted to it, any other string registers a new brand.
+            start: The first prefix of the range, up to 8 digits.
+            end: The last prefix of the range, up to 8 digits, defaults to `start`.
+            lengths: The valid lengths of card numbers in the range, any length if empty.
+
+        Raises:
+            ValueError: If a prefix is not 1 to 8 digits, or the range is empty.
+        """
+        self._ranges.append(_bin_range(brand, start, end, lengths))
+        self._rebuild()
+
+    def load(self, path: str | os.PathLike[str]) -> int:
+        """Register the BIN ranges of an issuer range file.
+
+        The file is CSV with a header row and `start`, `end`, `brand` and `lengths` columns, where `end`
+        may be left empty for single prefixes and `lengths` holds space separated lengths. Other columns
+        are ignored. Rows are registered in file order, and only once the whole file has been read, so
+        a file with an invalid row registers nothing.
+
+        Args:
+            path: The path to the CSV file.
+
+        Returns:
+            The number of ranges registered.
+
+        Raises:
+            ValueError: If a row has an invalid prefix or length, or an empty range.
+        """
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        ranges = [
+            _bin_range(
+                row['brand'].strip(),
+                row['start'].strip(),
+                row['end'].strip() or None,
+                [int(length) for length in row['lengths'].split()],
+            )
+            for row in rows
+        ]
+        self._ranges.extend(ranges)
+        self._rebuild()
+        return len(ranges)
+
+    def copy(self) -> BinTable:
+        """A copy of the table, e.g. for a `PaymentCardNumber` subclass with its own ranges."""
+        table = BinTable()
+        table._ranges = list(self._ranges)
+        table._intervals = self._intervals
+        return table
+
+    def lookup(self, card_number: str) -> BinEntry:
+        """Find the brand of a card number.
+
+        Args:
+            card_number: The card number, or at least its first 8 digits.
+
+        Returns:
+            A tuple of (brand, valid_lengths), `(PaymentCardBrand.other, ())` if no range matches.
+        """
+        starts, ends, entries = self._intervals
+        key = int(card_number[:BIN_LENGTH].ljust(BIN_LENGTH, '0'))
+        i = bisect_right(starts, key) - 1
+        if i >= 0 and key <= ends[i]:
+            return entries[i]
+        return PaymentCardBrand.other, ()
+
+    def _rebuild(self) -> None:
+        """Flatten the registered ranges into non-overlapping intervals, later registrations winning."""
+        opening: dict[int, list[int]] = {}
+        for i, (low, _, _) in enumerate(self._ranges):
+            opening.setdefault(low, []).append(i)
+        boundaries = sorted({b for low, high, _ in self._ranges for b in (low, high + 1)})
+
+        starts: list[int] = []
+        ends: list[int] = []
+        entries: list[BinEntry] = []
+        active: list[int] = []  # heap of negated registration indices
+        for low, next_low in zip(boundaries, boundaries[1:]):
+            for i in opening.get(low, ()):
+                heapq.heappush(active, -i)
+            while active and self._ranges[-active[0]][1] < low:
+                heapq.heappop(active)
+            if not active:
+                continue
+            entry = self._ranges[-active[0]][2]
+            if entries and ends[-1] == low - 1 and entries[-1] == entry:
+                ends[-1] = next_low - 1
+            else:
+                starts.append(low)
+                ends.append(next_low - 1)
+                entries.append(entry)
+        self._intervals = (starts, ends, entries)
+        self._arrays = None
+
+
+def _normalize_bin(prefix: str, fill: str) -> int:
+    if not 1 <= len(prefix) <= BIN_LENGTH or not prefix.isdigit():
+        raise ValueError(f'BIN prefixes must be 1 to {BIN_LENGTH} digits, got {prefix!r}')
+    return int(prefix.ljust(BIN_LENGTH, fill))
+
+
+def _bin_range(
+    brand: PaymentCardBrand | str, start: str, end: str | None, lengths: Iterable[int]
+) -> tuple[int, int, BinEntry]:
+    """Check a BIN range and normalize it to the 8-digit interval it covers."""
+    if not isinstance(brand, PaymentCardBrand):
+        try:
+            brand = PaymentCardBrand(brand)
+        except ValueError:
+            pass
+    low = _normalize_bin(start, '0')
+    high = _normalize_bin(start if end is None else end, '9')
+    if low > high:
+        raise ValueError(f'BIN range {start!r} to {end!r} is empty')
+    return low, high, (brand, tuple(sorted(set(lengths))))
+
+
+_BUILTIN_BIN_RANGES: list[tuple[PaymentCardBrand, list[tuple[str, str]], list[int]]] = [
+    (PaymentCardBrand.visa, [('4', '4')], [13, 16, 19]),
+    (PaymentCardBrand.mastercard, [('51', '55'), ('2221', '2720')], [16]),
+    (PaymentCardBrand.amex, [('34', '34'), ('37', '37')], [15]),
+    (PaymentCardBrand.mir, [('2200', '2204')], list(range(16, 20))),
+    (
+        PaymentCardBrand.maestro,
+        [(p, p) for p in ('5018', '5020', '5038', '5893', '6304', '6759', '6761', '6762', '6763', '676770', '676774')],
+        list(range(12, 20)),
+    ),
+    (PaymentCardBrand.discover, [('65', '65'), ('644', '649'), ('6011', '6011')], list(range(16, 20))),
+    (PaymentCardBrand.verve, [('506099', '506198'), ('650002', '650027'), ('507865', '507964')], [16, 18, 19]),
+    (PaymentCardBrand.dankort, [('5019', '5019'), ('4571', '4571')], [16]),
+    (PaymentCardBrand.troy, [('9792', '9792')], [16]),
+    (PaymentCardBrand.unionpay, [('62', '62'), ('81', '81')], [16, 19]),
+    (PaymentCardBrand.jcb, [('3528', '3589')], [16, 19]),
+    (PaymentCardBrand.diners_club, [('30', '30'), ('36', '36'), ('38', '39')], list(range(14, 20))),
+    (PaymentCardBrand.diners_club, [('55', '55')], [16]),
+]
+"""The built-in BIN ranges, highest precedence first."""
+
+
+def _builtin_bin_table() -> BinTable:
+    table = BinTable()
+    for brand, ranges, lengths in reversed(_BUILTIN_BIN_RANGES):
+        for start, end in ranges:
+            table._ranges.append(_bin_range(brand, start, end, lengths))
+    table._rebuild()
+    return table
+
+
 class PaymentCardNumber(str):
     """A [payment card number](https://en.wikipedia.org/wiki/Payment_card_number)."""
 
@@ -45,8 +246,10 @@ class PaymentCardNumber(str):
     """The first 6 digits of the card number."""
     last4: str
     """The last 4 digits of the card number."""
-    brand: PaymentCardBrand
-    """The brand of the card."""
+    brand: PaymentCardBrand | str
+    """The brand of the card, a `PaymentCardBrand` unless it comes from a brand registered in `bin_table`."""
+    bin_table: ClassVar[BinTable]
+    """The BIN ranges used to identify the brand, see [`BinTable`][pydantic_extra_types.payment.BinTable]."""
 
     def __init__(self, card_number: str):
         self.validate_digits(card_number)
@@ -79,6 +282,72 @@ class PaymentCardNumber(str):
         """
         return cls(__input_value)
 
+    @classmethod
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[PaymentCardNumber]:
+        """Validate many card numbers at once, without raising.
+
+        Args:
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
+
+        Returns:
+            The valid card numbers in input order, and an `(index, error_type)` pair for each invalid value.
+        """
+        return validate_each(values, cls._validate_str)
+
+    @classmethod
+    def _validate_str(cls, card_number: str) -> PaymentCardNumber:
+        """Apply the string constraints of the core schema, then validate."""
+        if cls.strip_whitespace:
+            card_number = card_number.strip()
+        if len(card_number) < cls.min_length:
+            raise PydanticCustomError(
+                'string_too_short',
+                'String should have at least {min_length} characters',
+                {'min_length': cls.min_length},
+            )
+        if len(card_number) > cls.max_length:
+            raise PydanticCustomError(
+                'string_too_long',
+                'String should have at most {max_length} characters',
+                {'max_length': cls.max_length},
+            )
+        return cls(card_number)
+
+    @classmethod
+    def validate_array(cls, values: Any) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.object_]]:
+        """Validate a column of card numbers with vectorized NumPy operations.
+
+        The digit, length, Luhn and brand checks give the same results as validating each value,
+        but run over whole arrays, in chunks of `_ARRAY_CHUNK_SIZE` rows to bound memory use.
+
+        Args:
+            values: A NumPy array, pandas Series or any sequence of card number strings.
+
+        Returns:
+            A boolean mask of the valid card numbers, and an array with the `PaymentCardBrand` of each
+                valid card number and `None` for the invalid ones.
+        """
+        try:
+            import numpy as np
+        except ModuleNotFoundError as e:  # pragma: no cover
+            raise RuntimeError(
+                '`PaymentCardNumber.validate_array` requires "numpy" to be installed.'
+                ' You can install it with "pip install numpy".'
+            ) from e
+
+        array = np.asarray(values.to_numpy() if hasattr(values, 'to_numpy') else values)
+        if array.dtype.kind != 'U':
+            # non-string values (None, NaN, ints...) are invalid, like in the core schema
+            array = np.array([v if isinstance(v, str) else '' for v in array.ravel()], dtype=str)
+        array = array.ravel()
+
+        mask = np.zeros(len(array), dtype=bool)
+        brands = np.full(len(array), None, dtype=object)
+        for start in range(0, len(array), _ARRAY_CHUNK_SIZE):
+            chunk = slice(start, start + _ARRAY_CHUNK_SIZE)
+            mask[chunk], brands[chunk] = _validate_card_numbers(cls, array[chunk])
+        return mask, brands
+
     @property
     def masked(self) -> str:
         """The masked card number."""
@@ -128,78 +397,20 @@ class PaymentCardNumber(str):
         return card_number
 
     @classmethod
-    def _identify_brand(cls, card_number: str) -> tuple[PaymentCardBrand, list[int]]:
+    def _identify_brand(cls, card_number: str) -> tuple[PaymentCardBrand | str, list[int]]:
         """Identify the brand and required length for a card number.
 
         Args:
             card_number: The card number to identify.
 
         Returns:
-            A tuple of (brand, required_length)
+            A tuple of (brand, required_length), where an empty required_length allows any length.
         """
-        # VISA
-        if card_number[0] == '4':
-            return PaymentCardBrand.visa, [13, 16, 19]
-
-        # Mastercard
-        if (51 <= int(card_number[:2]) <= 55) or (2221 <= int(card_number[:4]) <= 2720):
-            return PaymentCardBrand.mastercard, [16]
-
-        # American Express
-        if card_number[:2] in {'34', '37'}:
-            return PaymentCardBrand.amex, [15]
-
-        # MIR
-        if 2200 <= int(card_number[:4]) <= 2204:
-            return PaymentCardBrand.mir, list(range(16, 20))
-
-        # Maestro
-        if card_number[:4] in {'5018', '5020', '5038', '5893', '6304', '6759', '6761', '6762', '6763'} or card_number[
-            :6
-        ] in ('676770', '676774'):
-            return PaymentCardBrand.maestro, list(range(12, 20))
-
-        # Discover
-        if card_number.startswith('65') or 644 <= int(card_number[:3]) <= 649 or card_number.startswith('6011'):
-            return PaymentCardBrand.discover, list(range(16, 20))
-
-        # Verve
-        if (
-            506099 <= int(card_number[:6]) <= 506198
-            or 650002 <= int(card_number[:6]) <= 650027
-            or 507865 <= int(card_number[:6]) <= 507964
-        ):
-            return PaymentCardBrand.verve, [16, 18, 19]
-
-        # Dankort
-        if card_number[:4] in {'5019', '4571'}:
-            return PaymentCardBrand.dankort, [16]
-
-        # Troy
-        if card_number.startswith('9792'):
-            return PaymentCardBrand.troy, [16]
-
-        # UnionPay
-        if card_number[:2] in {'62', '81'}:
-            return PaymentCardBrand.unionpay, [16, 19]
-
-        # JCB
-        if 3528 <= int(card_number[:4]) <= 3589:
-            return PaymentCardBrand.jcb, [16, 19]
-
-        # Diners Club
-        if card_number[:2] in {'30', '36', '38', '39'}:
-            return PaymentCardBrand.diners_club, list(range(14, 20))
-
-        # More Diners Club
-        if card_number.startswith('55'):
-            return PaymentCardBrand.diners_club, [16]
-
-        # Other / Unknown
-        return PaymentCardBrand.other, []
-
-    @staticmethod
-    def validate_brand(card_number: str) -> PaymentCardBrand:
+        brand, required_length = cls.bin_table.lookup(card_number)
+        return brand, list(required_length)
+
+    @classmethod
+    def validate_brand(cls, card_number: str) -> PaymentCardBrand | str:
         """Validate length based on
         [BIN](https://en.wikipedia.org/wiki/Payment_card_number#Issuer_identification_number_(IIN))
         for major brands.
@@ -213,9 +424,9 @@ class PaymentCardNumber(str):
         Raises:
             PydanticCustomError: If the card number is not valid.
         """
-        brand, required_length = PaymentCardNumber._identify_brand(card_number)
+        brand, required_length = cls._identify_brand(card_number)
 
-        valid = len(card_number) in required_length if brand != PaymentCardBrand.other else True
+        valid = not required_length or len(card_number) in required_length
 
         if not valid:
             raise PydanticCustomError(
@@ -225,3 +436,77 @@ class PaymentCardNumber(str):
             )
 
         return brand
+
+
+PaymentCardNumber.bin_table = _builtin_bin_table()
+
+_ARRAY_CHUNK_SIZE = 1 << 20
+"""Rows processed at once by `PaymentCardNumber.validate_array`."""
+
+
+def _validate_card_numbers(
+    cls: type[PaymentCardNumber], array: npt.NDArray[np.str_]
+) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.object_]]:
+    """Vectorized equivalent of `PaymentCardNumber.__init__` over an array of strings."""
+    import numpy as np
+
+    if cls.strip_whitespace:
+        array = np.char.strip(array)
+    lengths = np.char.str_len(array)
+    width = max(int(lengths.max(initial=0)), 1)
+
+    # one row of code points per card number, zero-padded on the right
+    codes = np.ascontiguousarray(array, dtype=f'<U{width}').view(np.uint32).reshape(len(array), width)
+    in_number = np.arange(width) < lengths[:, None]
+    is_digit = (codes >= ord('0')) & (codes <= ord('9'))
+    digits = np.where(in_number & is_digit, codes - ord('0'), 0).astype(np.int64)
+
+    valid = (lengths >= cls.min_length) & (lengths <= cls.max_length) & (is_digit | ~in_number).all(axis=1)
+
+    # Luhn: every second digit from the right, excluding the check digit, is doubled
+    from_right = lengths[:, None] - 1 - np.arange(width)
+    doubled = np.where(from_right % 2 == 1, digits * 2, digits)
+    doubled = np.where(doubled > 9, doubled - 9, doubled)
+    valid &= doubled.sum(axis=1) % 10 == 0
+
+    # the 8-digit BIN of each card number, zero-padded on the right like `BinTable.lookup` does
+    bin_digits = np.zeros((len(array), BIN_LENGTH), dtype=np.int64)
+    bin_digits[:, : min(width, BIN_LENGTH)] = digits[:, :BIN_LENGTH]
+    keys = bin_digits @ 10 ** np.arange(BIN_LENGTH - 1, -1, -1)
+
+    starts, ends, entry_brands, any_length, allowed_lengths = _bin_table_arrays(cls.bin_table)
+    # interval of each key, or the extra last row (`other`, any length) if no interval contains it
+    index = np.searchsorted(starts, keys, side='right') - 1
+    hit = index >= 0
+    hit[hit] &= keys[hit] <= ends[index[hit]]
+    index[~hit] = len(starts)
+
+    brands = entry_brands[index]
+    max_length = allowed_lengths.shape[1] - 1
+    valid &= any_length[index] | allowed_lengths[index, np.minimum(lengths, max_length)] & (lengths <= max_length)
+
+    brands[~valid] = None
+    return valid, brands
+
+
+def _bin_table_arrays(table: BinTable) -> tuple[Any, ...]:
+    """The intervals of a `BinTable` as NumPy arrays, built once per version of the table."""
+    import numpy as np
+
+    if table._arrays is None:
+        starts, ends, entries = table._intervals
+        entries = [*entries, (PaymentCardBrand.other, ())]
+        max_length = max((max(lengths, default=0) for _, lengths in entries), default=0)
+        allowed_lengths = np.zeros((len(entries), max_length + 1), dtype=bool)
+        for row, (_, lengths) in enumerate(entries):
+            allowed_lengths[row, list(lengths)] = True
+        entry_brands = np.empty(len(entries), dtype=object)
+        entry_brands[:] = [brand for brand, _ in entries]
+        table._arrays = (
+            np.array(starts, dtype=np.int64),
+            np.array(ends, dtype=np.int64),
+            entry_brands,
+            np.array([not lengths for _, lengths in entries]),
+            allowed_lengths,
+        )
+    return table._arrays  # type: ignore[no-any-return]
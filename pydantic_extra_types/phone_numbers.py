@@ -7,14 +7,21 @@ which is a Python port of Google's [libphonenumber](https://github.com/google/li
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import itertools
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Optional
 
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
 from pydantic_core import PydanticCustomError, core_schema
 
+from pydantic_extra_types._batch import BatchErrors, BatchResult, as_iterable
+from pydantic_extra_types._cache import ParseCache, ParseCacheInfo
+
 try:
     import phonenumbers
     from phonenumbers import PhoneNumber as BasePhoneNumber
@@ -115,20 +122,7 @@ class PhoneNumber(str):
 
     @classmethod
     def _validate(cls, phone_number: str, _: core_schema.ValidationInfo) -> str:
-        try:
-            parsed_number = phonenumbers.parse(phone_number, cls.default_region_code)
-        except phonenumbers.phonenumberutil.NumberParseException as exc:
-            raise PydanticCustomError('value_error', 'value is not a valid phone number') from exc
-        if not phonenumbers.is_valid_number(parsed_number):
-            raise PydanticCustomError('value_error', 'value is not a valid phone number')
-
-        if cls.supported_regions and not any(
-            phonenumbers.is_valid_number_for_region(parsed_number, region_code=region)
-            for region in cls.supported_regions
-        ):
-            raise PydanticCustomError('value_error', 'value is not from a supported region')
-
-        return phonenumbers.format_number(parsed_number, getattr(phonenumbers.PhoneNumberFormat, cls.phone_format))
+        return _parse_cached(phone_number, cls.default_region_code, cls.supported_regions, cls.phone_format)
 
     def __eq__(self, other: Any) -> bool:
         return super().__eq__(other)
@@ -203,24 +197,9 @@ class PhoneNumberValidator:
         if not isinstance(phone_number, (str, BasePhoneNumber)):
             raise PydanticCustomError('value_error', 'value is not a valid phone number')
 
-        parsed_number = None
         if isinstance(phone_number, BasePhoneNumber):
-            parsed_number = phone_number
-        else:
-            try:
-                parsed_number = phonenumbers.parse(phone_number, region=region)
-            except NumberParseException as exc:
-                raise PydanticCustomError('value_error', 'value is not a valid phone number') from exc
-
-        if not phonenumbers.is_valid_number(parsed_number):
-            raise PydanticCustomError('value_error', 'value is not a valid phone number')
-
-        if supported_regions and not any(
-            phonenumbers.is_valid_number_for_region(parsed_number, region_code=region) for region in supported_regions
-        ):
-            raise PydanticCustomError('value_error', 'value is not from a supported region')
-
-        return phonenumbers.format_number(parsed_number, getattr(phonenumbers.PhoneNumberFormat, number_format))
+            return _validate_parsed(phone_number, number_format, supported_regions)
+        return _parse_cached(phone_number, region, supported_regions, number_format)
 
     def __get_pydantic_core_schema__(self, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
         return core_schema.no_info_before_validator_function(
@@ -243,3 +222,174 @@ class PhoneNumberValidator:
 
     def __hash__(self) -> int:
         return super().__hash__()
+
+
+def _validate_parsed(
+    parsed_number: BasePhoneNumber, number_format: str, supported_regions: Sequence[str] | None
+) -> str:
+    if not phonenumbers.is_valid_number(parsed_number):
+        raise PydanticCustomError('value_error', 'value is not a valid phone number')
+
+    if supported_regions and not any(
+        phonenumbers.is_valid_number_for_region(parsed_number, region_code=region) for region in supported_regions
+    ):
+        raise PydanticCustomError('value_error', 'value is not from a supported region')
+
+    return phonenumbers.format_number(parsed_number, getattr(phonenumbers.PhoneNumberFormat, number_format))
+
+
+def _parse_number(
+    phone_number: str, region: str | None, supported_regions: Sequence[str] | None, number_format: str
+) -> str:
+    try:
+        parsed_number = phonenumbers.parse(phone_number, region=region)
+    except NumberParseException as exc:
+        raise PydanticCustomError('value_error', 'value is not a valid phone number') from exc
+    return _validate_parsed(parsed_number, number_format, supported_regions)
+
+
+_parse_cache: ParseCache[tuple[str, Optional[str], Optional[tuple[str, ...]], str], str] = ParseCache()
+
+
+def _parse_cached(
+    phone_number: str, region: str | None, supported_regions: Sequence[str] | None, number_format: str
+) -> str:
+    if not _parse_cache.maxsize:
+        return _parse_number(phone_number, region, supported_regions, number_format)
+    key = (phone_number, region, tuple(supported_regions) if supported_regions else None, number_format)
+    return _parse_cache.get(key, partial(_parse_number, phone_number, region, supported_regions, number_format))
+
+
+def enable_parse_cache(maxsize: int = 10_000) -> None:
+    """Cache the results of validating phone number strings, for inputs that repeat a lot.
+
+    `PhoneNumber` and `PhoneNumberValidator` then look each string up by its value, default region,
+    supported regions and number format before parsing it with `phonenumbers`. Invalid inputs are
+    cached too. The least recently used entries are evicted beyond `maxsize`, and calling this again
+    resizes the cache, keeping its entries and statistics.
+
+    Args:
+        maxsize: The maximum number of cached strings.
+
+    Raises:
+        ValueError: If `maxsize` is not positive.
+    """
+    if maxsize <= 0:
+        raise ValueError(f'maxsize must be positive, got {maxsize}')
+    _parse_cache.resize(maxsize)
+
+
+def disable_parse_cache() -> None:
+    """Stop caching parse results, and drop the cached entries and statistics."""
+    _parse_cache.resize(0)
+    _parse_cache.clear()
+
+
+def clear_parse_cache() -> None:
+    """Drop the cached parse results and reset the statistics, leaving the cache enabled."""
+    _parse_cache.clear()
+
+
+def parse_cache_info() -> ParseCacheInfo:
+    """The hit and miss statistics and size of the parse cache."""
+    return _parse_cache.info()
+
+
+def normalize_many(
+    numbers: Iterable[Any],
+    *,
+    default_region: str | None = None,
+    number_format: str = 'RFC3966',
+    supported_regions: Sequence[str] | None = None,
+    workers: int | None = None,
+    chunk_size: int = 10_000,
+) -> BatchResult[str]:
+    """Validate and format many phone numbers at once, in parallel across processes.
+
+    Parsing with `phonenumbers` is CPU-bound Python, so threads do not help. The numbers are sent to
+    a pool of worker processes in chunks of `chunk_size`, with at most two chunks per worker in flight
+    so that large iterators are not read into memory up front. Each number goes through the same
+    checks as a field annotated with `PhoneNumberValidator(default_region, number_format, supported_regions)`.
+
+    ```py
+    from pydantic_extra_types.phone_numbers import normalize_many
+
+    valid, errors = normalize_many(
+        ['+1 650 253 0000', '650 253 0001', 'nope'], default_region='US', number_format='E164'
+    )
+    print(valid, errors)
+    # > ['+16502530000', '+16502530001'] [(2, 'value_error')]
+    ```
+
+    Args:
+        numbers: Any iterable of strings or `phonenumbers.PhoneNumber` objects, including NumPy,
+            pandas and Arrow arrays.
+        default_region: The region of numbers without an international prefix.
+        number_format: The `phonenumbers.PhoneNumberFormat` to format the numbers with.
+        supported_regions: The regions numbers must belong to, all regions if empty.
+        workers: The number of worker processes, defaults to the number of CPUs. With `1`, the numbers
+            are validated in the calling process.
+        chunk_size: The number of numbers sent to a worker at once.
+
+    Returns:
+        The formatted valid numbers in input order, and an `(index, error_type)` pair for each invalid value.
+
+    Raises:
+        ValueError: If a region, the format, `workers` or `chunk_size` is invalid.
+    """
+    validator = PhoneNumberValidator(
+        default_region=default_region, number_format=number_format, supported_regions=supported_regions
+    )
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers <= 0:
+        raise ValueError(f'workers must be positive, got {workers}')
+    if chunk_size <= 0:
+        raise ValueError(f'chunk_size must be positive, got {chunk_size}')
+
+    valid: list[str] = []
+    errors: BatchErrors = []
+    chunks = _chunks(as_iterable(numbers), chunk_size)
+    if workers == 1:
+        for start, chunk in chunks:
+            chunk_valid, chunk_errors = _normalize_chunk(validator, start, chunk)
+            valid += chunk_valid
+            errors += chunk_errors
+        return valid, errors
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[BatchResult[str]]] = deque()
+        for start, chunk in chunks:
+            pending.append(executor.submit(_normalize_chunk, validator, start, chunk))
+            while len(pending) >= 2 * workers or (pending and pending[0].done()):
+                chunk_valid, chunk_errors = pending.popleft().result()
+                valid += chunk_valid
+                errors += chunk_errors
+        for future in pending:
+            chunk_valid, chunk_errors = future.result()
+            valid += chunk_valid
+            errors += chunk_errors
+    return valid, errors
+
+
+def _chunks(values: Iterable[Any], chunk_size: int) -> Iterator[tuple[int, list[Any]]]:
+    """Split values into lists of `chunk_size`, with the index of their first value."""
+    iterator = iter(values)
+    for start in itertools.count(0, chunk_size):
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+
+
+def _normalize_chunk(validator: PhoneNumberValidator, start: int, numbers: list[Any]) -> BatchResult[str]:
+    """Validate a chunk of `normalize_many` in a worker, reporting errors at their index in the whole input."""
+    valid: list[str] = []
+    errors: BatchErrors = []
+    for index, number in enumerate(numbers, start):
+        try:
+            valid.append(
+                validator._parse(validator.default_region, validator.number_format, validator.supported_regions, number)
+            )
+        except PydanticCustomError as exc:
+            errors.append((index, exc.type))
+    return valid, errors
@@ -2,18 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
-from pydantic_core import PydanticCustomError, core_schema
+from pydantic_core import core_schema
 
-try:
-    import pycountry
-except ModuleNotFoundError as e:  # pragma: no cover
-    raise RuntimeError(
-        'The `script_code` module requires "pycountry" to be installed.'
-        ' You can install it with "pip install pycountry".'
-    ) from e
+from pydantic_extra_types._batch import BatchResult, validate_codes
+from pydantic_extra_types._codes import code_schema
+from pydantic_extra_types._pycountry import reference_data
 
 
 class ISO_15924(str):
@@ -36,33 +34,24 @@ class ISO_15924(str):
     ```
     """
 
-    allowed_values_list = [script.alpha_4 for script in pycountry.scripts]
+    allowed_values_list = list(reference_data().scripts)
     allowed_values = set(allowed_values_list)
 
     @classmethod
-    def _validate(cls, __input_value: str, _: core_schema.ValidationInfo) -> ISO_15924:
-        """Validate a ISO 15924 language code from the provided str value.
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[ISO_15924]:
+        """Validate many ISO 15924 script codes at once, without raising.
 
         Args:
-            __input_value: The str value to be validated.
-            _: The Pydantic ValidationInfo.
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
 
         Returns:
-            The validated ISO 15924 script code.
-
-        Raises:
-            PydanticCustomError: If the ISO 15924 script code is not valid.
+            The valid codes in input order, and an `(index, error_type)` pair for each invalid value.
         """
-        if __input_value not in cls.allowed_values:
-            raise PydanticCustomError(
-                'ISO_15924', 'Invalid ISO 15924 script code. See https://en.wikipedia.org/wiki/ISO_15924'
-            )
-        return cls(__input_value)
+        instances = _instances(cls)
+        return validate_codes(values, instances, instances.__getitem__, 'ISO_15924', length=4)
 
     @classmethod
-    def __get_pydantic_core_schema__(
-        cls, _: type[Any], __: GetCoreSchemaHandler
-    ) -> core_schema.AfterValidatorFunctionSchema:
+    def __get_pydantic_core_schema__(cls, _: type[Any], __: GetCoreSchemaHandler) -> core_schema.CoreSchema:
         """Return a Pydantic CoreSchema with the ISO 639-3 language code validation.
 
         Args:
@@ -73,9 +62,11 @@ class ISO_15924(str):
             A Pydantic CoreSchema with the ISO 639-3 language code validation.
 
         """
-        return core_schema.with_info_after_validator_function(
-            cls._validate,
+        return code_schema(
             core_schema.str_schema(min_length=4, max_length=4),
+            _instances(cls).values(),
+            'ISO_15924',
+            'Invalid ISO 15924 script code. See https://en.wikipedia.org/wiki/ISO_15924',
         )
 
     @classmethod
@@ -95,3 +86,9 @@ class ISO_15924(str):
         json_schema = handler(schema)
         json_schema.update({'enum': cls.allowed_values_list})
         return json_schema
+
+
+@lru_cache
+def _instances(cls: type[ISO_15924]) -> dict[str, ISO_15924]:
+    """The one `cls` instance of each ISO 15924 script code, shared by all values validated as `cls`."""
+    return {code: cls(code) for code in cls.allowed_values_list}
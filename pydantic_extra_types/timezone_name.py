@@ -5,11 +5,14 @@ from __future__ import annotations
 import importlib
 import sys
 import warnings
+from collections.abc import Iterable
 from typing import Any, Callable, cast
 
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
 from pydantic_core import PydanticCustomError, core_schema
 
+from pydantic_extra_types._batch import BatchResult, validate_each
+
 
 def _is_available(name: str) -> bool:
     """Check if a module is available for import."""
@@ -215,6 +218,27 @@ class TimeZoneName(str):
             raise PydanticCustomError('TimeZoneName', 'Invalid timezone name.')
         return cls(__input_value)
 
+    @classmethod
+    def validate_many(cls, values: Iterable[Any]) -> BatchResult[TimeZoneName]:
+        """Validate many time zone names at once, without raising.
+
+        Args:
+            values: Any iterable of strings, including NumPy, pandas and Arrow string arrays.
+
+        Returns:
+            The valid time zone names in input order, and an `(index, error_type)` pair for each invalid value.
+        """
+        return validate_each(values, cls._validate_str)
+
+    @classmethod
+    def _validate_str(cls, __input_value: str) -> TimeZoneName:
+        """Apply the string constraints of the core schema, then validate."""
+        if not __input_value:
+            raise PydanticCustomError(
+                'string_too_short', 'String should have at least {min_length} character', {'min_length': 1}
+            )
+        return cls._validate(__input_value, None)  # type: ignore[arg-type]
+
     @classmethod
     def __get_pydantic_core_schema__(
         cls, _: type[Any], __: GetCoreSchemaHandler
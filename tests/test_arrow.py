@@ -0,0 +1,227 @@
+import datetime
+from typing import Annotated
+
+import pandas as pd
+import pytest
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+pa = pytest.importorskip('pyarrow')
+
+from pydantic_extra_types.arrow import ArrowArray, ArrowTable, ArrowTableValidator, to_ipc  # noqa: E402
+
+
+class TableModel(BaseModel):
+    table: ArrowTable
+
+
+class ArrayModel(BaseModel):
+    array: ArrowArray
+
+
+def test_table_and_record_batch_are_kept() -> None:
+    table = pa.table({'a': [1, 2, 3]})
+    assert TableModel(table=table).table is table
+    batch = table.to_batches()[0]
+    assert TableModel(table=batch).table is batch
+
+
+def test_arrow_backed_dataframe_is_not_copied() -> None:
+    df = pd.DataFrame(
+        {'a': pd.array([1, 2], dtype='int64[pyarrow]'), 'b': pd.array(['x', None], dtype='string[pyarrow]')}
+    )
+    table = TableModel(table=df).table
+    assert isinstance(table, pa.Table)
+    assert (
+        table.column('a').chunks[0].buffers()[1].address
+        == df['a'].array.__arrow_array__().chunks[0].buffers()[1].address
+    )
+    assert table.column('b').to_pylist() == ['x', None]
+
+
+def test_numpy_backed_dataframe_fails() -> None:
+    df = pd.DataFrame({'a': pd.array([1, 2], dtype='int64[pyarrow]'), 'b': [1.0, 2.0]})
+    with pytest.raises(ValidationError, match='pandas columns are not Arrow-backed: b'):
+        TableModel(table=df)
+
+
+def test_invalid_table() -> None:
+    with pytest.raises(ValidationError, match='value is not a valid Arrow table'):
+        TableModel(table=[1, 2])
+    with pytest.raises(ValidationError, match='value is not a valid Arrow IPC stream'):
+        TableModel(table=b'not arrow')
+    with pytest.raises(ValidationError, match='value is not valid base64'):
+        TableModel(table='not base64!')
+    with pytest.raises(ValidationError, match='value is not a valid Arrow IPC stream'):
+        TableModel(table=b'\xff\xff\xff\xff\x10\x00\x00\x00' + b'\x00' * 16)
+
+
+def test_table_ipc_round_trip() -> None:
+    model = TableModel(table=pa.table({'a': [1, None], 'b': ['x', 'y']}))
+    assert model.model_dump()['table'] is model.table
+    dumped = model.model_dump(mode='json')['table']
+    assert isinstance(dumped, str)
+    assert TableModel.model_validate_json(model.model_dump_json()).table.equals(model.table)
+    assert TableModel(table=dumped).table.equals(model.table)
+    assert TableModel(table=to_ipc(model.table)).table.equals(model.table)
+
+
+def test_array() -> None:
+    array = pa.array([1.5, None])
+    assert ArrayModel(array=array).array is array
+
+    series = pd.Series(pd.array([1, 2], dtype='int64[pyarrow]'))
+    assert ArrayModel(array=series).array.to_pylist() == [1, 2]
+    with pytest.raises(ValidationError, match='pandas columns are not Arrow-backed'):
+        ArrayModel(array=pd.Series([1, 2]))
+    with pytest.raises(ValidationError, match='value is not a valid Arrow array'):
+        ArrayModel(array=[1, 2])
+    with pytest.raises(ValidationError, match='value is not a valid Arrow array'):
+        ArrayModel(array=to_ipc(pa.table({})))
+
+    model = ArrayModel(array=array)
+    assert ArrayModel.model_validate_json(model.model_dump_json()).array.to_pylist() == [1.5, None]
+
+
+def test_json_schema() -> None:
+    assert TableModel.model_json_schema()['properties']['table'] == {
+        'type': 'string',
+        'contentEncoding': 'base64',
+        'contentMediaType': 'application/vnd.apache.arrow.stream',
+        'title': 'ArrowTable',
+    }
+
+
+ConstrainedTable = Annotated[
+    pa.Table,
+    ArrowTableValidator(
+        required_columns=['note'],
+        types={'id': pa.int64(), 'price': 'double'},
+        non_null=['price'],
+        unique=['id'],
+        min={'price': 0},
+        max={'quantity': 10},
+        categories={'status': ['open', 'paid']},
+    ),
+]
+
+
+def test_constraints_pass() -> None:
+    table = pa.table(
+        {
+            'id': [1, 2, 3],
+            'price': [0.0, 9.5, 2.0],
+            'quantity': [10, 1, None],
+            'status': ['open', None, 'paid'],
+            'note': ['', '', ''],
+        }
+    )
+    assert TypeAdapter(ConstrainedTable).validate_python(table) is table
+
+
+def test_constraints_report_counts_and_sample_rows() -> None:
+    table = pa.table(
+        {
+            'id': [1, 2, 2, *range(3, 23)],
+            'price': [1.0, None, -1.0, *[-2.0] * 20],
+            'quantity': [11, 1, 3, *[1] * 20],
+            'status': ['open', 'shipped', 'paid', *['open'] * 20],
+            'note': [''] * 23,
+        }
+    )
+    with pytest.raises(ValidationError) as exc_info:
+        TypeAdapter(ConstrainedTable).validate_python(table.to_batches()[0])
+
+    (error,) = exc_info.value.errors()
+    assert error['msg'] == (
+        "Table has invalid values in 'id' (1 row), 'price' (22 rows), 'quantity' (1 row), 'status' (1 row)"
+    )
+    assert error['ctx']['errors'] == [
+        {'column': 'id', 'type': 'duplicate', 'count': 1, 'rows': [2]},
+        {'column': 'price', 'type': 'missing', 'count': 1, 'rows': [1]},
+        {'column': 'price', 'type': 'greater_than_equal', 'count': 21, 'rows': list(range(2, 12)), 'ctx': {'ge': 0}},
+        {'column': 'quantity', 'type': 'less_than_equal', 'count': 1, 'rows': [0], 'ctx': {'le': 10}},
+        {'column': 'status', 'type': 'category', 'count': 1, 'rows': [1], 'ctx': {'expected': ['open', 'paid']}},
+    ]
+
+
+def test_constraints_types_and_required_columns() -> None:
+    table = pa.table({'id': [1], 'price': [1], 'quantity': ['1'], 'status': ['open'], 'note': ['']})
+    with pytest.raises(ValidationError) as exc_info:
+        TypeAdapter(ConstrainedTable).validate_python(table)
+    (error,) = exc_info.value.errors()
+    assert error['ctx']['columns'] == "'price' (dtype int64, expected double), 'quantity' (dtype string)"
+
+    with pytest.raises(ValidationError, match='missing required columns: note, price, quantity, status'):
+        TypeAdapter(ConstrainedTable).validate_python(pa.table({'id': [1]}))
+
+
+def test_unique_across_chunks_and_nulls() -> None:
+    class Table(ArrowTable):
+        unique = ['id']
+
+    table = pa.Table.from_batches([pa.record_batch({'id': [1, None, 2]}), pa.record_batch({'id': [None, 1, 3]})])
+    with pytest.raises(ValidationError) as exc_info:
+        TypeAdapter(Table).validate_python(table)
+    assert exc_info.value.errors()[0]['ctx']['errors'] == [
+        {'column': 'id', 'type': 'duplicate', 'count': 2, 'rows': [3, 4]}
+    ]
+
+
+def test_dictionary_encoded_columns() -> None:
+    table = pa.table(
+        {
+            'id': pa.array([1, 2, 1]).dictionary_encode(),
+            'status': pa.array(['open', 'shipped', None]).dictionary_encode(),
+        }
+    )
+    adapter = TypeAdapter(Annotated[pa.Table, ArrowTableValidator(unique=['id'], categories={'status': ['open']})])
+    with pytest.raises(ValidationError) as exc_info:
+        adapter.validate_python(table)
+    assert exc_info.value.errors()[0]['ctx']['errors'] == [
+        {'column': 'id', 'type': 'duplicate', 'count': 1, 'rows': [2]},
+        {'column': 'status', 'type': 'category', 'count': 1, 'rows': [1], 'ctx': {'expected': ['open']}},
+    ]
+    assert adapter.validate_python(table.slice(0, 1)).num_rows == 1
+
+
+def test_bounds_are_cast_to_the_column_type() -> None:
+    class Table(ArrowTable):
+        min = {'day': datetime.date(2024, 1, 1), 'count': 0.5}
+        max = {'t': '2025-01-01'}
+
+    table = pa.table(
+        {
+            't': pa.array([datetime.datetime(2024, 6, 1), datetime.datetime(2025, 6, 1)], pa.timestamp('us')),
+            'day': pa.array([datetime.date(2024, 1, 1), datetime.date(2023, 1, 1)]),
+            'count': [1, 0],
+        }
+    )
+    with pytest.raises(ValidationError) as exc_info:
+        TypeAdapter(Table).validate_python(table)
+    assert exc_info.value.errors()[0]['ctx']['errors'] == [
+        {
+            'column': 'day',
+            'type': 'greater_than_equal',
+            'count': 1,
+            'rows': [1],
+            'ctx': {'ge': datetime.date(2024, 1, 1)},
+        },
+        {'column': 'count', 'type': 'greater_than_equal', 'count': 1, 'rows': [1], 'ctx': {'ge': 0.5}},
+        {'column': 't', 'type': 'less_than_equal', 'count': 1, 'rows': [1], 'ctx': {'le': '2025-01-01'}},
+    ]
+
+
+def test_bounds_that_cannot_be_compared() -> None:
+    with pytest.raises(ValueError, match="max bound 'x' of column 'count' cannot be compared with int64"):
+        TypeAdapter(Annotated[pa.Table, ArrowTableValidator(types={'count': 'int64'}, max={'count': 'x'})])
+
+    # without a declared type, the column type is at fault
+    adapter = TypeAdapter(Annotated[pa.Table, ArrowTableValidator(max={'count': 10})])
+    with pytest.raises(ValidationError, match=r"'count' \(dtype string\)"):
+        adapter.validate_python(pa.table({'count': ['1']}))
+
+
+def test_duplicate_columns() -> None:
+    table = pa.Table.from_arrays([pa.array([1]), pa.array([2])], names=['a', 'a'])
+    with pytest.raises(ValidationError, match='Table has duplicate columns: a'):
+        TypeAdapter(Annotated[pa.Table, ArrowTableValidator(non_null=['a'])]).validate_python(table)
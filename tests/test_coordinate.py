@@ -7,7 +7,14 @@ from dirty_equals import IsPartialDict
 from pydantic import BaseModel, ValidationError
 from pydantic_core._pydantic_core import ArgsKwargs
 
-from pydantic_extra_types.coordinate import Coordinate, Latitude, Longitude
+from pydantic_extra_types.coordinate import (
+    EARTH_RADIUS,
+    Coordinate,
+    CoordinateArray,
+    Latitude,
+    Longitude,
+    haversine,
+)
 
 
 class Coord(BaseModel):
@@ -286,3 +293,104 @@ def test_json_schema():
         'title': 'Model',
         'type': 'object',
     }
+
+
+def test_coordinate_array():
+    np = pytest.importorskip('numpy')
+    coordinates = CoordinateArray([(41.40338, 2.17403), [Decimal('48.8566'), '2.3522'], '51.5072,-0.1276'])
+    assert coordinates.points.shape == (3, 2)
+    assert coordinates.points.dtype == np.float64
+    assert coordinates.points.flags.c_contiguous
+    assert coordinates.latitudes.tolist() == [41.40338, 48.8566, 51.5072]
+    assert coordinates.longitudes.tolist() == [2.17403, 2.3522, -0.1276]
+    assert len(coordinates) == 3
+    assert coordinates[2] == Coordinate(51.5072, -0.1276)
+    assert coordinates[1:] == CoordinateArray([(48.8566, 2.3522), (51.5072, -0.1276)])
+    assert coordinates[::-2].points.flags.c_contiguous
+    assert CoordinateArray(coordinates) == coordinates
+    assert CoordinateArray([Coordinate(1, 2), (3, 4)]).points.tolist() == [[1, 2], [3, 4]]
+    assert CoordinateArray(np.array([[1, 2], [3, 4]], dtype=np.int32)).points.dtype == np.float64
+    assert CoordinateArray([]).points.shape == (0, 2)
+
+
+def test_coordinate_array_indexing():
+    np = pytest.importorskip('numpy')
+    coordinates = CoordinateArray([(1, 2), (3, 4), (5, 6)])
+    assert coordinates[np.int64(-1)] == Coordinate(5, 6)
+    assert coordinates[np.array([True, False, True])] == CoordinateArray([(1, 2), (5, 6)])
+    assert coordinates[[2, 0]] == CoordinateArray([(5, 6), (1, 2)])
+    assert coordinates[np.array([1])].points.flags.c_contiguous
+    assert len(coordinates[[]]) == 0
+    for index in (1.0, '1', (0, 1), True, np.array([[0]]), [0.5]):
+        with pytest.raises(TypeError, match='CoordinateArray indices must be integers, slices, boolean masks'):
+            coordinates[index]
+
+
+def test_coordinate_array_equality():
+    pytest.importorskip('numpy')
+    coordinates = CoordinateArray([(1, 2)])
+    assert coordinates.__eq__([(1, 2)]) is NotImplemented
+    assert coordinates != [(1, 2)]
+    assert coordinates == CoordinateArray([(1, 2)])
+
+
+@pytest.mark.parametrize(
+    'values, error',
+    [
+        ([(91, 0)], 'latitude must be in the range -90.0 to 90.0 at index 0'),
+        ([(0, 0), (0, -180.5)], 'longitude must be in the range -180.0 to 180.0 at index 1'),
+        ([(0, float('nan'))], 'longitude must be in the range'),
+        ([(0, 0), 'north,south'], 'value is not a valid coordinate at index 1'),
+        ([(1, 2, 3)], r'arrays must have shape \(N, 2\)'),
+        ('0,0', 'value must be a list, tuple or array of coordinates'),
+    ],
+)
+def test_coordinate_array_invalid(values: Any, error: str):
+    pytest.importorskip('numpy')
+
+    class Model(BaseModel):
+        points: CoordinateArray
+
+    with pytest.raises(ValidationError, match=error):
+        Model(points=values)
+
+
+def test_coordinate_array_distances():
+    np = pytest.importorskip('numpy')
+    # Barcelona to Paris
+    cities = CoordinateArray([(41.40338, 2.17403), (48.8566, 2.3522)])
+    np.testing.assert_allclose(cities.distance_to(Coordinate(41.40338, 2.17403)), [0, 828_879], atol=1)
+    np.testing.assert_allclose(cities.distance_to(cities), 0)
+
+    points = CoordinateArray([(0, 0), (0, 90), (90, 0), (0, 180)])
+    np.testing.assert_allclose(points.distance_to((0, 0), radius=1), [0, np.pi / 2, np.pi / 2, np.pi])
+    np.testing.assert_allclose(points.distance_to(points[::-1]) / EARTH_RADIUS, [np.pi, np.pi / 2, np.pi / 2, np.pi])
+    # across the antimeridian, a degree of the equator
+    np.testing.assert_allclose(haversine([0, 10], [-179.5, 10], [0, 10], [179.5, 10]), [111_195, 0], atol=1)
+
+
+def test_coordinate_array_bounding_box_and_centroid():
+    pytest.importorskip('numpy')
+    coordinates = CoordinateArray([(10, -20), (-5, 30), (40, 0)])
+    assert coordinates.bounding_box() == (Coordinate(-5, -20), Coordinate(40, 30))
+    assert CoordinateArray([(0, 179), (0, -179)]).centroid() == Coordinate(0, 180)
+    centroid = CoordinateArray([(10, 10), (-10, -10)]).centroid()
+    assert centroid.latitude == pytest.approx(0, abs=1e-12) and centroid.longitude == pytest.approx(0, abs=1e-12)
+
+    with pytest.raises(ValueError, match='no bounding box'):
+        CoordinateArray([]).bounding_box()
+    with pytest.raises(ValueError, match='no centroid'):
+        CoordinateArray([]).centroid()
+
+
+def test_coordinate_array_model():
+    pytest.importorskip('numpy')
+
+    class Route(BaseModel):
+        stops: CoordinateArray
+
+    route = Route(stops=[(41.40338, 2.17403), (48.8566, 2.3522)])
+    assert isinstance(route.model_dump()['stops'], CoordinateArray)
+    assert route.model_dump(mode='json') == {'stops': [[41.40338, 2.17403], [48.8566, 2.3522]]}
+    assert Route.model_validate_json(route.model_dump_json()).stops == route.stops
+    assert repr(route) == 'Route(stops=CoordinateArray([[41.40338, 2.17403], [48.8566, 2.3522]]))'
@@ -1,18 +1,22 @@
+import copy
+import pickle
 from string import printable
 
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from pydantic_extra_types.country import (
     CountryAlpha2,
     CountryAlpha3,
     CountryInfo,
+    CountryName,
     CountryNumericCode,
     CountryShortName,
     _index_by_alpha2,
     _index_by_alpha3,
     _index_by_numeric_code,
     _index_by_short_name,
+    suggest_country_names,
 )
 
 PARAMS_AMOUNT = 20
@@ -108,3 +112,152 @@ def test_valid_numeric_code(numeric_code: str, country_data: CountryInfo, Produc
 def test_invalid_numeric_code(numeric_code: str, ProductNumericCode):
     with pytest.raises(ValidationError, match='Invalid country numeric code'):
         ProductNumericCode(made_in=numeric_code)
+
+
+@pytest.mark.parametrize('cls', [CountryAlpha2, CountryAlpha3, CountryNumericCode, CountryShortName, CountryName])
+def test_validate_many_matches_schema(cls):
+    values = ['US', 'usa', 'DEU', '840', '000', 'United States', 'Germany', 'xx', 42, None]
+    adapter = TypeAdapter(cls)
+    expected_valid, expected_errors = [], []
+    for index, value in enumerate(values):
+        try:
+            expected_valid.append(adapter.validate_python(value))
+        except ValidationError as e:
+            expected_errors.append((index, e.errors()[0]['type']))
+
+    valid, errors = cls.validate_many(values)
+    assert valid == expected_valid
+    assert all(type(v) is cls for v in valid)
+    assert errors == expected_errors
+
+
+def test_validate_many_accepts_arrays():
+    np = pytest.importorskip('numpy')
+    pd = pytest.importorskip('pandas')
+
+    assert CountryAlpha2.validate_many(np.array(['US', 'XX', 'de'])) == (['US', 'DE'], [(1, 'country_alpha2')])
+    assert CountryAlpha2.validate_many(pd.Series(['US', None])) == (['US'], [(1, 'string_type')])
+    assert CountryAlpha2.validate_many(iter(['ES'])) == (['ES'], [])
+
+
+@pytest.mark.parametrize('mode', ['validation', 'serialization'])
+def test_json_schema_does_not_list_codes(mode):
+    assert TypeAdapter(CountryAlpha2).json_schema(mode=mode) == {'pattern': r'^\w{2}$', 'type': 'string'}
+
+
+@pytest.mark.parametrize(
+    'name, short_name',
+    [
+        ('United States', 'United States'),
+        ('united states', 'United States'),
+        ('United States of America', 'United States'),
+        ('USA', 'United States'),
+        ('us', 'United States'),
+        ('Türkiye', 'Türkiye'),
+        ('TURKIYE', 'Türkiye'),
+        ('  Republic of  Türkiye ', 'Türkiye'),
+        ('Bolivia', 'Bolivia, Plurinational State of'),
+        ('Cote d’Ivoire', "Côte d'Ivoire"),
+        ('guinea bissau', 'Guinea-Bissau'),
+    ],
+)
+def test_country_name_resolves_aliases(name: str, short_name: str):
+    country = TypeAdapter(CountryName).validate_python(name)
+    assert country == short_name
+    assert type(country) is CountryName
+    assert country.alpha2 == _index_by_short_name()[short_name].alpha2
+
+
+def test_country_name_suggestions():
+    assert suggest_country_names('Germny') == ['Germany']
+    assert suggest_country_names('Russia', limit=1) == ['Russian Federation']
+    assert suggest_country_names('x') == []
+
+    adapter = TypeAdapter(CountryName)
+    with pytest.raises(ValidationError, match="Invalid country name, did you mean 'Germany'\\?"):
+        adapter.validate_python('Germny')
+    with pytest.raises(ValidationError, match='Invalid country name \\['):
+        adapter.validate_python('x')
+
+
+@pytest.mark.parametrize(
+    'cls, value',
+    [
+        (CountryAlpha2, 'us'),
+        (CountryAlpha3, 'usa'),
+        (CountryNumericCode, '840'),
+        (CountryShortName, 'United States'),
+        (CountryName, 'USA'),
+    ],
+)
+def test_validated_values_are_shared(cls, value):
+    adapter = TypeAdapter(cls)
+    first = adapter.validate_python(value)
+    assert type(first) is cls
+    assert adapter.validate_python(value) is first
+    assert adapter.validate_json(f'"{value}"') is first
+    assert cls.validate_many([value])[0][0] is first
+
+
+@pytest.mark.parametrize(
+    'cls, value',
+    [
+        (CountryAlpha2, 'us'),
+        (CountryAlpha3, 'usa'),
+        (CountryNumericCode, '840'),
+        (CountryShortName, 'United States'),
+        (CountryName, 'USA'),
+    ],
+)
+def test_subclasses_keep_their_type(cls, value):
+    subclass = type('MyCode', (cls,), {})
+    first = TypeAdapter(subclass).validate_python(value)
+    assert type(first) is subclass
+    assert TypeAdapter(subclass).validate_python(value) is first
+    assert type(subclass.validate_many([value])[0][0]) is subclass
+    assert type(TypeAdapter(cls).validate_python(value)) is cls
+    assert first.__dict__['_info'] is TypeAdapter(cls).validate_python(value)._info
+
+
+@pytest.mark.parametrize(
+    'cls, value, attribute, expected',
+    [
+        (CountryAlpha2, 'us', 'alpha3', 'USA'),
+        (CountryAlpha3, 'usa', 'alpha2', 'US'),
+        (CountryNumericCode, '840', 'alpha2', 'US'),
+        (CountryShortName, 'United States', 'alpha3', 'USA'),
+        (CountryName, 'USA', 'numeric_code', '840'),
+    ],
+)
+def test_validated_values_can_be_copied(cls, value, attribute, expected):
+    class Product(BaseModel):
+        made_in: cls
+
+    product = Product(made_in=value)
+    value = product.made_in
+    for copied in (
+        pickle.loads(pickle.dumps(value)),
+        copy.deepcopy(value),
+        copy.deepcopy(product).made_in,
+        product.model_copy(deep=True).made_in,
+    ):
+        assert copied == value
+        assert type(copied) is cls
+        assert getattr(copied, attribute) == expected
+
+
+def test_validated_values_are_bound_to_their_record():
+    country = TypeAdapter(CountryAlpha2).validate_python('de')
+    assert country.__dict__['_info'] is _index_by_alpha2()['DE']
+    assert (country.alpha3, country.numeric_code, country.short_name) == ('DEU', '276', 'Germany')
+
+    # instances built directly look their record up on first use
+    assert CountryAlpha3('DEU').short_name == 'Germany'
+
+
+def test_country_info_is_frozen():
+    country = _index_by_alpha2()['DE']
+    with pytest.raises(AttributeError):
+        country.alpha2 = 'XX'
+    assert not hasattr(country, '__dict__')
+    assert pickle.loads(pickle.dumps(country)) == copy.deepcopy(country) == country
@@ -71,3 +71,11 @@ def test_forbidden_everyday(forbidden_currency):
         ),
     ):
         CurrencyCheckingModel(currency=forbidden_currency)
+
+
+def test_validate_many():
+    assert currency_code.ISO4217.validate_many(['usd', 'XAU', 'ABC', 'US', None]) == (
+        ['USD', 'XAU'],
+        [(2, 'ISO4217'), (3, 'string_too_short'), (4, 'string_type')],
+    )
+    assert currency_code.Currency.validate_many(['eur', 'XAU']) == (['EUR'], [(1, 'InvalidCurrency')])
@@ -1,9 +1,10 @@
+import pickle
 from typing import Any
 
 import pytest
 from pydantic import BaseModel, ValidationError
 
-from pydantic_extra_types.iban import IBAN, _validate_iban_check_digits
+from pydantic_extra_types.iban import BBAN_FORMATS, IBAN, IBAN_COUNTRY_CODE_LENGTH, _validate_iban_check_digits
 
 
 class BankAccount(BaseModel):
@@ -69,6 +70,8 @@ def test_invalid_iban(iban: str) -> None:
         ('GB29NWBK6016133192681!', 'iban_invalid_characters'),  # non-alphanumeric body
         ('GBABNWBK60161331926819', 'iban_invalid_check_digits'),  # check digits not numeric
         ('GB00NWBK60161331926819', 'iban_invalid_checksum'),  # MOD-97 checksum fails
+        ('GB851234601613319268AB', 'iban_invalid_bban_format'),  # digits in the bank code
+        ('DE0537040044053201300A', 'iban_invalid_bban_format'),  # letter in a numeric account number
     ],
 )
 def test_invalid_iban_raises_specific_error(iban: str, error_type: str) -> None:
@@ -118,3 +121,91 @@ def test_iban_requires_string(iban_value: Any) -> None:
 def test_iban_rejects_non_ascii_digits(iban: str) -> None:
     with pytest.raises(ValidationError, match='iban_invalid_characters'):
         BankAccount(iban=iban)
+
+
+def test_validate_many() -> None:
+    valid, errors = IBAN.validate_many(['gb29 nwbk 6016 1331 9268 19', 'GB00NWBK60161331926819', 'XX00', 42])
+    assert valid == ['GB29NWBK60161331926819']
+    assert type(valid[0]) is IBAN
+    assert errors == [(1, 'iban_invalid_checksum'), (2, 'iban_invalid_length'), (3, 'iban_type')]
+
+
+def test_bban_formats_match_lengths() -> None:
+    assert BBAN_FORMATS.keys() == IBAN_COUNTRY_CODE_LENGTH.keys()
+    for country_code, bban_format in BBAN_FORMATS.items():
+        assert bban_format.length + 4 == IBAN_COUNTRY_CODE_LENGTH[country_code]
+
+
+@pytest.mark.parametrize(
+    'iban, bank_code, branch_code, account_number',
+    [
+        ('GB29NWBK60161331926819', 'NWBK', '601613', '31926819'),
+        ('IT60X0542811101000000123456', '05428', '11101', '000000123456'),
+        ('DE89370400440532013000', '37040044', None, '0532013000'),
+        ('MU17BOMM0101101030300200000MUR', 'BOMM01', '01', '101030300200000MUR'),
+    ],
+)
+def test_iban_parts(iban: str, bank_code: str, branch_code: Any, account_number: str) -> None:
+    account = BankAccount(iban=iban)
+    assert account.iban.bank_code == bank_code
+    assert account.iban.branch_code == branch_code
+    assert account.iban.account_number == account_number
+
+
+def test_iban_parts_are_slots() -> None:
+    iban = BankAccount(iban='GB29NWBK60161331926819').iban
+    assert not hasattr(iban, '__dict__')
+    restored = pickle.loads(pickle.dumps(iban))
+    assert restored == iban
+    assert (restored.bank_code, restored.branch_code, restored.account_number) == ('NWBK', '601613', '31926819')
+
+
+def test_iban_is_built_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    init = IBAN.__init__
+
+    def counting_init(self: IBAN, iban: str) -> None:
+        calls.append(iban)
+        init(self, iban)
+
+    monkeypatch.setattr(IBAN, '__init__', counting_init)
+    assert type(BankAccount(iban='GB29 NWBK 6016 1331 9268 19').iban) is IBAN
+    assert calls == ['GB29NWBK60161331926819']
+
+
+def test_validate_array_matches_scalar() -> None:
+    np = pytest.importorskip('numpy')
+    ibans = [
+        'GB29NWBK60161331926819',
+        'IT60X0542811101000000123456',
+        'NO9386011117947',
+        'LC55HEMM000100010012001200023015',
+        'gb29 nwbk 6016 1331 9268 19',
+        'GB00NWBK60161331926819',
+        'GB29NWBK6016133192681',
+        'XX29NWBK60161331926819',
+        'G129NWBK60161331926819',
+        'GBAANWBK60161331926819',
+        'GB29NWBK6016133192681!',
+        'GB29NWBK٦0161331926819',
+        'GB29NWBK6016133192681ı',
+        'GB851234601613319268AB',
+        'DE0537040044053201300A',
+        'GB',
+        '',
+    ]
+    valid, errors = IBAN.validate_many(ibans)
+    mask, normalized = IBAN.validate_array(np.array(ibans))
+    assert np.flatnonzero(~mask).tolist() == [index for index, _ in errors]
+    assert normalized[mask].tolist() == valid
+    assert normalized[~mask].tolist() == [''] * len(errors)
+
+
+def test_validate_array_series() -> None:
+    pd = pytest.importorskip('pandas')
+    mask, normalized = IBAN.validate_array(pd.Series(['GB29NWBK60161331926819', None, 42]))
+    assert mask.tolist() == [True, False, False]
+    assert normalized.tolist() == ['GB29NWBK60161331926819', '', '']
+
+    mask, normalized = IBAN.validate_array(pd.Series([], dtype=object))
+    assert mask.tolist() == normalized.tolist() == []
@@ -7,9 +7,15 @@ from pydantic import BaseModel
 
 import pydantic_extra_types
 from pydantic_extra_types import epoch
-from pydantic_extra_types.color import Color
-from pydantic_extra_types.coordinate import Coordinate, Latitude, Longitude
-from pydantic_extra_types.country import CountryAlpha2, CountryAlpha3, CountryNumericCode, CountryShortName
+from pydantic_extra_types.color import Color, ColorArray
+from pydantic_extra_types.coordinate import Coordinate, CoordinateArray, Latitude, Longitude
+from pydantic_extra_types.country import (
+    CountryAlpha2,
+    CountryAlpha3,
+    CountryName,
+    CountryNumericCode,
+    CountryShortName,
+)
 from pydantic_extra_types.cron import CronStr
 from pydantic_extra_types.currency_code import ISO4217, Currency
 from pydantic_extra_types.domain import DomainStr
@@ -79,6 +85,38 @@ USNumberE164 = Annotated[
                 'type': 'object',
             },
         ),
+        (
+            ColorArray,
+            {
+                'properties': {'x': {'items': {'format': 'color', 'type': 'string'}, 'title': 'X', 'type': 'array'}},
+                'required': ['x'],
+                'title': 'Model',
+                'type': 'object',
+            },
+        ),
+        (
+            CoordinateArray,
+            {
+                'properties': {
+                    'x': {
+                        'items': {
+                            'maxItems': 2,
+                            'minItems': 2,
+                            'prefixItems': [
+                                {'maximum': 90.0, 'minimum': -90.0, 'type': 'number'},
+                                {'maximum': 180.0, 'minimum': -180.0, 'type': 'number'},
+                            ],
+                            'type': 'array',
+                        },
+                        'title': 'X',
+                        'type': 'array',
+                    }
+                },
+                'required': ['x'],
+                'title': 'Model',
+                'type': 'object',
+            },
+        ),
         (
             PaymentCardNumber,
             {
@@ -145,6 +183,15 @@ USNumberE164 = Annotated[
                 'type': 'object',
             },
         ),
+        (
+            CountryName,
+            {
+                'properties': {'x': {'title': 'X', 'type': 'string'}},
+                'required': ['x'],
+                'title': 'Model',
+                'type': 'object',
+            },
+        ),
         (
             MacAddress,
             {
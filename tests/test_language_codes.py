@@ -1,9 +1,11 @@
+import copy
+import pickle
 import re
 from string import printable
 
 import pycountry
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from pydantic_extra_types import language_code
 from pydantic_extra_types.language_code import (
@@ -106,3 +108,87 @@ def test_iso5_language_fail():
         ),
     ):
         ISO5CheckingModel(lang='LOL')
+
+
+def test_validate_many():
+    assert LanguageAlpha2.validate_many(['en', 'DE', 'xx', 1]) == (
+        ['en', 'de'],
+        [(2, 'language_alpha2'), (3, 'string_type')],
+    )
+    assert LanguageName.validate_many(['Dutch', 'dutch']) == (['Dutch'], [(1, 'language_name')])
+    assert language_code.ISO639_3.validate_many(['eng', 'xxx', 'en', 'engl']) == (
+        ['eng'],
+        [(1, 'ISO649_3'), (2, 'string_too_short'), (3, 'string_too_long')],
+    )
+    valid, errors = language_code.ISO639_5.validate_many(['gem', 'eng'])
+    assert valid == ['gem'] and type(valid[0]) is language_code.ISO639_5
+    assert errors == [(1, 'ISO649_5')]
+
+
+@pytest.mark.parametrize(
+    'cls, value',
+    [
+        (LanguageAlpha2, 'EN'),
+        (LanguageName, 'English'),
+        (language_code.ISO639_3, 'eng'),
+        (language_code.ISO639_5, 'gem'),
+    ],
+)
+def test_validated_values_are_shared(cls, value):
+    adapter = TypeAdapter(cls)
+    first = adapter.validate_python(value)
+    assert type(first) is cls
+    assert adapter.validate_python(value) is first
+    assert cls.validate_many([value])[0][0] is first
+
+
+@pytest.mark.parametrize(
+    'cls, value',
+    [
+        (LanguageAlpha2, 'EN'),
+        (LanguageName, 'English'),
+        (language_code.ISO639_3, 'eng'),
+        (language_code.ISO639_5, 'gem'),
+    ],
+)
+def test_subclasses_keep_their_type(cls, value):
+    subclass = type('MyCode', (cls,), {})
+    assert type(TypeAdapter(subclass).validate_python(value)) is subclass
+    assert type(subclass.validate_many([value])[0][0]) is subclass
+    assert type(TypeAdapter(cls).validate_python(value)) is cls
+
+
+@pytest.mark.parametrize(
+    'cls, value, attribute, expected',
+    [
+        (LanguageAlpha2, 'EN', 'alpha3', 'eng'),
+        (LanguageName, 'English', 'alpha2', 'en'),
+    ],
+)
+def test_validated_values_can_be_copied(cls, value, attribute, expected):
+    class Movie(BaseModel):
+        audio: cls
+
+    movie = Movie(audio=value)
+    value = movie.audio
+    for copied in (
+        pickle.loads(pickle.dumps(value)),
+        copy.deepcopy(value),
+        copy.deepcopy(movie).audio,
+        movie.model_copy(deep=True).audio,
+    ):
+        assert copied == value
+        assert type(copied) is cls
+        assert getattr(copied, attribute) == expected
+    info = movie.audio._info
+    assert pickle.loads(pickle.dumps(info)) == copy.deepcopy(info) == info
+
+
+def test_validated_values_are_bound_to_their_record():
+    language = TypeAdapter(LanguageAlpha2).validate_python('en')
+    assert language.__dict__['_info'] is _index_by_alpha2()['en']
+    assert (language.alpha3, language.name) == ('eng', 'English')
+    assert LanguageName('English').alpha3 == 'eng'
+
+    with pytest.raises(AttributeError):
+        language.__dict__['_info'].name = 'Klingon'
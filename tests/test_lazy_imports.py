@@ -0,0 +1,79 @@
+import subprocess
+import sys
+
+import pytest
+
+import pydantic_extra_types
+
+# generous on purpose: the package itself does almost nothing at import, the budget only has to catch
+# someone adding an eager import back to `__init__.py`
+IMPORT_BUDGET_US = 20_000
+
+
+def _importtime(code: str) -> dict[str, tuple[int, int]]:
+    """Run *code* in a fresh interpreter and return `{module: (self_us, cumulative_us)}` from `-X importtime`."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:') :].split('|')
+        timings[module.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+@pytest.mark.parametrize('name', [name for name in pydantic_extra_types.__all__ if name != '__version__'])
+def test_lazy_attribute(name: str) -> None:
+    if pydantic_extra_types._dynamic_imports[name] == 'arrow':
+        pytest.importorskip('pyarrow')
+    attr = getattr(pydantic_extra_types, name)
+    module = sys.modules[f'pydantic_extra_types.{pydantic_extra_types._dynamic_imports[name]}']
+    assert attr is getattr(module, name)
+    assert name in vars(pydantic_extra_types)
+
+
+def test_arrow_types() -> None:
+    pytest.importorskip('pyarrow')
+    from pydantic_extra_types import ArrowArray, ArrowTable, ArrowTableValidator
+    from pydantic_extra_types.arrow import ArrowArray as Array
+    from pydantic_extra_types.arrow import ArrowTable as Table
+    from pydantic_extra_types.arrow import ArrowTableValidator as TableValidator
+
+    assert (ArrowArray, ArrowTable, ArrowTableValidator) == (Array, Table, TableValidator)
+
+
+def test_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'NotAType'"):
+        pydantic_extra_types.NotAType
+
+
+def test_submodule_import_still_works() -> None:
+    from pydantic_extra_types import epoch
+
+    assert epoch.__name__ == 'pydantic_extra_types.epoch'
+
+
+def test_dir() -> None:
+    assert set(dir(pydantic_extra_types)) == set(pydantic_extra_types.__all__)
+
+
+def test_import_does_not_load_submodules() -> None:
+    timings = _importtime('import pydantic_extra_types')
+    loaded = [module for module in timings if module.startswith(('pydantic_extra_types.', 'pydantic'))]
+    assert loaded == ['pydantic_extra_types']
+    assert timings['pydantic_extra_types'][0] < IMPORT_BUDGET_US
+
+
+def test_import_only_loads_what_is_touched() -> None:
+    code = (
+        'import sys\n'
+        'from pydantic_extra_types import Color\n'
+        "print(*sorted(m for m in sys.modules if m.startswith('pydantic_extra_types.')))"
+    )
+    # private helper modules are shared and cheap, what matters is that no other type module is loaded
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert [m for m in result.stdout.split() if not m.startswith('pydantic_extra_types._')] == [
+        'pydantic_extra_types.color'
+    ]
@@ -1,5 +1,5 @@
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from pydantic_extra_types.mime_types import (
     Application,
@@ -96,6 +96,23 @@ class TestMimeTypeValidation:
         assert response.content_type == 'application/vnd.api+json'
         assert response.content_type.category == 'application'
 
+    def test_validated_values_are_shared(self, ResponseModel):
+        """Test that every validation of a MIME type returns the same instance, in its original case."""
+        first = ResponseModel(content_type='application/3gpphal+json').content_type
+        assert first == 'application/3gppHal+json'
+        assert ResponseModel(content_type='APPLICATION/3GPPHAL+JSON').content_type is first
+        assert MimeType.validate_many(['application/3gppHal+json'])[0][0] is first
+
+    def test_subclasses_keep_their_type(self, ResponseModel):
+        """Test that subclasses validate to instances of the subclass, not of `MimeType`."""
+
+        class MyMimeType(MimeType):
+            pass
+
+        assert type(TypeAdapter(MyMimeType).validate_python('text/html')) is MyMimeType
+        assert type(MyMimeType.validate_many(['text/html'])[0][0]) is MyMimeType
+        assert type(ResponseModel(content_type='text/html').content_type) is MimeType
+
 
 class TestMimeTypeProperties:
     """Test MimeType properties."""
@@ -248,3 +265,23 @@ class TestMimeTypeInModels:
         m = Model(content_type='application/json')
         assert m.model_dump() == {'content_type': 'application/json'}
         assert m.model_dump_json() == '{"content_type":"application/json"}'
+
+
+def test_validate_many():
+    valid, errors = MimeType.validate_many(['APPLICATION/JSON', 'foo/bar', b'text/html', b'\xff', 1])
+    assert valid == ['application/json', 'text/html']
+    assert type(valid[0]) is MimeType
+    assert errors == [(1, 'mime_type'), (3, 'string_unicode'), (4, 'string_type')]
+
+
+def test_validate_many_matches_schema_errors():
+    values = ['APPLICATION/JSON', 'foo/bar', b'text/html', b'\xff', 1]
+    adapter = TypeAdapter(MimeType)
+    valid, errors = MimeType.validate_many(values)
+    expected_valid, expected_errors = [], []
+    for index, value in enumerate(values):
+        try:
+            expected_valid.append(adapter.validate_python(value))
+        except ValidationError as e:
+            expected_errors.append((index, e.errors()[0]['type']))
+    assert (valid, errors) == (expected_valid, expected_errors)
@@ -1,13 +1,22 @@
-from typing import Annotated
+import io
+from collections import Counter
+from typing import Annotated, Any, Optional
 
 import pandas as pd
 import pytest
 from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import PydanticCustomError, PydanticSerializationError
 
+from pydantic_extra_types.color import Color
+from pydantic_extra_types.country import CountryAlpha2
+from pydantic_extra_types.iban import IBAN
 from pydantic_extra_types.pandas import (
+    ColumnError,
     PandasDataFrame,
+    PandasDataFrameStream,
     PandasDataFrameValidator,
     PandasSeries,
+    validate_columns,
 )
 
 
@@ -160,3 +169,358 @@ def test_type_adapter_series() -> None:
     result = adapter.validate_python(s)
     assert isinstance(result, pd.Series)
     assert result.equals(s)
+
+
+TypedFrame = Annotated[
+    pd.DataFrame,
+    PandasDataFrameValidator(columns={'country': CountryAlpha2, 'iban': IBAN, 'color': Color}),
+]
+
+
+class TypedModel(BaseModel):
+    df: TypedFrame
+
+
+def test_column_types_pass() -> None:
+    df = pd.DataFrame(
+        {
+            'country': ['ES', 'de'],
+            'iban': ['GB82WEST12345698765432', 'GB82 WEST 1234 5698 7654 32'],
+            'color': ['red', '#fff'],
+        }
+    )
+    assert TypedModel(df=df).df is df
+
+
+def test_column_types_report_every_invalid_row() -> None:
+    df = pd.DataFrame(
+        {
+            'country': ['ES', 'XX', 'de', 'XX', None],
+            'iban': ['GB82WEST12345698765432', 'GB00WEST12345698765432', 'x', 'GB82WEST12345698765432', 1],
+            'color': ['red', '#fff', 'nope', 'blue', 'red'],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+    with pytest.raises(ValidationError) as exc_info:
+        TypedModel(df=df)
+
+    (error,) = exc_info.value.errors()
+    assert error['msg'] == "DataFrame has invalid values in 'country' (3 rows), 'iban' (3 rows), 'color' (1 row)"
+    assert error['ctx']['errors'] == [
+        {'column': 'country', 'type': 'country_alpha2', 'count': 2, 'rows': [11, 13]},
+        {'column': 'country', 'type': 'string_type', 'count': 1, 'rows': [14]},
+        {'column': 'iban', 'type': 'iban_invalid_checksum', 'count': 1, 'rows': [11]},
+        {'column': 'iban', 'type': 'iban_invalid_length', 'count': 1, 'rows': [12]},
+        {'column': 'iban', 'type': 'iban_type', 'count': 1, 'rows': [14]},
+        {'column': 'color', 'type': 'color_error', 'count': 1, 'rows': [12]},
+    ]
+
+
+def test_typed_columns_are_required() -> None:
+    with pytest.raises(ValidationError, match='missing required columns: iban, color'):
+        TypedModel(df=pd.DataFrame({'country': ['ES']}))
+
+
+class QuantityFrame(PandasDataFrame):
+    columns = {'quantity': Optional[int]}
+
+
+def test_column_types_via_subclassing() -> None:
+    class Model(BaseModel):
+        df: QuantityFrame
+
+    assert Model(df=pd.DataFrame({'quantity': [1, None, 3]})).df.shape == (3, 1)
+    with pytest.raises(ValidationError, match="'quantity' \\(1 row\\)"):
+        Model(df=pd.DataFrame({'quantity': [1, 'many', None]}))
+
+
+def test_validate_columns() -> None:
+    df = pd.DataFrame({'country': ['ES', 'XX'], 'tags': [['a'], 'b']})
+    assert validate_columns(df, {'country': CountryAlpha2, 'tags': list[str]}) == [
+        ColumnError('country', 'country_alpha2', [1]),
+        ColumnError('tags', 'list_type', [1]),
+    ]
+    assert validate_columns(df, {'country': Optional[str]}) == []
+
+
+def test_duplicate_typed_columns() -> None:
+    df = pd.DataFrame([[1, 2, 'x']], columns=['a', 'a', 'b'])
+    adapter = TypeAdapter(Annotated[pd.DataFrame, PandasDataFrameValidator(columns={'a': int})])
+    with pytest.raises(ValidationError, match='DataFrame has duplicate columns: a'):
+        adapter.validate_python(df)
+    with pytest.raises(PydanticCustomError, match='DataFrame has duplicate columns: a'):
+        validate_columns(df, {'a': int})
+    with pytest.raises(PydanticCustomError, match='DataFrame has duplicate columns: a'):
+        list(PandasDataFrameStream([df], columns={'a': int}))
+
+    # labels that are not checked may repeat
+    assert validate_columns(df, {'b': str}) == []
+    assert TypeAdapter(Annotated[pd.DataFrame, PandasDataFrameValidator(columns={'b': str})]).validate_python(df) is df
+
+
+ConstrainedFrame = Annotated[
+    pd.DataFrame,
+    PandasDataFrameValidator(
+        dtypes={'id': 'int64', 'price': 'float64'},
+        non_null=['price'],
+        unique=['id'],
+        min={'price': 0},
+        max={'quantity': 10},
+        categories={'status': ['open', 'paid']},
+    ),
+]
+
+
+def test_constraints_pass() -> None:
+    df = pd.DataFrame(
+        {'id': [1, 2, 3], 'price': [0.0, 9.5, 2.0], 'quantity': [10, 1, None], 'status': ['open', None, 'paid']}
+    )
+    assert TypeAdapter(ConstrainedFrame).validate_python(df) is df
+
+
+def test_constraints_report_counts_and_sample_rows() -> None:
+    df = pd.DataFrame(
+        {
+            'id': [1, 2, 2, *range(3, 23)],
+            'price': [1.0, None, -1.0, *[-2.0] * 20],
+            'quantity': [11, 1, 3, *[1] * 20],
+            'status': ['open', 'shipped', 'paid', *['open'] * 20],
+        }
+    )
+    with pytest.raises(ValidationError) as exc_info:
+        TypeAdapter(ConstrainedFrame).validate_python(df)
+
+    (error,) = exc_info.value.errors()
+    assert error['msg'] == (
+        "DataFrame has invalid values in 'id' (1 row), 'price' (22 rows), 'quantity' (1 row), 'status' (1 row)"
+    )
+    assert error['ctx']['errors'] == [
+        {'column': 'id', 'type': 'duplicate', 'count': 1, 'rows': [2]},
+        {'column': 'price', 'type': 'missing', 'count': 1, 'rows': [1]},
+        {'column': 'price', 'type': 'greater_than_equal', 'count': 21, 'rows': list(range(2, 12)), 'ctx': {'ge': 0}},
+        {'column': 'quantity', 'type': 'less_than_equal', 'count': 1, 'rows': [0], 'ctx': {'le': 10}},
+        {'column': 'status', 'type': 'category', 'count': 1, 'rows': [1], 'ctx': {'expected': ['open', 'paid']}},
+    ]
+
+
+def test_constraints_dtype() -> None:
+    df = pd.DataFrame({'id': [1, 2], 'price': [1, 2], 'quantity': ['1', 2], 'status': ['open', 'paid']})
+    with pytest.raises(ValidationError) as exc_info:
+        TypeAdapter(ConstrainedFrame).validate_python(df)
+
+    (error,) = exc_info.value.errors()
+    assert error['ctx']['columns'] == "'price' (dtype int64, expected float64), 'quantity' (dtype object)"
+
+
+def test_constrained_columns_are_required() -> None:
+    with pytest.raises(ValidationError, match='missing required columns: price, quantity, status'):
+        TypeAdapter(ConstrainedFrame).validate_python(pd.DataFrame({'id': [1]}))
+
+
+@pytest.mark.parametrize(
+    'constraints',
+    [
+        {'dtypes': {'a': 'int64'}},
+        {'non_null': ['a']},
+        {'unique': ['a']},
+        {'min': {'a': 0}},
+        {'max': {'a': 0}},
+        {'categories': {'a': [1]}},
+    ],
+)
+def test_duplicate_constrained_columns(constraints: dict[str, Any]) -> None:
+    df = pd.DataFrame([[1, None]], columns=['a', 'a'])
+    adapter = TypeAdapter(Annotated[pd.DataFrame, PandasDataFrameValidator(**constraints)])
+    with pytest.raises(ValidationError, match='DataFrame has duplicate columns: a'):
+        adapter.validate_python(df)
+
+
+class ScoreFrame(PandasDataFrame):
+    non_null = ['score']
+    min = {'score': 0}
+    max = {'score': 100}
+
+
+def test_constraints_via_subclassing() -> None:
+    class Model(BaseModel):
+        df: ScoreFrame
+
+    assert Model(df=pd.DataFrame({'score': [0, 100]})).df.shape == (2, 1)
+    with pytest.raises(ValidationError, match="'score' \\(2 rows\\)"):
+        Model(df=pd.DataFrame({'score': [-1, None, 50]}))
+
+
+def test_duplicate_constrained_columns_via_subclassing() -> None:
+    class Model(BaseModel):
+        df: ScoreFrame
+
+    with pytest.raises(ValidationError, match='DataFrame has duplicate columns: score'):
+        Model(df=pd.DataFrame([[1, 2]], columns=['score', 'score']))
+
+
+ORDERS_CSV = 'id,country\n1,ES\n2,XX\n3,de\n4,FR\n5,XX\n'
+
+
+def test_stream_validates_csv_chunks_lazily() -> None:
+    stream = PandasDataFrameStream(
+        pd.read_csv(io.StringIO(ORDERS_CSV), chunksize=2), columns={'country': CountryAlpha2}, on_error='drop'
+    )
+    chunks = iter(stream)
+    assert next(chunks)['id'].tolist() == [1]
+    assert (stream.rows, stream.invalid_rows) == (2, 1)
+    assert [chunk['id'].tolist() for chunk in chunks] == [[3, 4], []]
+    assert (stream.rows, stream.invalid_rows) == (5, 2)
+    assert stream.error_counts == Counter({('country', 'country_alpha2'): 2})
+
+
+def test_stream_keep_and_raise() -> None:
+    kept = PandasDataFrameStream(
+        pd.read_csv(io.StringIO(ORDERS_CSV), chunksize=2), columns={'country': CountryAlpha2}, on_error='keep'
+    )
+    assert sum(len(chunk) for chunk in kept) == 5
+    assert kept.invalid_rows == 2
+
+    raised = PandasDataFrameStream(
+        pd.read_csv(io.StringIO(ORDERS_CSV), chunksize=2), columns={'country': CountryAlpha2}
+    )
+    with pytest.raises(PydanticCustomError, match="invalid values in 'country' \\(1 row\\)") as exc_info:
+        list(raised)
+    assert exc_info.value.context['errors'] == [
+        {'column': 'country', 'type': 'country_alpha2', 'count': 1, 'rows': [1]}
+    ]
+
+
+def test_stream_drops_rows_by_position() -> None:
+    chunk = pd.DataFrame({'country': ['US', 'XX', 'ES'], 'iban': [None, None, 'XX00']}, index=[0, 0, 1])
+    stream = PandasDataFrameStream([chunk], columns={'country': CountryAlpha2, 'iban': Optional[IBAN]}, on_error='drop')
+    assert [chunk['country'].tolist() for chunk in stream] == [['US']]
+    assert (stream.rows, stream.invalid_rows) == (3, 2)
+    assert stream.error_counts == Counter({('country', 'country_alpha2'): 1, ('iban', 'iban_invalid_length'): 1})
+
+
+def test_stream_invalid_on_error() -> None:
+    with pytest.raises(ValueError, match="on_error must be 'raise', 'drop' or 'keep', got 'dorp'"):
+        PandasDataFrameStream([], on_error='dorp')  # type: ignore[arg-type]
+
+
+def test_stream_required_columns() -> None:
+    stream = PandasDataFrameStream(pd.read_csv(io.StringIO(ORDERS_CSV), chunksize=2), required_columns=['amount'])
+    with pytest.raises(PydanticCustomError, match='missing required columns: amount'):
+        next(iter(stream))
+
+
+def test_stream_parquet_row_groups(tmp_path) -> None:
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = tmp_path / 'orders.parquet'
+    pd.read_csv(io.StringIO(ORDERS_CSV)).to_parquet(path, row_group_size=2)
+
+    stream = PandasDataFrameStream(pq.ParquetFile(path), columns={'country': CountryAlpha2}, on_error='keep')
+    chunks = list(stream)
+    assert [chunk.index.tolist() for chunk in chunks] == [[0, 1, 2, 3, 4]]
+    assert stream.error_counts == Counter({('country', 'country_alpha2'): 2})
+
+    stream = PandasDataFrameStream(pq.ParquetFile(path).iter_batches(batch_size=2), columns={'country': CountryAlpha2})
+    with pytest.raises(PydanticCustomError) as exc_info:
+        list(stream)
+    assert exc_info.value.context['errors'][0]['rows'] == [1]
+
+
+class OrderStream(PandasDataFrameStream):
+    required_columns = ['id']
+    columns = {'country': CountryAlpha2}
+
+
+def test_stream_as_model_field() -> None:
+    class Model(BaseModel):
+        orders: OrderStream
+
+    model = Model(orders=[pd.DataFrame({'id': [1], 'country': ['ES']})])
+    assert isinstance(model.orders, OrderStream)
+    assert [chunk['country'].tolist() for chunk in model.orders] == [['ES']]
+
+
+def test_stream_is_not_serialized_to_json() -> None:
+    class Model(BaseModel):
+        orders: OrderStream
+
+    model = Model(orders=[pd.DataFrame({'id': [1], 'country': ['ES']})])
+    assert model.model_dump()['orders'] is model.orders
+    with pytest.raises(PydanticSerializationError, match='a DataFrame stream cannot be serialized to JSON'):
+        model.model_dump_json()
+    with pytest.raises(PydanticSerializationError, match='a DataFrame stream cannot be serialized to JSON'):
+        model.model_dump(mode='json')
+    assert Model(orders=model.orders).orders is model.orders
+
+    with pytest.raises(ValidationError, match='not a valid source of pandas DataFrame chunks'):
+        Model(orders='orders.csv')
+
+
+SERIALIZED_FRAME = pd.DataFrame({'id': [1, 2], 'price': [9.5, None], 'status': ['open', None]}, index=[10, 11])
+
+
+@pytest.mark.parametrize(
+    'serialization, dumped, index',
+    [
+        ('list', {'id': [1, 2], 'price': [9.5, None], 'status': ['open', None]}, [0, 1]),
+        ('records', [{'id': 1, 'price': 9.5, 'status': 'open'}, {'id': 2, 'price': None, 'status': None}], [0, 1]),
+        (
+            'split',
+            {'index': [10, 11], 'columns': ['id', 'price', 'status'], 'data': [[1, 9.5, 'open'], [2, None, None]]},
+            [10, 11],
+        ),
+    ],
+)
+def test_json_serialization(serialization: str, dumped: object, index: list[int]) -> None:
+    class Model(BaseModel):
+        df: Annotated[pd.DataFrame, PandasDataFrameValidator(serialization=serialization)]
+
+    model = Model(df=SERIALIZED_FRAME)
+    assert model.model_dump()['df'] is SERIALIZED_FRAME
+    assert model.model_dump(mode='json') == {'df': dumped}
+
+    restored = Model.model_validate_json(model.model_dump_json()).df
+    assert restored.index.tolist() == index
+    assert Model(df=restored).model_dump(mode='json') == {'df': dumped}
+    assert Model(df=dumped).df.shape == (2, 3)
+
+
+class ArrowSerializedFrame(PandasDataFrame):
+    required_columns = ['id']
+    serialization = 'arrow'
+
+
+class ParquetSerializedFrame(ArrowSerializedFrame):
+    serialization = 'parquet'
+
+
+@pytest.mark.parametrize('frame', [ArrowSerializedFrame, ParquetSerializedFrame])
+def test_binary_serialization_round_trips(frame: type[PandasDataFrame]) -> None:
+    pytest.importorskip('pyarrow')
+
+    class Model(BaseModel):
+        df: frame  # type: ignore[valid-type]
+
+    model = Model(df=SERIALIZED_FRAME)
+    dumped = model.model_dump(mode='json')['df']
+    assert isinstance(dumped, str)
+    pd.testing.assert_frame_equal(Model.model_validate_json(model.model_dump_json()).df, SERIALIZED_FRAME)
+    pd.testing.assert_frame_equal(Model(df=dumped).df, SERIALIZED_FRAME)
+    assert Model.model_json_schema()['properties']['df']['contentEncoding'] == 'base64'
+
+    with pytest.raises(ValidationError, match='value is not a valid pandas DataFrame: '):
+        Model(df='bm90IGEgZnJhbWU=')
+
+    class Unconstrained(frame):  # type: ignore[valid-type,misc]
+        required_columns = None
+
+    class UnconstrainedModel(BaseModel):
+        df: Unconstrained
+
+    without_id = UnconstrainedModel(df=SERIALIZED_FRAME[['price']]).model_dump(mode='json')['df']
+    with pytest.raises(ValidationError, match='missing required columns: id'):
+        Model(df=without_id)
+
+
+def test_unknown_serialization() -> None:
+    with pytest.raises(ValueError, match="unknown DataFrame serialization 'csv'"):
+        TypeAdapter(Annotated[pd.DataFrame, PandasDataFrameValidator(serialization='csv')])  # type: ignore[arg-type]
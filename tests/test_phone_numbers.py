@@ -1,8 +1,11 @@
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+from pydantic_extra_types import phone_numbers
 from pydantic_extra_types.phone_numbers import PhoneNumber
 
 
@@ -70,3 +73,66 @@ def test_eq() -> None:
     assert PhoneNumber('555-1212') == '555-1212'
     assert PhoneNumber('555-1212') != '555-1213'
     assert PhoneNumber('555-1212') != PhoneNumber('555-1213')
+
+
+@pytest.fixture
+def parse_cache():
+    phone_numbers.enable_parse_cache(maxsize=2)
+    yield
+    phone_numbers.disable_parse_cache()
+
+
+def test_parse_cache_disabled_by_default() -> None:
+    Something(phone_number='+1 901 555 1212')
+    assert phone_numbers.parse_cache_info() == phone_numbers.ParseCacheInfo(hits=0, misses=0, maxsize=0, currsize=0)
+
+
+def test_parse_cache(parse_cache: None) -> None:
+    for _ in range(3):
+        assert Something(phone_number='+1 901 555 1212').phone_number == 'tel:+1-901-555-1212'
+    assert phone_numbers.parse_cache_info() == phone_numbers.ParseCacheInfo(hits=2, misses=1, maxsize=2, currsize=1)
+
+    # invalid numbers are cached too, and still raise every time
+    for _ in range(2):
+        with pytest.raises(ValidationError, match='value is not a valid phone number'):
+            Something(phone_number='+1 555-1212')
+    assert phone_numbers.parse_cache_info().hits == 3
+
+    # the least recently used number is evicted
+    Something(phone_number='+1 650 253 0000')
+    Something(phone_number='+1 901 555 1212')
+    assert phone_numbers.parse_cache_info() == phone_numbers.ParseCacheInfo(hits=3, misses=4, maxsize=2, currsize=2)
+
+    phone_numbers.clear_parse_cache()
+    assert phone_numbers.parse_cache_info() == phone_numbers.ParseCacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_parse_cache_keys_on_settings(parse_cache: None) -> None:
+    class NationalPhoneNumber(PhoneNumber):
+        default_region_code = 'US'
+        phone_format = 'NATIONAL'
+
+    assert TypeAdapter(NationalPhoneNumber).validate_python('901 555 1212') == '(901) 555-1212'
+    with pytest.raises(ValidationError, match='value is not a valid phone number'):
+        Something(phone_number='901 555 1212')
+    assert phone_numbers.parse_cache_info().misses == 2
+
+
+def test_parse_cache_threads(parse_cache: None) -> None:
+    numbers = ['+1 901 555 1212', '+1 650 253 0000', '+1 555-1212'] * 100
+    adapter = TypeAdapter(list[PhoneNumber])
+
+    def validate(_: int) -> None:
+        with contextlib.suppress(ValidationError):
+            adapter.validate_python(numbers)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(validate, range(16)))
+    info = phone_numbers.parse_cache_info()
+    assert info.hits + info.misses == 16 * len(numbers)
+    assert info.currsize == 2
+
+
+def test_enable_parse_cache_invalid_size() -> None:
+    with pytest.raises(ValueError, match='maxsize must be positive'):
+        phone_numbers.enable_parse_cache(maxsize=0)
@@ -5,7 +5,7 @@ import pytest
 from phonenumbers import PhoneNumber
 from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from pydantic_extra_types.phone_numbers import PhoneNumberValidator
+from pydantic_extra_types.phone_numbers import PhoneNumberValidator, normalize_many
 
 Number = Annotated[Union[str, PhoneNumber], PhoneNumberValidator()]
 NANumber = Annotated[
@@ -99,3 +99,30 @@ def test_parse_error() -> None:
 def test_parsed_but_not_a_valid_number() -> None:
     with pytest.raises(ValidationError, match='value is not a valid phone number'):
         Numbers(phone_number='+1 555-1212')
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_normalize_many(workers: int) -> None:
+    numbers = ['+1 901 555 1212', '901 555 1213', '', '+44 20 7946 0958', 12, phonenumbers.parse('+1 901 555 1214')] * 3
+    adapter = TypeAdapter(NANumber)
+    expected_valid, expected_errors = [], []
+    for index, number in enumerate(numbers):
+        try:
+            expected_valid.append(adapter.validate_python(number))
+        except ValidationError as exc:
+            expected_errors.append((index, exc.errors()[0]['type']))
+
+    valid, errors = normalize_many(
+        numbers, default_region='US', supported_regions=['US', 'CA'], workers=workers, chunk_size=4
+    )
+    assert valid == expected_valid
+    assert errors == expected_errors == [(i + offset, 'value_error') for i in range(0, 18, 6) for offset in (2, 3, 4)]
+
+
+def test_normalize_many_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match='Invalid number format: XX'):
+        normalize_many([], number_format='XX')
+    with pytest.raises(ValueError, match='workers must be positive'):
+        normalize_many([], workers=0)
+    with pytest.raises(ValueError, match='chunk_size must be positive'):
+        normalize_many([], chunk_size=0)
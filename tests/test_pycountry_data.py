@@ -0,0 +1,35 @@
+from importlib.metadata import version
+from pathlib import Path
+
+import pytest
+
+from pydantic_extra_types import _pycountry, _pycountry_snapshot
+
+
+@pytest.fixture
+def live_data(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv(_pycountry.LIVE_DATA_ENV, '1')
+    _pycountry.reference_data.cache_clear()
+    yield _pycountry.reference_data()
+    _pycountry.reference_data.cache_clear()
+
+
+def test_snapshot_is_default() -> None:
+    data = _pycountry.reference_data()
+    assert data.pycountry_version == _pycountry_snapshot.PYCOUNTRY_VERSION
+    assert data.countries is _pycountry_snapshot.COUNTRIES
+
+
+def test_live_data(live_data: _pycountry.ReferenceData) -> None:
+    assert live_data.pycountry_version == version('pycountry')
+    assert live_data.countries is not _pycountry_snapshot.COUNTRIES
+    assert ('US', 'USA', '840', 'United States') in live_data.countries
+
+
+@pytest.mark.skipif(
+    version('pycountry') != _pycountry_snapshot.PYCOUNTRY_VERSION,
+    reason='snapshot was generated from another pycountry version',
+)
+def test_snapshot_is_up_to_date() -> None:
+    """Run `make pycountry-snapshot` if this fails."""
+    assert _pycountry.generate_snapshot() == Path(_pycountry_snapshot.__file__).read_text(encoding='utf-8')
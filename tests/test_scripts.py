@@ -2,7 +2,7 @@ import re
 
 import pycountry
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from pydantic_extra_types.script_code import ISO_15924
 
@@ -51,3 +51,25 @@ def test_ISO_15924_code_fail_not_existing():
         ),
     ):
         ScriptCheck(script='Klin')
+
+
+def test_validate_many():
+    valid, errors = ISO_15924.validate_many(['Latn', 'Xxxx', 'Lat', 'latin'])
+    assert valid == ['Latn'] and type(valid[0]) is ISO_15924
+    assert errors == [(1, 'ISO_15924'), (2, 'string_too_short'), (3, 'string_too_long')]
+
+
+def test_validated_values_are_shared():
+    first = ScriptCheck(script='Latn').script
+    assert type(first) is ISO_15924
+    assert ScriptCheck(script='Latn').script is first
+    assert ISO_15924.validate_many(['Latn'])[0][0] is first
+
+
+def test_subclasses_keep_their_type():
+    class MyScript(ISO_15924):
+        pass
+
+    assert type(TypeAdapter(MyScript).validate_python('Latn')) is MyScript
+    assert type(MyScript.validate_many(['Latn'])[0][0]) is MyScript
+    assert type(ScriptCheck(script='Latn').script) is ISO_15924
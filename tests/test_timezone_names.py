@@ -216,3 +216,10 @@ def test_timezone_name_slots():
     tz = TimeZoneName('America/New_York')
     with pytest.raises(AttributeError):
         tz.new_attribute = 'test'
+
+
+def test_validate_many():
+    valid, errors = TimeZoneName.validate_many(['Europe/London', 'europe/london', '', None])
+    assert valid == ['Europe/London']
+    assert type(valid[0]) is TimeZoneName
+    assert errors == [(1, 'TimeZoneName'), (2, 'string_too_short'), (3, 'string_type')]
@@ -4,6 +4,7 @@ import pytest
 from pydantic import BaseModel, ValidationError
 from pydantic_core import PydanticCustomError
 
+from pydantic_extra_types import color
 from pydantic_extra_types.color import Color
 
 
@@ -232,3 +233,248 @@ def test_color_hashable():
     assert hash(Color('red')) != hash(Color('blue'))
     assert hash(Color('red')) == hash(Color((255, 0, 0)))
     assert hash(Color('red')) != hash(Color((255, 0, 0, 0.5)))
+
+
+@pytest.fixture
+def parse_cache():
+    color.enable_parse_cache(maxsize=3)
+    yield
+    color.disable_parse_cache()
+
+
+def test_parse_cache_disabled_by_default():
+    Color('red')
+    assert color.parse_cache_info() == color.ParseCacheInfo(hits=0, misses=0, maxsize=0, currsize=0)
+
+
+def test_parse_cache(parse_cache):
+    first = Color('#DAB')
+    second = Color(' #dab')
+    assert Color('#dab')._rgba is first._rgba
+    assert second._rgba is not first._rgba
+    assert first.original() == '#DAB'
+    assert color.parse_cache_info() == color.ParseCacheInfo(hits=1, misses=2, maxsize=3, currsize=2)
+
+    # tuples and lists with the same items share an entry
+    assert Color((1, 2, 3))._rgba is Color([1, 2, 3])._rgba
+    assert color.parse_cache_info() == color.ParseCacheInfo(hits=2, misses=3, maxsize=3, currsize=3)
+
+    # invalid inputs are cached too, and still raise every time with their context
+    for _ in range(2):
+        with pytest.raises(PydanticCustomError, match='must be in the range 0 to 255'):
+            Color((1, 2, 300))
+    assert color.parse_cache_info() == color.ParseCacheInfo(hits=3, misses=4, maxsize=3, currsize=3)
+
+    color.clear_parse_cache()
+    assert color.parse_cache_info() == color.ParseCacheInfo(hits=0, misses=0, maxsize=3, currsize=0)
+
+
+def test_parse_cache_unhashable_tuple(parse_cache):
+    with pytest.raises(PydanticCustomError, match='must be a valid number'):
+        Color(([1], 2, 3))
+    assert color.parse_cache_info().currsize == 0
+
+
+def test_enable_parse_cache_invalid_size():
+    with pytest.raises(ValueError, match='maxsize must be positive'):
+        color.enable_parse_cache(maxsize=0)
+
+
+@pytest.mark.parametrize('metric', ['rgb', 'lab', 'ciede2000'])
+def test_as_nearest_named_exact(metric):
+    for value, name in color.COLORS_BY_VALUE.items():
+        assert Color(value).as_nearest_named(metric) == name == Color(value).as_named()
+
+
+@pytest.mark.parametrize(
+    'metric, name', [('rgb', 'royalblue'), ('lab', 'blueviolet'), ('ciede2000', 'blue')], ids=lambda v: v
+)
+def test_as_nearest_named(metric, name):
+    assert Color('#3c2ecd').as_nearest_named(metric) == name
+    # alpha is ignored
+    assert Color((60, 46, 205, 0.5)).as_nearest_named(metric) == name
+
+
+def test_as_nearest_named_invalid_metric():
+    with pytest.raises(ValueError, match="metric must be 'rgb', 'lab' or 'ciede2000', got 'hsl'"):
+        Color('red').as_nearest_named('hsl')  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    'lab1, lab2, difference',
+    [
+        # from the test data of Sharma, Wu and Dalal (2005)
+        ((50.0, 2.6772, -79.7751), (50.0, 0.0, -82.7485), 2.0425),
+        ((50.0, 0.0, 0.0), (50.0, -1.0, 2.0), 2.3669),
+        ((50.0, 2.49, -0.001), (50.0, -2.49, 0.0009), 7.1792),
+        ((50.0, -0.001, 2.49), (50.0, 0.0009, -2.49), 4.8045),
+        ((50.0, 2.5, 0.0), (73.0, 25.0, -18.0), 27.1492),
+        ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644),
+    ],
+)
+def test_ciede2000(lab1, lab2, difference):
+    assert color._ciede2000(lab1, lab2) == pytest.approx(difference, abs=1e-4)
+    np = pytest.importorskip('numpy')
+    assert color._ciede2000_array(np.array(lab1), np.array(lab2)) == pytest.approx(difference, abs=1e-4)
+
+
+@pytest.mark.parametrize('metric', ['rgb', 'lab', 'ciede2000'])
+def test_nearest_named_array_matches_scalar(metric):
+    np = pytest.importorskip('numpy')
+    pixels = np.random.default_rng(0).integers(0, 256, size=(20, 25, 3), dtype=np.uint8)
+    names = Color.nearest_named_array(pixels, metric)
+    assert names.shape == (20, 25)
+    assert names.tolist() == [[Color(tuple(map(int, p))).as_nearest_named(metric) for p in row] for row in pixels]
+    assert (Color.nearest_named_array(pixels.astype(np.float32), metric) == names).all()
+
+
+def test_nearest_named_array_alpha_and_empty():
+    np = pytest.importorskip('numpy')
+    assert Color.nearest_named_array([[255, 0, 0, 0.5], [1, 2, 250, 1]]).tolist() == ['red', 'blue']
+    assert Color.nearest_named_array(np.zeros((0, 3), dtype=np.uint8)).shape == (0,)
+
+
+@pytest.mark.parametrize(
+    'values, metric, message',
+    [
+        ([1, 2, 3], 'hsl', "metric must be 'rgb', 'lab' or 'ciede2000'"),
+        ([[1, 2]], 'rgb', r'values must have shape \(..., 3\) or \(..., 4\), got \(1, 2\)'),
+        (5, 'rgb', r'values must have shape \(..., 3\) or \(..., 4\), got \(\)'),
+        ([[1, 2, 256]], 'rgb', 'values must be between 0 and 255'),
+        ([[-1.0, 2, 3]], 'rgb', 'values must be between 0 and 255'),
+    ],
+)
+def test_nearest_named_array_invalid(values, metric, message):
+    pytest.importorskip('numpy')
+    with pytest.raises(ValueError, match=message):
+        Color.nearest_named_array(values, metric)
+
+
+@pytest.fixture
+def color_inputs():
+    return ['red', '#00f8', (0, 128, 0), '0x777777cc', 'hsl(120, 100%, 25%)', (1, 2, 3, 0.5), 'transparent']
+
+
+def test_color_array(color_inputs):
+    np = pytest.importorskip('numpy')
+    colors = color.ColorArray(color_inputs)
+    assert colors.rgba.shape == (7, 4)
+    assert colors.rgba.dtype == np.float64
+    assert colors.rgba.flags.c_contiguous
+    assert len(colors) == 7
+    assert colors[1].as_hex() == '#00f8'
+    assert colors[0] == Color('red')
+    assert color.ColorArray(colors) == colors
+    assert color.ColorArray([]).rgba.shape == (0, 4)
+
+    singles = [Color(value) for value in color_inputs]
+    for fmt in ('short', 'long'):
+        assert colors.as_hex(fmt).tolist() == [c.as_hex(fmt) for c in singles]
+    assert colors.as_named(fallback=True).tolist() == [c.as_named(fallback=True) for c in singles]
+    for alpha in (True, False):
+        np.testing.assert_allclose(colors.as_rgb_tuple(alpha=alpha), [c.as_rgb_tuple(alpha=alpha) for c in singles])
+        np.testing.assert_allclose(
+            colors.as_hsl_tuple(alpha=alpha), [c.as_hsl_tuple(alpha=alpha) for c in singles], atol=1e-6
+        )
+    assert colors.as_rgb_tuple().shape == colors.as_hsl_tuple().shape == (7, 4)
+    assert colors.as_rgb_tuple(alpha=False).dtype == np.uint8
+
+
+def test_color_array_without_alpha():
+    np = pytest.importorskip('numpy')
+    colors = color.ColorArray(np.array([[255, 0, 0], [0, 0, 255.0]]))
+    assert colors.as_named().tolist() == ['red', 'blue']
+    assert colors.as_rgb_tuple().tolist() == [[255, 0, 0], [0, 0, 255]]
+    assert colors.as_hsl_tuple().shape == (2, 3)
+    assert np.isnan(colors.rgba[:, 3]).all()
+    # an alpha of 1 is no alpha, as for `Color`
+    assert np.isnan(color.ColorArray(np.array([[255, 0, 0, 1.0]])).rgba[0, 3])
+
+    with pytest.raises(ValueError, match='no named color found'):
+        color.ColorArray(['red', '#123456']).as_named()
+
+
+@pytest.mark.parametrize(
+    'values',
+    [
+        ['#00f8', 'red', (1, 2, 3, 0.1)],
+        ['hsl(270, 60%, 50%)', 'hsl(10, 33%, 47%)', 'hsla(200, 70%, 35%, 0.3)', 'rgb(12.5, 100.5, 200.5)'],
+        [
+            f'hsl({hue}, {saturation}%, {lightness}%)'
+            for hue in range(0, 360, 7)
+            for saturation, lightness in ((60, 50), (33, 47))
+        ],
+    ],
+)
+def test_color_array_matches_color(values):
+    pytest.importorskip('numpy')
+    colors = color.ColorArray(values)
+    singles = [Color(value) for value in values]
+    for fmt in ('short', 'long'):
+        assert colors.as_hex(fmt).tolist() == [c.as_hex(fmt) for c in singles]
+    assert colors.as_rgb_tuple(alpha=False).tolist() == [list(c.as_rgb_tuple(alpha=False)) for c in singles]
+    assert colors.as_named(fallback=True).tolist() == [c.as_named(fallback=True) for c in singles]
+    if all(c.as_rgb_tuple(alpha=False) in color.COLORS_BY_VALUE or c._rgba.alpha is not None for c in singles):
+        assert colors.as_named().tolist() == [c.as_named() for c in singles]
+
+
+class PaletteModel(BaseModel):
+    colors: color.ColorArray
+
+
+def test_color_array_model(color_inputs):
+    pytest.importorskip('numpy')
+    model = PaletteModel(colors=color_inputs)
+    assert isinstance(model.model_dump()['colors'], color.ColorArray)
+    assert model.model_dump(mode='json') == {
+        'colors': ['red', '#00f8', 'green', '#777c', 'green', '#01020380', '#0000']
+    }
+    assert PaletteModel.model_validate_json(model.model_dump_json()).colors.as_hex().tolist() == [
+        '#f00',
+        '#00f8',
+        '#008000',
+        '#777c',
+        '#008000',
+        '#01020380',
+        '#0000',
+    ]
+
+
+@pytest.mark.parametrize(
+    'colors, message',
+    [
+        (['red', 'nope'], 'value is not a valid color: string not recognised as a valid color at index 1'),
+        ([(1, 2)], 'tuples must have length 3 or 4 at index 0'),
+        ([1.5], 'value must be a tuple, list or string at index 0'),
+        ('red', 'value must be a list, tuple or array of colors'),
+        ({'red'}, 'value must be a list, tuple or array of colors'),
+    ],
+)
+def test_color_array_invalid(colors, message):
+    pytest.importorskip('numpy')
+    with pytest.raises(ValidationError, match=message):
+        PaletteModel(colors=colors)
+
+
+@pytest.mark.parametrize(
+    'shape_or_values, message',
+    [
+        ((2, 5), r'arrays must have shape \(N, 3\) or \(N, 4\)'),
+        ((3,), r'arrays must have shape \(N, 3\) or \(N, 4\)'),
+        ([[0, 0, 256]], 'color values must be in the range 0 to 255'),
+        ([[0, 0, float('nan')]], 'color values must be in the range 0 to 255'),
+        ([[0, 0, 0, 1.5]], 'alpha values must be in the range 0 to 1'),
+    ],
+)
+def test_color_array_invalid_array(shape_or_values, message):
+    np = pytest.importorskip('numpy')
+    values = np.zeros(shape_or_values) if isinstance(shape_or_values, tuple) else np.array(shape_or_values)
+    with pytest.raises(ValidationError, match=message):
+        PaletteModel(colors=values)
+
+
+def test_channel_values_are_shared():
+    rgba = Color('#01020380')._rgba
+    assert rgba == (1 / 255, 2 / 255, 3 / 255, 128 / 255)
+    assert rgba.r is Color((1, 2, 3))._rgba.r is Color('rgb(1, 2, 3)')._rgba.r
+    assert rgba.alpha is Color('#00000080')._rgba.alpha
@@ -5,7 +5,7 @@ import pytest
 from pydantic import BaseModel, ValidationError
 from pydantic_core._pydantic_core import PydanticCustomError
 
-from pydantic_extra_types.payment import PaymentCardBrand, PaymentCardNumber
+from pydantic_extra_types.payment import BinTable, PaymentCardBrand, PaymentCardNumber
 
 VALID_AMEX = '370000000000002'
 VALID_MC = '5100000000000003'
@@ -200,3 +200,128 @@ def test_payment_card_brand():
     assert b is not PaymentCardBrand.visa
     assert b != PaymentCardBrand.visa
     assert b not in {PaymentCardBrand.visa, PaymentCardBrand.mastercard}
+
+
+def test_validate_many():
+    valid, errors = PaymentCardNumber.validate_many(
+        [f' {VALID_VISA_16} ', LUHN_INVALID, LEN_INVALID, '42', '4' * 20, 4]
+    )
+    assert valid == [VALID_VISA_16]
+    assert valid[0].brand == PaymentCardBrand.visa
+    assert errors == [
+        (1, 'payment_card_number_luhn'),
+        (2, 'payment_card_number_brand'),
+        (3, 'string_too_short'),
+        (4, 'string_too_long'),
+        (5, 'string_type'),
+    ]
+
+
+def test_validate_array_matches_scalar():
+    np = pytest.importorskip('numpy')
+    card_numbers = [
+        VALID_AMEX,
+        VALID_MC,
+        VALID_VISA_13,
+        VALID_VISA_19,
+        VALID_MIR_17,
+        VALID_DISCOVER,
+        VALID_VERVE_18,
+        VALID_DANKORT,
+        VALID_UNIONPAY_19,
+        VALID_JCB_16,
+        VALID_MAESTRO,
+        VALID_TROY,
+        VALID_OTHER,
+        VALID_DINERS_CLUB_17,
+        f' {VALID_VISA_16} ',
+        LUHN_INVALID,
+        LEN_INVALID,
+        '1' * 11,
+        '1' * 20,
+        'h' * 16,
+        '²' * 16,
+    ]
+    expected_brands = []
+    for card_number in card_numbers:
+        try:
+            expected_brands.append(PaymentCardNumber._validate_str(card_number).brand)
+        except PydanticCustomError:
+            expected_brands.append(None)
+
+    mask, brands = PaymentCardNumber.validate_array(np.array(card_numbers))
+    assert brands.tolist() == expected_brands
+    assert mask.tolist() == [brand is not None for brand in expected_brands]
+
+
+def test_validate_array_series():
+    pd = pytest.importorskip('pandas')
+    mask, brands = PaymentCardNumber.validate_array(pd.Series([VALID_AMEX, None, 4242424242424242]))
+    assert mask.tolist() == [True, False, False]
+    assert brands.tolist() == [PaymentCardBrand.amex, None, None]
+
+    mask, brands = PaymentCardNumber.validate_array(pd.Series([], dtype=object))
+    assert mask.tolist() == brands.tolist() == []
+
+
+class CustomBinCard(PaymentCardNumber):
+    bin_table = PaymentCardNumber.bin_table.copy()
+
+
+CustomBinCard.bin_table.register('Acme Pay', '60480000', '60489999', lengths=[16])
+CustomBinCard.bin_table.register(PaymentCardBrand.dankort.value, '457100', lengths=[16])
+
+
+def test_bin_table_register():
+    assert CustomBinCard('6048000000000001').brand == 'Acme Pay'
+    assert CustomBinCard.validate_brand('4571000000000003') is PaymentCardBrand.dankort
+    assert CustomBinCard.validate_brand('4572000000000003') is PaymentCardBrand.visa
+    with pytest.raises(PydanticCustomError) as exc_info:
+        CustomBinCard.validate_brand('604800000000003')
+    assert exc_info.value.type == 'payment_card_number_brand'
+
+    # registered ranges only apply to the subclass
+    assert PaymentCardNumber('6048000000000001').brand == PaymentCardBrand.other
+    assert len(CustomBinCard.bin_table) == len(PaymentCardNumber.bin_table) + 2
+
+
+@pytest.mark.parametrize('start, end', [('', None), ('4a', None), ('123456789', None), ('55', '51')])
+def test_bin_table_register_invalid(start: str, end: Any):
+    with pytest.raises(ValueError):
+        BinTable().register('Acme Pay', start, end)
+
+
+def test_bin_table_load(tmp_path):
+    bin_file = tmp_path / 'bins.csv'
+    bin_file.write_text(
+        'start,end,brand,lengths,issuer\n'
+        '5100,5199,Acme Pay,16 19,Acme Bank\n'
+        '510042,,Mastercard,16,Other Bank\n'
+        '99,,Loyalty,,Acme Bank\n'
+    )
+    table = PaymentCardNumber.bin_table.copy()
+    assert table.load(bin_file) == 3
+    assert table.lookup('5100000000000003') == ('Acme Pay', (16, 19))
+    assert table.lookup('5100420000000003') == (PaymentCardBrand.mastercard, (16,))
+    assert table.lookup('5200000000000003') == (PaymentCardBrand.mastercard, (16,))
+    assert table.lookup('99') == ('Loyalty', ())
+    assert table.lookup('98') == (PaymentCardBrand.other, ())
+
+
+@pytest.mark.parametrize('bad_row', ['88,,Broken,x,', '8a,,Broken,16,', '89,80,Broken,16,'])
+def test_bin_table_load_invalid_row_registers_nothing(tmp_path, bad_row: str):
+    bin_file = tmp_path / 'bins.csv'
+    bin_file.write_text(f'start,end,brand,lengths,issuer\n777777,,Acme Pay,16,Acme Bank\n{bad_row}\n')
+    table = BinTable()
+    with pytest.raises(ValueError):
+        table.load(bin_file)
+    assert len(table) == 0
+    table.register('Loyalty', '99')
+    assert table.lookup('7777770000000000') == (PaymentCardBrand.other, ())
+
+
+def test_validate_array_custom_bin_table():
+    np = pytest.importorskip('numpy')
+    mask, brands = CustomBinCard.validate_array(np.array(['6048000000000001', '604800000000003', VALID_VISA_16]))
+    assert mask.tolist() == [True, False, True]
+    assert brands.tolist() == ['Acme Pay', None, PaymentCardBrand.visa]